@@ -0,0 +1,124 @@
+"""
+Micro-benchmark of schema enforcement on the mock CSVs in tests/mocks.
+
+Each mock frame is scaled up to ``--rows`` rows and converted with the
+legacy per-column loop and with the compiled `ConversionPlan`, both the
+first pass (raw CSV dtypes) and a second pass (already converted frame).
+
+Usage
+-----
+    python benchmarks/bench_schema_conversion.py --rows 50000 --repeat 5
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from morningpy.core.dataframe_schema import ConversionPlan
+from morningpy.schema import (
+    FinancialStatementSchema,
+    HeadlineNewsSchema,
+    HistoricalTimeseriesSchema,
+    HoldingInfoSchema,
+    HoldingSchema,
+    IntradayTimeseriesSchema,
+    MarketCalendarUsInfoSchema,
+    MarketCommoditiesSchema,
+    MarketCurrenciesSchema,
+    MarketFairValueSchema,
+    MarketIndexesSchema,
+    MarketMoversSchema,
+)
+
+MOCKS_DIR = Path(__file__).resolve().parent.parent / "tests" / "mocks"
+
+MOCK_SCHEMAS = {
+    "get_financial_statement": FinancialStatementSchema,
+    "get_headline_news": HeadlineNewsSchema,
+    "get_historical_timeseries": HistoricalTimeseriesSchema,
+    "get_holding_info": HoldingInfoSchema,
+    "get_holding": HoldingSchema,
+    "get_intraday_timeseries": IntradayTimeseriesSchema,
+    "get_market_commodities": MarketCommoditiesSchema,
+    "get_market_currencies": MarketCurrenciesSchema,
+    "get_market_fair_value": MarketFairValueSchema,
+    "get_market_indexes": MarketIndexesSchema,
+    "get_market_movers": MarketMoversSchema,
+    "get_market_us_calendar_info": MarketCalendarUsInfoSchema,
+}
+
+logger = logging.getLogger("bench")
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+def legacy_convert(df: pd.DataFrame, schema: type) -> pd.DataFrame:
+    """Per-column conversion as done before compiled plans."""
+    dtype_map = schema().to_dtype_dict()
+    for col in set(dtype_map) & set(df.columns):
+        dtype = dtype_map[col]
+        try:
+            if dtype == "string":
+                df[col] = df[col].astype("string")
+            elif dtype == "Int64":
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+            elif dtype in ("float32", "float64"):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+            elif dtype == "boolean":
+                df[col] = df[col].astype("boolean")
+            else:
+                df[col] = df[col].astype(dtype)
+        except Exception:
+            pass
+    return df
+
+
+def plan_convert(df: pd.DataFrame, schema: type) -> pd.DataFrame:
+    return ConversionPlan.for_schema(schema).apply(df, logger=logger)
+
+
+def best_of(func, frame: pd.DataFrame, schema: type, repeat: int) -> float:
+    """Best wall time in milliseconds over repeat runs on fresh copies."""
+    timings = []
+    for _ in range(repeat):
+        data = frame.copy()
+        start = time.perf_counter()
+        func(data, schema)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    header = f"{'mock':<30}{'cols':>6}{'legacy':>10}{'plan':>10}{'legacy 2nd':>12}{'plan 2nd':>10}"
+    print(f"rows={args.rows}  times in ms (best of {args.repeat})")
+    print(header)
+    print("-" * len(header))
+
+    for name, schema in MOCK_SCHEMAS.items():
+        path = MOCKS_DIR / f"{name}_mock.csv"
+        if not path.exists():
+            continue
+        raw = pd.read_csv(path)
+        if raw.empty:
+            continue
+        frame = raw.sample(args.rows, replace=True, random_state=0).reset_index(drop=True)
+        converted = plan_convert(frame.copy(), schema)
+
+        print(
+            f"{name:<30}{frame.shape[1]:>6}"
+            f"{best_of(legacy_convert, frame, schema, args.repeat):>10.2f}"
+            f"{best_of(plan_convert, frame, schema, args.repeat):>10.2f}"
+            f"{best_of(legacy_convert, converted, schema, args.repeat):>12.2f}"
+            f"{best_of(plan_convert, converted, schema, args.repeat):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
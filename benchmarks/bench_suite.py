@@ -0,0 +1,432 @@
+"""
+Offline benchmark suite on the recorded fixture responses.
+
+Times the hot paths of an extraction without network access:
+
+- process/<fixture>        `_call_api` post-fetch: `_process_response` + concat
+- process_arrow/<fixture>  `_call_api_arrow`, for extractors with an Arrow path
+- schema/<fixture>         `_validate_and_convert_types` on the processed frame
+- statement/<layout>       `FinancialStatementExtractor._process_response` on statements
+                           alone (wide and long layouts), without fetch or concat
+- loader/<identifier>      `SecurityLoader` resolution against a synthetic universe
+- interchange/<engine>     `DataFrameInterchange` conversions of a timeseries frame
+
+Every benchmark runs at each scale (x1, x10, x100, x1000 by default):
+securities for per-security endpoints and lookups, bars for timeseries,
+pages for single-endpoint market data. The suite is run in several rounds
+and each benchmark reports the median of its rounds and their spread.
+Results can be saved as a baseline and later runs compared against it.
+
+Timings drift with CPU frequency and machine load, so the comparison is
+noise-aware. A fixed calibration workload is timed every round, and
+current timings are rescaled by the calibration ratio before comparing.
+A benchmark only counts as a regression when its median slowed by more
+than the tolerance on top of the spreads measured in the two runs.
+
+benchmarks/baseline.json holds the reference results with the commit they
+were measured at; regenerate it on the release machine with
+--save-baseline when an optimization or a fix of a benchmarked path lands.
+
+Usage
+-----
+From the repository root (morningpy does not need to be installed):
+
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --scales 1 10 --filter process/ --baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pyarrow as pa
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(BENCHMARKS_DIR), str(BENCHMARKS_DIR.parent)]
+
+from fixtures import CASES, build_extractor, load_response, offline, scaled_responses, synthetic_tickers  # noqa: E402
+from morningpy.core.base_extract import BaseExtractor  # noqa: E402
+from morningpy.core.interchange import DataFrameInterchange  # noqa: E402
+from morningpy.core.security_loader import SecurityLoader  # noqa: E402
+
+SCALES = (1, 10, 100, 1000)
+
+UNIVERSE_SIZE = 100_000
+
+ENGINES = ("polars", "arrow", "dask")
+
+IDENTIFIERS = ("ticker", "isin", "security_id")
+
+MAX_ROWS = 2_000_000  # larger scaled inputs are skipped to bound memory
+
+ROUNDS = 3
+
+CALIBRATION_REPEAT = 7
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark setup to skip it."""
+
+
+def _skip(reason: str) -> Callable[[], object]:
+    def setup():
+        raise SkipBenchmark(reason)
+    return setup
+
+# A benchmark yields (name, setup, func): setup builds fresh inputs outside
+# the timed region, func(inputs) is timed.
+Benchmark = Tuple[str, Callable[[], object], Callable[[object], object]]
+
+
+def median_of(setup: Callable[[], object], func: Callable[[object], object], repeat: int, budget: float) -> float:
+    """
+    Median wall time in seconds over at most repeat runs.
+
+    Stops early once budget seconds were spent, after at least one run.
+    """
+    timings: List[float] = []
+    spent = 0.0
+    while len(timings) < repeat and (not timings or spent < budget):
+        inputs = setup()
+        start = time.perf_counter()
+        func(inputs)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        spent += elapsed
+    return statistics.median(timings)
+
+
+def _calibration_workload(_) -> None:
+    """Fixed interpreter, NumPy and pandas work, unrelated to morningpy."""
+    import numpy as np
+
+    sum(i * i for i in range(200_000))
+    values = np.random.default_rng(0).random(200_000)
+    np.sort(values)
+    pd.Series(values).groupby((values * 100).astype(int)).mean()
+
+
+def calibrate(repeat: int = CALIBRATION_REPEAT) -> float:
+    """Median time of the calibration workload, a measure of the machine's current speed."""
+    return median_of(lambda: None, _calibration_workload, repeat, budget=float("inf"))
+
+
+def _offline_extractor(name: str, scale: int, securities: List[str]) -> BaseExtractor:
+    """Extractor whose fetch returns the scaled fixture responses."""
+    extractor = build_extractor(name, securities[:scale])
+    responses = scaled_responses(name, scale, extractor)
+    extractor.requests = (extractor.requests * len(responses))[:len(responses)]
+    extractor.max_requests = len(responses)
+    extractor.client.fetch_all = AsyncMock(return_value=responses)
+    extractor.client.logger.setLevel(logging.CRITICAL)
+    extractor._session = contextlib.nullcontext  # no HTTP session needed offline
+    return extractor
+
+
+@functools.lru_cache(maxsize=None)
+def _base_rows(name: str, loop) -> int:
+    """Rows produced by a fixture at x1."""
+    extractor = _offline_extractor(name, 1, ["0P00000000"])
+    return len(loop.run_until_complete(extractor._call_api()))
+
+
+def pipeline_benchmarks(scales: Tuple[int, ...], securities: List[str], loop, max_rows: int) -> Iterator[Benchmark]:
+    """process, process_arrow and schema benchmarks of every fixture."""
+    for name, (cls, _, _) in CASES.items():
+        has_arrow = cls._process_response_arrow is not BaseExtractor._process_response_arrow
+        for scale in scales:
+            rows = _base_rows(name, loop) * scale
+            if rows > max_rows:
+                for kind in ("process", "process_arrow", "schema") if has_arrow else ("process", "schema"):
+                    yield f"{kind}/{name}/x{scale}", _skip(f"~{rows:,} rows > max rows"), None
+                continue
+            extractor = _offline_extractor(name, scale, securities)
+            yield (
+                f"process/{name}/x{scale}",
+                lambda: None,
+                lambda _, e=extractor: loop.run_until_complete(e._call_api()),
+            )
+            if has_arrow:
+                yield (
+                    f"process_arrow/{name}/x{scale}",
+                    lambda: None,
+                    lambda _, e=extractor: loop.run_until_complete(e._call_api_arrow()),
+                )
+            if extractor.schema is not None:
+                yield (
+                    f"schema/{name}/x{scale}",
+                    lambda e=extractor: loop.run_until_complete(e._call_api()),
+                    extractor._validate_and_convert_types,
+                )
+
+
+def statement_benchmarks(scales: Tuple[int, ...], securities: List[str]) -> Iterator[Benchmark]:
+    """Financial statement tree flattening of scale statements, per layout."""
+    response = load_response("get_financial_statement")
+    for layout in ("wide", "long"):
+        for scale in scales:
+            extractor = build_extractor("get_financial_statement", securities[:1])
+            extractor.layout = layout
+            responses = [
+                {**response, "metadata": {"security_id": security_id, "security_label": security_id}}
+                for security_id in securities[:scale]
+            ]
+            yield (
+                f"statement/{layout}/x{scale}",
+                lambda: None,
+                lambda _, e=extractor, r=responses: [e._process_response(x) for x in r],
+            )
+
+
+def loader_benchmarks(scales: Tuple[int, ...], tickers: pd.DataFrame) -> Iterator[Benchmark]:
+    """SecurityLoader resolution of scale identifiers of each type."""
+    def resolve(column, values):
+        loader = SecurityLoader(**{column: values})
+        return loader.get(fields=["security_label", "ticker"])
+
+    yield (
+        f"loader/index_build/x{len(tickers)}",
+        lambda: setattr(SecurityLoader, "_cached_id_map", None),
+        lambda _: SecurityLoader(ticker="T0").id_map,
+    )
+    for column in IDENTIFIERS:
+        for scale in scales:
+            values = tickers[column].sample(scale, random_state=scale).tolist()
+            yield (
+                f"loader/{column}/x{scale}",
+                lambda: None,
+                lambda _, c=column, v=values: resolve(c, v),
+            )
+
+
+def interchange_benchmarks(scales: Tuple[int, ...], securities: List[str], loop, max_rows: int) -> Iterator[Benchmark]:
+    """DataFrameInterchange conversions of the historical timeseries frame."""
+    @functools.lru_cache(maxsize=1)
+    def frame(scale):
+        extractor = _offline_extractor("get_historical_timeseries", scale, securities)
+        return extractor._validate_and_convert_types(loop.run_until_complete(extractor._call_api()))
+
+    for scale in scales:
+        rows = _base_rows("get_historical_timeseries", loop) * scale
+        if rows > max_rows:
+            for engine in ENGINES + ("arrow_to_pandas", "arrow_to_polars"):
+                yield f"interchange/{engine}/x{scale}", _skip(f"~{rows:,} rows > max rows"), None
+            continue
+        for engine in ENGINES:
+            yield (
+                f"interchange/{engine}/x{scale}",
+                lambda s=scale: frame(s),
+                lambda f, e=engine: DataFrameInterchange(f).to_engine(e),
+            )
+        for engine in ("pandas", "polars"):
+            yield (
+                f"interchange/arrow_to_{engine}/x{scale}",
+                lambda s=scale: pa.Table.from_pandas(frame(s), preserve_index=False),
+                lambda t, e=engine: DataFrameInterchange.arrow_to_engine(t, e),
+            )
+
+
+def run(
+    scales: Tuple[int, ...],
+    pattern: Optional[str],
+    repeat: int,
+    budget: float,
+    max_rows: int = MAX_ROWS,
+    rounds: int = ROUNDS
+) -> Tuple[Dict[str, float], Dict[str, float], float]:
+    """
+    Run the selected benchmarks, printing each result as it completes.
+
+    The suite is run rounds times over and every benchmark is timed once
+    per round, so its samples span the whole run and their spread includes
+    the drift of the machine over minutes, not only back-to-back jitter.
+    A benchmark that raises, or whose input exceeds max_rows, is reported
+    and left out of the results.
+
+    Returns
+    -------
+    results : Dict[str, float]
+        Median over the rounds of the per-round median, in seconds.
+    spread : Dict[str, float]
+        (max - min) / median of the per-round medians.
+    calibration : float
+        Median time of the calibration workload over the rounds.
+    """
+    tickers = synthetic_tickers(max(UNIVERSE_SIZE, max(scales)))
+    securities = tickers["security_id"].tolist()
+    samples: Dict[str, List[float]] = {}
+    calibration: List[float] = []
+    loop = asyncio.new_event_loop()
+    try:
+        with offline(tickers):
+            for round_number in range(1, rounds + 1):
+                calibration.append(calibrate())
+                suites = (
+                    pipeline_benchmarks(scales, securities, loop, max_rows),
+                    statement_benchmarks(scales, securities),
+                    loader_benchmarks(scales, tickers),
+                    interchange_benchmarks(scales, securities, loop, max_rows),
+                )
+                for suite in suites:
+                    for name, setup, func in suite:
+                        if pattern and pattern not in name:
+                            continue
+                        label = f"[{round_number}/{rounds}] {name}"
+                        try:
+                            elapsed = median_of(setup, func, repeat, budget)
+                        except SkipBenchmark as e:
+                            if round_number == 1:
+                                print(f"{label:<61}{'skipped':>12}  {e}")
+                            continue
+                        except Exception as e:
+                            print(f"{label:<61}{'failed':>12}  {type(e).__name__}: {e}")
+                            continue
+                        samples.setdefault(name, []).append(elapsed)
+                        print(f"{label:<61}{elapsed * 1000:>12.2f}")
+    finally:
+        loop.close()
+
+    results = {name: statistics.median(v) for name, v in samples.items()}
+    spread = {name: (max(v) - min(v)) / results[name] for name, v in samples.items()}
+    return results, spread, statistics.median(calibration)
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the measured tree, None outside a git checkout."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment() -> Dict[str, Optional[str]]:
+    """Versions, machine and commit the results were measured on."""
+    import numpy as np
+    import polars as pl
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "pandas": pd.__version__,
+        "pyarrow": pa.__version__,
+        "polars": pl.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def compare(
+    current: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    tolerance: float,
+    min_delta: float
+) -> List[str]:
+    """
+    Print the change of every benchmark against the baseline.
+
+    Parameters
+    ----------
+    current, baseline : dict
+        Result documents ({"environment", "results", "spread"}). Current
+        timings are rescaled by the ratio of the baseline and current
+        calibration times when both documents have one.
+    tolerance : float
+        Relative slowdown allowed on top of the measured spreads.
+    min_delta : float
+        Smallest absolute slowdown, in seconds, that can count as a regression.
+
+    Returns
+    -------
+    List[str]
+        Benchmarks whose rescaled median is slower than the baseline by
+        more than tolerance + baseline spread + current spread, and by
+        more than min_delta seconds.
+    """
+    results, reference = current["results"], baseline["results"]
+    spread, reference_spread = current.get("spread", {}), baseline.get("spread", {})
+    calibration = current["environment"].get("calibration")
+    reference_calibration = baseline["environment"].get("calibration")
+    factor = reference_calibration / calibration if calibration and reference_calibration else 1.0
+
+    header = f"{'benchmark':<55}{'baseline':>12}{'current':>12}{'change':>10}{'allowed':>10}"
+    print(f"\ncomparison, times in ms rescaled by {factor:.2f} (tolerance {tolerance:.0%})")
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for name, measured in results.items():
+        if name not in reference:
+            continue
+        previous, value = reference[name], measured * factor
+        change = value / previous - 1 if previous else 0.0
+        allowed = tolerance + spread.get(name, 0.0) + reference_spread.get(name, 0.0)
+        regressed = change > allowed and value - previous > min_delta
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<55}{previous * 1000:>12.2f}{value * 1000:>12.2f}{change:>+10.1%}{allowed:>10.0%}{flag}")
+        if regressed:
+            regressions.append(name)
+    missing = sorted(set(reference) - set(results))
+    if missing:
+        print(f"{len(missing)} baseline benchmarks not run")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--filter", default=None, help="run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="passes over the suite")
+    parser.add_argument("--repeat", type=int, default=3, help="max runs per benchmark and round")
+    parser.add_argument("--budget", type=float, default=1.0, help="max seconds of runs per benchmark and round")
+    parser.add_argument("--max-rows", type=int, default=MAX_ROWS, help="skip larger scaled inputs")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--save-baseline", type=Path, help="write results as the new baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown on top of the measured spread, e.g. 0.25 for +25%%")
+    parser.add_argument("--min-delta", type=float, default=0.001, help="ignore slowdowns below this many seconds")
+    args = parser.parse_args()
+
+    print(f"scales={args.scales}  times in ms (median of up to {args.repeat} per round)")
+    results, spread, calibration = run(
+        tuple(args.scales), args.filter, args.repeat, args.budget, args.max_rows, args.rounds
+    )
+
+    document = {
+        "environment": {**environment(), "calibration": calibration},
+        "results": results,
+        "spread": spread,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        env = baseline["environment"]
+        print(f"baseline measured {env['date']} at commit {env.get('commit')} on {env['machine']}")
+        regressions = compare(document, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
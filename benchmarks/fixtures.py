@@ -0,0 +1,173 @@
+"""
+Offline inputs for the benchmark suite.
+
+Extractors are built without network access (authentication headers are
+stubbed and security lookups run against a synthetic tickers table), and
+fed the recorded responses in tests/fixtures/fake_responses, optionally
+scaled up to more securities or more bars.
+"""
+import json
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from morningpy.core.client import BaseClient
+from morningpy.core.security_loader import SecurityLoader
+from morningpy.extractor.market import (
+    MarketCalendarUsInfoExtractor,
+    MarketCommoditiesExtractor,
+    MarketCurrenciesExtractor,
+    MarketFairValueExtractor,
+    MarketIndexesExtractor,
+    MarketMoversExtractor,
+)
+from morningpy.extractor.news import HeadlineNewsExtractor
+from morningpy.extractor.security import (
+    FinancialStatementExtractor,
+    HoldingExtractor,
+    HoldingInfoExtractor,
+)
+from morningpy.extractor.timeseries import (
+    HistoricalTimeseriesExtractor,
+    IntradayTimeseriesExtractor,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+RESPONSES_DIR = ROOT / "tests" / "fixtures" / "fake_responses"
+
+# fixture name -> (extractor class, constructor kwargs, scale-up mode)
+# "securities": one response per security; "bars": one response with more bars;
+# "pages": the same response repeated (single-endpoint market data).
+CASES: Dict[str, Tuple[type, Dict[str, Any], str]] = {
+    "get_financial_statement": (
+        FinancialStatementExtractor,
+        {"statement_type": "Balance Sheet", "report_frequency": "Annualy"},
+        "securities",
+    ),
+    "get_holding": (HoldingExtractor, {}, "securities"),
+    "get_holding_info": (HoldingInfoExtractor, {}, "securities"),
+    "get_historical_timeseries": (
+        HistoricalTimeseriesExtractor,
+        {"start_date": "2020-01-01", "end_date": "2024-01-01", "frequency": "daily"},
+        "bars",
+    ),
+    "get_intraday_timeseries": (
+        IntradayTimeseriesExtractor,
+        {"start_date": "2024-01-02", "end_date": "2024-01-03", "frequency": "1min"},
+        "bars",
+    ),
+    "get_headline_news": (HeadlineNewsExtractor, {"edition": "Spain", "market": "Spain", "news": "economy"}, "pages"),
+    "get_market_commodities": (MarketCommoditiesExtractor, {}, "pages"),
+    "get_market_currencies": (MarketCurrenciesExtractor, {}, "pages"),
+    "get_market_fair_value": (MarketFairValueExtractor, {}, "pages"),
+    "get_market_indexes": (MarketIndexesExtractor, {}, "pages"),
+    "get_market_movers": (MarketMoversExtractor, {}, "pages"),
+    "get_market_us_calendar_info": (MarketCalendarUsInfoExtractor, {"date": "2024-01-15", "info_type": "earnings"}, "pages"),
+}
+
+
+@lru_cache(maxsize=None)
+def load_response(name: str) -> Any:
+    """Recorded response of a fixture, parsed once."""
+    with open(RESPONSES_DIR / f"{name}_response.json") as f:
+        return json.load(f)
+
+
+def synthetic_tickers(n: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Tickers table with n securities, shaped like morningpy/data/tickers.parquet.
+
+    Security IDs follow the Morningstar pattern (0P + 8 digits) and every
+    identifier is unique, so lookups hit exactly one row.
+    """
+    rng = np.random.default_rng(seed)
+    ids = [f"0P{i:08d}" for i in range(n)]
+    return pd.DataFrame({
+        "security_id": ids,
+        "security_label": [f"Security {i}" for i in range(n)],
+        "ticker": [f"T{i}" for i in range(n)],
+        "isin": [f"US{i:010d}" for i in range(n)],
+        "performance_id": [f"0P{i:08d}" for i in range(n)],
+        "exchange": rng.choice(["XNAS", "XNYS", "XPAR", "XLON"], n),
+        "currency": rng.choice(["USD", "EUR", "GBP"], n),
+    })
+
+
+@contextmanager
+def offline(tickers: pd.DataFrame) -> Iterator[None]:
+    """Stub authentication and serve security lookups from tickers."""
+    previous = SecurityLoader._cached_tickers, SecurityLoader._cached_id_map
+    SecurityLoader._cached_tickers, SecurityLoader._cached_id_map = tickers, None
+    try:
+        with patch.object(BaseClient, "_get_headers", return_value={}):
+            yield
+    finally:
+        SecurityLoader._cached_tickers, SecurityLoader._cached_id_map = previous
+
+
+def build_extractor(name: str, securities: List[str]):
+    """
+    Extractor of a fixture with its requests built, for the given securities.
+
+    Must run inside `offline`.
+    """
+    cls, kwargs, mode = CASES[name]
+    if mode == "securities" or mode == "bars":
+        kwargs = {**kwargs, "security_id": securities if mode == "securities" else securities[0]}
+    extractor = cls(**kwargs)
+    extractor._check_inputs()
+    extractor._build_request()
+    return extractor
+
+
+def _with_metadata(response: Any, metadata: Any) -> Any:
+    """Shallow copy of a response carrying request metadata, as BaseClient.get_async does."""
+    if not metadata:
+        return response
+    if isinstance(response, dict):
+        return {**response, "metadata": metadata}
+    if isinstance(response, list) and response and isinstance(response[0], dict):
+        return [{**response[0], "metadata": metadata}] + response[1:]
+    return response
+
+
+def _scale_bars(response: List[Dict[str, Any]], scale: int) -> List[Dict[str, Any]]:
+    """
+    Timeseries response with its series repeated scale times.
+
+    Historical series are lists of bars, intraday series lists of days
+    holding bars, so either way the bar count grows scale times.
+    """
+    return [{**entry, "series": (entry.get("series") or []) * scale} for entry in response]
+
+
+def scaled_responses(name: str, scale: int, extractor) -> List[Any]:
+    """
+    Responses for a fixture scaled up scale times.
+
+    "securities" cases return one response per request of the extractor,
+    "bars" cases one response with scale times the bars, "pages" cases the
+    response repeated scale times.
+    """
+    response = load_response(name)
+    _, _, mode = CASES[name]
+    if mode == "bars":
+        response = _scale_bars(response, scale) if scale > 1 else response
+        responses = [response]
+    elif mode == "pages":
+        responses = [response] * scale
+    else:
+        responses = [response] * len(extractor.requests)
+
+    metadata = [
+        request.get("metadata") if isinstance(request, dict) else None
+        for request in extractor.requests
+    ]
+    metadata += [metadata[-1] if metadata else None] * (len(responses) - len(metadata))
+    return [_with_metadata(r, m) for r, m in zip(responses, metadata)]
+
@@ -4,7 +4,8 @@ from morningpy.api.market import (
     get_market_currencies,
     get_market_movers,
     get_market_indexes,
-    get_market_fair_value
+    get_market_fair_value,
+    poll_market
 )
 
 from morningpy.api.news import (
@@ -13,8 +14,12 @@ from morningpy.api.news import (
 
 from morningpy.api.security import (
     get_financial_statement,
+    get_financial_statements,
     get_holding,
     get_holding_info,
+    get_holding_bundle,
+    get_holding_matrix,
+    update_holding_snapshots,
 )
 
 from morningpy.api.ticker import (
@@ -23,6 +28,10 @@ from morningpy.api.ticker import (
     batch_convert
 )
 
+from morningpy.api.bulk import (
+    download_universe
+)
+
 from morningpy.api.timeseries import (
     get_historical_timeseries,
     get_intraday_timeseries,
@@ -41,13 +50,19 @@ __all__ = [
     "get_market_movers",
     "get_market_indexes",
     "get_market_fair_value",
+    "poll_market",
     "get_headline_news",
     "get_financial_statement",
+    "get_financial_statements",
     "get_holding",
     "get_holding_info",
+    "get_holding_bundle",
+    "get_holding_matrix",
+    "update_holding_snapshots",
     "search_tickers",
     "convert",
     "batch_convert",
     "get_historical_timeseries",
     "get_intraday_timeseries",
+    "download_universe",
 ]
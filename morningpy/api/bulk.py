@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+from typing import Callable, Iterable, List, Literal, Optional, Union
+
+import pandas as pd
+
+from morningpy.core.bulk import BulkJob, JobReport
+from morningpy.core.config import CoreConfig
+from morningpy.extractor.security import (
+    FinancialStatementExtractor,
+    HoldingExtractor,
+    HoldingInfoExtractor,
+)
+
+DATASETS = {
+    "holding": HoldingExtractor,
+    "holding_info": HoldingInfoExtractor,
+    "financial_statement": FinancialStatementExtractor,
+}
+
+def download_universe(
+    universe: Union[pd.DataFrame, Iterable[str]],
+    dataset: Literal["holding", "holding_info", "financial_statement"],
+    output_dir: Union[str, Path],
+    statement_type: Union[str, List[str]] = None,
+    report_frequency: Literal["Annualy", "Quarterly"] = None,
+    batch_size: int = CoreConfig.BULK_BATCH_SIZE,
+    on_progress: Optional[Callable[[JobReport], None]] = None
+) -> JobReport:
+    """
+    Download a dataset for a whole universe, resuming any previous run.
+
+    Securities are processed in batches; each batch is written to a Parquet
+    part file under ``output_dir/data`` and its per-security outcome is
+    checkpointed in ``output_dir/manifest.jsonl``. Calling the function
+    again with the same output directory only fetches securities that are
+    missing or failed.
+
+    Parameters
+    ----------
+    universe : pd.DataFrame or iterable of str
+        Output of `search_tickers` (any frame with a security_id column) or
+        a list of Morningstar security IDs.
+    dataset : {"holding", "holding_info", "financial_statement"}
+        Dataset to download. Financial statements are stored in the long
+        layout (one row per security, line item and period).
+    output_dir : str or Path
+        Job directory. One directory holds one dataset with fixed options.
+    statement_type : str or list of str, optional
+        Statement type(s), for dataset="financial_statement".
+    report_frequency : {"Annualy", "Quarterly"}, optional
+        Report frequency, for dataset="financial_statement".
+    batch_size : int, default 100
+        Securities per batch and per part file.
+    on_progress : callable, optional
+        Called with the JobReport after each batch.
+
+    Returns
+    -------
+    JobReport
+        Completed, failed and resumed counts, rows written and throughput.
+        Use ``BulkJob(...).read()`` to load the result: it only reads the
+        part files checkpointed in the manifest.
+
+    Raises
+    ------
+    ValueError
+        If the dataset is unknown or output_dir holds another job.
+
+    Examples
+    --------
+    >>> etfs = search_tickers(security_type="etf")
+    >>> report = download_universe(etfs, "holding", "etf_holdings/")
+    >>> print(report)
+    31250/31250 done (0 resumed), 0 failed, ...
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Unsupported dataset '{dataset}'. Expected one of {sorted(DATASETS)}.")
+
+    options = {}
+    if dataset == "financial_statement":
+        # Securities report different periods, so wide statements have no
+        # common schema to append to one dataset.
+        options = {
+            "statement_type": statement_type,
+            "report_frequency": report_frequency,
+            "layout": "long",
+        }
+
+    job = BulkJob(
+        DATASETS[dataset],
+        universe,
+        output_dir,
+        options=options,
+        batch_size=batch_size,
+        on_progress=on_progress
+    )
+    return asyncio.run(job.run())
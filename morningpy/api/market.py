@@ -1,5 +1,5 @@
 import asyncio
-from typing import List, Union, Literal
+from typing import Any, Callable, Dict, List, Union, Literal, Optional
 
 from morningpy.extractor.market import (
     MarketCalendarUsInfoExtractor,
@@ -8,13 +8,20 @@ from morningpy.extractor.market import (
     MarketMoversExtractor,
     MarketCommoditiesExtractor,
     MarketCurrenciesExtractor,
+    MarketPoller,
 )
+from morningpy.core.config import CoreConfig
+from morningpy.core.poller import PollDelta
+from morningpy.core.decorator import with_deadline
 from morningpy.core.interchange import DataFrameInterchange
 
 
+@with_deadline
 def get_market_us_calendar_info(
     date: Union[str, List[str]],
-    info_type: Literal["earnings", "economic-releases", "ipos", "splits"] = None
+    info_type: Literal["earnings", "economic-releases", "ipos", "splits"] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve U.S. market calendar information for one or multiple dates.
@@ -25,21 +32,31 @@ def get_market_us_calendar_info(
         Date(s) in ISO format.
     info_type : {"earnings", "economic-releases", "ipos", "splits"}, optional
         Specific type of calendar information to retrieve.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Structured market calendar information.
     """
     extractor = MarketCalendarUsInfoExtractor(date=date, info_type=info_type)
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
 def get_market_indexes(
     index_type: Union[
         Literal["americas", "asia", "europe", "private", "sector", "us"],
         List[Literal["americas", "asia", "europe", "private", "sector", "us"]]
-    ]
+    ],
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve market index information.
@@ -48,18 +65,28 @@ def get_market_indexes(
     ----------
     index_type : str or list of str
         Categories of indices to retrieve.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Market index dataset.
     """
     extractor = MarketIndexesExtractor(index_type=index_type)
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
 def get_market_fair_value(
-    value_type: Literal["undervaluated", "overvaluated"]
+    value_type: Literal["undervaluated", "overvaluated"],
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve market fair value estimates.
@@ -68,21 +95,31 @@ def get_market_fair_value(
     ----------
     value_type : {"undervaluated", "overvaluated"}
         Whether to fetch undervalued or overvalued market segments.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Fair value dataset.
     """
     extractor = MarketFairValueExtractor(value_type=value_type)
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
 def get_market_movers(
     mover_type: Union[
         Literal["gainers", "losers", "actives"],
         List[Literal["gainers", "losers", "actives"]]
-    ]
+    ],
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve top market movers.
@@ -91,37 +128,114 @@ def get_market_movers(
     ----------
     mover_type : str or list of str
         Category of movers to retrieve: gainers, losers, or actives.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Market movers dataset.
     """
     extractor = MarketMoversExtractor(mover_type=mover_type)
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
-def get_market_commodities() -> DataFrameInterchange:
+@with_deadline
+def get_market_commodities(
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
+) -> DataFrameInterchange:
     """
     Retrieve commodity market data.
 
+    Parameters
+    ----------
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
+
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Commodity prices and metrics.
     """
     extractor = MarketCommoditiesExtractor()
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
-def get_market_currencies() -> DataFrameInterchange:
+@with_deadline
+def get_market_currencies(
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
+) -> DataFrameInterchange:
     """
     Retrieve currency market data.
 
+    Parameters
+    ----------
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
+
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         Exchange rates and FX metrics.
     """
     extractor = MarketCurrenciesExtractor()
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
+
+
+def poll_market(
+    on_delta: Callable[[PollDelta], Any],
+    feeds: Optional[List[Literal["movers", "indexes", "currencies", "commodities"]]] = None,
+    interval: Union[float, Dict[str, float]] = CoreConfig.POLL_INTERVAL,
+    duration: Optional[float] = None,
+    jitter: float = CoreConfig.POLL_JITTER
+) -> None:
+    """
+    Poll the real-time market feeds and emit only the rows that changed.
+
+    Blocks until duration elapses (or forever). Clients, auth tokens and
+    the HTTP session are created once and reused by every poll, instead of
+    once per call as with get_market_movers & co. Use MarketPoller directly
+    to poll from a running event loop or to consume an asyncio queue.
+
+    Parameters
+    ----------
+    on_delta : callable
+        Called with a PollDelta (feed, changes, polled_at) whenever a poll
+        adds, changes or removes rows; may be a coroutine function. The
+        first poll of a feed emits all its rows as added.
+    feeds : list of str, optional
+        Feeds among 'movers', 'indexes', 'currencies' and 'commodities'.
+        All by default.
+    interval : float or dict, default CoreConfig.POLL_INTERVAL
+        Seconds between two polls of every feed, or per feed name.
+    duration : float, optional
+        Seconds after which polling stops. Runs until interrupted by default.
+    jitter : float, default CoreConfig.POLL_JITTER
+        Fraction of the interval added or removed at random to each wait.
+
+    Examples
+    --------
+    >>> poll_market(lambda d: print(d.feed, len(d.changes)), feeds=["currencies"], interval=2)
+    """
+    async def run() -> None:
+        poller = MarketPoller(feeds, interval=interval, on_delta=on_delta, jitter=jitter)
+        await poller.run(duration)
+
+    asyncio.run(run())
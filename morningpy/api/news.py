@@ -1,10 +1,13 @@
 import asyncio
-from typing import Literal
+from typing import Literal, Optional
 
 from morningpy.extractor.news import *
+from morningpy.core.config import CoreConfig
+from morningpy.core.decorator import with_deadline
 from morningpy.core.interchange import DataFrameInterchange
 from typing import Literal
 
+@with_deadline
 def get_headline_news(
     edition: Literal[
         "Asia",
@@ -59,6 +62,8 @@ def get_headline_news(
         "stocks",
         "markets",
     ],
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve Morningstar headline news for a given edition, market, and category.
@@ -71,10 +76,17 @@ def get_headline_news(
         Market from which the news will be retrieved (e.g., "Germany", "United States").
     news : Literal
         News category such as "economy", "stocks", or "funds".
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A dataframe-like object containing the retrieved headline news.
 
     Notes
@@ -85,4 +97,4 @@ def get_headline_news(
     """
     
     extractor = HeadlineNewsExtractor(edition=edition,market=market, news=news)
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
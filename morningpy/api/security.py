@@ -1,16 +1,25 @@
 import asyncio
-from typing import Union, List, Literal
+import pandas as pd
+from typing import Union, List, Literal, Optional
 
 from morningpy.extractor.security import *
+from morningpy.core.config import CoreConfig
+from morningpy.core.decorator import with_deadline
+from morningpy.core.holding_matrix import HoldingMatrix
+from morningpy.core.snapshot_store import HoldingSnapshotStore
 from morningpy.core.interchange import DataFrameInterchange
 
+@with_deadline
 def get_financial_statement(
     ticker: Union[str, List[str]] = None, 
     isin: Union[str, List[str]] = None, 
     security_id: Union[str, List[str]] = None, 
     performance_id: Union[str, List[str]] = None, 
     statement_type: Literal["Balance Sheet", "Cash Flow Statement", "Income Statement"] = None,
-    report_frequency: Literal["Annualy", "Quarterly"] = None
+    report_frequency: Literal["Annualy", "Quarterly"] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None,
+    layout: Literal["wide", "long", "panel"] = "wide"
 ):
     """
     Retrieve financial statements for one or multiple securities.
@@ -34,12 +43,25 @@ def get_financial_statement(
         Type of financial statement to retrieve.
     report_frequency : {"Annualy", "Quarterly"}, optional
         Frequency of reporting for the statement.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are built from Arrow
+        record batches without a pandas round trip.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
+    layout : {"wide", "long", "panel"}, default "wide"
+        "wide": one row per line item, one column per period. "long": one
+        row per (security, line item, period) with categorical labels, which
+        stays compact when securities report different periods. "panel": a
+        StatementPanel holding a dense (securities × line items × periods)
+        NumPy array; engine is ignored.
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A standardized dataframe-like structure containing the requested
-        financial statement data.
+        financial statement data, or a StatementPanel for layout="panel".
     """
     extractor = FinancialStatementExtractor(
         ticker=ticker,
@@ -47,17 +69,105 @@ def get_financial_statement(
         security_id=security_id,
         performance_id=performance_id,
         statement_type=statement_type,
-        report_frequency=report_frequency
+        report_frequency=report_frequency,
+        layout="long" if layout == "panel" else layout
     )
     
-    return asyncio.run(extractor.run())
+    if layout == "panel":
+        return FinancialStatementExtractor.to_panel(asyncio.run(extractor.run()))
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
+def get_financial_statements(
+    ticker: Union[str, List[str]] = None, 
+    isin: Union[str, List[str]] = None, 
+    security_id: Union[str, List[str]] = None, 
+    performance_id: Union[str, List[str]] = None, 
+    statement_type: Union[str, List[str]] = None,
+    report_frequency: Union[str, List[str]] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None,
+    layout: Literal["wide", "long"] = "wide",
+    output: Literal["dict", "frame"] = "dict"
+):
+    """
+    Retrieve several financial statements at several frequencies in one job.
+
+    Unlike calling `get_financial_statement` once per combination, the
+    securities are resolved and authenticated once, and every
+    (security × statement × frequency) request goes through one shared
+    session.
+
+    Parameters
+    ----------
+    ticker : str or list of str, optional
+        The ticker symbol(s) of the security.
+    isin : str or list of str, optional
+        The ISIN code(s) of the security.
+    security_id : str or list of str, optional
+        Internal Morningstar security identifier(s).
+    performance_id : str or list of str, optional
+        Morningstar performance identifier(s).
+    statement_type : str or list of str, optional
+        Statements among {"Balance Sheet", "Cash Flow Statement", "Income Statement"}.
+        Defaults to all three.
+    report_frequency : str or list of str, optional
+        Frequencies among {"Annualy", "Quarterly"}. Defaults to both.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine of each result. output="frame" requires "pandas".
+    deadline : float, optional
+        Total time budget in seconds for the whole call.
+    layout : {"wide", "long"}, default "wide"
+        Layout of each result, see `get_financial_statement`.
+    output : {"dict", "frame"}, default "dict"
+        "dict": {(statement_type, report_frequency): result}. "frame": one
+        pandas DataFrame indexed by (statement, frequency, row).
+
+    Returns
+    -------
+    dict or pd.DataFrame
+        Results keyed by statement type and frequency.
+
+    Raises
+    ------
+    ValueError
+        If output is unknown, or output="frame" with an engine other than pandas.
+
+    Examples
+    --------
+    >>> statements = get_financial_statements(ticker=["AAPL", "MSFT"])
+    >>> statements["Income Statement", "Quarterly"]
+    """
+    if output not in ("dict", "frame"):
+        raise ValueError(f"Invalid output '{output}', must be 'dict' or 'frame'")
+    if output == "frame" and engine != "pandas":
+        raise ValueError("output='frame' requires engine='pandas'")
+
+    extractor = FinancialStatementExtractor(
+        ticker=ticker,
+        isin=isin,
+        security_id=security_id,
+        performance_id=performance_id,
+        statement_type=statement_type or list(FinancialStatementConfig.ENDPOINT),
+        report_frequency=report_frequency or list(FinancialStatementConfig.MAPPING_FREQUENCY),
+        layout=layout
+    )
+
+    results = asyncio.run(extractor.run_grouped(engine=engine))
+    if output == "dict":
+        return results
+    return pd.concat(results, names=["statement", "frequency", None])
+
+
+@with_deadline
 def get_holding_info(
     ticker: Union[str, List[str]] = None, 
     isin: Union[str, List[str]] = None, 
     security_id: Union[str, List[str]] = None, 
-    performance_id: Union[str, List[str]] = None
+    performance_id: Union[str, List[str]] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve holding metadata for one or more securities.
@@ -75,10 +185,17 @@ def get_holding_info(
         Internal Morningstar security identifier(s).
     performance_id : str or list of str, optional
         Morningstar performance identifier(s).
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are converted from the
+        processed pandas DataFrame.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A dataframe-like structure containing descriptive holding information.
     """
     extractor = HoldingInfoExtractor(
@@ -88,14 +205,20 @@ def get_holding_info(
         performance_id=performance_id
     )
     
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
 def get_holding(
     ticker: Union[str, List[str]] = None, 
     isin: Union[str, List[str]] = None, 
     security_id: Union[str, List[str]] = None, 
-    performance_id: Union[str, List[str]] = None
+    performance_id: Union[str, List[str]] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None,
+    top_n: Optional[int] = None,
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None
 ) -> DataFrameInterchange:
     """
     Retrieve portfolio holdings for a given security.
@@ -114,11 +237,87 @@ def get_holding(
         Internal Morningstar security identifier(s).
     performance_id : str or list of str, optional
         Morningstar performance identifier(s).
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are built from Arrow
+        record batches without a pandas round trip.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
+    top_n : int, optional
+        Keep only the top_n largest holdings by weighting of each fund. The
+        endpoint page size is set accordingly, so the rest of the portfolio
+        is not downloaded.
+    page_size : int, optional
+        Fetch the holdings page by page, page_size holdings per holding type
+        per request, stopping at the last page, at max_pages or once top_n
+        holdings are collected. By default each fund is fetched in one
+        request.
+    max_pages : int, optional
+        Maximum pages fetched per fund, with page_size.
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A dataframe-like structure containing detailed holdings data.
+
+    Notes
+    -----
+    For lazy paging (e.g. stopping at the first page containing a given
+    holding), iterate ``HoldingExtractor(...).pages(page_size)`` directly.
+    """
+    extractor = HoldingExtractor(
+        ticker=ticker,
+        isin=isin,
+        security_id=security_id,
+        performance_id=performance_id,
+        top_n=top_n
+    )
+
+    if page_size is not None:
+        return asyncio.run(extractor.run_paged(engine=engine, page_size=page_size, max_pages=max_pages))
+    return asyncio.run(extractor.run(engine=engine))
+
+
+@with_deadline
+def get_holding_matrix(
+    ticker: Union[str, List[str]] = None, 
+    isin: Union[str, List[str]] = None, 
+    security_id: Union[str, List[str]] = None, 
+    performance_id: Union[str, List[str]] = None,
+    deadline: Optional[float] = None
+) -> HoldingMatrix:
+    """
+    Retrieve the holdings of several funds as a sparse weight matrix.
+
+    Wraps `get_holding` and builds a HoldingMatrix for cross-fund analytics:
+    pairwise overlap, shared holdings, fund of funds look-through and
+    exposure by sector, country or currency. Requires scipy
+    (`pip install morningpy[analytics]`).
+
+    Parameters
+    ----------
+    ticker : str or list of str, optional
+        The ticker symbol(s) of the funds.
+    isin : str or list of str, optional
+        The ISIN code(s) of the funds.
+    security_id : str or list of str, optional
+        Internal Morningstar security identifier(s).
+    performance_id : str or list of str, optional
+        Morningstar performance identifier(s).
+    deadline : float, optional
+        Total time budget in seconds for the whole call.
+
+    Returns
+    -------
+    HoldingMatrix
+        Fund × security weights with the security attributes.
+
+    Examples
+    --------
+    >>> matrix = get_holding_matrix(ticker=["SPY", "IVV", "QQQ"])
+    >>> matrix.overlap()
+    >>> matrix.exposure("country", look_through=True)
     """
     extractor = HoldingExtractor(
         ticker=ticker,
@@ -126,5 +325,113 @@ def get_holding(
         security_id=security_id,
         performance_id=performance_id
     )
+
+    return HoldingMatrix.from_holdings(asyncio.run(extractor.run()))
+
+
+@with_deadline
+def update_holding_snapshots(
+    store: Union[str, HoldingSnapshotStore],
+    ticker: Union[str, List[str]] = None, 
+    isin: Union[str, List[str]] = None, 
+    security_id: Union[str, List[str]] = None, 
+    performance_id: Union[str, List[str]] = None,
+    deadline: Optional[float] = None
+):
+    """
+    Download holdings and record the changes in a local snapshot store.
+
+    Each fund is fetched once (see `get_holding_bundle`) and stored under
+    its own portfolio date, so running this daily only appends the
+    holdings that changed since the last reported portfolio.
+
+    Parameters
+    ----------
+    store : str or HoldingSnapshotStore
+        Store, or its directory.
+    ticker : str or list of str, optional
+        The ticker symbol(s) of the funds.
+    isin : str or list of str, optional
+        The ISIN code(s) of the funds.
+    security_id : str or list of str, optional
+        Internal Morningstar security identifier(s).
+    performance_id : str or list of str, optional
+        Morningstar performance identifier(s).
+    deadline : float, optional
+        Total time budget in seconds for the whole call.
+
+    Returns
+    -------
+    pd.DataFrame
+        Change records written; empty if no fund reported a new portfolio.
+
+    Examples
+    --------
+    >>> update_holding_snapshots("holdings_store/", ticker=["SPY", "QQQ"])
+    >>> HoldingSnapshotStore("holdings_store/").diff(spy_id, "2025-10-31", "2025-11-30")
+    """
+    if not isinstance(store, HoldingSnapshotStore):
+        store = HoldingSnapshotStore(store)
+
+    extractor = HoldingBundleExtractor(
+        ticker=ticker,
+        isin=isin,
+        security_id=security_id,
+        performance_id=performance_id
+    )
+    holdings, info = asyncio.run(extractor.run())
+    dates = info.set_index("security_id")["portfolio_latest_date_footer"].dropna().to_dict()
+    return store.put(holdings[holdings["parent_security_id"].isin(dates)], dates)
+
+
+@with_deadline
+def get_holding_bundle(
+    ticker: Union[str, List[str]] = None, 
+    isin: Union[str, List[str]] = None, 
+    security_id: Union[str, List[str]] = None, 
+    performance_id: Union[str, List[str]] = None,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
+) -> HoldingBundle:
+    """
+    Retrieve portfolio holdings and holding metadata in one pass.
+
+    Equivalent to calling `get_holding` and `get_holding_info` for the same
+    securities, but each fund payload is downloaded once and processed into
+    both results.
+
+    Parameters
+    ----------
+    ticker : str or list of str, optional
+        The ticker symbol(s) of the security.
+    isin : str or list of str, optional
+        The ISIN code(s) of the security.
+    security_id : str or list of str, optional
+        Internal Morningstar security identifier(s).
+    performance_id : str or list of str, optional
+        Morningstar performance identifier(s).
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine of both results.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
+
+    Returns
+    -------
+    HoldingBundle
+        Named tuple (holdings, info) of dataframe-like structures, as
+        returned by `get_holding` and `get_holding_info`.
+
+    Examples
+    --------
+    >>> holdings, info = get_holding_bundle(ticker=["SPY", "QQQ"])
+    """
+    extractor = HoldingBundleExtractor(
+        ticker=ticker,
+        isin=isin,
+        security_id=security_id,
+        performance_id=performance_id
+    )
     
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
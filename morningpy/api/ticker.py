@@ -57,7 +57,8 @@ def search_tickers(
     fund_equity_style_box: Union[str, List[str], None] = None,
     fund_fixed_income_style_box: Union[str, List[str], None] = None,
     fund_alternative_style_box: Union[str, List[str], None] = None,
-    exact_match: bool = False
+    exact_match: bool = False,
+    categorical: bool = False
 ) -> pd.DataFrame:
     """
     Search for financial securities using multiple filter criteria.
@@ -177,6 +178,10 @@ def search_tickers(
         Matching mode for string-based filters:
         - False: Case-insensitive partial matching (contains)
         - True: Exact matching (case-sensitive equality)
+    categorical : bool, default False
+        If True, low-cardinality columns (security_type, country, exchange,
+        ratings, style boxes...) are returned as pandas category dtype, which
+        is much smaller in memory. If False, they are returned as plain strings.
 
     Returns
     -------
@@ -311,7 +316,9 @@ def search_tickers(
     }
     
     extractor = TickerExtractor()
-    return extractor.search_tickers(filters=filters, exact_match=exact_match)
+    return extractor.search_tickers(
+        filters=filters, exact_match=exact_match, categorical=categorical
+    )
 
 def convert(
     ticker: Optional[str] = None,
@@ -1,9 +1,12 @@
 import asyncio
-from typing import Union, List, Literal
+from typing import Union, List, Literal, Optional
 
 from morningpy.extractor.timeseries import *
+from morningpy.core.config import CoreConfig
+from morningpy.core.decorator import with_deadline
 from morningpy.core.interchange import DataFrameInterchange
 
+@with_deadline
 def get_intraday_timeseries(
     ticker: str = None, 
     isin: str = None, 
@@ -12,7 +15,9 @@ def get_intraday_timeseries(
     start_date: str = None,
     end_date: str = None,
     frequency: Literal["1min", "5min", "10min", "15min", "30min", "60min"] = None,
-    pre_after: Literal[True, False] = False
+    pre_after: Literal[True, False] = False,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve intraday time series data for a security.
@@ -41,10 +46,17 @@ def get_intraday_timeseries(
         Intraday sampling frequency.
     pre_after : bool, default False
         Whether to include pre-market and after-market trading sessions.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are built from Arrow
+        record batches without a pandas round trip.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A standardized dataframe-like structure containing intraday OHLCV data.
     """
     extractor = IntradayTimeseriesExtractor(
@@ -58,9 +70,10 @@ def get_intraday_timeseries(
         pre_after=pre_after
     )
     
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
 
 
+@with_deadline
 def get_historical_timeseries(
     ticker: Union[str, List[str]] = None, 
     isin: Union[str, List[str]] = None, 
@@ -69,7 +82,9 @@ def get_historical_timeseries(
     start_date: str = None,
     end_date: str = None,
     frequency: Literal["daily", "weekly", "monthly"] = None,
-    pre_after: Literal[True, False] = False
+    pre_after: Literal[True, False] = False,
+    engine: CoreConfig.EngineLiteral = "pandas",
+    deadline: Optional[float] = None
 ) -> DataFrameInterchange:
     """
     Retrieve historical time series data for one or multiple securities.
@@ -96,10 +111,17 @@ def get_historical_timeseries(
         Sampling frequency for the time series.
     pre_after : bool, default False
         Whether to include pre-market and after-market sessions when available.
+    engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+        Output engine. "arrow", "polars" and "duckdb" are built from Arrow
+        record batches without a pandas round trip.
+    deadline : float, optional
+        Total time budget in seconds for the whole call. Requests still
+        running when it expires are cancelled and the completed results are
+        returned, flagged as partial (PartialResultWarning).
 
     Returns
     -------
-    DataFrameInterchange
+    DataFrameInterchange or engine object
         A standardized dataframe-like structure containing historical OHLCV data.
     """
     extractor = HistoricalTimeseriesExtractor(
@@ -113,4 +135,4 @@ def get_historical_timeseries(
         pre_after=pre_after
     )
     
-    return asyncio.run(extractor.run())
+    return asyncio.run(extractor.run(engine=engine))
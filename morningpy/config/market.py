@@ -103,6 +103,20 @@ class MarketFairValueConfig:
         "overvaluated": "overvaluedStocks",
     }
     
+    FLATTEN_SPEC = {
+        "base": {
+            "securityID": ("meta", "securityID"),
+            "performanceID": ("meta", "performanceID"),
+            "companyID": ("meta", "companyID"),
+            "exchange": ("meta", "exchange"),
+            "ticker": ("meta", "ticker"),
+        },
+        "points": "fields",
+        "value_column": "{key}",
+        "require_value": True,
+        "exclude_properties": ["date", "currency"],
+    }
+    
     RENAME_COLUMNS = {
         "securityID":"security_id",
         "performanceID":"performance_id",
@@ -253,6 +267,13 @@ class MarketMoversConfig:
         "actives"
     }
     
+    FLATTEN_SPEC = {
+        "points": None,
+        "value_column": "{key}",
+        "require_value": True,
+        "exclude_properties": ["date", "currency"],
+    }
+    
     RENAME_COLUMNS = {
         "preMarketNetChange":"pre_market_net_change",
         "openPrice":"open_price",
@@ -321,6 +342,21 @@ class MarketCommoditiesConfig:
     
     API_URL = "https://www.morningstar.com/api/v2/markets/commodities"
     
+    FLATTEN_SPEC = {
+        "base": {
+            "id": "id",
+            "instrument": "instrument",
+            "instrumentID": "instrumentID",
+            "name": "name",
+            "exchange_name": "exchange",
+            "category": "category",
+        },
+        "points": "dataPoints",
+        "value_column": "{key}_value",
+        "exclude_properties": ["date", "currency"],
+        "extra_keys": ["exchange"],
+    }
+    
     RENAME_COLUMNS = {
         "instrumentID":"instrument_id",
         "netChange_exchange":"exchange",
@@ -334,6 +370,7 @@ class MarketCommoditiesConfig:
         "category",
         "name",
         "instrument_id",
+        "exchange_name",
         "exchange",
         "option_expiration_date",
         "last_price",
@@ -350,6 +387,21 @@ class MarketCurrenciesConfig:
     
     API_URL = "https://www.morningstar.com/api/v2/markets/currencies"
     
+    FLATTEN_SPEC = {
+        "base": {
+            "id": "id",
+            "instrumentID": "instrumentID",
+            "label": "label",
+            "name": "name",
+            "category": "category",
+            "bidPriceDecimals": "bidPriceDecimals",
+        },
+        "points": "dataPoints",
+        "value_column": "{key}_value",
+        "exclude_properties": ["date", "currency"],
+        "extra_keys": ["exchange"],
+    }
+    
     RENAME_COLUMNS = {
         "instrumentID":"instrument_id",
         "bidPriceDecimals":"bid_price_decimals",
@@ -369,4 +421,19 @@ class MarketCurrenciesConfig:
         "bid_price",
         "net_change",
         "percent_net_change"
-    ]
\ No newline at end of file
+    ]
+
+class MarketPollerConfig:
+
+    FEEDS = ["movers", "indexes", "currencies", "commodities"]
+
+    KEYS = {
+        "movers": ["category", "performance_id"],
+        "indexes": ["category", "security_id"],
+        "currencies": ["instrument_id"],
+        "commodities": ["instrument_id"],
+    }
+
+    IGNORED_COLUMNS = {
+        "movers": ["updated_on"],
+    }
@@ -38,6 +38,20 @@ class FinancialStatementConfig:
         "income-statement":"IncomeStatement"
     }
 
+    LAYOUTS = ("wide", "long")
+
+    LINE_ITEM_SEPARATOR = " > "
+
+    LABEL_CACHE_SIZE = 4096
+
+    LONG_CATEGORICAL_COLUMNS = [
+        "security_id",
+        "security_label",
+        "statement_type",
+        "line_item",
+        "period"
+    ]
+
 
 class HoldingConfig:
     
@@ -56,6 +70,18 @@ class HoldingConfig:
         "component": "sal-mip-holdings",
         "version": "4.69.0"
     }
+
+    HOLDING_PAGES = ["equityHoldingPage", "boldHoldingPage", "otherHoldingPage"]
+
+    PAGE_SIZE_PARAMS = ["premiumNum", "freeNum"]
+
+    PAGE_NUMBER_PARAM = "pageNumber"
+
+    PAGE_SIZE = 100
+
+    STREAM_BATCH_SIZE = 5000
+
+    STREAM_CHUNK_SIZE = 64 * 1024
     
     FIELD_MAPPING = {
         "child_security_id": "secId",
@@ -232,6 +258,34 @@ class HoldingConfig:
     ]
 
 
+class HoldingMatrixConfig:
+
+    KEY_COLUMNS = ("child_security_id", "isin", "security_name")
+
+    WEIGHT_COLUMN = "weighting"
+
+    WEIGHT_SCALE = 100.0
+
+    EXPOSURE_COLUMNS = ("sector", "country", "currency")
+
+    OVERLAP_METHODS = ("weight", "count", "cosine")
+
+    MISSING_GROUP = "N/A"
+
+    LOOKTHROUGH_MAX_DEPTH = 10
+
+
+class HoldingSnapshotConfig:
+
+    TRACKED_COLUMNS = ("weighting", "number_of_share")
+
+    ADD, REMOVE, CHANGE, SNAPSHOT = "add", "remove", "change", "snapshot"
+
+    DATA_DIR = "data"
+
+    COMPRESSION = "zstd"
+
+
 class HoldingInfoConfig:
     
     REQUIRED_AUTH: AuthType = AuthType.API_KEY
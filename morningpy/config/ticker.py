@@ -2,6 +2,28 @@ from typing import Literal
 
 class TickerConfig:
     
+    SEARCH_INDEX_COLUMNS = ["security_label", "ticker", "isin"]
+    
+    NGRAM_SIZE = 3
+    
+    SUGGEST_COLUMNS = ["security_label", "ticker"]
+    
+    FUZZY_MAX_DISTANCE = 2
+    
+    FUZZY_PREFIX_LENGTH = 7
+    
+    CATEGORICAL_COLUMNS = [
+        "security_type", "security_type_id", "sector", "industry", "country",
+        "country_id", "currency", "exchange_id", "exchange", "asset_class",
+        "region", "bond_sector", "credit_rating", "market_development",
+        "return_type", "size", "style", "strategic_beta", "stock_style_box",
+        "dividend_distribution_frequency", "broad_category_group",
+        "morningstar_category", "distribution_fund_type", "replication_method",
+        "fund_star_rating", "morningstar_risk_rating", "medalist_rating",
+        "sustainability_rating", "fund_equity_style_box",
+        "fund_fixed_income_style_box", "fund_alternative_style_box"
+    ]
+    
     IdLiteral = Literal["ticker", "isin", "performance_id", "security_id"]
     
     SecurityTypeLiteral = Literal["fund", "index", "etf", "stock"]
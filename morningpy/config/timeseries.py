@@ -56,6 +56,10 @@ class IntradayTimeseriesConfig:
     ]
     
     FINAL_COLUMNS = STRING_COLUMNS + NUMERIC_COLUMNS
+    
+    DATE_INPUT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+    
+    DATE_OUTPUT_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 class HistoricalTimeseriesConfig:
@@ -108,4 +112,8 @@ class HistoricalTimeseriesConfig:
         "volume",
     ]
     
-    FINAL_COLUMNS = STRING_COLUMNS + NUMERIC_COLUMNS
\ No newline at end of file
+    FINAL_COLUMNS = STRING_COLUMNS + NUMERIC_COLUMNS
+    
+    DATE_INPUT_FORMAT = "%Y-%m-%d"
+    
+    DATE_OUTPUT_FORMAT = "%Y-%m-%d"
@@ -8,6 +8,7 @@ from typing import Dict, Optional, Any
 
 from .config import CoreConfig
 from .cache import Cache
+from .deadline import bounded_timeout
 
 
 class AuthType(Enum):
@@ -63,7 +64,7 @@ class AuthManager:
         self._api_key: Optional[str] = None
         self._token_real_time: Optional[str] = None
         self._waf_token: Optional[str] = None
-        self.cache = Cache()
+        self.cache = Cache(CoreConfig.AUTH_CACHE_FILE)
 
     def get_maas_token(self, force_refresh: bool = False) -> str:
         """
@@ -258,12 +259,42 @@ class AuthManager:
         - Uses headless mode to avoid opening visible browser window
         - Searches for cookies containing 'waf' or 'token' in name
         - Browser cleanup handled in finally block
+        - If CoreConfig.URLS has a "waf_token" entry (e.g. a replay server),
+          the token is read from that URL instead and no browser is launched
         """
         cached = self.cache.get("waf_token")
 
         if self._waf_token and not force_refresh:
             return self._waf_token
 
+        if self._urls.get("waf_token"):
+            try:
+                waf_token = self._fetch_url(self._urls["waf_token"]).text.strip()
+            except Exception as e:
+                print(f"⚠️ WAF token fetch failed: {e}")
+                waf_token = ""
+        else:
+            waf_token = self._browser_waf_token(url)
+
+        if not waf_token:
+            if cached:
+                print("⚠️ Empty WAF token, using cached value.")
+                return cached
+            raise ValueError("WAF token not found in response or cache.")
+
+        self._waf_token = waf_token
+        self.cache.set("waf_token", waf_token)
+        return waf_token
+
+    def _browser_waf_token(self, url: str) -> str:
+        """
+        Load a page in headless Chrome and read the WAF token cookie.
+
+        Returns
+        -------
+        str
+            WAF token, or an empty string on failure.
+        """
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -283,7 +314,7 @@ class AuthManager:
             driver = webdriver.Chrome(options=chrome_options)
             driver.get(url)
 
-            WebDriverWait(driver, 10).until(
+            WebDriverWait(driver, bounded_timeout(10)).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
 
@@ -302,14 +333,6 @@ class AuthManager:
             if driver:
                 driver.quit()
 
-        if not waf_token:
-            if cached:
-                print("⚠️ Empty WAF token, using cached value.")
-                return cached
-            raise ValueError("WAF token not found in response or cache.")
-
-        self._waf_token = waf_token
-        self.cache.set("waf_token", waf_token)
         return waf_token
 
     def _fetch_url(self, url: str) -> requests.Response:
@@ -332,19 +355,23 @@ class AuthManager:
             If response status code is not 2xx
         requests.Timeout
             If request exceeds 20 second timeout
+        DeadlineExceededError
+            If the current deadline has expired
         
         Notes
         -----
-        Uses default headers from CONFIG and 20 second timeout
+        Uses default headers from CONFIG and 20 second timeout, bounded by
+        the remaining budget of the current deadline
         """
-        response = requests.get(url, headers=self._headers, timeout=20)
+        response = requests.get(url, headers=self._headers, timeout=bounded_timeout(20))
         response.raise_for_status()
         return response
 
     def get_headers(
         self, 
         auth_type: AuthType, 
-        url: Optional[str] = None
+        url: Optional[str] = None,
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Build HTTP headers with appropriate authentication for API requests.
@@ -355,6 +382,9 @@ class AuthManager:
             Type of authentication to apply (API_KEY, BEARER_TOKEN, WAF_TOKEN, or NONE)
         url : str, optional
             URL required for WAF token generation (only used when auth_type is WAF_TOKEN)
+        force_refresh : bool, default=False
+            If True, fetch a new token instead of the in-memory one, e.g.
+            after the server rejected it
         
         Returns
         -------
@@ -379,12 +409,12 @@ class AuthManager:
         headers = self._headers.copy()
 
         if auth_type == AuthType.API_KEY:
-            headers["Apikey"] = self.get_api_key()
+            headers["Apikey"] = self.get_api_key(force_refresh=force_refresh)
 
         elif auth_type == AuthType.BEARER_TOKEN:
-            headers["authorization"] = f"Bearer {self.get_maas_token()}"
+            headers["authorization"] = f"Bearer {self.get_maas_token(force_refresh=force_refresh)}"
 
         elif auth_type == AuthType.WAF_TOKEN:
-            headers["x-aws-waf-token"] = self.get_waf_token(url)
+            headers["x-aws-waf-token"] = self.get_waf_token(url, force_refresh=force_refresh)
 
         return headers
\ No newline at end of file
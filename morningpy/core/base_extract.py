@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
 import aiohttp
+import warnings
 from typing import Any, List, Tuple, Dict, Optional, Union, Type
 import pandas as pd
+import pyarrow as pa
 
-from morningpy.core.decorator import save_dataframe_mock,save_api_response,save_api_request
+from morningpy.core.dataframe_schema import ConversionPlan
+from morningpy.core.decorator import instrumented,save_dataframe_mock,save_api_response,save_api_request
 from morningpy.core.interchange import DataFrameInterchange
+from morningpy.core.resilience import FailureReport
+from morningpy.core.sink import BaseSink
 from morningpy.core.config import CoreConfig
+from morningpy.core.deadline import Deadline, deadline_scope
+from morningpy.core.error import PartialResultWarning
+from morningpy.core import instrumentation
 
 
 class BaseExtractor(ABC):
@@ -31,6 +39,11 @@ class BaseExtractor(ABC):
         Query parameters for API requests
     max_requests : int
         Maximum number of concurrent requests allowed
+    failures : FailureReport
+        Failed requests of the last run, with their error and whether they
+        are worth re-queuing
+    partial : bool
+        True if the deadline of the last run cut off some requests
     """
 
     schema: Optional[Type] = None
@@ -48,6 +61,8 @@ class BaseExtractor(ABC):
         self.url: Union[str, List[str]] = ""
         self.params: Union[Dict[str, Any], List[Dict[str, Any]], None] = None
         self.max_requests: int = CoreConfig.MAX_REQUESTS
+        self.failures = FailureReport()
+        self.partial = False
         
     @abstractmethod
     def _check_inputs(self) -> None:
@@ -86,6 +101,53 @@ class BaseExtractor(ABC):
             Processed and normalized data
         """
         raise NotImplementedError
+
+    def _process_response_arrow(self, response: Any) -> pa.Table:
+        """
+        Transform API response into an Arrow table.
+
+        Used by the Arrow engines ("arrow", "polars", "duckdb"). The
+        timeseries, holdings and financial statement extractors override
+        this to build Arrow columns straight from the response; the default
+        converts the `_process_response` DataFrame.
+
+        Parameters
+        ----------
+        response : Any
+            Raw API response data (typically dict or list)
+
+        Returns
+        -------
+        pa.Table
+            Processed and normalized data
+        """
+        return pa.Table.from_pandas(self._process_response(response), preserve_index=False)
+
+    def _arrow_table(self, columns: Dict[str, List[Any]]) -> pa.Table:
+        """
+        Build an Arrow table from column lists, typed from the schema.
+
+        Columns with a schema type are converted directly to that type instead
+        of being inferred; if the values do not fit it, the type is inferred.
+
+        Parameters
+        ----------
+        columns : Dict[str, List[Any]]
+            Column name → values, in output order.
+
+        Returns
+        -------
+        pa.Table
+            Table with one column per entry.
+        """
+        types = ConversionPlan.for_schema(self.schema).arrow_types if self.schema else {}
+        arrays = {}
+        for name, values in columns.items():
+            try:
+                arrays[name] = pa.array(values, type=types.get(name))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays[name] = pa.array(values)
+        return pa.table(arrays)
     
     @save_dataframe_mock(activate=False) 
     async def _call_api(self) -> pd.DataFrame:
@@ -98,22 +160,18 @@ class BaseExtractor(ABC):
             Concatenated results from all successful API calls,
             empty DataFrame if all requests failed
         """
-        timeout = aiohttp.ClientTimeout(total=self.client.DEFAULT_TIMEOUT)
-
-        async with aiohttp.ClientSession(
-            timeout=timeout,
-            headers=self.client.headers
-        ) as session:
+        async with self._session() as session:
             self._check_requests()
             responses = await self._fetch_responses(session, self.requests)
 
             dfs = []
-            for res in responses:
+            for i, res in enumerate(responses):
                 if isinstance(res, Exception):
-                    self.client.logger.error(f"API call failed: {res}")
+                    self._record_failure(i, res)
                     continue
             
-                df = self._process_response(res)
+                with instrumentation.stage("process_response", self._request_url(i)):
+                    df = self._process_response(res)
                 if not isinstance(df, pd.DataFrame):
                     self.client.logger.error(
                         f"_process_response must return DataFrame, got {type(df)}"
@@ -122,7 +180,116 @@ class BaseExtractor(ABC):
 
                 dfs.append(df)
             
-            return pd.concat(dfs, ignore_index=True, sort=False) if dfs else pd.DataFrame()
+            with instrumentation.stage("concat", parts=len(dfs)):
+                return self._concat(dfs) if dfs else pd.DataFrame()
+
+    def _concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine the processed responses of a run.
+
+        Extractors override this when a plain concat loses information,
+        e.g. to keep categorical columns categorical.
+        """
+        return pd.concat(dfs, ignore_index=True, sort=False)
+
+    async def _call_api_arrow(self) -> pa.Table:
+        """
+        Execute asynchronous API calls and aggregate results as Arrow.
+        
+        Returns
+        -------
+        pa.Table
+            Concatenated results from all successful API calls,
+            empty table if all requests failed
+        """
+        async with self._session() as session:
+            self._check_requests()
+            responses = await self._fetch_responses(session, self.requests)
+
+        tables = []
+        for i, res in enumerate(responses):
+            if isinstance(res, Exception):
+                self._record_failure(i, res)
+                continue
+
+            with instrumentation.stage("process_response", self._request_url(i)):
+                table = self._process_response_arrow(res)
+            if not isinstance(table, pa.Table):
+                self.client.logger.error(
+                    f"_process_response_arrow must return pa.Table, got {type(table)}"
+                )
+                continue
+            if table.num_columns:
+                tables.append(table)
+
+        if not tables:
+            return pa.table({})
+        with instrumentation.stage("concat", parts=len(tables)):
+            return pa.concat_tables(tables, promote_options="permissive")
+
+    @instrumented
+    async def run_to_sink(self, sink: BaseSink) -> int:
+        """
+        Execute the pipeline, streaming each processed response into a sink.
+
+        Every response is processed on the Arrow path, schema-cast and written
+        as its own batch, so the full result is never concatenated in memory.
+        The sink is left open so several extractors can share it.
+
+        Parameters
+        ----------
+        sink : BaseSink
+            Destination, e.g. ``open_sink("holdings/", partition_cols=["security_id"])``.
+
+        Returns
+        -------
+        int
+            Number of rows written by this run. Failed requests are listed
+            in self.failures.
+        """
+        self._check_inputs()
+        with instrumentation.stage("build_request"):
+            self._build_request()
+        self.failures = FailureReport()
+
+        async with self._session() as session:
+            self._check_requests()
+            responses = await self._fetch_responses(session, self.requests)
+
+        rows_before = sink.rows_written
+        for i, res in enumerate(responses):
+            responses[i] = None  # release the raw payload once processed
+            if isinstance(res, Exception):
+                self._record_failure(i, res)
+                continue
+
+            with instrumentation.stage("process_response", self._request_url(i)):
+                table = self._process_response_arrow(res)
+            if not isinstance(table, pa.Table):
+                self.client.logger.error(
+                    f"_process_response_arrow must return pa.Table, got {type(table)}"
+                )
+                continue
+            sink.write_batch(self._validate_and_convert_arrow(table))
+
+        return sink.rows_written - rows_before
+
+    def _session(self) -> aiohttp.ClientSession:
+        """
+        HTTP session for a run, traced when instrumentation is enabled.
+        """
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.client.DEFAULT_TIMEOUT),
+            headers=self.client.headers,
+            trace_configs=instrumentation.trace_configs(),
+        )
+
+    def _request_url(self, index: int) -> Optional[str]:
+        """URL of the request at index, for instrumentation labels."""
+        if index >= len(self.requests):
+            return None
+        request = self.requests[index]
+        return request.get("url") if isinstance(request, dict) else request[0]
 
     @save_api_response(activate=False)
     async def _fetch_responses(self, session: aiohttp.ClientSession, 
@@ -144,6 +311,22 @@ class BaseExtractor(ABC):
         """
         return await self.client.fetch_all(session, requests)
 
+    def _record_failure(self, index: int, error: BaseException) -> None:
+        """
+        Log a failed request and add it to the failure report.
+
+        Parameters
+        ----------
+        index : int
+            Position of the request in self.requests.
+        error : BaseException
+            Exception returned for that request.
+        """
+        request = self.requests[index] if index < len(self.requests) else None
+        failure = self.failures.add(request, error)
+        label = f" [{failure.security_id}]" if failure.security_id else ""
+        self.client.logger.error(f"API call failed{label}: {error}")
+
     def _check_requests(self) -> None:
         """
         Validate request count against maximum allowed.
@@ -162,72 +345,121 @@ class BaseExtractor(ABC):
     def _validate_and_convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply schema-based type validation and conversion to DataFrame.
+
+        The schema is compiled once per class into a cached `ConversionPlan`,
+        so repeated runs skip type-hint resolution and columns that already
+        have the target dtype.
         """
         if self.schema is None:
             return df
 
-        schema_instance = self.schema()
-        dtype_map = schema_instance.to_dtype_dict()
+        plan = ConversionPlan.for_schema(self.schema)
+        with instrumentation.stage("schema_conversion", rows=len(df)):
+            return plan.apply(df, logger=self.client.logger)
 
-        # Colonnes du schéma présentes dans les données
-        schema_cols_in_data = set(dtype_map.keys()) & set(df.columns)
-        
-        # Colonnes du schéma absentes des données
-        missing_cols = set(dtype_map.keys()) - set(df.columns)
-        if missing_cols:
-            self.client.logger.debug(
-                f"Schema columns not in data (skipped): {missing_cols}"
-            )
-
-        # Conversion uniquement des colonnes présentes
-        for col in schema_cols_in_data:
-            dtype = dtype_map[col]
-            
-            try:
-                if dtype == "string":
-                    df[col] = df[col].astype("string")
-                elif dtype == "Int64":
-                    df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-                elif dtype in ("float32", "float64"):
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-                elif dtype == "boolean":
-                    df[col] = df[col].astype("boolean")
-                else:
-                    df[col] = df[col].astype(dtype)
-
-            except Exception as e:
-                self.client.logger.warning(
-                    f"Failed to convert column '{col}' to {dtype}: {e}"
-                )
-        
-        # Colonnes supplémentaires dans les données
-        extra_cols = set(df.columns) - set(dtype_map.keys())
-        if extra_cols:
-            self.client.logger.debug(
-                f"Extra columns in data (preserved): {extra_cols}"
-            )
+    def _validate_and_convert_arrow(self, table: pa.Table) -> pa.Table:
+        """
+        Apply schema-based type conversion to an Arrow table.
+        """
+        if self.schema is None:
+            return table
 
-        return df
+        plan = ConversionPlan.for_schema(self.schema)
+        with instrumentation.stage("schema_conversion", rows=table.num_rows):
+            return plan.apply_arrow(table, logger=self.client.logger)
 
-    async def run(self) -> DataFrameInterchange:
+    @instrumented
+    async def run(
+        self,
+        engine: CoreConfig.EngineLiteral = "pandas",
+        return_failures: bool = False,
+        deadline: Union[float, Deadline, None] = None
+    ) -> Any:
         """
         Execute the complete data extraction pipeline.
         
         Pipeline steps:
         1. Validate inputs (_check_inputs)
         2. Build requests (_build_request)
-        3. Execute API calls (_call_api)
+        3. Execute API calls (_call_api, or _call_api_arrow for Arrow engines)
         4. Validate and convert types (_validate_and_convert_types)
+
+        Parameters
+        ----------
+        engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+            Output engine. "arrow", "polars" and "duckdb" run the Arrow path:
+            responses are processed into Arrow tables, built directly by
+            extractors overriding `_process_response_arrow` and converted from
+            the `_process_response` DataFrame otherwise. Other engines convert
+            the pandas result.
+        return_failures : bool, default False
+            Also return the FailureReport of the run. Failed requests are
+            skipped either way; the report is always kept in self.failures.
+        deadline : float or Deadline, optional
+            Total budget in seconds. Request timeouts and retry sleeps are
+            bounded by the remaining budget; requests still running when it
+            expires are cancelled and the completed ones are returned, flagged
+            as partial. Defaults to the enclosing deadline, if any.
         
         Returns
         -------
-        DataFrameInterchange
-            Wrapper containing the final processed DataFrame
+        DataFrameInterchange or engine object
+            Wrapper containing the final processed DataFrame for "pandas",
+            otherwise the DataFrame, Table or relation of the requested engine.
+            With return_failures, a (result, FailureReport) tuple.
+            A result cut off by the deadline sets self.partial, warns with
+            PartialResultWarning and is flagged as ``attrs["partial"]``
+            (pandas) or ``morningpy.partial`` schema metadata (arrow).
+
+        Raises
+        ------
+        ValueError
+            If the requested engine is not supported.
         """
+        engine = engine.lower()
+        if engine not in CoreConfig.ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'.")
+
         self._check_inputs()
-        self._build_request()
+        with instrumentation.stage("build_request"):
+            self._build_request()
+        self.failures = FailureReport()
+
+        with deadline_scope(deadline) as scope:
+            if engine in CoreConfig.ARROW_ENGINES:
+                table = await self._call_api_arrow()
+                table = self._validate_and_convert_arrow(table)
+                self.partial = self._is_partial(scope)
+                result = DataFrameInterchange.arrow_to_engine(self._flag_partial(table), engine)
+            else:
+                df = await self._call_api()
+                df = self._validate_and_convert_types(df)
+                self.partial = self._is_partial(scope)
+                result = DataFrameInterchange(df).to_engine(engine)
+                if scope is not None and isinstance(result, pd.DataFrame):
+                    result.attrs["partial"] = self.partial
+
+        return (result, self.failures) if return_failures else result
 
-        df = await self._call_api()
-        df = self._validate_and_convert_types(df)
+    def _is_partial(self, deadline: Optional[Deadline]) -> bool:
+        """
+        Whether the deadline cut off some requests, warning if so.
+        """
+        if deadline is None or not deadline.expired or not self.failures:
+            return False
+        warnings.warn(
+            f"{type(self).__name__}: deadline of {deadline.seconds}s exceeded, "
+            f"returning partial results ({len(self.failures)}/{len(self.requests)} "
+            f"requests missing)",
+            PartialResultWarning,
+            stacklevel=3,
+        )
+        return True
 
-        return DataFrameInterchange(df)
\ No newline at end of file
+    def _flag_partial(self, table: pa.Table) -> pa.Table:
+        """Record the partial flag in the Arrow schema metadata."""
+        if not self.partial:
+            return table
+        metadata = dict(table.schema.metadata or {})
+        metadata[b"morningpy.partial"] = b"true"
+        return table.replace_schema_metadata(metadata)
\ No newline at end of file
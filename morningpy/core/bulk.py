@@ -0,0 +1,478 @@
+import json
+import logging
+import os
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.config import CoreConfig
+from morningpy.core.error import CircuitOpenError
+from morningpy.core.resilience import is_retryable
+from morningpy.core.sink import ParquetSink
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobManifest:
+    """
+    Append-only record of per-security completion for a bulk job.
+
+    The manifest is a JSON Lines file: a header line identifying the job,
+    then one line per security outcome. Appending (instead of rewriting a
+    JSON document) keeps each checkpoint O(batch) on large universes and
+    leaves earlier records intact if the process dies mid-write; a
+    truncated last line is ignored on load. The latest record of a
+    security wins.
+
+    Attributes
+    ----------
+    path : Path
+        Manifest file.
+    job : dict
+        Job identity (extractor and options) written in the header.
+    records : Dict[str, dict]
+        Latest record per security_id.
+    """
+
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: Union[str, Path], job: Dict[str, Any]):
+        """
+        Open or create the manifest.
+
+        Parameters
+        ----------
+        path : str or Path
+            Manifest file.
+        job : dict
+            Job identity. Must match the header of an existing manifest.
+
+        Raises
+        ------
+        ValueError
+            If the manifest belongs to a different job.
+        """
+        self.path = Path(path)
+        self.job = job
+        self.records: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._append([{"job": job}])
+
+    def _load(self) -> None:
+        """Replay the manifest, keeping the latest record per security."""
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring truncated manifest line in {self.path}")
+                    continue
+                if "job" in record:
+                    if record["job"] != self.job:
+                        raise ValueError(
+                            f"{self.path} belongs to another job: {record['job']}. "
+                            f"Use a different output directory."
+                        )
+                    continue
+                self.records[record["security_id"]] = record
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records in a single write and flush them to disk."""
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Checkpoint security outcomes.
+
+        Parameters
+        ----------
+        records : list of dict
+            One record per security with at least security_id and status.
+        """
+        if not records:
+            return
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for r in records:
+            previous = self.records.get(r["security_id"], {})
+            r.setdefault("attempts", previous.get("attempts", 0) + 1)
+            r.setdefault("updated", now)
+        self._append(records)
+        self.records.update((r["security_id"], r) for r in records)
+
+    @property
+    def completed(self) -> set:
+        """security_ids recorded as done."""
+        return {k for k, r in self.records.items() if r["status"] == self.DONE}
+
+    @property
+    def parts(self) -> set:
+        """Part files holding the rows of completed securities."""
+        return {
+            r["part"] for r in self.records.values()
+            if r["status"] == self.DONE and r.get("part")
+        }
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """security_id → last error of securities whose latest attempt failed."""
+        return {
+            k: r.get("error", "")
+            for k, r in self.records.items()
+            if r["status"] == self.FAILED
+        }
+
+    @property
+    def fatal(self) -> set:
+        """security_ids whose latest attempt failed with a non-retryable error."""
+        return {
+            k for k, r in self.records.items()
+            if r["status"] == self.FAILED and not r.get("retryable", True)
+        }
+
+
+@dataclass
+class JobReport:
+    """
+    Progress and throughput of a bulk job.
+
+    Attributes
+    ----------
+    total : int
+        Securities in the universe.
+    skipped : int
+        Securities already completed by a previous run.
+    completed : int
+        Securities completed by this run.
+    failed : Dict[str, str]
+        security_id → error for securities that failed in this run.
+    rows : int
+        Rows written by this run.
+    requests : int
+        Requests sent by this run.
+    elapsed : float
+        Seconds since the run started.
+    aborted : str, optional
+        Why the run stopped before the end of the universe (open circuit).
+    """
+
+    total: int = 0
+    skipped: int = 0
+    completed: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    rows: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+    aborted: Optional[str] = None
+
+    @property
+    def pending(self) -> int:
+        """Securities neither completed nor failed yet."""
+        return self.total - self.skipped - self.completed - len(self.failed)
+
+    @property
+    def securities_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        done = self.skipped + self.completed
+        return (
+            f"{done}/{self.total} done ({self.skipped} resumed), "
+            f"{len(self.failed)} failed, {self.rows} rows in {self.elapsed:.1f}s "
+            f"({self.securities_per_second:.1f} securities/s, "
+            f"{self.rows_per_second:.0f} rows/s)"
+        )
+
+
+class BulkJob:
+    """
+    Resumable download of one dataset for a whole security universe.
+
+    The universe is processed in batches of securities. Each batch builds
+    one extractor, sends its requests in windows of at most
+    ``extractor.max_requests`` concurrent requests, writes the rows of every
+    fully successful security to a new Parquet part file, then checkpoints
+    the outcome of each security, with the part file holding its rows, in
+    the manifest. Restarting the job with the same output directory skips
+    completed securities and retries the failed ones.
+
+    A part file counts only once the manifest references it: if the
+    process dies between writing a part file and checkpointing its batch,
+    the file is ignored by `read` and removed by the next `run`, whose
+    retry of the batch cannot duplicate its rows.
+
+    Layout of ``output_dir``::
+
+        manifest.jsonl
+        data/part-<run>-<batch>.parquet
+
+    Attributes
+    ----------
+    extractor_cls : Type[BaseExtractor]
+        Extractor built per batch as ``extractor_cls(security_id=batch, **options)``.
+    security_ids : List[str]
+        Deduplicated universe, in input order.
+    output_dir : Path
+        Job directory.
+    options : dict
+        Extra extractor arguments (e.g. statement_type).
+    batch_size : int
+        Securities per batch (and per part file).
+    manifest : JobManifest
+        Completion records.
+
+    Examples
+    --------
+    >>> universe = search_tickers(security_type="etf")
+    >>> job = BulkJob(HoldingExtractor, universe, "holdings_job/")
+    >>> report = await job.run()
+    >>> table = job.read()
+    """
+
+    def __init__(
+        self,
+        extractor_cls: Type[BaseExtractor],
+        universe: Union[pd.DataFrame, Iterable[str]],
+        output_dir: Union[str, Path],
+        options: Optional[Dict[str, Any]] = None,
+        batch_size: int = CoreConfig.BULK_BATCH_SIZE,
+        on_progress: Optional[Callable[[JobReport], None]] = None
+    ):
+        """
+        Initialize the job and open its manifest.
+
+        Parameters
+        ----------
+        extractor_cls : Type[BaseExtractor]
+            Extractor accepting a security_id list.
+        universe : pd.DataFrame or iterable of str
+            Securities to download: a frame with a security_id column (e.g.
+            the output of search_tickers) or security_ids.
+        output_dir : str or Path
+            Job directory, created if needed.
+        options : dict, optional
+            Extra extractor arguments, part of the job identity.
+        batch_size : int, default CoreConfig.BULK_BATCH_SIZE
+            Securities per batch.
+        on_progress : callable, optional
+            Called with the JobReport after each batch.
+
+        Raises
+        ------
+        ValueError
+            If batch_size is not positive or output_dir holds another job.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if isinstance(universe, pd.DataFrame):
+            universe = universe["security_id"].dropna()
+
+        self.extractor_cls = extractor_cls
+        self.security_ids = list(dict.fromkeys(universe))
+        self.output_dir = Path(output_dir)
+        self.options = dict(options or {})
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+        self.manifest = JobManifest(
+            self.output_dir / CoreConfig.BULK_MANIFEST_FILE,
+            job={"extractor": extractor_cls.__name__, "options": self.options},
+        )
+
+    @property
+    def data_dir(self) -> Path:
+        """Directory of the Parquet part files."""
+        return self.output_dir / "data"
+
+    def pending(self, retry_fatal: bool = False) -> List[str]:
+        """
+        security_ids still to download, in universe order.
+
+        Parameters
+        ----------
+        retry_fatal : bool, default False
+            Also include securities whose last attempt failed with a fatal
+            (non-retryable) error.
+        """
+        skip = self.manifest.completed
+        if not retry_fatal:
+            skip = skip | self.manifest.fatal
+        return [s for s in self.security_ids if s not in skip]
+
+    async def run(self, retry_fatal: bool = False) -> JobReport:
+        """
+        Download every pending security.
+
+        Parameters
+        ----------
+        retry_fatal : bool, default False
+            Also retry securities that previously failed with a fatal error.
+
+        Returns
+        -------
+        JobReport
+            Outcome of this run. Failures are also in the manifest and are
+            retried by the next run.
+        """
+        self._remove_orphan_parts()
+        pending = self.pending(retry_fatal)
+        report = JobReport(total=len(self.security_ids), skipped=len(self.security_ids) - len(pending))
+        run_token = uuid.uuid4().hex[:8]
+        start = time.perf_counter()
+
+        for number, offset in enumerate(range(0, len(pending), self.batch_size)):
+            batch = pending[offset:offset + self.batch_size]
+            records = await self._run_batch(batch, self.data_dir / f"part-{run_token}-{number:05d}.parquet", report)
+            self.manifest.record(records)
+
+            for r in records:
+                if r["status"] == JobManifest.DONE:
+                    report.completed += 1
+                    report.rows += r["rows"]
+                else:
+                    report.failed[r["security_id"]] = r["error"]
+            report.elapsed = time.perf_counter() - start
+
+            logger.info(f"[{self.extractor_cls.__name__}] {report}")
+            if self.on_progress is not None:
+                self.on_progress(report)
+            if report.aborted:
+                logger.warning(
+                    f"[{self.extractor_cls.__name__}] stopping: {report.aborted}. "
+                    f"Run the job again to resume."
+                )
+                break
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    async def _run_batch(self, batch: List[str], path: Path, report: JobReport) -> List[Dict[str, Any]]:
+        """
+        Fetch, process and write one batch of securities.
+
+        A security is written only if all of its requests succeeded and
+        its rows were accepted by the sink, so a retried security never
+        duplicates rows already on disk. A security failing to process or
+        write is recorded as failed without affecting the rest of the batch.
+
+        Returns
+        -------
+        list of dict
+            One manifest record per security of the batch.
+        """
+        try:
+            extractor = self.extractor_cls(security_id=batch, **self.options)
+            extractor._check_inputs()
+            extractor._build_request()
+        except Exception as e:
+            return [self._failure(s, e) for s in batch]
+
+        requests = extractor.requests
+        responses = await self._fetch(extractor, requests)
+        report.requests += len(requests)
+
+        per_security: Dict[str, List[Any]] = defaultdict(list)
+        for request, response in zip(requests, responses):
+            per_security[request["metadata"]["security_id"]].append(response)
+
+        records = []
+        with ParquetSink(path) as sink:
+            for security_id in batch:
+                results = per_security.get(security_id)
+                if not results:
+                    records.append(self._failure(security_id, "security_id not found in the ticker universe"))
+                    continue
+                error = next((r for r in results if isinstance(r, Exception)), None)
+                if error is not None:
+                    if isinstance(error, CircuitOpenError):
+                        report.aborted = str(error)
+                    records.append(self._failure(security_id, error))
+                    continue
+                try:
+                    tables = [
+                        extractor._validate_and_convert_arrow(extractor._process_response_arrow(r))
+                        for r in results
+                    ]
+                    tables = [t for t in tables if t.num_columns]
+                    # One write per security: a batch the sink rejects
+                    # leaves nothing of the security on disk.
+                    rows = 0
+                    if tables:
+                        table = pa.concat_tables(tables, promote_options="permissive")
+                        sink.write_batch(table)
+                        rows = table.num_rows
+                except Exception as e:
+                    records.append(self._failure(security_id, e))
+                    continue
+                record = {"security_id": security_id, "status": JobManifest.DONE, "rows": rows}
+                if rows:
+                    record["part"] = path.name
+                records.append(record)
+
+        return records
+
+    def _remove_orphan_parts(self) -> None:
+        """Delete part files of batches that were never checkpointed."""
+        parts = self.manifest.parts
+        for path in self.data_dir.glob("part-*.parquet"):
+            if path.name not in parts:
+                logger.warning(f"Removing {path}: its batch was interrupted before the checkpoint")
+                path.unlink()
+
+    @staticmethod
+    async def _fetch(extractor: BaseExtractor, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Send requests in windows of at most extractor.max_requests."""
+        responses: List[Any] = []
+        async with extractor._session() as session:
+            for offset in range(0, len(requests), extractor.max_requests):
+                window = requests[offset:offset + extractor.max_requests]
+                responses.extend(await extractor._fetch_responses(session, window))
+        return responses
+
+    @staticmethod
+    def _failure(security_id: str, error: Union[str, BaseException]) -> Dict[str, Any]:
+        retryable = False
+        if isinstance(error, BaseException):
+            retryable = is_retryable(error)
+            error = f"{type(error).__name__}: {error}"
+        return {
+            "security_id": security_id,
+            "status": JobManifest.FAILED,
+            "rows": 0,
+            "error": error,
+            "retryable": retryable,
+        }
+
+    def read(self) -> pa.Table:
+        """
+        Read everything downloaded so far.
+
+        Returns
+        -------
+        pa.Table
+            Concatenation of the part files referenced by the manifest,
+            empty if nothing was written.
+        """
+        paths = [str(self.data_dir / part) for part in sorted(self.manifest.parts)]
+        if not paths:
+            return pa.table({})
+        return ds.dataset(paths, format="parquet").to_table()
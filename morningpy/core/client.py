@@ -2,10 +2,17 @@ import aiohttp
 import requests
 import logging
 import asyncio
-from typing import Any, Dict, List, Tuple, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional
 
 from morningpy.core.auth import AuthManager
+from morningpy.core.deadline import bounded_timeout, current_deadline
 from morningpy.core.decorator import retry, save_api_response
+from morningpy.core.error import DeadlineExceededError
+from morningpy.core.hedging import HedgePolicy
+from morningpy.core import instrumentation
+from morningpy.core.payload_cache import PayloadCache, current_payload_cache
+from morningpy.core.resilience import CircuitBreaker, should_retry
 
 
 class BaseClient:
@@ -24,6 +31,12 @@ class BaseClient:
         Maximum number of retry attempts for failed requests
     BACKOFF_FACTOR : int
         Exponential backoff multiplier between retries
+    MAX_BACKOFF : int
+        Upper bound in seconds of a single retry wait, Retry-After included
+    BREAKER_FAILURE_THRESHOLD : int
+        Consecutive retryable failures that open the circuit of a host
+    BREAKER_RESET_TIMEOUT : int
+        Seconds an open circuit waits before letting a trial request through
     logger : logging.Logger
         Logger instance for client-level logs
     auth_type : str
@@ -36,18 +49,41 @@ class BaseClient:
         Persistent session for synchronous HTTP communication
     headers : dict
         Precomputed authentication headers
+    hedge_policy : HedgePolicy or None
+        Hedging of slow requests; defaults to the class-level policy
+        (None, i.e. disabled)
     
     Notes
     -----
-    - get_async is decorated with retry to automatically retry failed requests
+    - get_async is decorated with retry to automatically retry failed requests.
+      Only retryable errors (timeouts, connection errors, 408/425/429/5xx) are
+      retried, with jittered exponential backoff honoring Retry-After.
+    - Circuit breakers are kept per host and shared by all clients, so a
+      failing endpoint is not hammered by every extractor of a job.
+    - With a hedge_policy, a request slower than the learned latency
+      percentile of its endpoint is duplicated and the first answer wins.
+      Assign ``BaseClient.hedge_policy`` to enable it for every extractor.
+    - Token acquisition and requests emit instrumentation stages to the
+      registered hooks (see morningpy.core.instrumentation).
     - fetch_all dispatches async requests concurrently via asyncio.gather
     """
 
     DEFAULT_TIMEOUT = 20
-    MAX_RETRIES = 1
+    MAX_RETRIES = 3
     BACKOFF_FACTOR = 2
+    MAX_BACKOFF = 60
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_RESET_TIMEOUT = 30
 
-    def __init__(self, auth_type: str, url: Optional[str] = None):
+    _breakers: Dict[str, CircuitBreaker] = {}  # Class-level, one breaker per host
+    hedge_policy: Optional[HedgePolicy] = None  # Class-level default, shared budget
+
+    def __init__(
+        self,
+        auth_type: str,
+        url: Optional[str] = None,
+        hedge_policy: Optional[HedgePolicy] = None
+    ):
         """
         Initialize the BaseClient.
         
@@ -57,10 +93,14 @@ class BaseClient:
             Type of authentication mechanism registered with AuthManager
         url : str, optional
             Base URL for the endpoint, used to build authentication headers
+        hedge_policy : HedgePolicy, optional
+            Hedging policy of this client, overriding the class-level one
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.auth_type = auth_type
         self.url = url
+        if hedge_policy is not None:
+            self.hedge_policy = hedge_policy
         self.auth_manager = AuthManager()
         self.session = requests.Session()
         self.headers = self._get_headers()
@@ -74,9 +114,55 @@ class BaseClient:
         Dict[str, str]
             Authentication headers including tokens, user agent, etc.
         """
-        return self.auth_manager.get_headers(self.auth_type, self.url)
+        with instrumentation.stage("token", self.url, auth_type=str(self.auth_type)):
+            return self.auth_manager.get_headers(self.auth_type, self.url)
+
+    def refresh_headers(self) -> None:
+        """
+        Rebuild the authentication headers with a newly fetched token.
+
+        Long-lived clients call this when the server rejects their token
+        (401/403); later requests use the new headers.
+        """
+        with instrumentation.stage("token", self.url, auth_type=str(self.auth_type), refresh=True):
+            self.headers = self.auth_manager.get_headers(self.auth_type, self.url, force_refresh=True)
+
+    @classmethod
+    def breaker(cls, url: str) -> CircuitBreaker:
+        """
+        Circuit breaker of the host of a URL, created on first use.
 
-    @retry(max_retries=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR)
+        Parameters
+        ----------
+        url : str
+            Request URL.
+
+        Returns
+        -------
+        CircuitBreaker
+            Breaker shared by every request to that host.
+        """
+        host = CircuitBreaker.host_of(url)
+        if host not in cls._breakers:
+            cls._breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=cls.BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=cls.BREAKER_RESET_TIMEOUT,
+            )
+        return cls._breakers[host]
+
+    @classmethod
+    def reset_breakers(cls) -> None:
+        """Close every circuit by dropping all breakers."""
+        cls._breakers.clear()
+
+    @retry(
+        max_retries=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        retry_if=should_retry,
+        jitter=True,
+        max_backoff=MAX_BACKOFF,
+    )
     async def get_async(
         self,
         session: aiohttp.ClientSession,
@@ -112,30 +198,215 @@ class BaseClient:
         aiohttp.ClientError
             For lower-level network errors
         asyncio.TimeoutError
-            If the request exceeds DEFAULT_TIMEOUT
+            If the request exceeds DEFAULT_TIMEOUT, or the remaining deadline
+        DeadlineExceededError
+            If the current deadline expired before the attempt
+        CircuitOpenError
+            If the circuit of the host is open; the request is not sent
         
         Notes
         -----
         - Retry behavior is controlled via the @retry decorator
         - Headers are automatically included from self.headers
-        - raise_for_status triggers retries for HTTP 4xx/5xx errors
-        """
-        async with session.get(
-            url,
-            headers=self.headers,
-            timeout=self.DEFAULT_TIMEOUT,
-            params=params,
-        ) as response:
-            response.raise_for_status()
-            result = await response.json()
-            
-            if metadata:
-                if isinstance(result, dict):
-                    result.setdefault("metadata", metadata)
-                elif isinstance(result, list) and result and isinstance(result[0], dict):
-                    result[0].setdefault("metadata", metadata)
-                        
-            return result
+        - raise_for_status triggers retries for retryable HTTP statuses only
+        - Every attempt is admitted by, and reported to, the host breaker
+        - With a hedge_policy, an attempt may send one duplicate request
+        - Within a payload_scope, identical requests (same url and params)
+          share one fetch; each caller gets its own copy to attach metadata
+        """
+        timeout = bounded_timeout(self.DEFAULT_TIMEOUT)
+        cache = current_payload_cache()
+        if cache is None:
+            result = await self._fetch(session, url, params, timeout)
+        else:
+            result = self._shallow_copy(await cache.get(
+                PayloadCache.key(url, params),
+                lambda: self._fetch(session, url, params, timeout),
+            ))
+        
+        if metadata:
+            if isinstance(result, dict):
+                result.setdefault("metadata", metadata)
+            elif isinstance(result, list) and result and isinstance(result[0], dict):
+                result[0].setdefault("metadata", metadata)
+                    
+        return result
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Any:
+        """
+        Send one request attempt through the host breaker, hedged if enabled.
+        """
+        breaker = self.breaker(url)
+        trial = breaker.before_request()
+        try:
+            if self.hedge_policy is None:
+                result = await self._get_json(session, url, params, timeout)
+            else:
+                result = await self._get_hedged(session, url, params, timeout)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                breaker.record(e)
+            if trial:
+                # Cancelled or deadline-bound trials prove nothing about the host
+                breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    @staticmethod
+    def _shallow_copy(result: Any) -> Any:
+        """
+        Copy of a shared payload that its caller can attach metadata to.
+        """
+        if isinstance(result, dict):
+            return dict(result)
+        if isinstance(result, list) and result and isinstance(result[0], dict):
+            return [dict(result[0])] + result[1:]
+        return result
+
+    async def _get_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Any:
+        """
+        Send one GET request and parse its JSON body.
+
+        The latency of successful requests feeds the hedge policy. With
+        instrumentation enabled, the body download and JSON decode are
+        timed as separate stages.
+        """
+        start = time.perf_counter()
+        with instrumentation.stage("request", url):
+            async with session.get(
+                url,
+                headers=self.headers,
+                timeout=timeout,
+                params=params,
+            ) as response:
+                response.raise_for_status()
+                if instrumentation.enabled():
+                    with instrumentation.stage("download", url) as info:
+                        info["bytes"] = len(await response.read())
+                    with instrumentation.stage("decode", url):
+                        result = await response.json()
+                else:
+                    result = await response.json()
+        if self.hedge_policy is not None:
+            self.hedge_policy.record(url, time.perf_counter() - start)
+        return result
+
+    async def stream_chunks(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Send one GET request and yield its body in chunks as they arrive.
+
+        The request goes through the host breaker like get_async but is not
+        retried, hedged or shared through a payload_scope: chunks already
+        handed to the caller cannot be taken back.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            Active aiohttp session used to send the request
+        url : str
+            Full request URL
+        params : dict, optional
+            Query parameters for the GET request
+        chunk_size : int, default 65536
+            Maximum size of a chunk in bytes
+
+        Yields
+        ------
+        bytes
+            Consecutive pieces of the raw body.
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            If the server answers with an error status
+        CircuitOpenError
+            If the circuit of the host is open; the request is not sent
+        """
+        breaker = self.breaker(url)
+        trial = breaker.before_request()
+        try:
+            with instrumentation.stage("request", url) as info:
+                async with session.get(
+                    url,
+                    headers=self.headers,
+                    timeout=bounded_timeout(self.DEFAULT_TIMEOUT),
+                    params=params,
+                ) as response:
+                    response.raise_for_status()
+                    info["bytes"] = 0
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        info["bytes"] += len(chunk)
+                        yield chunk
+        except BaseException as e:
+            if isinstance(e, Exception):
+                breaker.record(e)
+            if trial:
+                # Consumer stopped early or the task was cancelled
+                breaker.release()
+            raise
+        breaker.record_success()
+
+    async def _get_hedged(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Any:
+        """
+        Send a GET request, duplicating it if it outlives the hedge delay.
+
+        The first successful answer is returned and the other request is
+        cancelled. If one request fails or is cancelled, the other one still
+        gets a chance; the error is raised only when both failed.
+        """
+        policy = self.hedge_policy
+        policy.requests += 1
+        primary = asyncio.ensure_future(self._get_json(session, url, params, timeout))
+        tasks = [primary]
+        try:
+            delay = policy.delay(url)
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+                if not primary.done() and policy.acquire():
+                    tasks.append(asyncio.ensure_future(self._get_json(session, url, params, timeout)))
+
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        error = error or asyncio.CancelledError()
+                        continue
+                    if task.exception() is None:
+                        if task is not primary:
+                            policy.wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def fetch_all(
         self,
@@ -164,6 +435,9 @@ class BaseClient:
         - Uses asyncio.gather with return_exceptions=True
         - Each request internally uses the retry logic of get_async
         - Failed requests return Exception objects instead of raising
+        - Under a deadline, requests still running when it expires are
+          cancelled and returned as DeadlineExceededError, so completed
+          responses are kept
         
         Examples
         --------
@@ -183,4 +457,31 @@ class BaseClient:
             )
             for req in requests
         ]
-        return await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+        deadline = current_deadline()
+        if deadline is None or not tasks:
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        return await self._gather_until(deadline, tasks)
+
+    @staticmethod
+    async def _gather_until(deadline, coroutines: List[Any]) -> List[Any]:
+        """
+        Gather coroutines, cancelling those still running at the deadline.
+
+        Returns
+        -------
+        List[Any]
+            Results or exceptions in input order; cancelled requests are
+            DeadlineExceededError.
+        """
+        tasks = [asyncio.ensure_future(c) for c in coroutines]
+        _, pending = await asyncio.wait(tasks, timeout=deadline.remaining())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        expired = DeadlineExceededError(f"Deadline of {deadline.seconds}s exceeded")
+        return [
+            expired if task.cancelled() else (task.exception() or task.result())
+            for task in tasks
+        ]
\ No newline at end of file
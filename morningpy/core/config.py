@@ -28,8 +28,32 @@ class CoreConfig:
         "maas_token":"https://www.morningstar.com/api/v2/stores/maas/token"
     }
 
+    AUTH_CACHE_FILE = "cache.json"
+
     TICKERS_FILE = "tickers.parquet"
 
+    TICKERS_INDEX_FILE = "tickers_index.npz"
+
+    ENGINES = ("pandas", "polars", "dask", "modin", "arrow", "duckdb")
+
+    ARROW_ENGINES = ("arrow", "polars", "duckdb")
+
+    DASK_MIN_PARTITION_ROWS = 100_000
+
+    BULK_BATCH_SIZE = 100
+
+    BULK_MANIFEST_FILE = "manifest.jsonl"
+
+    POLL_INTERVAL = 5.0
+
+    POLL_JITTER = 0.1
+
+    POLL_AUTH_ERROR_STATUSES = (401, 403)
+
+    POLL_ADD, POLL_REMOVE, POLL_CHANGE = "add", "remove", "change"
+
+    EngineLiteral = Literal["pandas", "polars", "dask", "modin", "arrow", "duckdb"]
+
     EXTRACTOR_CLASS_FUNC = {
         "MarketCalendarUsInfoExtractor":"get_market_us_calendar_info",
         "MarketCommoditiesExtractor":"get_market_commodities",
@@ -1,6 +1,11 @@
+import logging
 from dataclasses import dataclass
 from typing import get_type_hints, Dict, Optional
 
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_numeric_dtype
+
 
 @dataclass
 class DataFrameSchema:
@@ -61,3 +66,180 @@ class DataFrameSchema:
             dtypes[field_name] = dtype_map.get(field_type, 'object')
         
         return dtypes
+
+
+class ConversionPlan:
+    """
+    Compiled column conversions for one schema class.
+
+    The schema's dtype mapping is resolved once per schema class instead of
+    on every run. Applying the plan then only checks the current dtype of
+    each schema column: columns already in the target dtype are skipped,
+    `pd.to_numeric` only runs on non-numeric columns, and numeric columns
+    reach Int64 through a plain cast.
+
+    Columns are cast one by one: a single ``DataFrame.astype`` mapping copies
+    every untouched column as well and measured slower on wide frames.
+
+    Attributes
+    ----------
+    dtype_map : Dict[str, str]
+        Column name → target pandas dtype, as returned by `to_dtype_dict`.
+    arrow_types : Dict[str, pa.DataType]
+        Column name → target Arrow type, for the dtypes that have one
+        ('object' columns keep their inferred Arrow type).
+
+    Examples
+    --------
+    >>> plan = ConversionPlan.for_schema(HoldingSchema)
+    >>> df = plan.apply(df)
+    """
+
+    _cache: Dict[type, "ConversionPlan"] = {}  # Class-level plan cache
+
+    NUMERIC_DTYPES = ("Int64", "float32", "float64")
+
+    ARROW_TYPES = {
+        "Int64": pa.int64(),
+        "float32": pa.float32(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "boolean": pa.bool_(),
+    }
+
+    def __init__(self, dtype_map: Dict[str, str]):
+        """
+        Compile a plan from a column → dtype mapping.
+
+        Parameters
+        ----------
+        dtype_map : Dict[str, str]
+            Column name → target pandas dtype.
+        """
+        self.dtype_map = dict(dtype_map)
+        self.columns = set(self.dtype_map)
+        self.arrow_types: Dict[str, pa.DataType] = {
+            col: self.ARROW_TYPES[dtype]
+            for col, dtype in self.dtype_map.items()
+            if dtype in self.ARROW_TYPES
+        }
+
+    @classmethod
+    def for_schema(cls, schema: type) -> "ConversionPlan":
+        """
+        Return the cached plan of a schema class, compiling it on first use.
+
+        Parameters
+        ----------
+        schema : type
+            Schema class exposing `to_dtype_dict()` on its instances.
+
+        Returns
+        -------
+        ConversionPlan
+            Plan shared by every extractor using this schema.
+        """
+        plan = cls._cache.get(schema)
+        if plan is None:
+            plan = cls._cache[schema] = cls(schema().to_dtype_dict())
+        return plan
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all compiled plans."""
+        cls._cache.clear()
+
+    @staticmethod
+    def _is_target(series: pd.Series, dtype: str) -> bool:
+        """Whether the series needs no conversion to reach dtype."""
+        current = series.dtype
+        if dtype in ("float32", "float64"):
+            # pd.to_numeric leaves any numeric column untouched
+            return is_numeric_dtype(current)
+        return current == dtype
+
+    def apply(
+        self,
+        df: pd.DataFrame,
+        logger: Optional[logging.Logger] = None
+    ) -> pd.DataFrame:
+        """
+        Convert the schema columns present in df.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data to convert. Columns outside the schema are preserved as-is.
+        logger : logging.Logger, optional
+            Logger receiving conversion failures (warning) and missing or
+            extra columns (debug).
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with schema columns converted. Columns that fail to
+            convert are left unchanged.
+        """
+        logger = logger or logging.getLogger(__name__)
+
+        missing_cols = self.columns.difference(df.columns)
+        if missing_cols:
+            logger.debug(f"Schema columns not in data (skipped): {missing_cols}")
+
+        # Columns are addressed by position so that duplicated names convert
+        # one by one instead of selecting a DataFrame
+        for i, col in enumerate(df.columns):
+            dtype = self.dtype_map.get(col)
+            if dtype is None:
+                continue
+            series = df.iloc[:, i]
+            if self._is_target(series, dtype):
+                continue
+            try:
+                if dtype in self.NUMERIC_DTYPES and not is_numeric_dtype(series.dtype):
+                    values = pd.to_numeric(series, errors="coerce")
+                    df.isetitem(i, values.astype("Int64") if dtype == "Int64" else values)
+                else:
+                    df.isetitem(i, series.astype(dtype))
+            except Exception as e:
+                logger.warning(f"Failed to convert column '{col}' to {dtype}: {e}")
+
+        extra_cols = set(df.columns).difference(self.columns)
+        if extra_cols:
+            logger.debug(f"Extra columns in data (preserved): {extra_cols}")
+
+        return df
+
+    def apply_arrow(
+        self,
+        table: pa.Table,
+        logger: Optional[logging.Logger] = None
+    ) -> pa.Table:
+        """
+        Cast the schema columns present in an Arrow table.
+
+        Parameters
+        ----------
+        table : pa.Table
+            Data to convert. Columns outside the schema are preserved as-is.
+        logger : logging.Logger, optional
+            Logger receiving conversion failures (warning).
+
+        Returns
+        -------
+        pa.Table
+            Table with schema columns cast. Columns already of the target type
+            are kept without copy; columns that fail to cast are left unchanged.
+        """
+        logger = logger or logging.getLogger(__name__)
+
+        for i, field in enumerate(table.schema):
+            target = self.arrow_types.get(field.name)
+            if target is None or field.type == target:
+                continue
+            try:
+                table = table.set_column(i, field.name, table.column(i).cast(target))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                logger.warning(f"Failed to convert column '{field.name}' to {target}: {e}")
+
+        return table
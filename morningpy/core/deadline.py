@@ -0,0 +1,120 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+from morningpy.core.error import DeadlineExceededError
+
+
+class Deadline:
+    """
+    Total time budget of an extraction.
+
+    The active deadline is held in a context variable, so every layer of a
+    call (token fetch, request timeouts, retry sleeps, fetch_all) reads the
+    remaining budget without it being threaded through their signatures.
+    asyncio tasks inherit it from the task that creates them.
+
+    Attributes
+    ----------
+    seconds : float
+        Initial budget.
+    expires_at : float
+        ``time.monotonic()`` value at which the budget is exhausted.
+
+    Examples
+    --------
+    >>> with deadline_scope(2.5):
+    ...     df = asyncio.run(extractor.run())
+    >>> extractor.partial
+    False
+    """
+
+    def __init__(self, seconds: float):
+        if seconds < 0:
+            raise ValueError("deadline must be a non-negative number of seconds")
+        self.seconds = float(seconds)
+        self.expires_at = time.monotonic() + self.seconds
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.seconds}s, {self.remaining():.3f}s remaining)"
+
+    def remaining(self) -> float:
+        """Seconds left, 0 once expired."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, default: float) -> float:
+        """
+        Timeout of an operation bounded by the remaining budget.
+
+        Parameters
+        ----------
+        default : float
+            Timeout the operation would use without a deadline.
+
+        Raises
+        ------
+        DeadlineExceededError
+            If the deadline has already expired.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Deadline of {self.seconds}s exceeded")
+        return min(default, remaining)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("morningpy_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the running extraction, if any."""
+    return _current.get()
+
+
+def bounded_timeout(default: float) -> float:
+    """
+    `default`, bounded by the current deadline if one is set.
+
+    Raises
+    ------
+    DeadlineExceededError
+        If the current deadline has expired.
+    """
+    deadline = _current.get()
+    return default if deadline is None else deadline.timeout(default)
+
+
+@contextmanager
+def deadline_scope(deadline: Union[float, Deadline, None]) -> Iterator[Optional[Deadline]]:
+    """
+    Make a deadline current for the duration of the block.
+
+    Parameters
+    ----------
+    deadline : float, Deadline or None
+        Budget in seconds (started now) or an existing Deadline. None keeps
+        the enclosing deadline. A nested deadline never extends an enclosing
+        tighter one.
+
+    Yields
+    ------
+    Deadline or None
+        The effective deadline.
+    """
+    outer = _current.get()
+    if deadline is None:
+        yield outer
+        return
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
@@ -5,13 +5,22 @@ import logging
 from functools import wraps
 from pathlib import Path
 import json
+import inspect
+import random
+from typing import Callable, Optional
 from morningpy.core.config import CoreConfig
+from morningpy.core.deadline import current_deadline, deadline_scope
+from morningpy.core import instrumentation
+from morningpy.core.resilience import retry_after
 
 
 def retry(
     max_retries: int = 3,
     backoff_factor: float = 2,
     exceptions: tuple = (Exception,),
+    retry_if: Optional[Callable[[BaseException], bool]] = None,
+    jitter: bool = False,
+    max_backoff: Optional[float] = None,
 ):
     """
     Retry decorator supporting both synchronous and asynchronous functions,
@@ -31,6 +40,14 @@ def retry(
     exceptions : tuple of Exception types, optional
         Tuple of exception classes that should trigger a retry.
         Defaults to ``(Exception,)``.
+    retry_if : callable, optional
+        Predicate on the caught exception; exceptions for which it returns
+        False are raised immediately (e.g. HTTP 404).
+    jitter : bool, optional
+        Use "full jitter": wait a uniform random time in ``[0, wait_time]``
+        so concurrent clients do not retry in lockstep. Defaults to False.
+    max_backoff : float, optional
+        Upper bound of a single wait, including Retry-After hints.
 
     Returns
     -------
@@ -43,6 +60,11 @@ def retry(
     - Logs retry attempts at WARNING level.
     - The function sleeps using ``time.sleep`` for synchronous functions
       and ``asyncio.sleep`` for asynchronous ones.
+    - A server Retry-After hint (``Retry-After`` header or ``retry_after``
+      attribute of the exception) is a lower bound of the wait.
+    - Under a deadline (see `morningpy.core.deadline`), the last error is
+      raised instead of sleeping past the remaining budget.
+    - The number of attempts made is set as ``attempts`` on the raised exception.
 
     Examples
     --------
@@ -54,6 +76,32 @@ def retry(
     ... async def fetch_async():
     ...     ...
     """
+    def wait_for(attempt: int, error: BaseException) -> float:
+        wait_time = backoff_factor ** attempt
+        if jitter:
+            wait_time = random.uniform(0, wait_time)
+        hint = retry_after(error)
+        if hint is not None:
+            wait_time = max(wait_time, hint)
+        if max_backoff is not None:
+            wait_time = min(wait_time, max_backoff)
+        return wait_time
+
+    def next_wait(attempt: int, error: BaseException) -> Optional[float]:
+        """Wait before the next attempt, or None to give up and raise."""
+        wait_time = None
+        if attempt < max_retries and (retry_if is None or retry_if(error)):
+            wait_time = wait_for(attempt, error)
+            deadline = current_deadline()
+            if deadline is not None and deadline.remaining() <= wait_time:
+                wait_time = None
+        if wait_time is None:
+            try:
+                error.attempts = attempt
+            except AttributeError:
+                pass
+        return wait_time
+
     def decorator(func):
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -62,9 +110,9 @@ def retry(
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_retries:
+                    wait_time = next_wait(attempt, e)
+                    if wait_time is None:
                         raise
-                    wait_time = backoff_factor ** attempt
                     logger.warning(
                         f"[ASYNC RETRY] {func.__name__} failed "
                         f"({attempt}/{max_retries}): {e}. Retrying in {wait_time}s..."
@@ -78,9 +126,9 @@ def retry(
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_retries:
+                    wait_time = next_wait(attempt, e)
+                    if wait_time is None:
                         raise
-                    wait_time = backoff_factor ** attempt
                     logger.warning(
                         f"[SYNC RETRY] {func.__name__} failed "
                         f"({attempt}/{max_retries}): {e}. Retrying in {wait_time}s..."
@@ -91,6 +139,45 @@ def retry(
 
     return decorator
 
+def with_deadline(func):
+    """
+    Run a function under the deadline given by its ``deadline`` argument.
+
+    Used on the public ``get_*`` functions so that the deadline covers the
+    whole call, extractor construction (token fetch) included. Extractors
+    pick it up as the current deadline.
+
+    Examples
+    --------
+    >>> @with_deadline
+    ... def get_data(ticker=None, deadline=None):
+    ...     return asyncio.run(extractor.run())
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        deadline = signature.bind_partial(*args, **kwargs).arguments.get("deadline")
+        with deadline_scope(deadline):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+def instrumented(func):
+    """
+    Time an extractor coroutine as the ``run`` stage.
+
+    Every stage emitted while it runs, requests included, is labelled with
+    the extractor class name.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        with instrumentation.extractor_scope(type(self).__name__):
+            with instrumentation.stage("run", method=func.__name__):
+                return await func(self, *args, **kwargs)
+
+    return wrapper
+
 def save_api_response(activate: bool = False):
     """
     Decorator to save raw API responses in BaseClient.fetch_all.
@@ -108,6 +108,55 @@ class APIResponseError(APIError):
     pass
 
 
+class CircuitOpenError(APIConnectionError):
+    """
+    Raised when a request is refused because the circuit breaker of its host is open.
+    
+    The request is not sent: the host failed repeatedly and is given time to
+    recover before new requests are let through.
+    
+    Attributes
+    ----------
+    host : str
+        Host whose circuit is open.
+    retry_after : float
+        Seconds until the circuit lets a trial request through.
+    
+    Examples
+    --------
+    >>> raise CircuitOpenError("api-global.morningstar.com", retry_after=12.5)
+    """
+    def __init__(self, host: str, retry_after: float = None):
+        super().__init__(f"Circuit open for {host}, retry in {retry_after or 0:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(MorningpyError, TimeoutError):
+    """
+    Raised when the total deadline of an extraction is exhausted.
+    
+    Requests still in flight at the deadline are cancelled and reported with
+    this error; requests that would start after it are not sent.
+    
+    Examples
+    --------
+    >>> raise DeadlineExceededError("Deadline of 2.0s exceeded")
+    """
+    pass
+
+
+class PartialResultWarning(UserWarning):
+    """
+    Warned when a result is returned without the requests cut off by its deadline.
+    
+    Examples
+    --------
+    >>> warnings.warn("3/120 requests missed the deadline", PartialResultWarning)
+    """
+    pass
+
+
 class RateLimitError(APIError):
     """
     Raised when API rate limit is exceeded.
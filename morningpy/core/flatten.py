@@ -0,0 +1,257 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+
+class FlatColumns:
+    """
+    Column-oriented rows produced by a DataPointFlattener.
+
+    Each flatten call reserves one row per item; a column is created on
+    its first value, filled with None for the rows before and after it.
+
+    Attributes
+    ----------
+    data : Dict[str, list]
+        Column name → values, in order of first appearance.
+    rows : int
+        Number of rows flattened so far.
+    """
+
+    def __init__(self):
+        self.data: Dict[str, List[Any]] = {}
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _reserve(self, count: int) -> None:
+        """Add count empty rows to every column."""
+        self.rows += count
+        for column in self.data.values():
+            column.extend([None] * count)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame of the flattened rows, empty if there are none."""
+        if not self.rows:
+            return pd.DataFrame()
+        return pd.DataFrame(self.data)
+
+
+class DataPointFlattener:
+    """
+    Compiled flattening of Morningstar market data point payloads.
+
+    Market endpoints return one object per instrument whose data points are
+    ``{"value": ..., "properties": {name: {"value": ...}}}`` dicts. A
+    flattener turns a list of such objects into one column per base field,
+    data point value and kept property, following the FLATTEN_SPEC of a
+    market config:
+
+    - ``base``: output column → key, or tuple of keys, of an item field.
+    - ``points``: key of the data point dict in an item, None for the item
+      itself.
+    - ``value_column``: column name of a point value, formatted with the
+      point key (e.g. "{key}" or "{key}_value").
+    - ``require_value``: skip data points without a "value".
+    - ``exclude_properties``: properties whose key contains one of these
+      substrings (case-insensitive) are dropped.
+    - ``extra_keys``: point keys emitted as "{key}_{extra}" columns.
+
+    Filters are resolved once per column name: the exclusion substrings are
+    compiled into one regex, and the decision for every (point, property)
+    pair is cached together with its column name. Columns that the config
+    renames away or never selects are not emitted at all, so flattening a
+    payload only walks it and writes the kept values into preallocated
+    columns, without building a dict per row.
+
+    Attributes
+    ----------
+    spec : Dict[str, Any]
+        Flatten specification, as described above.
+    columns : set of str or None
+        Emitted columns, all if None.
+
+    Examples
+    --------
+    >>> flattener = DataPointFlattener.for_config(MarketCurrenciesConfig)
+    >>> flattener.flatten(response["page"]["currencies"]).to_frame()
+    """
+
+    _cache: Dict[type, "DataPointFlattener"] = {}  # Class-level flattener cache
+
+    def __init__(self, spec: Dict[str, Any], columns: Optional[Iterable[str]] = None):
+        """
+        Compile a flattener from a flatten specification.
+
+        Parameters
+        ----------
+        spec : Dict[str, Any]
+            Flatten specification, see the class docstring.
+        columns : iterable of str, optional
+            Columns to emit. Values of other columns are skipped. All
+            columns by default.
+        """
+        self.spec = spec
+        self.columns = set(columns) if columns is not None else None
+        self.base: List[Tuple[str, Tuple[str, ...]]] = [
+            (column, (path,) if isinstance(path, str) else tuple(path))
+            for column, path in spec.get("base", {}).items()
+            if self._kept(column)
+        ]
+        self.points: Optional[str] = spec.get("points")
+        self.value_column: str = spec.get("value_column", "{key}")
+        self.require_value: bool = spec.get("require_value", False)
+        self.extra_keys: Tuple[str, ...] = tuple(spec.get("extra_keys", ()))
+        excluded = spec.get("exclude_properties", ())
+        self._excluded = (
+            re.compile("|".join(map(re.escape, excluded)), re.IGNORECASE) if excluded else None
+        )
+        self._point_columns: Dict[str, Optional[str]] = {}
+        self._property_columns: Dict[Tuple[str, str], Optional[str]] = {}
+
+    @classmethod
+    def for_config(cls, config: type) -> "DataPointFlattener":
+        """
+        Return the cached flattener of a config class, compiling it on first use.
+
+        Only the columns reaching FINAL_COLUMNS, directly or through
+        RENAME_COLUMNS, are emitted when the config defines FINAL_COLUMNS.
+
+        Parameters
+        ----------
+        config : type
+            Config class exposing a FLATTEN_SPEC dict.
+
+        Returns
+        -------
+        DataPointFlattener
+            Flattener shared by every extractor using this config.
+        """
+        flattener = cls._cache.get(config)
+        if flattener is None:
+            final = getattr(config, "FINAL_COLUMNS", None)
+            columns = None
+            if final is not None:
+                renames = getattr(config, "RENAME_COLUMNS", {})
+                columns = set(final) | {raw for raw, col in renames.items() if col in final}
+            flattener = cls._cache[config] = cls(config.FLATTEN_SPEC, columns)
+        return flattener
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all compiled flatteners."""
+        cls._cache.clear()
+
+    def _kept(self, column: str) -> bool:
+        return self.columns is None or column in self.columns
+
+    def _point_column(self, key: str) -> Optional[str]:
+        """Column of a data point value, None if not emitted."""
+        try:
+            return self._point_columns[key]
+        except KeyError:
+            pass
+        column = self.value_column.format(key=key)
+        column = self._point_columns[key] = column if self._kept(column) else None
+        return column
+
+    def _property_column(self, key: str, prop_key: str) -> Optional[str]:
+        """Column of a property or extra key, None if excluded or not emitted."""
+        try:
+            return self._property_columns[key, prop_key]
+        except KeyError:
+            pass
+        column = f"{key}_{prop_key}"
+        if not self._kept(column) or (
+            prop_key not in self.extra_keys
+            and self._excluded is not None
+            and self._excluded.search(prop_key)
+        ):
+            column = None
+        self._property_columns[key, prop_key] = column
+        return column
+
+    @staticmethod
+    def _get(item: Any, path: Tuple[str, ...]) -> Any:
+        for key in path:
+            if not isinstance(item, dict):
+                return None
+            item = item.get(key)
+        return item
+
+    def flatten(
+        self,
+        items: Iterable[dict],
+        out: Optional[FlatColumns] = None,
+        **constants: Any
+    ) -> FlatColumns:
+        """
+        Flatten items into columns.
+
+        Parameters
+        ----------
+        items : iterable of dict
+            Instrument objects of a payload. Other values are skipped.
+        out : FlatColumns, optional
+            Columns to append to, e.g. to flatten several payload sections
+            into one frame. A new one by default.
+        **constants
+            Columns set to the same value on every row of these items
+            (e.g. category="gainers").
+
+        Returns
+        -------
+        FlatColumns
+            out, with one more row per item. When a row sets a column twice,
+            the last value wins.
+        """
+        out = out if out is not None else FlatColumns()
+        items = [item for item in items if isinstance(item, dict)]
+        start = out.rows
+        out._reserve(len(items))
+        data, rows = out.data, out.rows
+
+        def column(name: str) -> List[Any]:
+            values = data.get(name)
+            if values is None:
+                values = data[name] = [None] * rows
+            return values
+
+        point_columns, property_columns = self._point_columns, self._property_columns
+        for row, item in enumerate(items, start):
+            for name, path in self.base:
+                column(name)[row] = self._get(item, path)
+
+            points = item if self.points is None else item.get(self.points)
+            if not isinstance(points, dict):
+                continue
+            for key, point in points.items():
+                if not isinstance(point, dict):
+                    continue
+                if self.require_value and "value" not in point:
+                    continue
+                name = point_columns[key] if key in point_columns else self._point_column(key)
+                if name is not None:
+                    column(name)[row] = point.get("value")
+
+                properties = point.get("properties")
+                if properties:
+                    for prop_key, prop in properties.items():
+                        name = property_columns.get((key, prop_key), False)
+                        if name is False:
+                            name = self._property_column(key, prop_key)
+                        if name is not None:
+                            column(name)[row] = prop.get("value") if isinstance(prop, dict) else None
+
+                for extra in self.extra_keys:
+                    if extra in point:
+                        name = self._property_column(key, extra)
+                        if name is not None:
+                            value = point[extra]
+                            column(name)[row] = value.get("value") if isinstance(value, dict) else None
+
+        for name, value in constants.items():
+            column(name)[start:] = [value] * (rows - start)
+        return out
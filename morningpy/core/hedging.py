@@ -0,0 +1,179 @@
+import math
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+_ID_SEGMENT = re.compile(r"^[0-9A-Z]{10}$|^\d+$")
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Endpoint key of a URL: host and path with identifier segments masked.
+
+    Morningstar IDs (10 upper-case alphanumerics, e.g. 0P000000GY) and
+    numeric segments are replaced by ``{id}`` so that every security of an
+    endpoint shares one latency histogram.
+
+    Examples
+    --------
+    >>> endpoint_of("https://api-global.morningstar.com/sal-service/v1/etf/portfolio/holding/v2/0P0000A0B1/data")
+    'api-global.morningstar.com/sal-service/v1/etf/portfolio/holding/v2/{id}/data'
+    """
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in parts.path.split("/"))
+    return parts.netloc + path
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with exponential forgetting.
+
+    Buckets grow geometrically by GROWTH from MIN_LATENCY, so quantiles are
+    accurate to about 10% at any scale with a fixed, small memory. When the
+    sample count reaches max_samples every count is halved, so the
+    histogram follows latency drifts instead of averaging over all time.
+
+    Attributes
+    ----------
+    counts : List[float]
+        Sample weight per bucket.
+    total : float
+        Sum of counts.
+    """
+
+    MIN_LATENCY = 0.001
+    GROWTH = 1.1
+    BUCKETS = 160  # 1ms .. ~4 hours
+
+    def __init__(self, max_samples: int = 10_000):
+        self.max_samples = max_samples
+        self.counts: List[float] = [0.0] * self.BUCKETS
+        self.total = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_LATENCY:
+            return 0
+        index = int(math.log(seconds / self.MIN_LATENCY) / math.log(self.GROWTH)) + 1
+        return min(index, self.BUCKETS - 1)
+
+    def _upper(self, bucket: int) -> float:
+        return self.MIN_LATENCY * self.GROWTH ** bucket
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        self.counts[self._bucket(seconds)] += 1
+        self.total += 1
+        if self.total >= self.max_samples:
+            self.counts = [c / 2 for c in self.counts]
+            self.total /= 2
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Latency below which a fraction q of the samples fall.
+
+        Returns
+        -------
+        float or None
+            Upper edge of the bucket holding the quantile, None if empty.
+        """
+        if self.total <= 0:
+            return None
+        target = q * self.total
+        cumulative = 0.0
+        for bucket, count in enumerate(self.counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return self._upper(bucket)
+        return self._upper(self.BUCKETS - 1)
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate ("hedge") of a slow idempotent GET.
+
+    A request still unanswered after the learned `percentile` latency of
+    its endpoint gets one duplicate; the first successful answer wins and
+    the other request is cancelled. Hedging starts once an endpoint has
+    `min_samples` latencies, and hedges are capped at `budget` times the
+    number of requests, so a slow backend sees at most that much extra
+    load.
+
+    Attributes
+    ----------
+    percentile : float
+        Latency quantile that triggers a hedge (e.g. 0.95).
+    budget : float
+        Maximum hedges as a fraction of requests.
+    min_samples : int
+        Samples an endpoint needs before it can be hedged.
+    min_delay : float
+        Lower bound of the hedge delay, in seconds.
+    requests : int
+        Requests sent under the policy.
+    hedges : int
+        Duplicates sent.
+    wins : int
+        Duplicates that answered first.
+
+    Examples
+    --------
+    >>> BaseClient.hedge_policy = HedgePolicy(percentile=0.95, budget=0.05)
+    >>> df = get_historical_timeseries(ticker=["AAPL", "MSFT"], ...)
+    >>> BaseClient.hedge_policy.hedges, BaseClient.hedge_policy.wins
+    (3, 2)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        max_samples: int = 10_000
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if budget < 0:
+            raise ValueError("budget must be non-negative")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_samples = max_samples
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def histogram(self, url: str) -> LatencyHistogram:
+        """Latency histogram of the endpoint of a URL."""
+        key = endpoint_of(url)
+        if key not in self.histograms:
+            self.histograms[key] = LatencyHistogram(self.max_samples)
+        return self.histograms[key]
+
+    def record(self, url: str, seconds: float) -> None:
+        """Record the latency of a successful request."""
+        self.histogram(url).record(seconds)
+
+    def delay(self, url: str) -> Optional[float]:
+        """
+        Seconds to wait before hedging a request to url.
+
+        Returns
+        -------
+        float or None
+            None while the endpoint has fewer than min_samples samples.
+        """
+        histogram = self.histogram(url)
+        if histogram.total < self.min_samples:
+            return None
+        return max(self.min_delay, histogram.quantile(self.percentile))
+
+    def acquire(self) -> bool:
+        """Take a hedge from the budget, if any is left."""
+        if self.hedges + 1 > self.budget * self.requests:
+            return False
+        self.hedges += 1
+        return True
@@ -0,0 +1,396 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Any, Optional, Sequence, Union
+
+from morningpy.config.security import HoldingMatrixConfig
+
+
+def require_scipy():
+    """
+    Import the optional scipy.sparse dependency.
+
+    Raises
+    ------
+    ImportError
+        If scipy is not installed.
+    """
+    try:
+        import scipy.sparse as sparse
+    except ImportError as e:
+        raise ImportError(
+            "scipy is required for holdings analytics. "
+            "Install it with `pip install morningpy[analytics]`."
+        ) from e
+    return sparse
+
+
+def holding_keys(
+    holdings: pd.DataFrame,
+    key_columns: Sequence[str] = HoldingMatrixConfig.KEY_COLUMNS
+) -> pd.Series:
+    """
+    Identifier of each holding: the first non-missing value of key_columns.
+
+    Cash lines and holdings without a Morningstar id fall back to their
+    ISIN or name. Empty strings and "N/A" count as missing.
+
+    Returns
+    -------
+    pd.Series
+        Object keys aligned with holdings, NA when every key column is missing.
+    """
+    missing = ("", HoldingMatrixConfig.MISSING_GROUP)
+    keys = pd.Series(pd.NA, index=holdings.index, dtype="object")
+    for col in key_columns:
+        if col in holdings.columns:
+            values = holdings[col].astype("object")
+            keys = keys.fillna(values.where(~values.isin(missing)))
+    return keys
+
+
+class HoldingMatrix:
+    """
+    Sparse fund × security weight matrix built from holdings.
+
+    Row i holds the portfolio weights of funds[i] as fractions (0.05 for a
+    5% position), column j is securities[j]. Overlap, look-through and
+    exposure aggregation are sparse matrix products, so memory grows with
+    the number of positions rather than with funds² or funds × securities.
+
+    Attributes
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Weights, shape (funds, securities).
+    funds : pd.Index
+        Fund security_ids, one per row.
+    securities : pd.Index
+        Holding keys, one per column (child_security_id, else ISIN, else
+        name, see HoldingMatrixConfig.KEY_COLUMNS).
+    attributes : pd.DataFrame
+        Descriptive columns of each security (name, sector, country,
+        currency), indexed like the columns.
+
+    Examples
+    --------
+    >>> holdings = get_holding(ticker=["SPY", "IVV", "VOO", "QQQ"])
+    >>> matrix = HoldingMatrix.from_holdings(holdings)
+    >>> matrix.overlap()
+    >>> matrix.exposure("sector")
+    """
+    config = HoldingMatrixConfig
+
+    def __init__(self, weights: Any, funds: pd.Index, securities: pd.Index, attributes: pd.DataFrame):
+        """
+        Initialize the matrix from its parts.
+
+        Parameters
+        ----------
+        weights : scipy.sparse matrix
+            Weights, shape (len(funds), len(securities)); converted to CSR.
+        funds : pd.Index
+            Row labels.
+        securities : pd.Index
+            Column labels.
+        attributes : pd.DataFrame
+            Security attributes, reindexed on securities.
+
+        Raises
+        ------
+        ValueError
+            If the shape of weights does not match the labels.
+        """
+        sparse = require_scipy()
+        weights = sparse.csr_matrix(weights, dtype="float64")
+        if weights.shape != (len(funds), len(securities)):
+            raise ValueError(
+                f"weights shape {weights.shape} does not match "
+                f"{len(funds)} funds × {len(securities)} securities"
+            )
+        self.weights = weights
+        self.funds = pd.Index(funds, name="fund")
+        self.securities = pd.Index(securities, name="security")
+        self.attributes = attributes.reindex(self.securities)
+
+    def __repr__(self) -> str:
+        return (
+            f"HoldingMatrix({len(self.funds)} funds × {len(self.securities)} securities, "
+            f"{self.weights.nnz} positions)"
+        )
+
+    @classmethod
+    def from_holdings(
+        cls,
+        holdings: Any,
+        key_columns: Sequence[str] = HoldingMatrixConfig.KEY_COLUMNS,
+        weight_column: str = HoldingMatrixConfig.WEIGHT_COLUMN,
+        scale: float = HoldingMatrixConfig.WEIGHT_SCALE
+    ) -> "HoldingMatrix":
+        """
+        Build the matrix from the output of HoldingExtractor.
+
+        Parameters
+        ----------
+        holdings : pd.DataFrame, polars DataFrame or pyarrow Table
+            One row per (parent_security_id, holding), e.g. get_holding output.
+        key_columns : sequence of str, default HoldingMatrixConfig.KEY_COLUMNS
+            Columns identifying a holding, by priority, see `holding_keys`.
+        weight_column : str, default "weighting"
+            Column of the position weights.
+        scale : float, default 100.0
+            Divisor turning weights into fractions (weights are percents).
+
+        Returns
+        -------
+        HoldingMatrix
+            Rows without fund, key or weight are dropped; repeated
+            (fund, holding) positions are summed.
+        """
+        sparse = require_scipy()
+        if not isinstance(holdings, pd.DataFrame):
+            holdings = holdings.to_pandas()
+
+        keys = holding_keys(holdings, key_columns)
+        parents = holdings["parent_security_id"].astype("object")
+        weights = pd.to_numeric(holdings[weight_column], errors="coerce") / scale
+        valid = (keys.notna() & parents.notna() & weights.notna() & (weights != 0)).to_numpy()
+
+        fund_codes, funds = pd.factorize(parents[valid].to_numpy())
+        security_codes, securities = pd.factorize(keys[valid].to_numpy())
+        matrix = sparse.coo_matrix(
+            (weights[valid].to_numpy(dtype="float64"), (fund_codes, security_codes)),
+            shape=(len(funds), len(securities)),
+        ).tocsr()
+
+        columns = [
+            col for col in ("security_name", *HoldingMatrixConfig.EXPOSURE_COLUMNS)
+            if col in holdings.columns
+        ]
+        attributes = (
+            holdings.loc[valid, columns]
+            .astype("object")
+            .assign(_key=securities[security_codes])
+            .groupby("_key", sort=False)
+            .first()
+        )
+        return cls(matrix, pd.Index(funds), pd.Index(securities), attributes)
+
+    def _binary(self):
+        """Weights replaced by 1 for every position."""
+        binary = self.weights.copy()
+        binary.data[:] = 1.0
+        return binary
+
+    def overlap(self, method: str = "weight", dense: bool = True) -> Union[pd.DataFrame, Any]:
+        """
+        Pairwise overlap of the funds.
+
+        Parameters
+        ----------
+        method : {"weight", "count", "cosine"}, default "weight"
+            "weight": entry (a, b) is the weight of fund a invested in
+            securities also held by fund b (not symmetric). "count": number
+            of securities held by both. "cosine": cosine similarity of the
+            weight vectors.
+        dense : bool, default True
+            Return a labelled DataFrame. With False, return the sparse
+            (funds × funds) result, which stays small when most fund pairs
+            share nothing.
+
+        Returns
+        -------
+        pd.DataFrame or scipy.sparse.csr_matrix
+            Overlap of every fund pair, funds on both axes.
+
+        Raises
+        ------
+        ValueError
+            If the method is not supported.
+        """
+        sparse = require_scipy()
+        if method not in self.config.OVERLAP_METHODS:
+            raise ValueError(
+                f"Invalid method '{method}', must be one of {list(self.config.OVERLAP_METHODS)}"
+            )
+
+        if method == "count":
+            binary = self._binary()
+            result = binary @ binary.T
+        elif method == "weight":
+            result = self.weights @ self._binary().T
+        else:
+            norms = np.sqrt(np.asarray(self.weights.multiply(self.weights).sum(axis=1)).ravel())
+            inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+            normalized = sparse.diags(inverse) @ self.weights
+            result = normalized @ normalized.T
+
+        result = sparse.csr_matrix(result)
+        if not dense:
+            return result
+        return pd.DataFrame(result.toarray(), index=self.funds, columns=self.funds)
+
+    def shared_holdings(self, fund_a: str, fund_b: str, n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        Largest positions held by both funds.
+
+        Parameters
+        ----------
+        fund_a, fund_b : str
+            Fund security_ids, rows of the matrix.
+        n : int, optional, default 10
+            Number of holdings to return; None returns them all.
+
+        Returns
+        -------
+        pd.DataFrame
+            security, security_name, weight_a, weight_b and overlap (the
+            smaller weight), sorted by decreasing overlap.
+        """
+        a = self.weights[self.funds.get_loc(fund_a)]
+        b = self.weights[self.funds.get_loc(fund_b)]
+        common, in_a, in_b = np.intersect1d(a.indices, b.indices, return_indices=True)
+
+        df = pd.DataFrame({
+            "security": self.securities[common],
+            "security_name": self.attributes["security_name"].to_numpy()[common]
+            if "security_name" in self.attributes else None,
+            "weight_a": a.data[in_a],
+            "weight_b": b.data[in_b],
+        })
+        df["overlap"] = np.minimum(df["weight_a"], df["weight_b"])
+        df = df.sort_values("overlap", ascending=False, ignore_index=True, kind="stable")
+        return df if n is None else df.head(n)
+
+    def most_held(self, n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        Securities held by the most funds.
+
+        Parameters
+        ----------
+        n : int, optional, default 10
+            Number of securities to return; None returns them all.
+
+        Returns
+        -------
+        pd.DataFrame
+            security, security_name, funds (number of holders) and
+            total_weight (sum of the holder weights), sorted by decreasing
+            funds then total_weight.
+        """
+        df = pd.DataFrame({
+            "security": self.securities,
+            "security_name": self.attributes["security_name"].to_numpy()
+            if "security_name" in self.attributes else None,
+            "funds": np.asarray(self._binary().sum(axis=0)).ravel().astype("int64"),
+            "total_weight": np.asarray(self.weights.sum(axis=0)).ravel(),
+        })
+        df = df.sort_values(["funds", "total_weight"], ascending=False, ignore_index=True, kind="stable")
+        return df if n is None else df.head(n)
+
+    def look_through(self, max_depth: int = HoldingMatrixConfig.LOOKTHROUGH_MAX_DEPTH) -> "HoldingMatrix":
+        """
+        Replace positions in funds of the matrix by their underlying holdings.
+
+        A position in a fund that is itself a row of the matrix is expanded
+        into that fund's holdings scaled by the position weight, recursively
+        for funds of funds. Positions in funds without holdings data are
+        kept as they are.
+
+        With F the (funds × funds) weights of the fund positions and S the
+        weights of the other positions, the result is S + F S + F² S + ...,
+        stopping once F^k S is empty.
+
+        Parameters
+        ----------
+        max_depth : int, default HoldingMatrixConfig.LOOKTHROUGH_MAX_DEPTH
+            Maximum number of fund levels expanded. Weight still held through
+            funds beyond it (e.g. funds holding each other) is dropped with a
+            warning.
+
+        Returns
+        -------
+        HoldingMatrix
+            Matrix on the same funds, without the expanded fund columns.
+        """
+        sparse = require_scipy()
+        fund_rows = self.funds.get_indexer(self.securities)
+        is_fund = fund_rows >= 0
+        if not is_fund.any():
+            return self
+
+        fund_cols = np.flatnonzero(is_fund)
+        to_funds = sparse.csr_matrix(
+            (np.ones(len(fund_cols)), (fund_cols, fund_rows[fund_cols])),
+            shape=(len(self.securities), len(self.funds)),
+        )
+        keep = np.flatnonzero(~is_fund)
+        direct = self.weights[:, keep]
+        through = self.weights @ to_funds
+
+        result = direct
+        term = direct
+        for _ in range(max_depth):
+            term = through @ term
+            term.eliminate_zeros()
+            if term.nnz == 0:
+                break
+            result = result + term
+        else:
+            if (through @ term).nnz:
+                warnings.warn(
+                    f"Fund holdings nested deeper than max_depth={max_depth} "
+                    "(or holding each other) were truncated",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+        return HoldingMatrix(result, self.funds, self.securities[keep], self.attributes.iloc[keep])
+
+    def exposure(self, by: str = "sector", look_through: bool = False) -> pd.DataFrame:
+        """
+        Weight of each fund per group of securities.
+
+        Parameters
+        ----------
+        by : str, default "sector"
+            Attribute to group by, e.g. "sector", "country" or "currency".
+        look_through : bool, default False
+            Expand fund of fund positions first, see `look_through`.
+
+        Returns
+        -------
+        pd.DataFrame
+            Funds × groups weights (fractions). Securities with no value for
+            the attribute are grouped under HoldingMatrixConfig.MISSING_GROUP.
+
+        Raises
+        ------
+        ValueError
+            If the attribute is unknown.
+        """
+        sparse = require_scipy()
+        if by not in self.attributes.columns:
+            raise ValueError(
+                f"Invalid attribute '{by}', must be one of {list(self.attributes.columns)}"
+            )
+        matrix = self.look_through() if look_through else self
+
+        labels = matrix.attributes[by].fillna(self.config.MISSING_GROUP).to_numpy(dtype="object")
+        codes, groups = pd.factorize(labels, sort=True)
+        grouping = sparse.csr_matrix(
+            (np.ones(len(codes)), (np.arange(len(codes)), codes)),
+            shape=(len(codes), len(groups)),
+        )
+        exposure = (matrix.weights @ grouping).toarray()
+        return pd.DataFrame(exposure, index=matrix.funds, columns=pd.Index(groups, name=by))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Positions as a long frame of fund, security and weight.
+        """
+        coo = self.weights.tocoo()
+        return pd.DataFrame({
+            "fund": self.funds[coo.row],
+            "security": self.securities[coo.col],
+            "weight": coo.data,
+        })
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class IdentifierMap:
+    """
+    Precomputed identifier → row-position maps over the ticker universe.
+
+    For each identifier column, values are factorized once into a unique
+    hash index plus the row positions of every value, grouped per value
+    (CSR layout). Single lookups are then O(1) hash probes and batch lookups
+    are one vectorized ``get_indexer`` call, instead of a boolean scan of
+    the whole universe per identifier.
+
+    Attributes
+    ----------
+    frame : pd.DataFrame
+        Ticker universe the positions refer to.
+    columns : List[str]
+        Identifier columns covered by the map.
+
+    Notes
+    -----
+    Identifiers shared by several rows (e.g. a ticker listed on several
+    exchanges) keep all their rows; `first_positions` and `position`
+    return the first one in universe order.
+
+    Examples
+    --------
+    >>> id_map = IdentifierMap(tickers)
+    >>> tickers.iloc[id_map.position("AAPL", "ticker")]["isin"]
+    'US0378331005'
+    >>> id_map.first_positions(["AAPL", "UNKNOWN"], "ticker")
+    array([  42,   -1])
+    """
+
+    ID_COLUMNS = ("ticker", "isin", "performance_id", "security_id")
+
+    def __init__(self, frame: pd.DataFrame, columns: Iterable[str] = ID_COLUMNS):
+        """
+        Build the maps for the given identifier columns.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Ticker universe.
+        columns : iterable of str, optional
+            Identifier columns to map. Columns absent from the frame are skipped.
+            Defaults to ticker, isin, performance_id and security_id.
+        """
+        self.frame = frame
+        self.columns = [c for c in columns if c in frame.columns]
+        self._maps: Dict[str, Tuple[pd.Index, np.ndarray, np.ndarray]] = {
+            column: self._build(frame[column]) for column in self.columns
+        }
+
+    @staticmethod
+    def _build(values: pd.Series) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+        """
+        Factorize a column into (unique keys, group offsets, row positions).
+
+        Missing values are not mapped.
+        """
+        codes, uniques = pd.factorize(values, sort=False)
+        present = codes >= 0
+
+        order = np.argsort(codes, kind="stable")
+        positions = order[present[order]].astype(np.int64)
+
+        counts = np.bincount(codes[present], minlength=len(uniques))
+        offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return pd.Index(uniques), offsets, positions
+
+    def _groups(self, values: Iterable, column: str) -> np.ndarray:
+        """Group number of each value in the column map, -1 if absent."""
+        if column not in self._maps:
+            raise KeyError(f"Column '{column}' is not an identifier column")
+        keys, _, _ = self._maps[column]
+        return keys.get_indexer(pd.Index(list(values), dtype=object))
+
+    def position(self, value: str, column: str) -> Optional[int]:
+        """
+        Row position of the first row whose column equals value.
+
+        Parameters
+        ----------
+        value : str
+            Identifier to look up.
+        column : str
+            Identifier column.
+
+        Returns
+        -------
+        int or None
+            Row position, or None if the identifier is unknown.
+        """
+        if column not in self._maps:
+            raise KeyError(f"Column '{column}' is not an identifier column")
+        keys, offsets, positions = self._maps[column]
+        try:
+            group = keys.get_loc(value)
+        except (KeyError, TypeError):
+            return None
+        return int(positions[offsets[group]])
+
+    def first_positions(self, values: Iterable, column: str) -> np.ndarray:
+        """
+        Vectorized lookup returning one row position per input value.
+
+        Parameters
+        ----------
+        values : iterable
+            Identifiers to look up.
+        column : str
+            Identifier column.
+
+        Returns
+        -------
+        np.ndarray
+            Row position of the first match for each input, in input order,
+            -1 where the identifier is unknown.
+        """
+        _, offsets, positions = self._maps.get(column, (None, None, None))
+        groups = self._groups(values, column)
+        found = groups >= 0
+        result = np.full(len(groups), -1, dtype=np.int64)
+        result[found] = positions[offsets[groups[found]]]
+        return result
+
+    def rows(self, values: Iterable, column: str) -> np.ndarray:
+        """
+        Row positions of every row whose column is in values.
+
+        Parameters
+        ----------
+        values : iterable
+            Identifiers to look up.
+        column : str
+            Identifier column.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted row positions, equivalent to
+            ``np.flatnonzero(frame[column].isin(values))``.
+        """
+        _, offsets, positions = self._maps.get(column, (None, None, None))
+        groups = np.unique(self._groups(values, column))
+        groups = groups[groups >= 0]
+        if not len(groups):
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate([
+            positions[offsets[g]:offsets[g + 1]] for g in groups.tolist()
+        ]))
@@ -0,0 +1,452 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+import pandas as pd
+
+from morningpy.core.hedging import LatencyHistogram, endpoint_of
+
+
+logger = logging.getLogger(__name__)
+
+
+STAGES = (
+    "token",
+    "build_request",
+    "dns",
+    "connect",
+    "first_byte",
+    "download",
+    "decode",
+    "request",
+    "process_response",
+    "concat",
+    "schema_conversion",
+    "run",
+)
+
+
+def require_opentelemetry():
+    """
+    Import the optional opentelemetry tracing API.
+
+    Raises
+    ------
+    ImportError
+        If opentelemetry-api is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as e:
+        raise ImportError(
+            "opentelemetry-api is required for OpenTelemetryHook. "
+            "Install it with `pip install morningpy[otel]`."
+        ) from e
+    return trace
+
+
+@dataclass
+class StageEvent:
+    """
+    One timed stage of an extraction.
+
+    Attributes
+    ----------
+    stage : str
+        Stage name, one of STAGES.
+    duration : float
+        Seconds spent in the stage.
+    start_ns : int
+        Wall-clock start, in nanoseconds since the epoch.
+    extractor : str or None
+        Extractor class running the stage.
+    endpoint : str or None
+        Endpoint key (host and path, identifiers masked), for per-request stages.
+    bytes : int or None
+        Payload size, for the download stage.
+    error : BaseException or None
+        Exception raised by the stage, if it failed.
+    attributes : dict
+        Extra stage attributes (e.g. rows).
+    """
+
+    stage: str
+    duration: float
+    start_ns: int
+    extractor: Optional[str] = None
+    endpoint: Optional[str] = None
+    bytes: Optional[int] = None
+    error: Optional[BaseException] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def end_ns(self) -> int:
+        return self.start_ns + int(self.duration * 1e9)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class InstrumentationHook:
+    """
+    Receiver of stage events.
+
+    Subclasses override `on_event`. Hooks are called synchronously from the
+    extraction, so they should only record; exceptions they raise are
+    logged and swallowed.
+    """
+
+    def on_event(self, event: StageEvent) -> None:
+        raise NotImplementedError
+
+
+_hooks: List[InstrumentationHook] = []
+
+_extractor: ContextVar[Optional[str]] = ContextVar("morningpy_extractor", default=None)
+
+
+def register_hook(hook: InstrumentationHook) -> InstrumentationHook:
+    """Start sending stage events to a hook."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+    return hook
+
+
+def unregister_hook(hook: InstrumentationHook) -> None:
+    """Stop sending stage events to a hook."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def enabled() -> bool:
+    """Whether any hook is registered. Without hooks, stages cost nothing."""
+    return bool(_hooks)
+
+
+@contextmanager
+def instrument(*hooks: InstrumentationHook) -> Iterator[Tuple[InstrumentationHook, ...]]:
+    """
+    Register hooks for the duration of the block.
+
+    Examples
+    --------
+    >>> with instrument(MetricsCollector()) as (metrics,):
+    ...     df = get_holding(ticker=["SPY", "QQQ"])
+    >>> metrics.to_frame()
+    """
+    for hook in hooks:
+        register_hook(hook)
+    try:
+        yield hooks
+    finally:
+        for hook in hooks:
+            unregister_hook(hook)
+
+
+@contextmanager
+def extractor_scope(name: str) -> Iterator[None]:
+    """Label the stages emitted in the block with an extractor name."""
+    token = _extractor.set(name)
+    try:
+        yield
+    finally:
+        _extractor.reset(token)
+
+
+def emit(
+    stage_name: str,
+    duration: float,
+    start_ns: Optional[int] = None,
+    url: Optional[str] = None,
+    error: Optional[BaseException] = None,
+    size: Optional[int] = None,
+    **attributes: Any
+) -> None:
+    """
+    Send a stage event to every registered hook.
+
+    Parameters
+    ----------
+    stage_name : str
+        Stage name.
+    duration : float
+        Seconds spent in the stage.
+    start_ns : int, optional
+        Wall-clock start in nanoseconds; defaults to now minus duration.
+    url : str, optional
+        Request URL, reduced to its endpoint key.
+    error : BaseException, optional
+        Exception raised by the stage.
+    size : int, optional
+        Payload size in bytes.
+    """
+    if not _hooks:
+        return
+    if start_ns is None:
+        start_ns = time.time_ns() - int(duration * 1e9)
+    event = StageEvent(
+        stage=stage_name,
+        duration=duration,
+        start_ns=start_ns,
+        extractor=_extractor.get(),
+        endpoint=endpoint_of(url) if url else None,
+        bytes=size,
+        error=error,
+        attributes=attributes,
+    )
+    for hook in list(_hooks):
+        try:
+            hook.on_event(event)
+        except Exception as e:
+            logger.warning(f"Instrumentation hook {type(hook).__name__} failed: {e}")
+
+
+@contextmanager
+def stage(stage_name: str, url: Optional[str] = None, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time the block as one stage.
+
+    Yields a dict the block can fill with extra attributes; a ``bytes``
+    entry is reported as the payload size. Exceptions are recorded on the
+    event and re-raised.
+
+    Examples
+    --------
+    >>> with stage("concat") as info:
+    ...     df = pd.concat(dfs)
+    ...     info["rows"] = len(df)
+    """
+    info = dict(attributes)
+    if not _hooks:
+        yield info
+        return
+    start_ns = time.time_ns()
+    start = time.perf_counter()
+    error = None
+    try:
+        yield info
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        size = info.pop("bytes", None)
+        emit(stage_name, time.perf_counter() - start, start_ns, url, error, size, **info)
+
+
+def trace_configs() -> List[aiohttp.TraceConfig]:
+    """
+    aiohttp trace configs emitting the dns, connect and first_byte stages.
+
+    Returns an empty list when no hook is registered, so sessions are not
+    traced at all.
+    """
+    if not _hooks:
+        return []
+
+    async def on_request_start(session, ctx, params):
+        ctx.url = str(params.url)
+        ctx.request_start = (time.perf_counter(), time.time_ns())
+
+    async def on_request_end(session, ctx, params):
+        start, start_ns = ctx.request_start
+        emit("first_byte", time.perf_counter() - start, start_ns, ctx.url, status=params.response.status)
+
+    def span(name):
+        async def on_start(session, ctx, params):
+            setattr(ctx, name, (time.perf_counter(), time.time_ns()))
+
+        async def on_end(session, ctx, params):
+            start, start_ns = getattr(ctx, name)
+            emit(name, time.perf_counter() - start, start_ns, getattr(ctx, "url", None))
+
+        return on_start, on_end
+
+    config = aiohttp.TraceConfig(trace_config_ctx_factory=lambda trace_request_ctx: SimpleNamespace())
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_end)
+    dns_start, dns_end = span("dns")
+    config.on_dns_resolvehost_start.append(dns_start)
+    config.on_dns_resolvehost_end.append(dns_end)
+    connect_start, connect_end = span("connect")
+    config.on_connection_create_start.append(connect_start)
+    config.on_connection_create_end.append(connect_end)
+    return [config]
+
+
+@dataclass
+class StageStats:
+    """
+    Aggregated events of one (stage, extractor, endpoint) series.
+
+    Attributes
+    ----------
+    count : int
+        Events recorded.
+    errors : int
+        Events that raised.
+    total : float
+        Sum of durations, in seconds.
+    max : float
+        Longest duration.
+    bytes : int
+        Sum of payload sizes.
+    histogram : LatencyHistogram
+        Duration distribution, for quantiles.
+    """
+
+    count: int = 0
+    errors: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    bytes: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, event: StageEvent) -> None:
+        self.count += 1
+        self.errors += not event.ok
+        self.total += event.duration
+        self.max = max(self.max, event.duration)
+        self.bytes += event.bytes or 0
+        self.histogram.record(event.duration)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsCollector(InstrumentationHook):
+    """
+    In-memory counters and latency histograms per stage, extractor and endpoint.
+
+    Examples
+    --------
+    >>> metrics = register_hook(MetricsCollector())
+    >>> df = get_financial_statement(ticker=["AAPL"], statement_type="Balance Sheet")
+    >>> metrics.to_frame().sort_values("total", ascending=False).head()
+    >>> print(metrics.to_prometheus())
+    """
+
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    COLUMNS = ["stage", "extractor", "endpoint", "count", "errors", "total", "mean", "p50", "p90", "p99", "max", "bytes"]
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, str, str], StageStats] = {}
+
+    def on_event(self, event: StageEvent) -> None:
+        key = (event.stage, event.extractor or "", event.endpoint or "")
+        if key not in self.stats:
+            self.stats[key] = StageStats()
+        self.stats[key].add(event)
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        self.stats.clear()
+
+    def summary(self, stage_name: str, extractor: Optional[str] = None) -> StageStats:
+        """
+        Stats of a stage merged over endpoints (and extractors, unless given).
+        """
+        merged = StageStats()
+        for (name, ext, _), stats in self.stats.items():
+            if name != stage_name or (extractor is not None and ext != extractor):
+                continue
+            merged.count += stats.count
+            merged.errors += stats.errors
+            merged.total += stats.total
+            merged.max = max(merged.max, stats.max)
+            merged.bytes += stats.bytes
+            merged.histogram.counts = [a + b for a, b in zip(merged.histogram.counts, stats.histogram.counts)]
+            merged.histogram.total += stats.histogram.total
+        return merged
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per series, durations in seconds."""
+        rows = [
+            (
+                *key,
+                s.count,
+                s.errors,
+                s.total,
+                s.mean,
+                *(s.histogram.quantile(q) for q in self.QUANTILES),
+                s.max,
+                s.bytes,
+            )
+            for key, s in self.stats.items()
+        ]
+        return pd.DataFrame(rows, columns=self.COLUMNS)
+
+    def to_prometheus(self, prefix: str = "morningpy") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Stage durations are exported as a summary (quantiles, sum and
+        count), failures and payload sizes as counters, all labelled by
+        stage, extractor and endpoint.
+        """
+        def labels(key, **extra):
+            pairs = dict(zip(("stage", "extractor", "endpoint"), key), **extra)
+            return ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items())
+
+        duration, errors, size = f"{prefix}_stage_duration_seconds", f"{prefix}_stage_errors_total", f"{prefix}_stage_bytes_total"
+        lines = [
+            f"# HELP {duration} Time spent in each extraction stage.",
+            f"# TYPE {duration} summary",
+        ]
+        for key, s in self.stats.items():
+            for q in self.QUANTILES:
+                lines.append(f"{duration}{{{labels(key, quantile=str(q))}}} {s.histogram.quantile(q)}")
+            lines.append(f"{duration}_sum{{{labels(key)}}} {s.total}")
+            lines.append(f"{duration}_count{{{labels(key)}}} {s.count}")
+        lines += [f"# HELP {errors} Failed stage executions.", f"# TYPE {errors} counter"]
+        lines += [f"{errors}{{{labels(key)}}} {s.errors}" for key, s in self.stats.items()]
+        lines += [f"# HELP {size} Payload bytes downloaded.", f"# TYPE {size} counter"]
+        lines += [f"{size}{{{labels(key)}}} {s.bytes}" for key, s in self.stats.items() if s.bytes]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpenTelemetryHook(InstrumentationHook):
+    """
+    Export every stage as an OpenTelemetry span.
+
+    Spans are created when the stage ends, with its recorded start and end
+    times, under the span current at that point.
+
+    Parameters
+    ----------
+    tracer : opentelemetry.trace.Tracer, optional
+        Tracer to use; defaults to ``trace.get_tracer("morningpy")``, which
+        requires opentelemetry-api.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            tracer = require_opentelemetry().get_tracer("morningpy")
+        self.tracer = tracer
+
+    def on_event(self, event: StageEvent) -> None:
+        attributes = {"morningpy.stage": event.stage}
+        if event.extractor:
+            attributes["morningpy.extractor"] = event.extractor
+        if event.endpoint:
+            attributes["morningpy.endpoint"] = event.endpoint
+        if event.bytes is not None:
+            attributes["morningpy.bytes"] = event.bytes
+        attributes.update({f"morningpy.{k}": v for k, v in event.attributes.items() if v is not None})
+
+        span = self.tracer.start_span(f"morningpy.{event.stage}", start_time=event.start_ns, attributes=attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error", True)
+        span.end(end_time=event.end_ns)
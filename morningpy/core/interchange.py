@@ -1,9 +1,17 @@
+import math
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
 import pandas as pd
 import polars as pl
 import dask.dataframe as dd
 import modin.pandas as mpd
 import pyarrow as pa
 
+from morningpy.core.config import CoreConfig
+from morningpy.core.sink import open_sink, require_duckdb
+
 
 class DataFrameInterchange(pd.DataFrame):
     """
@@ -36,23 +44,71 @@ class DataFrameInterchange(pd.DataFrame):
         """
         Convert the current DataFrameInterchange instance to a Polars DataFrame.
 
+        The conversion goes through `to_arrow_table`: numeric columns without
+        nulls and Arrow-backed columns are handed to Polars without copying
+        their buffers.
+
         Returns
         -------
         pl.DataFrame
             Polars DataFrame equivalent of the current DataFrame.
         """
-        return pl.from_pandas(self)
+        return pl.from_arrow(self.to_arrow_table(preserve_index=False))
 
-    def to_dask_dataframe(self) -> dd.DataFrame:
+    @staticmethod
+    def default_npartitions(n_rows: int) -> int:
+        """
+        Number of Dask partitions for a frame of n_rows rows.
+
+        One partition per core, without going below
+        `CoreConfig.DASK_MIN_PARTITION_ROWS` rows per partition.
+
+        Parameters
+        ----------
+        n_rows : int
+            Row count of the frame.
+
+        Returns
+        -------
+        int
+            Number of partitions, at least 1.
+        """
+        by_rows = math.ceil(n_rows / CoreConfig.DASK_MIN_PARTITION_ROWS)
+        return max(1, min(os.cpu_count() or 1, by_rows))
+
+    def to_dask_dataframe(
+        self,
+        npartitions: Optional[int] = None,
+        partition_on: Optional[str] = None
+    ) -> dd.DataFrame:
         """
         Convert the current DataFrameInterchange instance to a Dask DataFrame.
 
+        Parameters
+        ----------
+        npartitions : int, optional
+            Number of partitions. Defaults to `default_npartitions(len(self))`.
+        partition_on : str, optional
+            Column to partition by (e.g. "security_id"). The column becomes
+            the sorted index and all rows sharing a value land in the same
+            partition, so per-security groupby/apply run without a shuffle.
+
         Returns
         -------
         dd.DataFrame
             Dask DataFrame equivalent of the current DataFrame.
         """
-        return dd.from_pandas(self, npartitions=1)
+        if npartitions is None:
+            npartitions = self.default_npartitions(len(self))
+
+        if partition_on is None:
+            return dd.from_pandas(self, npartitions=npartitions)
+
+        return dd.from_pandas(
+            self.set_index(partition_on),
+            npartitions=npartitions,
+            sort=True
+        )
 
     def to_modin_dataframe(self) -> mpd.DataFrame:
         """
@@ -65,16 +121,139 @@ class DataFrameInterchange(pd.DataFrame):
         """
         return mpd.DataFrame(self)
 
-    def to_arrow_table(self) -> pa.Table:
+    def to_arrow_table(self, preserve_index: Optional[bool] = None) -> pa.Table:
         """
         Convert the current DataFrameInterchange instance to a PyArrow Table.
 
+        Numeric columns without nulls and Arrow-backed (``pd.ArrowDtype``)
+        columns share memory with the Table instead of being copied.
+
+        Parameters
+        ----------
+        preserve_index : bool, optional
+            Passed to `pa.Table.from_pandas`. The default stores a RangeIndex
+            as metadata only and other indexes as columns.
+
         Returns
         -------
         pa.Table
             PyArrow Table equivalent of the current DataFrame.
         """
-        return pa.Table.from_pandas(self)
+        return pa.Table.from_pandas(self, preserve_index=preserve_index)
+
+    def to_duckdb_relation(self):
+        """
+        Convert the current DataFrameInterchange instance to a DuckDB relation.
+
+        Returns
+        -------
+        duckdb.DuckDBPyRelation
+            DuckDB relation over the Arrow representation of the DataFrame.
+
+        Raises
+        ------
+        ImportError
+            If duckdb is not installed.
+        """
+        return require_duckdb().from_arrow(self.to_arrow_table())
+
+    @staticmethod
+    def arrow_to_engine(table: pa.Table, engine: str):
+        """
+        Convert a PyArrow Table to a specific engine.
+
+        Arrow, Polars and DuckDB outputs share the Table buffers (zero-copy);
+        other engines go through a pandas DataFrameInterchange.
+
+        Parameters
+        ----------
+        table : pa.Table
+            Table to convert.
+        engine : str
+            Name of the target engine. Supported values:
+            "pandas", "polars", "dask", "modin", "arrow", "duckdb".
+
+        Returns
+        -------
+        object
+            DataFrame, Table or relation in the requested engine.
+
+        Raises
+        ------
+        ValueError
+            If the requested engine is not supported.
+        """
+        engine = engine.lower()
+        if engine == "arrow":
+            return table
+        if engine == "polars":
+            return pl.from_arrow(table)
+        if engine == "duckdb":
+            return require_duckdb().from_arrow(table)
+        return DataFrameInterchange(table.to_pandas()).to_engine(engine)
+
+    def write(
+        self,
+        path: Union[str, Path],
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        compression: Optional[str] = "zstd",
+        row_group_size: Optional[int] = None,
+        table: str = "data"
+    ) -> Path:
+        """
+        Write the DataFrame to a columnar file, dataset or database.
+
+        The frame is converted to Arrow once (sharing numeric buffers) and
+        written through the same sinks extractors stream into.
+
+        Parameters
+        ----------
+        path : str or Path
+            Target file, root directory when partition_cols is given, or
+            database file for "duckdb".
+        format : {"parquet", "ipc", "arrow", "feather", "duckdb"}, default "parquet"
+            Output format. "ipc", "arrow" and "feather" all write Arrow IPC files.
+        partition_cols : list of str, optional
+            Hive partition columns, e.g. ["security_id"] or ["security_id", "date"].
+            Not supported for "duckdb".
+        compression : str, optional, default "zstd"
+            Codec for Parquet ("zstd", "snappy", "gzip", "brotli", "lz4", None)
+            or Arrow IPC ("zstd", "lz4", None).
+        row_group_size : int, optional
+            Maximum rows per Parquet row group / IPC record batch.
+        table : str, default "data"
+            Target table for "duckdb", created if needed and appended to.
+
+        Returns
+        -------
+        Path
+            The written path.
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported, or partitioning is requested for duckdb.
+
+        Examples
+        --------
+        >>> df.write("holdings/", partition_cols=["security_id"])
+        >>> df.write("prices.arrow", format="ipc", compression="lz4")
+        """
+        if format.lower() == "duckdb":
+            if partition_cols:
+                raise ValueError("partition_cols is not supported for format 'duckdb'.")
+            options = {"table": table}
+        else:
+            options = {
+                "partition_cols": partition_cols,
+                "compression": compression,
+                "row_group_size": row_group_size,
+            }
+
+        with open_sink(path, format, **options) as sink:
+            sink.write_batch(self.to_arrow_table(preserve_index=False))
+        return sink.path
 
     def to_engine(self, engine: str):
         """
@@ -84,12 +263,12 @@ class DataFrameInterchange(pd.DataFrame):
         ----------
         engine : str
             Name of the target engine. Supported values:
-            "pandas", "polars", "dask", "modin", "arrow".
+            "pandas", "polars", "dask", "modin", "arrow", "duckdb".
 
         Returns
         -------
         object
-            DataFrame or Table in the requested engine.
+            DataFrame, Table or relation in the requested engine.
 
         Raises
         ------
@@ -103,6 +282,7 @@ class DataFrameInterchange(pd.DataFrame):
             "dask": self.to_dask_dataframe,
             "modin": self.to_modin_dataframe,
             "arrow": self.to_arrow_table,
+            "duckdb": self.to_duckdb_relation,
         }
         if engine not in converters:
             raise ValueError(f"Unsupported engine '{engine}'.")
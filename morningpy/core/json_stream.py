@@ -0,0 +1,219 @@
+import codecs
+import json
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+Path = Tuple[str, ...]
+
+_INCOMPLETE = object()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]}" + _WHITESPACE
+
+
+class _Frame:
+    """Object or array being parsed, with its non-streamed content."""
+    __slots__ = ("kind", "path", "container", "state", "key")
+
+    def __init__(self, kind: str, path: Path, container: Any):
+        self.kind = kind
+        self.path = path
+        self.container = container
+        self.state = "first"
+        self.key: Optional[str] = None
+
+
+class JsonArrayStream:
+    """
+    Incremental JSON parser streaming the items of selected arrays.
+
+    Bytes are fed as they arrive; every complete item of a target array is
+    returned by `feed` as soon as it is available and never kept by the
+    parser, so memory is bounded by the largest item and the chunk size
+    rather than by the array. Everything outside the target arrays is
+    decoded normally and available as `root` once the document is closed,
+    with each target array left empty.
+
+    Only the objects leading to a target array are walked by the parser;
+    every other value, and each streamed item, is decoded in one call to
+    the C JSON decoder.
+
+    Attributes
+    ----------
+    targets : set of tuple
+        Key paths of the streamed arrays, e.g. ("boldHoldingPage", "holdingList").
+    root : Any
+        The document without the streamed items, set once complete.
+    items : int
+        Number of items streamed so far.
+
+    Examples
+    --------
+    >>> stream = JsonArrayStream([("boldHoldingPage", "holdingList")])
+    >>> async for chunk in response.content.iter_chunked(65536):
+    ...     for path, holding in stream.feed(chunk):
+    ...         ...
+    >>> stream.close()
+    >>> stream.root["numberOfHolding"]
+    """
+
+    def __init__(self, targets: Iterable[Sequence[str]]):
+        self.targets = {tuple(t) for t in targets}
+        self._prefixes = {t[:i] for t in self.targets for i in range(len(t) + 1)}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._done = False
+        self.root: Any = None
+        self.items = 0
+
+    def feed(self, chunk: bytes) -> List[Tuple[Path, Any]]:
+        """
+        Parse a chunk of the body.
+
+        Returns
+        -------
+        list of (path, item)
+            Items of the target arrays completed by this chunk, in order.
+
+        Raises
+        ------
+        ValueError
+            If the document is not valid JSON.
+        """
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Tuple[Path, Any]]:
+        """
+        Parse the end of the body.
+
+        Returns
+        -------
+        list of (path, item)
+            Items still pending.
+
+        Raises
+        ------
+        ValueError
+            If the document is truncated or not valid JSON.
+        """
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if not self._done:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _decode(self, final: bool) -> Any:
+        """Decode the value at the cursor, or _INCOMPLETE if more data is needed."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise ValueError(f"Invalid JSON document: {e}") from e
+            return _INCOMPLETE
+        # A number or literal not followed by a delimiter may continue in the next chunk
+        if (
+            not final
+            and not isinstance(value, (dict, list, str))
+            and (end >= len(self._buffer) or self._buffer[end] not in _DELIMITERS)
+        ):
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _open(self, char: str, path: Path) -> None:
+        kind = "object" if char == "{" else "array"
+        container = {} if kind == "object" else []
+        self._stack.append(_Frame(kind, path, container))
+        self._pos += 1
+
+    def _close(self) -> None:
+        frame = self._stack.pop()
+        self._pos += 1
+        if not self._stack:
+            self.root = frame.container
+            self._done = True
+            return
+        parent = self._stack[-1]
+        if parent.kind == "object":
+            parent.container[parent.key] = frame.container
+        else:
+            parent.container.append(frame.container)
+
+    def _parse(self, final: bool) -> List[Tuple[Path, Any]]:
+        out: List[Tuple[Path, Any]] = []
+        buffer = self._buffer
+        while True:
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos >= len(buffer):
+                return out
+            char = buffer[self._pos]
+
+            if not self._stack:
+                if self._done:
+                    raise ValueError("Extra data after the JSON document")
+                if () in self._prefixes and char in "{[":
+                    self._open(char, ())
+                    continue
+                value = self._decode(final)
+                if value is _INCOMPLETE:
+                    return out
+                self.root, self._done = value, True
+                continue
+
+            frame = self._stack[-1]
+            closing = "}" if frame.kind == "object" else "]"
+
+            if frame.state == "next":
+                if char == ",":
+                    self._pos += 1
+                    frame.state = "key" if frame.kind == "object" else "value"
+                elif char == closing:
+                    self._close()
+                else:
+                    raise ValueError(f"Expected ',' or '{closing}' at {self._pos}, got {char!r}")
+                continue
+
+            if frame.state == "first" and char == closing:
+                self._close()
+                continue
+
+            if frame.kind == "object" and frame.state in ("first", "key"):
+                if char != '"':
+                    raise ValueError(f"Expected a key at {self._pos}, got {char!r}")
+                key = self._decode(final)
+                if key is _INCOMPLETE:
+                    return out
+                frame.key, frame.state = key, "colon"
+                continue
+
+            if frame.state == "colon":
+                if char != ":":
+                    raise ValueError(f"Expected ':' at {self._pos}, got {char!r}")
+                self._pos += 1
+                frame.state = "value"
+                continue
+
+            # Value of an object key, or array item
+            path = frame.path + (frame.key,) if frame.kind == "object" else frame.path
+            streamed = frame.kind == "array" and path in self.targets
+            if not streamed and char in "{[" and path in self._prefixes:
+                frame.state = "next"
+                self._open(char, path)
+                continue
+
+            value = self._decode(final)
+            if value is _INCOMPLETE:
+                return out
+            frame.state = "next"
+            if streamed:
+                out.append((path, value))
+                self.items += 1
+            elif frame.kind == "object":
+                frame.container[frame.key] = value
+            else:
+                frame.container.append(value)
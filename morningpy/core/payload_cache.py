@@ -0,0 +1,105 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class PayloadCache:
+    """
+    Responses of a run, shared by the extractors that request the same URL.
+
+    While a cache is current, BaseClient.get_async sends each distinct
+    (url, params) request once: the first caller starts the fetch and
+    concurrent or later callers await the same result. Failed fetches are
+    dropped so that retries send the request again. The cache only lives
+    for the block of `payload_scope`, so payloads are never reused across
+    runs.
+
+    Attributes
+    ----------
+    hits : int
+        Requests answered by a fetch already started or completed.
+    misses : int
+        Requests that started a fetch.
+
+    Examples
+    --------
+    >>> with payload_scope() as cache:
+    ...     holdings, info = await asyncio.gather(holding.run(), holding_info.run())
+    >>> cache.misses, cache.hits
+    (2, 2)
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple:
+        """Cache key of a request; parameter order does not matter."""
+        return url, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Result of the fetch of key, started by fetch() if not already running.
+
+        A caller cancelled while waiting (e.g. by a deadline) does not cancel
+        the shared fetch, which other callers may still be waiting on.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[key] = asyncio.ensure_future(fetch())
+        else:
+            self.hits += 1
+        try:
+            return await asyncio.shield(entry)
+        except BaseException:
+            if entry.done() and (entry.cancelled() or entry.exception() is not None):
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            raise
+
+    def close(self) -> None:
+        """Cancel the fetches nobody awaits anymore and drop every payload."""
+        for entry in self._entries.values():
+            if not entry.done() and not entry.get_loop().is_closed():
+                entry.cancel()
+        self._entries.clear()
+
+
+_current: ContextVar[Optional[PayloadCache]] = ContextVar("morningpy_payload_cache", default=None)
+
+
+def current_payload_cache() -> Optional[PayloadCache]:
+    """Payload cache of the running extraction, if any."""
+    return _current.get()
+
+
+@contextmanager
+def payload_scope() -> Iterator[PayloadCache]:
+    """
+    Share identical requests for the duration of the block.
+
+    A nested scope reuses the enclosing cache.
+
+    Yields
+    ------
+    PayloadCache
+        The effective cache.
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+    cache = PayloadCache()
+    token = _current.set(cache)
+    try:
+        yield cache
+    finally:
+        _current.reset(token)
+        cache.close()
@@ -0,0 +1,354 @@
+import asyncio
+import inspect
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import aiohttp
+import numpy as np
+import pandas as pd
+
+from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.config import CoreConfig
+from morningpy.core.resilience import FailureReport
+from morningpy.core import instrumentation
+
+
+logger = logging.getLogger(__name__)
+
+
+class PollDelta(NamedTuple):
+    """
+    Rows of a feed that changed since its previous poll.
+
+    Attributes
+    ----------
+    feed : str
+        Feed name.
+    changes : pd.DataFrame
+        Added and changed rows (current values) and removed rows (last
+        known values), with a leading ``change`` column ("add", "change"
+        or "remove").
+    polled_at : datetime
+        UTC time of the poll.
+    """
+    feed: str
+    changes: pd.DataFrame
+    polled_at: datetime
+
+
+@dataclass
+class PollFeed:
+    """
+    One extractor polled on its own interval.
+
+    Attributes
+    ----------
+    extractor : BaseExtractor
+        Extractor whose requests are built once and re-sent on every poll.
+    keys : list of str
+        Columns identifying a row across polls.
+    interval : float
+        Seconds between the start of two polls, before jitter.
+    ignored : list of str
+        Columns whose changes alone do not make a row changed (e.g. a
+        payload timestamp).
+    snapshot : pd.DataFrame or None
+        Rows of the last successful poll, indexed by keys.
+    """
+    extractor: BaseExtractor
+    keys: List[str]
+    interval: float = CoreConfig.POLL_INTERVAL
+    ignored: List[str] = field(default_factory=list)
+    snapshot: Optional[pd.DataFrame] = None
+
+
+class ExtractorPoller:
+    """
+    Long-running poller emitting the changed rows of several extractors.
+
+    Every feed is polled in its own task on a jittered interval, so feeds
+    with the same interval do not hit the endpoints in lockstep. The state
+    that one-shot API calls rebuild on each call is kept warm for the whole
+    run:
+
+    - extractors, and so their clients and auth headers, are created once;
+    - requests are built once;
+    - one aiohttp session (and its keep-alive connections) is shared by
+      all feeds;
+    - a rejected token (401/403) is refreshed in place and used from the
+      next poll.
+
+    Each poll is processed and schema-converted like `run`, then compared
+    with the previous poll of the feed on its key columns. Only added,
+    changed and removed rows are emitted, as a PollDelta, to a callback or
+    an asyncio queue; a poll without changes emits nothing. The first poll
+    emits every row as added. A failed poll is logged and skipped, leaving
+    the previous snapshot in place, so an outage does not look like every
+    row being removed.
+
+    Attributes
+    ----------
+    feeds : Dict[str, PollFeed]
+        Polled feeds by name.
+    queue : asyncio.Queue
+        Queue receiving the deltas when no callback is given.
+    jitter : float
+        Fraction of the interval added or removed at random to each wait.
+    errors : Dict[str, int]
+        Failed polls per feed.
+
+    Examples
+    --------
+    >>> async with ExtractorPoller({"movers": PollFeed(MarketMoversExtractor(), ["ticker"])}) as poller:
+    ...     task = asyncio.create_task(poller.run())
+    ...     delta = await poller.queue.get()
+    """
+
+    def __init__(
+        self,
+        feeds: Dict[str, PollFeed],
+        on_delta: Optional[Callable[[PollDelta], Any]] = None,
+        queue: Optional[asyncio.Queue] = None,
+        jitter: float = CoreConfig.POLL_JITTER,
+    ):
+        """
+        Initialize the poller.
+
+        Parameters
+        ----------
+        feeds : Dict[str, PollFeed]
+            Feeds to poll by name.
+        on_delta : callable, optional
+            Called with every PollDelta; may be a coroutine function, which
+            is awaited before the feed polls again.
+        queue : asyncio.Queue, optional
+            Queue receiving the deltas when on_delta is not given. A new
+            unbounded queue by default.
+        jitter : float, default CoreConfig.POLL_JITTER
+            Fraction of the interval, between 0 and 1, added or removed at
+            random to each wait.
+
+        Raises
+        ------
+        ValueError
+            If there is no feed, an interval is not positive or jitter is
+            out of range.
+        """
+        if not feeds:
+            raise ValueError("At least one feed is required")
+        for name, feed in feeds.items():
+            if feed.interval <= 0:
+                raise ValueError(f"Interval of feed '{name}' must be positive")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+
+        self.feeds = feeds
+        self.on_delta = on_delta
+        self.queue = queue if queue is not None else asyncio.Queue()
+        self.jitter = jitter
+        self.errors: Dict[str, int] = {name: 0 for name in feeds}
+        self._random = random.Random()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stop: Optional[asyncio.Event] = None
+
+        for feed in feeds.values():
+            feed.extractor._check_inputs()
+            feed.extractor._build_request()
+
+    async def __aenter__(self) -> "ExtractorPoller":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Open the shared HTTP session."""
+        if self._session is None:
+            extractor = next(iter(self.feeds.values())).extractor
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=extractor.client.DEFAULT_TIMEOUT),
+                trace_configs=instrumentation.trace_configs(),
+            )
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def stop(self) -> None:
+        """Make `run` return once the polls in flight are done."""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """
+        Poll every feed until `stop` is called or duration elapses.
+
+        Parameters
+        ----------
+        duration : float, optional
+            Seconds after which polling stops. Runs until stopped by default.
+        """
+        self._stop = asyncio.Event()
+        owns_session = self._session is None
+        await self.open()
+        timer = None
+        if duration is not None:
+            timer = asyncio.get_running_loop().call_later(duration, self.stop)
+        try:
+            await asyncio.gather(*(self._poll_loop(name) for name in self.feeds))
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if owns_session:
+                await self.close()
+
+    def _wait_time(self, interval: float, elapsed: float) -> float:
+        """Seconds to wait before the next poll, jittered."""
+        jittered = interval * (1 + self._random.uniform(-self.jitter, self.jitter))
+        return max(jittered - elapsed, 0.0)
+
+    async def _poll_loop(self, name: str) -> None:
+        loop = asyncio.get_running_loop()
+        feed = self.feeds[name]
+        while not self._stop.is_set():
+            started = loop.time()
+            try:
+                delta = await self.poll_once(name)
+            except Exception as e:
+                self.errors[name] += 1
+                logger.error(f"Poll of '{name}' failed: {e}")
+                delta = None
+            if delta is not None:
+                await self._emit(delta)
+
+            wait = self._wait_time(feed.interval, loop.time() - started)
+            try:
+                await asyncio.wait_for(self._stop.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _emit(self, delta: PollDelta) -> None:
+        if self.on_delta is None:
+            await self.queue.put(delta)
+            return
+        result = self.on_delta(delta)
+        if inspect.isawaitable(result):
+            await result
+
+    async def poll_once(self, name: str) -> Optional[PollDelta]:
+        """
+        Poll one feed and diff it with its previous snapshot.
+
+        The delta is returned, not emitted.
+
+        Parameters
+        ----------
+        name : str
+            Feed name.
+
+        Returns
+        -------
+        PollDelta or None
+            Changed rows, None if nothing changed.
+
+        Raises
+        ------
+        RuntimeError
+            If a request of the feed failed; the snapshot is kept. A 401 or
+            403 refreshes the auth headers of the feed first.
+        """
+        feed = self.feeds[name]
+        current = await self._fetch(feed)
+        current = current.drop_duplicates(feed.keys, keep="last").set_index(feed.keys)
+
+        changes = self.diff(feed.snapshot, current, feed.ignored)
+        feed.snapshot = current
+        if changes.empty:
+            return None
+        return PollDelta(name, changes, datetime.now(timezone.utc))
+
+    async def _fetch(self, feed: PollFeed) -> pd.DataFrame:
+        """Processed and schema-converted rows of one poll of a feed."""
+        await self.open()
+        extractor = feed.extractor
+        extractor.failures = FailureReport()
+        responses = await extractor._fetch_responses(self._session, extractor.requests)
+
+        dfs = []
+        for i, res in enumerate(responses):
+            if isinstance(res, Exception):
+                extractor._record_failure(i, res)
+                continue
+            dfs.append(extractor._process_response(res))
+
+        if extractor.failures:
+            statuses = {getattr(f.error, "status", None) for f in extractor.failures}
+            if statuses & set(CoreConfig.POLL_AUTH_ERROR_STATUSES):
+                extractor.client.refresh_headers()
+            raise RuntimeError(
+                f"{len(extractor.failures)}/{len(extractor.requests)} requests failed"
+            )
+
+        dfs = [df for df in dfs if isinstance(df, pd.DataFrame) and not df.empty]
+        df = extractor._concat(dfs) if dfs else pd.DataFrame(columns=feed.keys)
+        return extractor._validate_and_convert_types(df)
+
+    @staticmethod
+    def diff(
+        previous: Optional[pd.DataFrame],
+        current: pd.DataFrame,
+        ignored: Sequence[str] = ()
+    ) -> pd.DataFrame:
+        """
+        Rows added, changed or removed between two snapshots.
+
+        Parameters
+        ----------
+        previous : pd.DataFrame or None
+            Previous snapshot, indexed by the keys; None on the first poll.
+        current : pd.DataFrame
+            Current snapshot, indexed by the keys.
+        ignored : sequence of str
+            Columns not compared. Every common row is changed when the
+            snapshots do not have the same columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            Key columns, ``change`` and the other columns: current values
+            for added and changed rows, previous values for removed ones.
+        """
+        if previous is None:
+            added, changed, removed = current, current.iloc[:0], current.iloc[:0]
+        else:
+            added = current[~current.index.isin(previous.index)]
+            removed = previous[~previous.index.isin(current.index)]
+            common = current.index[current.index.isin(previous.index)]
+            new = current.loc[common]
+            old = previous.loc[common]
+
+            # Columns are compared by position: names may be duplicated
+            same = np.full(len(common), new.columns.equals(old.columns))
+            if same.any():
+                for i, col in enumerate(new.columns):
+                    if col in ignored:
+                        continue
+                    a, b = new.iloc[:, i], old.iloc[:, i]
+                    equal = a.eq(b.to_numpy()).fillna(False).astype(bool).to_numpy()
+                    same &= equal | (a.isna().to_numpy() & b.isna().to_numpy())
+            changed = new[~same]
+
+        changes = pd.concat([
+            added.assign(change=CoreConfig.POLL_ADD),
+            changed.assign(change=CoreConfig.POLL_CHANGE),
+            removed.assign(change=CoreConfig.POLL_REMOVE),
+        ])
+        change = changes.columns.get_loc("change")
+        order = [change] + [i for i in range(changes.shape[1]) if i != change]
+        return changes.iloc[:, order].reset_index()
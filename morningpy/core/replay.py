@@ -0,0 +1,442 @@
+import argparse
+import asyncio
+import importlib
+import math
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+from aiohttp import web
+
+from morningpy.core.config import CoreConfig
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "data" / "fixture"
+
+CONFIG_MODULES = (
+    "morningpy.config.market",
+    "morningpy.config.news",
+    "morningpy.config.security",
+    "morningpy.config.timeseries",
+)
+
+REPLAY_API_KEY = "replay-api-key"
+REPLAY_TOKEN = "replay-token"
+
+
+def _has_fixtures(path: Path) -> bool:
+    return path.is_dir() and any(path.glob("*_response.json"))
+
+
+def default_fixtures_dir() -> Path:
+    """
+    Directory served when no fixtures_dir is given: the responses saved
+    with save_api_response (FIXTURES_DIR).
+
+    Raises
+    ------
+    FileNotFoundError
+        If FIXTURES_DIR holds no ``*_response.json`` file, e.g. in a fresh
+        install where nothing was recorded yet.
+    """
+    if _has_fixtures(FIXTURES_DIR):
+        return FIXTURES_DIR
+    raise FileNotFoundError(
+        f"No recorded responses in {FIXTURES_DIR}; record some with "
+        "save_api_response or pass fixtures_dir (e.g. the repository's "
+        "tests/fixtures/fake_responses)"
+    )
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    Endpoint served by the replay server.
+
+    Attributes
+    ----------
+    fixture : str
+        Fixture name; the body is ``<fixture>_response.json`` (the file
+        name written by save_api_response).
+    path : str
+        Regular expression the request path must fully match.
+    params : dict
+        Query parameter → regular expression the value must fully match,
+        to tell apart endpoints sharing a path.
+    """
+
+    fixture: str
+    path: str
+    params: Dict[str, str] = field(default_factory=dict)
+
+    def matches(self, path: str, query: Dict[str, str]) -> bool:
+        if not re.fullmatch(self.path, path):
+            return False
+        return all(re.fullmatch(p, query.get(k, "")) for k, p in self.params.items())
+
+
+# First match wins: routes sharing a path list the most specific first.
+ROUTES: Tuple[Route, ...] = (
+    Route("get_financial_statement", r"/sal-service/v1/stock/newfinancials/[^/]+/[^/]+/detail"),
+    Route("get_holding_info", r"/sal-service/v1/etf/portfolio/holding/v2/[^/]+/data", {"freeNum": "1"}),
+    Route("get_holding", r"/sal-service/v1/etf/portfolio/holding/v2/[^/]+/data"),
+    Route("get_intraday_timeseries", r"/QS-markets/chartservice/v2/timeseries", {"frequency": r"\d+"}),
+    Route("get_historical_timeseries", r"/QS-markets/chartservice/v2/timeseries"),
+    Route("get_headline_news", r"/api/v1/[^/]+/sections/[^/]+"),
+    Route("get_market_us_calendar_info", r"/api/v2/markets/calendar"),
+    Route("get_market_fair_value", r"/api/v2/markets/fair-value"),
+    Route("get_market_indexes", r"/api/v2/markets/indexes"),
+    Route("get_market_commodities", r"/api/v2/markets/commodities"),
+    Route("get_market_currencies", r"/api/v2/markets/currencies"),
+    Route("get_market_movers", r"/api/v2/stores/realtime/movers"),
+)
+
+
+class TokenBucket:
+    """
+    Request rate limiter: `rate` tokens per second, up to `burst` stored.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> Optional[float]:
+        """
+        Take a token.
+
+        Returns
+        -------
+        float or None
+            None if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate
+
+
+class ReplayServer:
+    """
+    Local stand-in for the Morningstar endpoints, serving recorded responses.
+
+    Every route answers with its recorded fixture, after an injected
+    latency, and may fail with an injected error or a 429 when the
+    request rate exceeds the throttle. Authentication endpoints (API key
+    script, MAAS token, WAF token) answer with dummy tokens. Combined
+    with `replay_mode`, the whole pipeline (auth headers, sessions,
+    retries, breakers, parsing) runs offline and reproducibly.
+
+    Parameters
+    ----------
+    fixtures_dir : str or Path, optional
+        Directory of ``<fixture>_response.json`` files. Defaults to
+        `default_fixtures_dir`, the responses written by save_api_response.
+    latency : float, default 0.0
+        Seconds added to every response.
+    jitter : float, default 0.0
+        Random extra latency, uniform in [0, jitter] seconds.
+    error_rate : float, default 0.0
+        Probability that a request fails with one of error_statuses.
+    error_statuses : sequence of int, default (500, 502, 503, 504)
+        Statuses of injected errors.
+    rate_limit : float, optional
+        Requests per second accepted before answering 429 with a
+        Retry-After header. None disables throttling.
+    burst : int, default 10
+        Requests accepted at once before rate_limit applies.
+    seed : int, optional
+        Seed of the latency and error draws, for reproducible runs.
+    routes : sequence of Route, default ROUTES
+        Served endpoints.
+
+    Raises
+    ------
+    ValueError
+        If error_rate is out of [0, 1].
+    FileNotFoundError
+        If the fixture directory holds no recorded response, or
+        fixtures_dir is omitted and nothing was saved by save_api_response.
+
+    Attributes
+    ----------
+    stats : Counter
+        Responses sent per (fixture, status); unmatched paths count under
+        their path.
+    url : str
+        Base URL once started, e.g. ``http://127.0.0.1:54321``.
+
+    Examples
+    --------
+    >>> with ReplayServer(latency=0.05, jitter=0.02, error_rate=0.1).running() as server:
+    ...     with replay_mode(server):
+    ...         df = get_holding(ticker=["SPY", "QQQ"])
+    >>> server.stats
+    Counter({('get_holding', 200): 2, ('get_holding', 503): 1})
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Union[str, Path, None] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503, 504),
+        rate_limit: Optional[float] = None,
+        burst: int = 10,
+        seed: Optional[int] = None,
+        routes: Sequence[Route] = ROUTES,
+    ):
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be in [0, 1]")
+        if fixtures_dir:
+            self.fixtures_dir = Path(fixtures_dir)
+            if not _has_fixtures(self.fixtures_dir):
+                raise FileNotFoundError(f"No *_response.json fixture in {self.fixtures_dir}")
+        else:
+            self.fixtures_dir = default_fixtures_dir()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.routes = tuple(routes)
+        self.random = random.Random(seed)
+        self.stats: Counter = Counter()
+        self.url: Optional[str] = None
+        self._bodies: Dict[str, bytes] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    def route(self, path: str, query: Dict[str, str]) -> Optional[Route]:
+        """First route matching a request, if any."""
+        return next((r for r in self.routes if r.matches(path, query)), None)
+
+    def body(self, fixture: str) -> Optional[bytes]:
+        """Raw recorded response of a fixture, read once."""
+        if fixture not in self._bodies:
+            path = self.fixtures_dir / f"{fixture}_response.json"
+            if not path.exists():
+                return None
+            self._bodies[fixture] = path.read_bytes()
+        return self._bodies[fixture]
+
+    def app(self) -> web.Application:
+        """aiohttp application serving the routes and auth endpoints."""
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self._handle)
+        return app
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = request.path
+        if path.endswith(".js"):  # API key script
+            return web.Response(
+                text=f'keyApigee:"{REPLAY_API_KEY}",tokenRealtime:"{REPLAY_TOKEN}"',
+                content_type="application/javascript",
+            )
+        if path in ("/api/v2/stores/maas/token", "/waf-token"):
+            return web.Response(text=REPLAY_TOKEN)
+
+        route = self.route(path, dict(request.query))
+        key = route.fixture if route else path
+
+        if self.bucket is not None:
+            wait = self.bucket.acquire()
+            if wait is not None:
+                self.stats[(key, 429)] += 1
+                return web.json_response(
+                    {"error": "Too Many Requests"},
+                    status=429,
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            status = self.random.choice(self.error_statuses)
+            self.stats[(key, status)] += 1
+            return web.json_response({"error": "injected"}, status=status)
+
+        body = self.body(route.fixture) if route else None
+        if body is None:
+            self.stats[(key, 404)] += 1
+            return web.json_response({"error": f"no fixture for {path}"}, status=404)
+        self.stats[(key, 200)] += 1
+        return web.Response(body=body, content_type="application/json")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving on the running event loop.
+
+        Returns
+        -------
+        str
+            Base URL of the server; port 0 picks a free port.
+        """
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "ReplayServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    @contextmanager
+    def running(self, host: str = "127.0.0.1", port: int = 0) -> Iterator["ReplayServer"]:
+        """
+        Serve from a background thread for the duration of the block.
+
+        Needed by the synchronous ``get_*`` functions, which run their own
+        event loop with asyncio.run.
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="morningpy-replay", daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.start(host, port), loop).result()
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+def _redirect(url: str, base: str) -> str:
+    """url with its scheme and host replaced by those of base."""
+    target = urlsplit(base)
+    parts = urlsplit(url)
+    return urlunsplit((target.scheme, target.netloc, parts.path, parts.query, parts.fragment))
+
+
+def config_classes() -> List[type]:
+    """Endpoint config classes, i.e. those defining an API_URL."""
+    classes = []
+    for name in CONFIG_MODULES:
+        module = importlib.import_module(name)
+        classes += [
+            obj for obj in vars(module).values()
+            if isinstance(obj, type) and obj.__module__ == name and hasattr(obj, "API_URL")
+        ]
+    return classes
+
+
+@contextmanager
+def replay_mode(
+    server: Union[str, ReplayServer],
+    cache_file: Union[str, Path, None] = None,
+) -> Iterator[str]:
+    """
+    Point every endpoint and authentication URL at a replay server.
+
+    Within the block, the API_URL and PAGE_URL of every endpoint config
+    and the CoreConfig.URLS authentication endpoints are redirected to
+    the server. The WAF token is read over HTTP instead of through a
+    browser, tokens are cached in a separate file so the real cached
+    tokens are kept, and circuit breakers start closed. Extractors must be
+    created inside the block, since they read their URLs on creation.
+
+    Parameters
+    ----------
+    server : str or ReplayServer
+        Started server or its base URL (for a server run with
+        ``python -m morningpy.core.replay``).
+    cache_file : str or Path, optional
+        Auth cache file used within the block. A file in a temporary
+        directory, removed on exit, by default.
+
+    Yields
+    ------
+    str
+        Base URL of the server.
+    """
+    from morningpy.core.client import BaseClient
+
+    base = server.url if isinstance(server, ReplayServer) else server
+    if not base:
+        raise ValueError("Replay server is not started")
+
+    saved: List[Tuple[type, str, str]] = []
+    for cls in config_classes():
+        for attr in ("API_URL", "PAGE_URL"):
+            if attr in vars(cls):
+                saved.append((cls, attr, getattr(cls, attr)))
+                setattr(cls, attr, _redirect(getattr(cls, attr), base))
+    saved_urls = dict(CoreConfig.URLS)
+    saved_cache = CoreConfig.AUTH_CACHE_FILE
+    cache_dir = tempfile.TemporaryDirectory(prefix="morningpy-replay-") if cache_file is None else None
+
+    CoreConfig.URLS.update({k: _redirect(v, base) for k, v in saved_urls.items()})
+    CoreConfig.URLS["waf_token"] = f"{base}/waf-token"
+    # An absolute path: Cache resolves relative names in the package data dir
+    CoreConfig.AUTH_CACHE_FILE = str(
+        Path(cache_dir.name) / "auth_cache.json" if cache_dir else Path(cache_file).resolve()
+    )
+    BaseClient.reset_breakers()
+    try:
+        yield base
+    finally:
+        for cls, attr, value in saved:
+            setattr(cls, attr, value)
+        CoreConfig.URLS.clear()
+        CoreConfig.URLS.update(saved_urls)
+        CoreConfig.AUTH_CACHE_FILE = saved_cache
+        BaseClient.reset_breakers()
+        if cache_dir is not None:
+            cache_dir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded Morningstar responses locally.")
+    parser.add_argument("--fixtures-dir", default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = ReplayServer(
+        fixtures_dir=args.fixtures_dir,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+    )
+    web.run_app(server.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
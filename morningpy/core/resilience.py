@@ -0,0 +1,346 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import pandas as pd
+
+from morningpy.core.error import (
+    APIConnectionError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RateLimitError,
+)
+
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an exception, if any."""
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify an exception as retryable (transient) or fatal.
+
+    Retryable: timeouts, connection and payload errors, open circuits and
+    HTTP 408, 425, 429 and 5xx gateway/availability statuses. Fatal:
+    every other HTTP status (400, 401, 403, 404, ...), malformed JSON and
+    any other exception, which would fail again identically.
+
+    Parameters
+    ----------
+    error : BaseException
+        Exception raised by a request.
+
+    Returns
+    -------
+    bool
+        True if sending the same request again may succeed.
+    """
+    if isinstance(error, (asyncio.TimeoutError, APIConnectionError, RateLimitError)):
+        return True
+    if isinstance(error, aiohttp.ContentTypeError):
+        return False
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUSES
+    if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return True
+    return error_status(error) in RETRYABLE_STATUSES
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """
+    Seconds the server asked to wait before retrying.
+
+    Reads a ``retry_after`` attribute (RateLimitError, CircuitOpenError) or
+    the ``Retry-After`` header of an HTTP error, given either in seconds or
+    as an HTTP date.
+
+    Returns
+    -------
+    float or None
+        Non-negative delay, or None if the error carries no hint.
+    """
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        headers = getattr(error, "headers", None) or {}
+        value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def should_retry(error: BaseException) -> bool:
+    """
+    Retry predicate used by BaseClient.
+
+    Same as `is_retryable`, except that open circuits and exhausted
+    deadlines fail fast instead of waiting.
+    """
+    return is_retryable(error) and not isinstance(error, (CircuitOpenError, DeadlineExceededError))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one host.
+
+    closed
+        Requests flow. Each retryable failure increments a counter, each
+        success resets it. Reaching failure_threshold opens the circuit.
+    open
+        Requests are refused with CircuitOpenError without being sent, until
+        reset_timeout seconds have elapsed.
+    half-open
+        A single trial request is let through. Success closes the circuit,
+        failure opens it again for another reset_timeout. A trial that ends
+        without an outcome (cancelled, abandoned) is released so the next
+        request becomes the trial.
+
+    Fatal errors (e.g. 404) prove the host is answering and do not count as
+    failures.
+
+    Attributes
+    ----------
+    host : str
+        Host guarded by the breaker.
+    failure_threshold : int
+        Consecutive failures that open the circuit.
+    reset_timeout : float
+        Seconds the circuit stays open before a trial request.
+    failures : int
+        Current consecutive failure count.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self) -> bool:
+        """
+        Admit or refuse a request.
+
+        Returns
+        -------
+        bool
+            True if the request is the half-open trial. It must then end in
+            record_success, record_failure or release.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open, or half-open with a trial already in flight.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return False
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        raise CircuitOpenError(self.host, retry_after=max(0.0, remaining))
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed trial."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """End the half-open trial without an outcome, leaving the failure count as is."""
+        self._probing = False
+
+    def record(self, error: BaseException) -> None:
+        """Update the breaker from a request error."""
+        if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+            return
+        if is_retryable(error):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Breaker key of a URL."""
+        return urlsplit(url).netloc
+
+
+@dataclass
+class RequestFailure:
+    """
+    One failed request.
+
+    Attributes
+    ----------
+    url : str
+        Request URL.
+    params : dict or None
+        Query parameters.
+    metadata : dict or None
+        Request metadata (security_id, security_label, ...).
+    error : BaseException
+        Final exception.
+    retryable : bool
+        Whether re-queuing the request may succeed.
+    attempts : int
+        Attempts made before giving up.
+    """
+
+    url: str
+    params: Optional[Dict[str, Any]]
+    metadata: Optional[Dict[str, Any]]
+    error: BaseException
+    retryable: bool
+    attempts: int = 1
+
+    @property
+    def security_id(self) -> Optional[str]:
+        return (self.metadata or {}).get("security_id")
+
+    @property
+    def status(self) -> Optional[int]:
+        return error_status(self.error)
+
+    @property
+    def error_type(self) -> str:
+        return type(self.error).__name__
+
+    def to_request(self) -> Dict[str, Any]:
+        """Request dict accepted by BaseClient.fetch_all, for re-queuing."""
+        return {"url": self.url, "params": self.params, "metadata": self.metadata}
+
+
+class FailureReport:
+    """
+    Failed requests of an extraction run.
+
+    Extractors skip failed requests and return the rows of the successful
+    ones; the report tells which requests (and securities) are missing and
+    why, so callers can fail the job or re-queue only the failures.
+
+    Examples
+    --------
+    >>> df, failures = await extractor.run(return_failures=True)
+    >>> failures.to_frame()
+      security_id  url  error_type  status  retryable  attempts  message
+    >>> retry = failures.requests(retryable=True)
+    """
+
+    COLUMNS = ["security_id", "url", "error_type", "status", "retryable", "attempts", "message"]
+
+    def __init__(self):
+        self.failures: List[RequestFailure] = []
+
+    def add(self, request: Any, error: BaseException) -> RequestFailure:
+        """
+        Record a failed request.
+
+        Parameters
+        ----------
+        request : dict, tuple or None
+            Request as built by the extractor: a dict with url, params and
+            metadata keys, or a (url, params, metadata) tuple.
+        error : BaseException
+            Exception returned by fetch_all.
+        """
+        if isinstance(request, dict):
+            url, params, metadata = request.get("url"), request.get("params"), request.get("metadata")
+        elif isinstance(request, (tuple, list)):
+            url, params, metadata = (list(request) + [None] * 3)[:3]
+        else:
+            url = params = metadata = None
+        failure = RequestFailure(
+            url=url,
+            params=params,
+            metadata=metadata,
+            error=error,
+            retryable=is_retryable(error),
+            attempts=getattr(error, "attempts", 1),
+        )
+        self.failures.append(failure)
+        return failure
+
+    def __len__(self) -> int:
+        return len(self.failures)
+
+    def __iter__(self) -> Iterator[RequestFailure]:
+        return iter(self.failures)
+
+    def __bool__(self) -> bool:
+        return bool(self.failures)
+
+    def __repr__(self) -> str:
+        fatal = sum(not f.retryable for f in self.failures)
+        return f"FailureReport({len(self)} failed, {len(self) - fatal} retryable, {fatal} fatal)"
+
+    def _select(self, retryable: Optional[bool]) -> List[RequestFailure]:
+        return [f for f in self.failures if retryable is None or f.retryable == retryable]
+
+    def requests(self, retryable: Optional[bool] = True) -> List[Dict[str, Any]]:
+        """
+        Failed requests to re-queue.
+
+        Parameters
+        ----------
+        retryable : bool or None, default True
+            Keep only retryable (True) or fatal (False) failures; None keeps all.
+        """
+        return [f.to_request() for f in self._select(retryable)]
+
+    def security_ids(self, retryable: Optional[bool] = None) -> List[str]:
+        """Distinct security_ids with at least one failed request, in failure order."""
+        ids = (f.security_id for f in self._select(retryable))
+        return list(dict.fromkeys(i for i in ids if i is not None))
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per failed request."""
+        return pd.DataFrame(
+            [
+                (f.security_id, f.url, f.error_type, f.status, f.retryable, f.attempts, str(f.error))
+                for f in self.failures
+            ],
+            columns=self.COLUMNS,
+        )
@@ -0,0 +1,802 @@
+import re
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class NGramIndex:
+    """
+    Case-insensitive inverted n-gram index over string columns of a DataFrame.
+
+    Each indexed column is reduced to lowercase values, split into overlapping
+    n-grams and stored as a posting list per n-gram (sorted row positions).
+    Substring and prefix queries intersect the posting lists of the query
+    n-grams, then verify the few remaining candidates instead of scanning
+    the whole column.
+
+    Attributes
+    ----------
+    n : int
+        Size of the n-grams (3 for trigrams).
+    columns : List[str]
+        Names of the indexed columns.
+    fingerprint : int
+        Content hash of the indexed columns, used to detect a stale
+        persisted index.
+
+    Notes
+    -----
+    - Postings are stored in CSR layout (sorted grams, offsets, row ids),
+      which keeps the index compact and cheap to persist with numpy.
+    - Queries shorter than ``n`` cannot use the postings and fall back to
+      a scan of the lowercase column values.
+    - Matching is literal: query characters are never treated as regex.
+
+    Examples
+    --------
+    >>> index = NGramIndex.build(tickers, ["security_label", "ticker", "isin"])
+    >>> positions, scores = index.search("security_label", "vanguard")
+    >>> tickers.iloc[positions]
+    """
+
+    # Rank tiers packed into the upper bits of the score, see _rank
+    EXACT, PREFIX, SUBSTRING = 0, 1, 2
+
+    def __init__(
+        self,
+        n: int,
+        postings: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        fingerprint: int,
+    ):
+        """
+        Initialize the index from prebuilt postings.
+
+        Parameters
+        ----------
+        n : int
+            Size of the n-grams.
+        postings : Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]
+            Mapping of column name to (grams, offsets, rows) arrays.
+        fingerprint : int
+            Content hash of the indexed columns.
+
+        Notes
+        -----
+        Use build() or load_or_build() rather than calling this directly.
+        Lowercase column values must be attached with attach() before search.
+        """
+        self.n = n
+        self.fingerprint = fingerprint
+        self.columns = list(postings.keys())
+        self._postings = postings
+        self._gram_lookup = {
+            column: dict(zip(grams.tolist(), range(len(grams))))
+            for column, (grams, _, _) in postings.items()
+        }
+        self._values: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def _lower_values(frame: pd.DataFrame, column: str) -> np.ndarray:
+        """Return the lowercase string values of a column, '' for missing."""
+        return frame[column].fillna("").astype(str).str.lower().to_numpy(dtype=object)
+
+    @staticmethod
+    def compute_fingerprint(frame: pd.DataFrame, columns: List[str]) -> int:
+        """
+        Hash the content of the indexed columns.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Source DataFrame.
+        columns : List[str]
+            Columns covered by the index.
+
+        Returns
+        -------
+        int
+            Order-sensitive 63-bit hash of the column contents.
+        """
+        hashes = pd.util.hash_pandas_object(frame[columns], index=False).to_numpy()
+        weights = np.arange(1, len(hashes) + 1, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            digest = int((hashes * weights).sum(dtype=np.uint64))
+        return (digest ^ len(hashes)) & 0x7FFFFFFFFFFFFFFF
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame, columns: List[str], n: int = 3) -> "NGramIndex":
+        """
+        Build an index over the given columns of a DataFrame.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Source DataFrame. Row positions in the index refer to its order.
+        columns : List[str]
+            String columns to index. Columns absent from the frame are skipped.
+        n : int, default 3
+            Size of the n-grams.
+
+        Returns
+        -------
+        NGramIndex
+            Index with lowercase values already attached.
+        """
+        columns = [c for c in columns if c in frame.columns]
+        postings = {}
+        values = {}
+
+        for column in columns:
+            lowered = cls._lower_values(frame, column)
+            grams_rows = defaultdict(list)
+            for row, value in enumerate(lowered):
+                for gram in {value[i:i + n] for i in range(len(value) - n + 1)}:
+                    grams_rows[gram].append(row)
+
+            grams = sorted(grams_rows)
+            lengths = np.fromiter((len(grams_rows[g]) for g in grams), dtype=np.int64, count=len(grams))
+            offsets = np.zeros(len(grams) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            rows = np.fromiter(
+                (row for g in grams for row in grams_rows[g]),
+                dtype=np.int32,
+                count=int(offsets[-1]),
+            )
+            postings[column] = (np.array(grams, dtype=f"<U{n}"), offsets, rows)
+            values[column] = lowered
+
+        index = cls(n, postings, cls.compute_fingerprint(frame, columns))
+        index._values = values
+        return index
+
+    def attach(self, frame: pd.DataFrame) -> "NGramIndex":
+        """
+        Attach the lowercase column values used to verify candidates.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            DataFrame the index was built from.
+
+        Returns
+        -------
+        NGramIndex
+            The index itself, to allow chaining.
+        """
+        self._values = {column: self._lower_values(frame, column) for column in self.columns}
+        return self
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Persist the postings to a numpy .npz archive.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file. Written atomically (temp file → rename).
+        """
+        path = Path(path)
+        arrays = {
+            "n": np.array(self.n),
+            "fingerprint": np.array(self.fingerprint, dtype=np.int64),
+            "columns": np.array(self.columns, dtype=str),
+        }
+        for column, (grams, offsets, rows) in self._postings.items():
+            arrays[f"{column}__grams"] = grams
+            arrays[f"{column}__offsets"] = offsets
+            arrays[f"{column}__rows"] = rows
+
+        tmp_path = path.with_suffix(".tmp.npz")
+        try:
+            np.savez(tmp_path, **arrays)
+            tmp_path.replace(path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NGramIndex":
+        """
+        Load postings previously written by save().
+
+        Parameters
+        ----------
+        path : str or Path
+            Source .npz file.
+
+        Returns
+        -------
+        NGramIndex
+            Index without attached values; call attach() before searching.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            columns = data["columns"].tolist()
+            postings = {
+                column: (
+                    data[f"{column}__grams"],
+                    data[f"{column}__offsets"],
+                    data[f"{column}__rows"],
+                )
+                for column in columns
+            }
+            return cls(int(data["n"]), postings, int(data["fingerprint"]))
+
+    @classmethod
+    def load_or_build(
+        cls,
+        frame: pd.DataFrame,
+        columns: List[str],
+        path: Optional[Union[str, Path]] = None,
+        n: int = 3,
+    ) -> "NGramIndex":
+        """
+        Load a persisted index if it matches the frame, otherwise rebuild it.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Source DataFrame.
+        columns : List[str]
+            String columns to index.
+        path : str or Path, optional
+            Location of the persisted index. If None, nothing is persisted.
+        n : int, default 3
+            Size of the n-grams.
+
+        Returns
+        -------
+        NGramIndex
+            Ready-to-search index.
+
+        Notes
+        -----
+        A persisted index is reused only if its n-gram size, columns and
+        content fingerprint match. Write failures (e.g. read-only install)
+        are ignored and the in-memory index is returned.
+        """
+        columns = [c for c in columns if c in frame.columns]
+
+        if path is not None and Path(path).exists():
+            try:
+                index = cls.load(path)
+                if (
+                    index.n == n
+                    and index.columns == columns
+                    and index.fingerprint == cls.compute_fingerprint(frame, columns)
+                ):
+                    return index.attach(frame)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        index = cls.build(frame, columns, n=n)
+        if path is not None:
+            try:
+                index.save(path)
+            except OSError:
+                pass
+        return index
+
+    def _candidates(self, column: str, query: str) -> np.ndarray:
+        """
+        Intersect the posting lists of all n-grams of the query.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted row positions that contain every n-gram of the query.
+        """
+        grams, offsets, rows = self._postings[column]
+        lookup = self._gram_lookup[column]
+
+        slices = []
+        for gram in {query[i:i + self.n] for i in range(len(query) - self.n + 1)}:
+            idx = lookup.get(gram)
+            if idx is None:
+                return np.empty(0, dtype=np.int64)
+            slices.append(rows[offsets[idx]:offsets[idx + 1]])
+
+        slices.sort(key=len)
+        result = slices[0]
+        for postings in slices[1:]:
+            result = np.intersect1d(result, postings, assume_unique=True)
+            if not len(result):
+                break
+        return result.astype(np.int64)
+
+    def _rank(self, values: np.ndarray, positions: np.ndarray, query: str, prefix: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Verify candidate rows and score them.
+
+        Lower scores rank first: exact matches, then prefix matches, then
+        substring matches; ties break on match position and value length.
+        """
+        kept, scores = [], []
+        for row in positions.tolist():
+            value = values[row]
+            pos = value.find(query)
+            if pos < 0 or (prefix and pos != 0):
+                continue
+            tier = self.EXACT if value == query else self.PREFIX if pos == 0 else self.SUBSTRING
+            kept.append(row)
+            scores.append((tier << 40) | (min(pos, 0xFFFFF) << 20) | min(len(value), 0xFFFFF))
+
+        kept = np.asarray(kept, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.int64)
+        order = np.argsort(scores, kind="stable")
+        return kept[order], scores[order]
+
+    def search(
+        self,
+        column: str,
+        query: str,
+        prefix: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find rows whose column value contains (or starts with) the query.
+
+        Parameters
+        ----------
+        column : str
+            Indexed column to search.
+        query : str
+            Literal search string, matched case-insensitively.
+        prefix : bool, default False
+            If True, only values starting with the query match.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Row positions and their scores, best match first.
+
+        Raises
+        ------
+        KeyError
+            If the column is not indexed.
+        """
+        if column not in self._postings:
+            raise KeyError(f"Column '{column}' is not indexed")
+
+        values = self._values[column]
+        query = query.lower()
+
+        if len(query) < self.n:
+            candidates = np.flatnonzero(
+                pd.Series(values).str.startswith(query) if prefix
+                else pd.Series(values).str.contains(query, regex=False)
+            )
+        else:
+            candidates = self._candidates(column, query)
+
+        return self._rank(values, candidates, query, prefix)
+
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _tokenize(value: str) -> List[str]:
+    """Split a lowercase string into alphanumeric words."""
+    return _WORD_PATTERN.findall(value)
+
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index for autocompletion over string columns.
+
+    Lowercase column values are sorted once; a prefix query is then two
+    binary searches delimiting the contiguous block of values sharing the
+    prefix. Individual words are indexed in a second sorted array so that
+    single-word prefixes also complete inner words ("500" finds
+    "Vanguard S&P 500 ETF").
+
+    Attributes
+    ----------
+    columns : List[str]
+        Names of the indexed columns.
+
+    Examples
+    --------
+    >>> index = PrefixIndex.build(tickers, ["security_label", "ticker"])
+    >>> tickers.iloc[index.suggest("vangu", limit=10)]
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        head: Tuple[np.ndarray, np.ndarray],
+        words: Tuple[np.ndarray, np.ndarray],
+    ):
+        """
+        Initialize the index from sorted key/row arrays.
+
+        Parameters
+        ----------
+        columns : List[str]
+            Indexed column names.
+        head : Tuple[np.ndarray, np.ndarray]
+            Sorted full values and their row positions.
+        words : Tuple[np.ndarray, np.ndarray]
+            Sorted words found inside values and their row positions.
+        """
+        self.columns = columns
+        self._head_keys, self._head_rows = head
+        self._word_keys, self._word_rows = words
+
+    @staticmethod
+    def _sort(keys: List[str], rows: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort keys and carry their row positions along."""
+        keys = np.array(keys, dtype=object)
+        rows = np.array(rows, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        return keys[order], rows[order]
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame, columns: List[str]) -> "PrefixIndex":
+        """
+        Build the index over the given columns of a DataFrame.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Source DataFrame. Row positions refer to its order.
+        columns : List[str]
+            String columns to index. Columns absent from the frame are skipped.
+
+        Returns
+        -------
+        PrefixIndex
+            Ready-to-query index.
+        """
+        columns = [c for c in columns if c in frame.columns]
+        head_keys, head_rows, word_keys, word_rows = [], [], [], []
+        interned: Dict[str, str] = {}
+
+        for column in columns:
+            for row, value in enumerate(NGramIndex._lower_values(frame, column)):
+                if not value:
+                    continue
+                head_keys.append(value)
+                head_rows.append(row)
+                for word in set(_tokenize(value)[1:]):
+                    word_keys.append(interned.setdefault(word, word))
+                    word_rows.append(row)
+
+        return cls(
+            columns,
+            cls._sort(head_keys, head_rows),
+            cls._sort(word_keys, word_rows),
+        )
+
+    @staticmethod
+    def _collect(
+        keys: np.ndarray,
+        rows: np.ndarray,
+        prefix: str,
+        seen: set,
+        out: List[int],
+        limit: int,
+    ) -> None:
+        """Append unseen rows whose key starts with prefix, up to limit."""
+        lo = int(np.searchsorted(keys, prefix, side="left"))
+        hi = int(np.searchsorted(keys, prefix + "\U0010ffff", side="left"))
+        for row in rows[lo:hi].tolist():
+            if len(out) >= limit:
+                return
+            if row not in seen:
+                seen.add(row)
+                out.append(row)
+
+    def suggest(self, prefix: str, limit: int = 10) -> np.ndarray:
+        """
+        Return rows whose value, or one of its words, starts with prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            Text typed so far, matched case-insensitively.
+        limit : int, default 10
+            Maximum number of rows to return.
+
+        Returns
+        -------
+        np.ndarray
+            Row positions. Values starting with the prefix come first in
+            lexicographic order (so an exact match leads), followed by
+            values where an inner word starts with it.
+        """
+        prefix = prefix.lower().lstrip()
+        if not prefix or limit <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        seen: set = set()
+        out: List[int] = []
+        self._collect(self._head_keys, self._head_rows, prefix, seen, out, limit)
+        if len(out) < limit and len(_tokenize(prefix)) == 1:
+            self._collect(self._word_keys, self._word_rows, prefix.strip(), seen, out, limit)
+        return np.asarray(out, dtype=np.int64)
+
+
+def edit_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance with early termination.
+
+    Parameters
+    ----------
+    source, target : str
+        Strings to compare.
+    max_distance : int
+        Distances above this bound are not computed exactly.
+
+    Returns
+    -------
+    int
+        Number of insertions, deletions, substitutions and adjacent
+        transpositions, or ``max_distance + 1`` if it exceeds the bound.
+
+    Examples
+    --------
+    >>> edit_distance("vangaurd", "vanguard", 2)
+    1
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    if source == target:
+        return 0
+
+    previous2 = None
+    previous = list(range(len(target) + 1))
+    for i, s_char in enumerate(source, 1):
+        current = [i] + [0] * len(target)
+        for j, t_char in enumerate(target, 1):
+            cost = 0 if s_char == t_char else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                previous2 is not None
+                and j > 1
+                and s_char == target[j - 2]
+                and source[i - 2] == t_char
+            ):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class SymSpellIndex:
+    """
+    Typo-tolerant word index based on the symmetric delete algorithm.
+
+    Every distinct word of the indexed columns is expanded into all strings
+    obtained by deleting up to ``max_distance`` characters from its first
+    ``prefix_length`` characters. A query word goes through the same
+    expansion; words sharing a delete are candidates, verified with
+    edit_distance. This needs a handful of binary searches per query
+    instead of comparing against every word.
+
+    Attributes
+    ----------
+    columns : List[str]
+        Names of the indexed columns.
+    max_distance : int
+        Largest edit distance the index can answer.
+    prefix_length : int
+        Number of leading characters expanded into deletes.
+
+    Notes
+    -----
+    Deletes are stored as sorted 64-bit hashes next to their word ids rather
+    than as a dict of strings, which keeps memory around 12 bytes per delete.
+    Hash collisions only add candidates that verification discards. Python
+    string hashes are salted per process, so the index is not persisted.
+
+    Examples
+    --------
+    >>> index = SymSpellIndex.build(tickers, ["security_label", "ticker"])
+    >>> rows, distances = index.search("vangaurd total", max_distance=2)
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        terms: List[str],
+        term_postings: Tuple[np.ndarray, np.ndarray],
+        deletes: Tuple[np.ndarray, np.ndarray],
+        max_distance: int,
+        prefix_length: int,
+    ):
+        """
+        Initialize the index from prebuilt arrays.
+
+        Parameters
+        ----------
+        columns : List[str]
+            Indexed column names.
+        terms : List[str]
+            Distinct words, indexed by word id.
+        term_postings : Tuple[np.ndarray, np.ndarray]
+            CSR (offsets, rows) giving the row positions of each word.
+        deletes : Tuple[np.ndarray, np.ndarray]
+            Sorted delete hashes and the word id each one comes from.
+        max_distance : int
+            Largest supported edit distance.
+        prefix_length : int
+            Number of leading characters expanded into deletes.
+        """
+        self.columns = columns
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms = terms
+        self._term_offsets, self._term_rows = term_postings
+        self._delete_hashes, self._delete_terms = deletes
+
+    @staticmethod
+    def _deletes(word: str, max_distance: int) -> set:
+        """All strings obtained by removing up to max_distance characters."""
+        result = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            frontier = {
+                item[:i] + item[i + 1:]
+                for item in frontier if len(item) > 1
+                for i in range(len(item))
+            }
+            result |= frontier
+        return result
+
+    @classmethod
+    def build(
+        cls,
+        frame: pd.DataFrame,
+        columns: List[str],
+        max_distance: int = 2,
+        prefix_length: int = 7,
+    ) -> "SymSpellIndex":
+        """
+        Build the index over the words of the given columns.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Source DataFrame. Row positions refer to its order.
+        columns : List[str]
+            String columns to index. Columns absent from the frame are skipped.
+        max_distance : int, default 2
+            Largest edit distance the index will answer.
+        prefix_length : int, default 7
+            Number of leading characters of each word expanded into deletes.
+
+        Returns
+        -------
+        SymSpellIndex
+            Ready-to-query index.
+        """
+        columns = [c for c in columns if c in frame.columns]
+        term_ids: Dict[str, int] = {}
+        term_rows: List[List[int]] = []
+
+        for column in columns:
+            for row, value in enumerate(NGramIndex._lower_values(frame, column)):
+                for word in set(_tokenize(value)):
+                    term_id = term_ids.setdefault(word, len(term_rows))
+                    if term_id == len(term_rows):
+                        term_rows.append([])
+                    postings = term_rows[term_id]
+                    if not postings or postings[-1] != row:
+                        postings.append(row)
+
+        term_rows = [sorted(set(postings)) for postings in term_rows]
+        terms = list(term_ids)
+        lengths = np.fromiter((len(r) for r in term_rows), dtype=np.int64, count=len(term_rows))
+        offsets = np.zeros(len(term_rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        rows = np.fromiter(
+            (row for postings in term_rows for row in postings),
+            dtype=np.int64,
+            count=int(offsets[-1]),
+        )
+
+        hashes, owners = [], []
+        for term_id, term in enumerate(terms):
+            for delete in cls._deletes(term[:prefix_length], max_distance):
+                hashes.append(hash(delete))
+                owners.append(term_id)
+
+        hashes = np.array(hashes, dtype=np.int64)
+        owners = np.array(owners, dtype=np.int32)
+        order = np.argsort(hashes, kind="stable")
+
+        return cls(
+            columns,
+            terms,
+            (offsets, rows),
+            (hashes[order], owners[order]),
+            max_distance,
+            prefix_length,
+        )
+
+    def lookup(self, word: str, max_distance: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find indexed words within max_distance of a single word.
+
+        Parameters
+        ----------
+        word : str
+            Lowercase query word.
+        max_distance : int
+            Maximum edit distance, capped at the index max_distance.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Word ids and their edit distances.
+        """
+        max_distance = min(max_distance, self.max_distance)
+        keys = np.fromiter(
+            (hash(delete) for delete in self._deletes(word[:self.prefix_length], max_distance)),
+            dtype=np.int64,
+        )
+        lo = np.searchsorted(self._delete_hashes, keys, side="left")
+        hi = np.searchsorted(self._delete_hashes, keys, side="right")
+        candidates = set()
+        for start, stop in zip(lo.tolist(), hi.tolist()):
+            if start < stop:
+                candidates.update(self._delete_terms[start:stop].tolist())
+
+        term_ids, distances = [], []
+        for term_id in candidates:
+            distance = edit_distance(word, self._terms[term_id], max_distance)
+            if distance <= max_distance:
+                term_ids.append(term_id)
+                distances.append(distance)
+        return np.asarray(term_ids, dtype=np.int64), np.asarray(distances, dtype=np.int64)
+
+    def _rows_for_word(self, word: str, max_distance: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row positions matching a word and the best distance for each row."""
+        term_ids, distances = self.lookup(word, max_distance)
+        if not len(term_ids):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        starts = self._term_offsets[term_ids]
+        counts = self._term_offsets[term_ids + 1] - starts
+        rows = np.concatenate([
+            self._term_rows[start:start + count] for start, count in zip(starts, counts)
+        ])
+        row_distances = np.repeat(distances, counts)
+
+        order = np.argsort(row_distances, kind="stable")
+        rows, first = np.unique(rows[order], return_index=True)
+        return rows, row_distances[order][first]
+
+    def search(self, query: str, max_distance: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find rows containing every query word, allowing typos.
+
+        Parameters
+        ----------
+        query : str
+            One or several words, matched case-insensitively.
+        max_distance : int, default 2
+            Maximum edit distance per word, capped at the index max_distance.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Row positions and total edit distance over the query words,
+            closest matches first.
+        """
+        words = _tokenize(query.lower())
+        if not words:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        rows, total = self._rows_for_word(words[0], max_distance)
+        for word in words[1:]:
+            if not len(rows):
+                break
+            word_rows, word_distances = self._rows_for_word(word, max_distance)
+            rows, left, right = np.intersect1d(rows, word_rows, assume_unique=True, return_indices=True)
+            total = total[left] + word_distances[right]
+
+        order = np.argsort(total, kind="stable")
+        return rows[order], total[order]
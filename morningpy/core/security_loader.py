@@ -4,6 +4,7 @@ from typing import List, Union, Dict,Optional
 from pathlib import Path
 
 from morningpy.core.config import CoreConfig
+from morningpy.core.identifier_map import IdentifierMap
 
 
 class SecurityLoader:
@@ -35,6 +36,13 @@ class SecurityLoader:
         Mapping of security_id to field dictionaries (populated by get())
     fields : List[str]
         List of resolved security_id values (populated by get())
+    id_map : IdentifierMap
+        Identifier → row-position maps over tickers, shared across instances
+    
+    Notes
+    -----
+    The mapping file and its identifier maps are loaded once per process and
+    shared by all instances. Use `clear_cache()` to reload them.
     
     Examples
     --------
@@ -49,6 +57,9 @@ class SecurityLoader:
     }
     """
 
+    _cached_tickers: Optional[pd.DataFrame] = None  # Class-level cache
+    _cached_id_map: Optional[IdentifierMap] = None  # Class-level identifier maps
+
     def __init__(
         self,
         ticker: Union[str, List[str], None] = None,
@@ -102,7 +113,36 @@ class SecurityLoader:
         self.data_dir = package_dir / "data"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.path_file = self.data_dir / self.tickers_file
-        self.tickers = pd.read_parquet(self.path_file)
+        if SecurityLoader._cached_tickers is None:
+            SecurityLoader._cached_tickers = pd.read_parquet(self.path_file)
+        self.tickers = SecurityLoader._cached_tickers
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear the cached mapping file and identifier maps.
+
+        Call this method when the underlying parquet file has been updated.
+        """
+        cls._cached_tickers = None
+        cls._cached_id_map = None
+
+    @property
+    def id_map(self) -> IdentifierMap:
+        """
+        Identifier → row-position maps over the mapping DataFrame.
+
+        Returns
+        -------
+        IdentifierMap
+            Maps shared by all instances, rebuilt only if tickers changed.
+        """
+        if (
+            SecurityLoader._cached_id_map is None
+            or SecurityLoader._cached_id_map.frame is not self.tickers
+        ):
+            SecurityLoader._cached_id_map = IdentifierMap(self.tickers)
+        return SecurityLoader._cached_id_map
     
     @staticmethod
     def _normalize_input(value: Union[str, List[str], None]) -> List[str]:
@@ -161,7 +201,7 @@ class SecurityLoader:
         if not values:
             return []
 
-        matches = self.tickers[self.tickers[column].isin(values)]
+        matches = self.tickers.iloc[self.id_map.rows(values, column)]
 
         duplicates = (
             matches.groupby(column)["security_id"]
@@ -216,9 +256,8 @@ class SecurityLoader:
         if invalid_format:
             warnings.warn(f"Invalid ID format detected: {sorted(invalid_format)}")
 
-        valid_in_mapping = self.tickers[
-            self.tickers["security_id"].isin(valid_format)
-        ]["security_id"].unique().tolist()
+        positions = self.id_map.first_positions(valid_format, "security_id")
+        valid_in_mapping = [i for i, pos in zip(valid_format, positions) if pos >= 0]
 
         missing = set(valid_format) - set(valid_in_mapping)
         if missing:
@@ -327,8 +366,8 @@ class SecurityLoader:
         valid_columns = [c for c in columns_to_select if c in available_columns]
         
         # Get matching rows
-        matches = self.tickers[
-            self.tickers["security_id"].isin(security_ids)
+        matches = self.tickers.iloc[
+            self.id_map.rows(security_ids, "security_id")
         ][valid_columns].drop_duplicates()
         
         # For invalid fields that were requested, add them as empty strings
@@ -0,0 +1,391 @@
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+logger = logging.getLogger(__name__)
+
+BatchLike = Union[pa.Table, pa.RecordBatch, pd.DataFrame]
+
+
+def require_duckdb():
+    """
+    Import the optional duckdb dependency.
+
+    Raises
+    ------
+    ImportError
+        If duckdb is not installed.
+    """
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError(
+            "duckdb is required for engine='duckdb'. "
+            "Install it with `pip install morningpy[duckdb]`."
+        ) from e
+    return duckdb
+
+
+class BaseSink(ABC):
+    """
+    Abstract columnar sink receiving data batch by batch.
+
+    Sinks let extractors persist results incrementally: every batch is
+    written and released, so the full result never has to sit in memory.
+    The schema is fixed by the first batch; later batches are conformed to
+    it (columns cast, missing columns filled with nulls). A later batch
+    carrying columns absent from the schema raises unless the sink was
+    opened with ``extra_columns="drop"``.
+
+    Parameters
+    ----------
+    path : str or Path
+        Target file, directory or database.
+    extra_columns : {"raise", "drop"}, default "raise"
+        What to do with columns absent from the sink schema: raise a
+        ValueError, or drop them with a warning.
+
+    Attributes
+    ----------
+    path : Path
+        Target file, directory or database.
+    rows_written : int
+        Number of rows written so far.
+    schema : pa.Schema or None
+        Schema of the written data, set by the first batch.
+
+    Examples
+    --------
+    >>> with ParquetSink("holdings/", partition_cols=["security_id"]) as sink:
+    ...     for batch in batches:
+    ...         sink.write_batch(batch)
+    """
+
+    EXTRA_COLUMNS = ("raise", "drop")
+
+    def __init__(self, path: Union[str, Path], extra_columns: str = "raise"):
+        if extra_columns not in self.EXTRA_COLUMNS:
+            raise ValueError(
+                f"extra_columns must be one of {self.EXTRA_COLUMNS}, got '{extra_columns}'"
+            )
+        self.path = Path(path)
+        self.extra_columns = extra_columns
+        self.rows_written = 0
+        self.schema: Optional[pa.Schema] = None
+        self._closed = False
+
+    def __enter__(self) -> "BaseSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _to_table(batch: BatchLike) -> pa.Table:
+        """Normalize a batch to a pa.Table."""
+        if isinstance(batch, pa.Table):
+            return batch
+        if isinstance(batch, pa.RecordBatch):
+            return pa.Table.from_batches([batch])
+        if isinstance(batch, pd.DataFrame):
+            return pa.Table.from_pandas(batch, preserve_index=False)
+        raise TypeError(f"Unsupported batch type {type(batch)}")
+
+    def _conform(self, table: pa.Table) -> pa.Table:
+        """Align a batch with the sink schema."""
+        if self.schema is None:
+            # A column that is entirely null in the first batch would pin
+            # the null type; store it as string instead.
+            fields = [
+                pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                for f in table.schema
+            ]
+            self.schema = pa.schema(fields)
+            return table.cast(self.schema)
+
+        if table.schema.equals(self.schema):
+            return table
+
+        extra = set(table.column_names) - set(self.schema.names)
+        if extra:
+            if self.extra_columns == "raise":
+                raise ValueError(
+                    f"Columns absent from the sink schema: {sorted(extra)}. "
+                    f"Pass extra_columns='drop' to discard them."
+                )
+            logger.warning(f"Dropping columns absent from the sink schema: {sorted(extra)}")
+
+        columns = [
+            table.column(f.name).cast(f.type)
+            if f.name in table.column_names
+            else pa.nulls(table.num_rows, type=f.type)
+            for f in self.schema
+        ]
+        return pa.Table.from_arrays(columns, schema=self.schema)
+
+    def write_batch(self, batch: BatchLike) -> None:
+        """
+        Write one batch.
+
+        Parameters
+        ----------
+        batch : pa.Table, pa.RecordBatch or pd.DataFrame
+            Data to append. Empty batches are ignored once the schema is set.
+        """
+        if self._closed:
+            raise ValueError(f"{type(self).__name__} is closed")
+        table = self._to_table(batch)
+        if table.num_columns == 0 or (table.num_rows == 0 and self.schema is not None):
+            return
+        table = self._conform(table)
+        self._write(table)
+        self.rows_written += table.num_rows
+
+    @abstractmethod
+    def _write(self, table: pa.Table) -> None:
+        """Persist a batch already conformed to the sink schema."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush and release the underlying writer."""
+        self._closed = True
+
+
+class _FileSink(BaseSink):
+    """
+    Shared logic of the Parquet and Arrow IPC sinks.
+
+    Without partitioning, batches are appended to a single file through a
+    lazily opened writer. With partitioning, each batch is written as new
+    files into a Hive-style directory tree (``security_id=.../part-*.ext``).
+    """
+
+    file_format: str = ""
+    extension: str = ""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        partition_cols: Optional[List[str]] = None,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        extra_columns: str = "raise"
+    ):
+        super().__init__(path, extra_columns)
+        self.partition_cols = list(partition_cols or [])
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self._writer = None
+        self._token = uuid.uuid4().hex[:8]
+        self._batches = 0
+
+    def _write(self, table: pa.Table) -> None:
+        if self.partition_cols:
+            self._write_partitioned(table)
+        else:
+            if self._writer is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._writer = self._open_writer()
+            self._write_table(table)
+        self._batches += 1
+
+    def _write_partitioned(self, table: pa.Table) -> None:
+        missing = set(self.partition_cols) - set(table.column_names)
+        if missing:
+            raise ValueError(f"Partition columns not in data: {sorted(missing)}")
+
+        ds.write_dataset(
+            table,
+            base_dir=self.path,
+            format=self.file_format,
+            file_options=self._file_options(),
+            partitioning=self.partition_cols,
+            partitioning_flavor="hive",
+            basename_template=f"part-{self._token}-{self._batches}-{{i}}.{self.extension}",
+            existing_data_behavior="overwrite_or_ignore",
+            **({"max_rows_per_group": self.row_group_size,
+                "min_rows_per_group": 0} if self.row_group_size else {}),
+        )
+
+    @abstractmethod
+    def _open_writer(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_table(self, table: pa.Table) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _file_options(self):
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        super().close()
+
+
+class ParquetSink(_FileSink):
+    """
+    Streaming Parquet sink.
+
+    Parameters
+    ----------
+    path : str or Path
+        Target file, or root directory when partition_cols is given.
+    partition_cols : list of str, optional
+        Hive partition columns, e.g. ["security_id"].
+    compression : str, default "zstd"
+        Parquet codec ("zstd", "snappy", "gzip", "brotli", "lz4", "none").
+    row_group_size : int, optional
+        Maximum rows per row group. Defaults to one row group per batch.
+    extra_columns : {"raise", "drop"}, default "raise"
+        Handling of later columns absent from the schema, see BaseSink.
+    """
+
+    file_format = "parquet"
+    extension = "parquet"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        partition_cols: Optional[List[str]] = None,
+        compression: Optional[str] = "zstd",
+        row_group_size: Optional[int] = None,
+        extra_columns: str = "raise"
+    ):
+        super().__init__(path, partition_cols, compression, row_group_size, extra_columns)
+
+    def _open_writer(self) -> pq.ParquetWriter:
+        return pq.ParquetWriter(self.path, self.schema, compression=self.compression or "none")
+
+    def _write_table(self, table: pa.Table) -> None:
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def _file_options(self):
+        return ds.ParquetFileFormat().make_write_options(
+            compression=self.compression or "none"
+        )
+
+
+class IPCSink(_FileSink):
+    """
+    Streaming Arrow IPC (Feather v2) sink.
+
+    Parameters
+    ----------
+    path : str or Path
+        Target file, or root directory when partition_cols is given.
+    partition_cols : list of str, optional
+        Hive partition columns, e.g. ["security_id"].
+    compression : {"zstd", "lz4"}, optional
+        Buffer compression. Uncompressed files can be memory-mapped.
+    row_group_size : int, optional
+        Maximum rows per record batch.
+    extra_columns : {"raise", "drop"}, default "raise"
+        Handling of later columns absent from the schema, see BaseSink.
+    """
+
+    file_format = "ipc"
+    extension = "arrow"
+
+    def _ipc_options(self) -> pa.ipc.IpcWriteOptions:
+        return pa.ipc.IpcWriteOptions(compression=self.compression)
+
+    def _open_writer(self) -> pa.ipc.RecordBatchFileWriter:
+        return pa.ipc.new_file(self.path, self.schema, options=self._ipc_options())
+
+    def _write_table(self, table: pa.Table) -> None:
+        self._writer.write_table(table, max_chunksize=self.row_group_size)
+
+    def _file_options(self):
+        return ds.IpcFileFormat().make_write_options(compression=self.compression)
+
+
+class DuckDBSink(BaseSink):
+    """
+    Streaming sink appending to a DuckDB table.
+
+    Parameters
+    ----------
+    path : str or Path
+        DuckDB database file, created if needed.
+    table : str, default "data"
+        Target table, created from the first batch if it does not exist.
+        Later batches are inserted by column name.
+    extra_columns : {"raise", "drop"}, default "raise"
+        Handling of later columns absent from the schema, see BaseSink.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str = "data", extra_columns: str = "raise"):
+        super().__init__(path, extra_columns)
+        self.table = table
+        self._con = None
+
+    def _write(self, table: pa.Table) -> None:
+        if self._con is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._con = require_duckdb().connect(str(self.path))
+            self._con.register("_morningpy_batch", table)
+            self._con.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.table}" AS '
+                f"SELECT * FROM _morningpy_batch LIMIT 0"
+            )
+        else:
+            self._con.register("_morningpy_batch", table)
+        self._con.execute(f'INSERT INTO "{self.table}" BY NAME SELECT * FROM _morningpy_batch')
+        self._con.unregister("_morningpy_batch")
+
+    def close(self) -> None:
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+        super().close()
+
+
+SINKS: Dict[str, Type[BaseSink]] = {
+    "parquet": ParquetSink,
+    "ipc": IPCSink,
+    "arrow": IPCSink,
+    "feather": IPCSink,
+    "duckdb": DuckDBSink,
+}
+
+
+def open_sink(path: Union[str, Path], format: str = "parquet", **options: Any) -> BaseSink:
+    """
+    Create a sink for the given format.
+
+    Parameters
+    ----------
+    path : str or Path
+        Target file, directory (partitioned) or database (duckdb).
+    format : {"parquet", "ipc", "arrow", "feather", "duckdb"}, default "parquet"
+        Output format.
+    **options
+        Sink options: partition_cols, compression, row_group_size for file
+        formats; table for duckdb; extra_columns for all.
+
+    Returns
+    -------
+    BaseSink
+        Open sink, to be closed (or used as a context manager).
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+    """
+    fmt = format.lower()
+    if fmt not in SINKS:
+        raise ValueError(f"Unsupported format '{format}'. Expected one of {sorted(SINKS)}.")
+    return SINKS[fmt](path, **options)
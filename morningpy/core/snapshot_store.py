@@ -0,0 +1,325 @@
+import datetime
+import os
+import uuid
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from morningpy.config.security import HoldingSnapshotConfig
+from morningpy.core.dataframe_schema import ConversionPlan
+from morningpy.core.holding_matrix import holding_keys
+from morningpy.schema.security import HoldingSchema
+
+DateLike = Union[str, datetime.date, pd.Timestamp]
+
+
+class HoldingSnapshotStore:
+    """
+    Local store of fund holdings snapshots, keyed by fund and portfolio date.
+
+    Only the changes between consecutive snapshots of a fund are written:
+    one record per added holding (full row), removed holding (key only) and
+    holding whose weighting or number of shares changed (tracked columns
+    only), plus one marker per stored (fund, date). Each `put` appends a
+    zstd-compressed Parquet part file; mostly-null change columns compress
+    to almost nothing. Any stored date can be rebuilt with `as_of` and
+    compared with `diff` without calling the API.
+
+    Holdings are identified by child_security_id, else ISIN, else name (see
+    `holding_keys`). Columns other than the tracked ones are those of the
+    snapshot where the holding was last added.
+
+    Layout of ``path``::
+
+        data/part-<sequence>-<token>.parquet
+
+    Record columns: fund, portfolio_date, security, op ("add", "remove",
+    "change" or "snapshot") followed by the holding columns.
+
+    Attributes
+    ----------
+    path : Path
+        Store directory.
+
+    Examples
+    --------
+    >>> store = HoldingSnapshotStore("holdings_store/")
+    >>> store.put(get_holding(ticker="SPY"), portfolio_date="2025-10-31")
+    >>> store.put(get_holding(ticker="SPY"), portfolio_date="2025-11-30")
+    >>> store.diff(spy_id, "2025-10-31", "2025-11-30")
+    >>> store.as_of(spy_id, "2025-11-15")
+    """
+    config = HoldingSnapshotConfig
+    META_COLUMNS = ["fund", "portfolio_date", "security", "op"]
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @property
+    def data_dir(self) -> Path:
+        """Directory of the Parquet part files."""
+        return self.path / self.config.DATA_DIR
+
+    @staticmethod
+    def _to_date(value: DateLike) -> datetime.date:
+        return pd.Timestamp(value).date()
+
+    def put(
+        self,
+        holdings: Any,
+        portfolio_date: Union[DateLike, Mapping[str, DateLike]]
+    ) -> pd.DataFrame:
+        """
+        Store a snapshot of the holdings of one or more funds.
+
+        Parameters
+        ----------
+        holdings : pd.DataFrame, polars DataFrame or pyarrow Table
+            HoldingExtractor output, one row per (parent_security_id, holding).
+        portfolio_date : date-like or mapping of fund to date-like
+            Portfolio date of every fund, or per fund (e.g. the
+            portfolio_latest_date_footer of get_holding_info).
+
+        Returns
+        -------
+        pd.DataFrame
+            Change records written, empty if every snapshot was already
+            stored. A snapshot on a date already stored for its fund is
+            skipped.
+
+        Raises
+        ------
+        ValueError
+            If a fund has no portfolio date, or its date is older than the
+            latest stored snapshot of the fund.
+        """
+        if not isinstance(holdings, pd.DataFrame):
+            holdings = holdings.to_pandas()
+        holdings = holdings.assign(security=holding_keys(holdings))
+        holdings = holdings[holdings["security"].notna() & holdings["parent_security_id"].notna()]
+
+        records = self._records()
+        latest = (
+            records[records["op"] == self.config.SNAPSHOT]
+            .groupby("fund")["portfolio_date"].max().to_dict()
+        )
+
+        frames = []
+        for fund, current in holdings.groupby("parent_security_id", sort=False):
+            if isinstance(portfolio_date, Mapping):
+                if fund not in portfolio_date:
+                    raise ValueError(f"No portfolio_date given for fund '{fund}'")
+                date = self._to_date(portfolio_date[fund])
+            else:
+                date = self._to_date(portfolio_date)
+
+            last = latest.get(fund)
+            if last is not None and date == last:
+                continue
+            if last is not None and date < last:
+                raise ValueError(
+                    f"Snapshot of '{fund}' on {date} is older than the stored snapshot of {last}"
+                )
+
+            previous = self._state(records[records["fund"] == fund])
+            frames.append(self._changes(self._deduplicate(current), previous).assign(
+                fund=fund, portfolio_date=date
+            ))
+
+        if not frames:
+            return pd.DataFrame(columns=self.META_COLUMNS)
+
+        changes = pd.concat(frames, ignore_index=True, sort=False)
+        columns = self.META_COLUMNS + [
+            c for c in changes.columns
+            if c not in self.META_COLUMNS and c != "parent_security_id"
+        ]
+        changes = changes[columns]
+        self._write(changes)
+        return changes
+
+    def _deduplicate(self, holdings: pd.DataFrame) -> pd.DataFrame:
+        """One row per security, summing the tracked columns of repeated ones."""
+        first = holdings.drop_duplicates("security")
+        if len(first) == len(holdings):
+            return first
+        tracked = [c for c in self.config.TRACKED_COLUMNS if c in holdings.columns]
+        sums = holdings.groupby("security", sort=False)[tracked].sum(min_count=1)
+        first = first.copy()
+        first[tracked] = sums.loc[first["security"]].to_numpy()
+        return first
+
+    def _changes(self, current: pd.DataFrame, previous: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Change records turning previous into current, snapshot marker included."""
+        marker = pd.DataFrame({"security": [None], "op": [self.config.SNAPSHOT]})
+        if previous is None or previous.empty:
+            return pd.concat([marker, current.assign(op=self.config.ADD)], ignore_index=True, sort=False)
+
+        tracked = [c for c in self.config.TRACKED_COLUMNS if c in current.columns]
+        current = current.set_index("security")
+        previous = previous.set_index("security")
+
+        added = current[~current.index.isin(previous.index)]
+        removed = previous.index[~previous.index.isin(current.index)]
+        common = current.index[current.index.isin(previous.index)]
+
+        new = current.loc[common, tracked].astype("float64")
+        old = previous.loc[common, tracked].astype("float64")
+        same = (new == old) | (new.isna() & old.isna())
+        changed = new[~same.all(axis=1)]
+
+        return pd.concat([
+            marker,
+            added.assign(op=self.config.ADD).reset_index(),
+            pd.DataFrame({"security": removed, "op": self.config.REMOVE}),
+            changed.assign(op=self.config.CHANGE).reset_index(),
+        ], ignore_index=True, sort=False)
+
+    def _write(self, changes: pd.DataFrame) -> None:
+        """Write one part file atomically."""
+        table = pa.Table.from_pandas(changes, preserve_index=False)
+        # All-null columns would pin the null type; store them as strings.
+        table = table.cast(pa.schema([
+            pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+            for f in table.schema
+        ]))
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        sequence = len(list(self.data_dir.glob("part-*.parquet")))
+        path = self.data_dir / f"part-{sequence:06d}-{uuid.uuid4().hex[:8]}.parquet"
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(table, tmp, compression=self.config.COMPRESSION)
+        os.replace(tmp, path)
+
+    def _records(self, fund: Optional[str] = None) -> pd.DataFrame:
+        """Stored records, optionally of one fund, in write order."""
+        files = sorted(self.data_dir.glob("part-*.parquet")) if self.data_dir.exists() else []
+        if not files:
+            return pd.DataFrame(columns=self.META_COLUMNS)
+
+        schema = pa.unify_schemas([pq.read_schema(f) for f in files], promote_options="permissive")
+        dataset = ds.dataset([str(f) for f in files], schema=schema, format="parquet")
+        table = dataset.to_table(filter=ds.field("fund") == fund if fund is not None else None)
+        return table.to_pandas()
+
+    def _state(self, records: pd.DataFrame, date: Optional[datetime.date] = None) -> Optional[pd.DataFrame]:
+        """Holdings of one fund at its latest snapshot on or before date."""
+        if date is not None:
+            records = records[records["portfolio_date"] <= date]
+        snapshots = records.loc[records["op"] == self.config.SNAPSHOT, "portfolio_date"]
+        if snapshots.empty:
+            return None
+
+        records = records[records["op"] != self.config.SNAPSHOT].sort_values("portfolio_date", kind="stable")
+        last = records.drop_duplicates("security", keep="last")
+        alive = last[last["op"] != self.config.REMOVE].set_index("security")
+        state = (
+            records[records["op"] == self.config.ADD]
+            .drop_duplicates("security", keep="last")
+            .set_index("security")
+            .loc[alive.index]
+        )
+        tracked = [c for c in self.config.TRACKED_COLUMNS if c in state.columns]
+        state[tracked] = alive[tracked]
+
+        state = state.drop(columns=["op"]).reset_index()
+        state["portfolio_date"] = snapshots.max()
+        state.insert(0, "parent_security_id", state.pop("fund"))
+        state = ConversionPlan.for_schema(HoldingSchema).apply(state)
+        return state.sort_values("security", ignore_index=True)
+
+    def funds(self) -> List[str]:
+        """Funds with at least one snapshot."""
+        records = self._records()
+        return sorted(records.loc[records["op"] == self.config.SNAPSHOT, "fund"].unique())
+
+    def dates(self, fund: str) -> List[datetime.date]:
+        """Stored portfolio dates of a fund, oldest first."""
+        records = self._records(fund)
+        return sorted(records.loc[records["op"] == self.config.SNAPSHOT, "portfolio_date"].unique())
+
+    def as_of(self, fund: str, date: Optional[DateLike] = None) -> pd.DataFrame:
+        """
+        Holdings of a fund at a point in time.
+
+        Parameters
+        ----------
+        fund : str
+            Fund security_id.
+        date : date-like, optional
+            Point in time. Defaults to the latest snapshot.
+
+        Returns
+        -------
+        pd.DataFrame
+            Holdings of the latest snapshot on or before date, with their
+            key (security) and the snapshot portfolio_date.
+
+        Raises
+        ------
+        KeyError
+            If the fund has no snapshot on or before date.
+        """
+        state = self._state(self._records(fund), None if date is None else self._to_date(date))
+        if state is None:
+            raise KeyError(f"No snapshot of '{fund}' on or before {date}")
+        return state
+
+    def diff(self, fund: str, date_a: DateLike, date_b: DateLike) -> pd.DataFrame:
+        """
+        Changes of the holdings of a fund between two dates.
+
+        Parameters
+        ----------
+        fund : str
+            Fund security_id.
+        date_a, date_b : date-like
+            Compared points in time, see `as_of`.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per added, removed or changed holding: security,
+            security_name, change ("add", "remove" or "change") and the
+            tracked columns at both dates (weighting_a, weighting_b,
+            number_of_share_a, number_of_share_b).
+
+        Raises
+        ------
+        KeyError
+            If the fund has no snapshot on or before one of the dates.
+        """
+        records = self._records(fund)
+        states = []
+        for date in (date_a, date_b):
+            state = self._state(records, self._to_date(date))
+            if state is None:
+                raise KeyError(f"No snapshot of '{fund}' on or before {date}")
+            states.append(state)
+
+        tracked = [c for c in self.config.TRACKED_COLUMNS if c in states[1].columns]
+        labels = ["security"] + (["security_name"] if "security_name" in states[1].columns else [])
+        a, b = (s[labels + tracked] for s in states)
+        merged = a.merge(b, on="security", how="outer", suffixes=("_a", "_b"), indicator=True)
+
+        change = merged["_merge"].map({
+            "left_only": self.config.REMOVE,
+            "right_only": self.config.ADD,
+            "both": self.config.CHANGE,
+        }).astype("object")
+        new = merged[[f"{c}_b" for c in tracked]].astype("float64").to_numpy()
+        old = merged[[f"{c}_a" for c in tracked]].astype("float64").to_numpy()
+        same = ((new == old) | (pd.isna(new) & pd.isna(old))).all(axis=1)
+        keep = (change != self.config.CHANGE) | ~same
+
+        df = pd.DataFrame({"security": merged["security"], "change": change})
+        if "security_name" in labels:
+            df.insert(1, "security_name", merged["security_name_b"].fillna(merged["security_name_a"]))
+        for c in tracked:
+            df[f"{c}_a"] = merged[f"{c}_a"]
+            df[f"{c}_b"] = merged[f"{c}_b"]
+        return df[keep.to_numpy()].reset_index(drop=True)
@@ -1,9 +1,13 @@
+import asyncio
 import pandas as pd
 from datetime import datetime
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from morningpy.core.client import BaseClient
 from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.config import CoreConfig
+from morningpy.core.poller import ExtractorPoller, PollDelta, PollFeed
+from morningpy.core.flatten import DataPointFlattener, FlatColumns
 from morningpy.config.market import *
 from morningpy.schema.market import *
 
@@ -267,6 +271,8 @@ class MarketFairValueExtractor(BaseExtractor):
         List of allowed value_type values.
     mapping_inputs : dict
         Mapping of value_type to API component keys.
+    flattener : DataPointFlattener
+        Compiled flattener of the fair value fields.
     """
     
     config = MarketFairValueConfig
@@ -302,6 +308,7 @@ class MarketFairValueExtractor(BaseExtractor):
         self.str_columns = self.config.STRING_COLUMNS
         self.numeric_columns = self.config.NUMERIC_COLUMNS
         self.final_columns = self.config.FINAL_COLUMNS
+        self.flattener = DataPointFlattener.for_config(self.config)
 
     def _check_inputs(self) -> None:
         """
@@ -374,13 +381,13 @@ class MarketFairValueExtractor(BaseExtractor):
         -----
         The method flattens nested field structures from the API response,
         extracting both primary values and nested properties while excluding
-        date and currency metadata fields.
+        date and currency metadata fields (see FLATTEN_SPEC).
         """
         if not response or "components" not in response:
             return pd.DataFrame()
 
         components = response.get("components", {})
-        all_rows = []
+        columns = FlatColumns()
 
         for key in self.value_type:
             comp_key = self.mapping_inputs.get(key)
@@ -400,40 +407,12 @@ class MarketFairValueExtractor(BaseExtractor):
             if not results:
                 continue
 
-            rows = []
-            for item in results:
-                fields = item.get("fields", {})
-                meta = item.get("meta", {})
+            self.flattener.flatten(results, out=columns, category=comp_key)
 
-                row = {
-                    "securityID": meta.get("securityID"),
-                    "performanceID": meta.get("performanceID"),
-                    "companyID": meta.get("companyID"),
-                    "exchange": meta.get("exchange"),
-                    "ticker": meta.get("ticker"),
-                    "category": comp_key
-                }
-
-                for field_key, field_data in fields.items():
-                    if not isinstance(field_data, dict) or "value" not in field_data:
-                        continue
-
-                    row[field_key] = field_data.get("value")
-
-                    props = field_data.get("properties", {})
-                    for prop_key, prop_val in props.items():
-                        if any(x in prop_key.lower() for x in ["date", "currency"]):
-                            continue
-                        row[f"{field_key}_{prop_key}"] = prop_val.get("value")
-
-                rows.append(row)
-
-            all_rows.extend(rows)
-
-        if not all_rows:
+        if not columns.rows:
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_rows)
+        df = columns.to_frame()
         df.rename(columns=self.rename_columns, inplace=True)
         df = df.dropna(subset=["security_id"]).reset_index(drop=True)
         df = df[self.final_columns]
@@ -629,6 +608,8 @@ class MarketMoversExtractor(BaseExtractor):
         Final column order for the DataFrame.
     valid_inputs : list of str
         List of allowed mover_type values.
+    flattener : DataPointFlattener
+        Compiled flattener of the mover data points.
     """
     
     config = MarketMoversConfig
@@ -662,7 +643,8 @@ class MarketMoversExtractor(BaseExtractor):
         self.rename_columns = self.config.RENAME_COLUMNS
         self.str_columns = self.config.STRING_COLUMNS
         self.numeric_columns = self.config.NUMERIC_COLUMNS
-        self.final_columns = self.config.FINAL_COLUMNS       
+        self.final_columns = self.config.FINAL_COLUMNS
+        self.flattener = DataPointFlattener.for_config(self.config)
 
     def _check_inputs(self) -> None:
         """
@@ -734,52 +716,28 @@ class MarketMoversExtractor(BaseExtractor):
         Notes
         -----
         The method flattens nested field structures, extracting both primary 
-        values and nested properties while excluding date and currency metadata.
-        An updated_on timestamp and category label are added to each row.
+        values and nested properties while excluding date and currency metadata
+        (see FLATTEN_SPEC). An updated_on timestamp and category label are added
+        to each row.
         """
         if not response:
             return pd.DataFrame()
 
-        all_rows = []
+        columns = FlatColumns()
 
         for m_type in self.mover_type:
             data = response.get(m_type, [])
             if not data:
                 continue
 
-            rows = []
-            for item in data:
-                row = {}
-
-                for key, value_dict in item.items():
-                    if not isinstance(value_dict, dict) or "value" not in value_dict:
-                        continue
-                    
-                    if key not in row:
-                        row[key] = value_dict.get("value")
-
-                    properties = value_dict.get("properties", {})
-                    for prop_key, prop_value in properties.items():
-                        col_name = f"{key}_{prop_key}"
-                        if any(x in prop_key.lower() for x in ["date", "currency"]):
-                            continue
-                        if col_name not in row:
-                            row[col_name] = prop_value.get("value")
-
-                rows.append(row)
-
-            if not rows:
-                continue
-
-            df = pd.DataFrame(rows)
-            df["updated_on"] = response.get("updatedOn")
-            df["category"] = m_type
-            all_rows.append(df)
+            self.flattener.flatten(
+                data, out=columns, updated_on=response.get("updatedOn"), category=m_type
+            )
 
-        if not all_rows:
+        if not columns.rows:
             return pd.DataFrame()
 
-        df = pd.concat(all_rows, ignore_index=True)
+        df = columns.to_frame()
         df.rename(columns=self.rename_columns, inplace=True)
         df = df[self.final_columns]
         df[self.str_columns] = df[self.str_columns].fillna("N/A") 
@@ -804,6 +762,8 @@ class MarketCommoditiesExtractor(BaseExtractor):
         Mapping of API column names to standardized names.
     final_columns : list of str
         Final column order for the DataFrame.
+    flattener : DataPointFlattener
+        Compiled flattener of the commodity data points.
     """
     
     config = MarketCommoditiesConfig
@@ -827,6 +787,7 @@ class MarketCommoditiesExtractor(BaseExtractor):
         self.url = self.config.API_URL
         self.rename_columns = self.config.RENAME_COLUMNS
         self.final_columns = self.config.FINAL_COLUMNS
+        self.flattener = DataPointFlattener.for_config(self.config)
 
     def _check_inputs(self) -> None:
         """
@@ -877,42 +838,18 @@ class MarketCommoditiesExtractor(BaseExtractor):
         -----
         The method flattens nested dataPoints structures, extracting values
         and their properties while excluding date and currency metadata.
-        Each commodity includes its exchange information when available.
+        Each commodity includes its exchange information when available:
+        exchange_name is the exchange name of the instrument and exchange the
+        MIC of its net change data point.
         """
         if not response or "page" not in response or "commodities" not in response["page"]:
             return pd.DataFrame()
 
-        commodities = response["page"]["commodities"]
-        rows = []
-
-        for item in commodities:
-            base_info = {
-                "id": item.get("id"),
-                "instrument": item.get("instrument"),
-                "instrumentID": item.get("instrumentID"),
-                "name": item.get("name"),
-                "category": item.get("category"),
-                "exchange": item.get("exchange"),
-            }
-
-            data_points = item.get("dataPoints", {})
-            for key, dp in data_points.items():
-                base_info[f"{key}_value"] = dp.get("value")
-
-                props = dp.get("properties", {})
-                for prop_key, prop_value in props.items():
-                    if "date" not in prop_key.lower() and "currency" not in prop_key.lower():
-                        base_info[f"{key}_{prop_key}"] = prop_value.get("value")
-
-                if "exchange" in dp:
-                    base_info[f"{key}_exchange"] = dp["exchange"].get("value")
-
-            rows.append(base_info)
-
-        if not rows:
+        columns = self.flattener.flatten(response["page"]["commodities"])
+        if not columns.rows:
             return pd.DataFrame()
 
-        df = pd.DataFrame(rows)
+        df = columns.to_frame()
         df.rename(columns=self.rename_columns, inplace=True)
         df = df[self.final_columns]
         df = df.sort_values(by="category", ascending=True).reset_index(drop=True)
@@ -935,6 +872,8 @@ class MarketCurrenciesExtractor(BaseExtractor):
         Mapping of API column names to standardized names.
     final_columns : list of str
         Final column order for the DataFrame.
+    flattener : DataPointFlattener
+        Compiled flattener of the currency data points.
     """
     
     config = MarketCurrenciesConfig
@@ -958,6 +897,7 @@ class MarketCurrenciesExtractor(BaseExtractor):
         self.url = self.config.API_URL
         self.rename_columns = self.config.RENAME_COLUMNS
         self.final_columns = self.config.FINAL_COLUMNS
+        self.flattener = DataPointFlattener.for_config(self.config)
         
     def _check_inputs(self) -> None:
         """
@@ -1013,39 +953,120 @@ class MarketCurrenciesExtractor(BaseExtractor):
         if not response or "page" not in response or "currencies" not in response["page"]:
             return pd.DataFrame()
 
-        currencies = response["page"]["currencies"]
-        rows = []
+        columns = self.flattener.flatten(response["page"]["currencies"])
+        if not columns.rows:
+            return pd.DataFrame()
 
-        for item in currencies:
-            base_info = {
-                "id": item.get("id"),
-                "instrumentID": item.get("instrumentID"),
-                "label": item.get("label"),
-                "name": item.get("name"),
-                "category": item.get("category"),
-                "bidPriceDecimals": item.get("bidPriceDecimals"),
-            }
+        df = columns.to_frame()
+        df.rename(columns=self.rename_columns, inplace=True)
+        df = df[self.final_columns]
+        df = df.sort_values(by="category", ascending=True).reset_index(drop=True)
+        
+        return df
 
-            data_points = item.get("dataPoints", {})
-            for key, dp in data_points.items():
-                base_info[f"{key}_value"] = dp.get("value")
 
-                props = dp.get("properties", {})
-                for prop_key, prop_value in props.items():
-                    if "date" not in prop_key.lower() and "currency" not in prop_key.lower():
-                        base_info[f"{key}_{prop_key}"] = prop_value.get("value")
+class MarketPoller(ExtractorPoller):
+    """
+    Long-running poller of the real-time market feeds, emitting deltas.
 
-                if "exchange" in dp:
-                    base_info[f"{key}_exchange"] = dp["exchange"].get("value")
+    Polls movers, indexes, currencies and commodities on their own jittered
+    intervals with warm extractors, auth headers and HTTP session, and emits
+    only the rows that changed since the previous poll (see ExtractorPoller).
+    Rows are keyed per feed by MarketPollerConfig.KEYS: security_id for
+    indexes, performance_id for movers and instrument_id for currencies and
+    commodities, whose payloads carry no security_id. A security listed in
+    several categories (e.g. gainers and actives) is one row per category.
 
-            rows.append(base_info)
+    Attributes
+    ----------
+    feeds : Dict[str, PollFeed]
+        Polled feeds by name.
+    queue : asyncio.Queue
+        Queue receiving the deltas when no callback is given.
+
+    Examples
+    --------
+    >>> poller = MarketPoller(["movers", "currencies"], interval={"movers": 2})
+    >>> task = asyncio.create_task(poller.run())
+    >>> while True:
+    ...     delta = await poller.queue.get()
+    ...     dashboard.apply(delta.feed, delta.changes)
+    """
+    config = MarketPollerConfig
+
+    EXTRACTORS = {
+        "movers": MarketMoversExtractor,
+        "indexes": MarketIndexesExtractor,
+        "currencies": MarketCurrenciesExtractor,
+        "commodities": MarketCommoditiesExtractor,
+    }
+
+    def __init__(
+        self,
+        feeds: Optional[List[str]] = None,
+        interval: Union[float, Dict[str, float]] = CoreConfig.POLL_INTERVAL,
+        on_delta: Optional[Callable[[PollDelta], Any]] = None,
+        queue: Optional[asyncio.Queue] = None,
+        jitter: float = CoreConfig.POLL_JITTER,
+        mover_type: Optional[List[str]] = None,
+        index_type: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the MarketPoller.
 
-        if not rows:
-            return pd.DataFrame()
+        Parameters
+        ----------
+        feeds : list of str, optional
+            Feeds among 'movers', 'indexes', 'currencies' and 'commodities'.
+            All by default.
+        interval : float or dict, default CoreConfig.POLL_INTERVAL
+            Seconds between two polls of every feed, or per feed name
+            (feeds not listed use the default).
+        on_delta : callable, optional
+            Called with every PollDelta, may be a coroutine function.
+            Deltas go to self.queue otherwise.
+        queue : asyncio.Queue, optional
+            Queue receiving the deltas when on_delta is not given.
+        jitter : float, default CoreConfig.POLL_JITTER
+            Fraction of the interval added or removed at random to each wait.
+        mover_type : list of str, optional
+            Mover categories polled. All by default.
+        index_type : list of str, optional
+            Index regions polled. All by default.
 
-        df = pd.DataFrame(rows)
-        df.rename(columns=self.rename_columns, inplace=True)
-        df = df[self.final_columns]
-        df = df.sort_values(by="category", ascending=True).reset_index(drop=True)
-        
-        return df
\ No newline at end of file
+        Raises
+        ------
+        ValueError
+            If a feed is unknown.
+
+        Notes
+        -----
+        The extractors, and so their auth tokens, are created here, once
+        for the whole run.
+        """
+        feeds = list(feeds) if feeds is not None else list(self.config.FEEDS)
+        invalid = [f for f in feeds if f not in self.EXTRACTORS]
+        if invalid:
+            raise ValueError(f"Invalid feed(s) {invalid}, must be among {self.config.FEEDS}")
+
+        options = {
+            "movers": {"mover_type": mover_type or sorted(MarketMoversConfig.VALID_INPUTS)},
+            "indexes": {"index_type": index_type or sorted(MarketIndexesConfig.VALID_INPUTS)},
+        }
+        intervals = interval if isinstance(interval, dict) else {}
+        default = CoreConfig.POLL_INTERVAL if isinstance(interval, dict) else interval
+
+        super().__init__(
+            {
+                name: PollFeed(
+                    extractor=self.EXTRACTORS[name](**options.get(name, {})),
+                    keys=self.config.KEYS[name],
+                    interval=intervals.get(name, default),
+                    ignored=self.config.IGNORED_COLUMNS.get(name, []),
+                )
+                for name in feeds
+            },
+            on_delta=on_delta,
+            queue=queue,
+            jitter=jitter,
+        )
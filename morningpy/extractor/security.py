@@ -1,9 +1,26 @@
+import asyncio
+import re
+from functools import lru_cache
+import aiohttp
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import union_categoricals
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from morningpy.core.security_loader import SecurityLoader
 from morningpy.core.client import BaseClient
 from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.config import CoreConfig
+from morningpy.core.deadline import Deadline, deadline_scope
+from morningpy.core.decorator import instrumented
+from morningpy.core.interchange import DataFrameInterchange
+from morningpy.core.json_stream import JsonArrayStream
+from morningpy.core.payload_cache import payload_scope
+from morningpy.core.resilience import FailureReport
+from morningpy.core.sink import BaseSink
+from morningpy.core import instrumentation
 from morningpy.config.security import *
 from morningpy.schema.security import *
     
@@ -14,7 +31,48 @@ from morningpy.core.security_loader import SecurityLoader
 from morningpy.core.client import BaseClient
 from morningpy.core.base_extract import BaseExtractor
 from morningpy.config.security import FinancialStatementConfig
-from morningpy.schema.security import FinancialStatementSchema
+from morningpy.schema.security import FinancialStatementSchema, FinancialStatementLongSchema
+
+
+class StatementPanel(NamedTuple):
+    """
+    Dense financial statement panel.
+
+    Attributes
+    ----------
+    values : np.ndarray
+        Array of shape (securities, line items, periods); NaN where a
+        security does not report a line item for a period.
+    securities : pd.Index
+        Security IDs along axis 0.
+    line_items : pd.MultiIndex
+        (statement_type, line_item) pairs along axis 1.
+    periods : pd.Index
+        Period labels along axis 2, in chronological order.
+    """
+    values: np.ndarray
+    securities: pd.Index
+    line_items: pd.MultiIndex
+    periods: pd.Index
+
+
+class StatementTree(NamedTuple):
+    """
+    Flattened financial statement tree, one entry per leaf line item.
+
+    Attributes
+    ----------
+    levels : list of list of str
+        Labels per depth; levels[0] is the statement root. Leaves shallower
+        than a level repeat their own label in it.
+    paths : list of tuple of str
+        Unpadded path of each leaf, root first.
+    values : np.ndarray
+        Normalized values, shape (leaves, periods).
+    """
+    levels: List[List[str]]
+    paths: List[Tuple[str, ...]]
+    values: np.ndarray
 
 
 class FinancialStatementExtractor(BaseExtractor):
@@ -38,8 +96,8 @@ class FinancialStatementExtractor(BaseExtractor):
         Morningstar performance IDs.
     statement_type : list of str
         Type(s) of statement to extract ("income", "balance", "cashflow").
-    report_frequency : str
-        Report frequency ("annual", "quarterly", etc.).
+    report_frequency : list of str
+        Report frequencies ("annual", "quarterly", etc.).
     url : str
         Base API URL for financial statements.
     endpoint : dict
@@ -48,6 +106,8 @@ class FinancialStatementExtractor(BaseExtractor):
         Valid frequencies for reports.
     frequency_mapping : dict
         Mapping from user-friendly frequency to API frequency.
+    layout : {"wide", "long"}
+        Output layout, see __init__.
     metadata : list of dict
         Security metadata including IDs and labels.
     """
@@ -61,7 +121,8 @@ class FinancialStatementExtractor(BaseExtractor):
         security_id: Union[str, List[str]] = None,
         performance_id: Union[str, List[str]] = None,
         statement_type: Union[str, List[str]] = None,
-        report_frequency: str = None
+        report_frequency: Union[str, List[str]] = None,
+        layout: str = "wide"
     ):
         """
         Initialize the FinancialStatementExtractor.
@@ -84,8 +145,19 @@ class FinancialStatementExtractor(BaseExtractor):
             Type of financial statement to extract. Valid values: 
             {"income", "balance", "cashflow"}. Can be a single string or list of strings
             to extract multiple statement types.
-        report_frequency : {"annual", "quarterly"}, optional
+        report_frequency : {"annual", "quarterly"} or list of str, optional
             Frequency of the financial reports. Determines the periodicity of data returned.
+            Can be a single string or list of strings; every statement type is
+            requested at every frequency.
+        layout : {"wide", "long"}, default "wide"
+            "wide" returns one row per line item and one column per period,
+            so securities reporting different periods leave NaN-filled
+            columns once concatenated. "long" returns one row per
+            (security, line item, period) with columns security_id,
+            security_label, statement_type, line_item, period and value;
+            every label column is categorical, line_item being the path of
+            the line item below the statement joined with " > ". See
+            `to_panel` for a dense NumPy view of a long result.
 
         Raises
         ------
@@ -105,10 +177,17 @@ class FinancialStatementExtractor(BaseExtractor):
         self.endpoint = self.config.ENDPOINT
         self.valid_frequency = self.config.VALID_FREQUENCY
         self.frequency_mapping = self.config.MAPPING_FREQUENCY
-        self.report_frequency = report_frequency 
+        self.report_frequency = (
+            [report_frequency] if isinstance(report_frequency, str)
+            else list(report_frequency) if report_frequency
+            else []
+        )
         self.filter_values = self.config.FILTER_VALUE
         self.params = self.config.PARAMS
+        self.layout = layout
         self.metadata = []
+        if layout == "long":
+            self.schema = FinancialStatementLongSchema
         
         self.statement_type = (
             [statement_type] if isinstance(statement_type, str) 
@@ -125,13 +204,27 @@ class FinancialStatementExtractor(BaseExtractor):
 
     def _check_inputs(self) -> None:
         """
-        Validate user inputs for statement type and report frequency.
+        Validate user inputs for statement type, report frequency and layout.
         
-        Notes
-        -----
-        This method is currently a placeholder for future validation logic.
+        Raises
+        ------
+        ValueError
+            If a statement type, report frequency or the layout is not supported.
         """
-        pass
+        if self.layout not in self.config.LAYOUTS:
+            raise ValueError(
+                f"Invalid layout '{self.layout}', must be one of {list(self.config.LAYOUTS)}"
+            )
+        for stmt_type in self.statement_type:
+            if stmt_type not in self.endpoint:
+                raise ValueError(
+                    f"Invalid statement_type '{stmt_type}', must be one of {sorted(self.endpoint)}"
+                )
+        for frequency in self.report_frequency:
+            if frequency not in self.valid_frequency:
+                raise ValueError(
+                    f"Invalid report_frequency '{frequency}', must be one of {sorted(self.valid_frequency)}"
+                )
 
     def _build_request(self) -> None:
         """
@@ -145,25 +238,31 @@ class FinancialStatementExtractor(BaseExtractor):
                 "params": ...,
                 "metadata": ...
             }
-        for each (security × statement type) combination.
+        for each (security × statement type × report frequency) combination.
+        The statement type and frequency are added to the request metadata
+        so that `run_grouped` can split the results.
         """
         self.requests = [
             {
                 "url": f"{self.url}{meta['security_id']}/{self.endpoint[stmt_type]}/detail",
                 "params": {
                     **self.params,
-                    "dataType": self.frequency_mapping[self.report_frequency],
+                    "dataType": self.frequency_mapping[frequency],
                 },
-                "metadata": meta,
+                "metadata": {**meta, "statement_type": stmt_type, "report_frequency": frequency},
             }
             for meta in self.metadata
             for stmt_type in self.statement_type
+            for frequency in self.report_frequency
         ]
     
     @staticmethod
+    @lru_cache(maxsize=FinancialStatementConfig.LABEL_CACHE_SIZE)
     def clean_label(label: str) -> str:
         """
         Remove 'total' from labels and normalize whitespace.
+
+        Results are cached: the same labels recur in every statement.
         
         Parameters
         ----------
@@ -212,63 +311,61 @@ class FinancialStatementExtractor(BaseExtractor):
         >>> FinancialStatementExtractor.normalize_value("123.45")
         123.45
         """
+        if value.__class__ is float:
+            return value
+        try:
+            return FinancialStatementExtractor._normalize_token(value)
+        except TypeError:  # unhashable
+            return 0.0
+
+    @staticmethod
+    @lru_cache(maxsize=FinancialStatementConfig.LABEL_CACHE_SIZE)
+    def _normalize_token(value: Any) -> float:
+        """Cached normalize_value of a non-float value ('_PO_', None, ints, numeric strings)."""
         if value in (None, "_PO_"):
             return 0.0
-        if isinstance(value, (int, float)):
-            return float(value)
         try:
             return float(value)
         except (ValueError, TypeError):
             return 0.0
-    
+
     @staticmethod
-    def recursive_tree(
-        node: dict, 
-        path: list, 
-        period_cols: list,
-        data_rows: list,
-        depth_tracker: list
-    ) -> None:
-        """
-        Recursively traverse hierarchical tree structure and collect leaf nodes.
-        
-        This method navigates the nested financial statement structure, building
-        paths through the hierarchy and collecting leaf node data with values.
-        
+    def flatten_tree(rows: List[dict], n_periods: int) -> StatementTree:
+        """
+        Flatten the hierarchical line items of a statement into columns.
+
+        Single iterative depth-first pass: the labels of the current path
+        are kept in one list truncated to the depth of each node, and every
+        leaf writes its levels and values straight into the output columns.
+        A level first reached after some leaves is backfilled for them with
+        their own label, so the levels come out padded to the deepest node.
+
         Parameters
         ----------
-        node : dict
-            Current node in the tree structure containing:
+        rows : list of dict
+            Root nodes, each containing:
             - label : str
                 Display label for this line item
             - datum : list
-                Data values for all periods (if leaf node)
+                Data values for all periods (if leaf node); the first 5
+                entries precede the periods
             - subLevel : list of dict
                 Child nodes (if not a leaf)
-        path : list
-            Current path from root to this node (list of labels).
-        period_cols : list
-            Column names for period data (dates/quarters).
-        data_rows : list
-            Accumulator list for collecting leaf node data.
-            Modified in place.
-        depth_tracker : list
-            Accumulator list for tracking path depths.
-            Modified in place.
-        
+        n_periods : int
+            Number of period values kept per leaf.
+
         Returns
         -------
-        None
-            Modifies data_rows and depth_tracker lists in place.
-        
+        StatementTree
+            Levels (one list of labels per depth, one entry per leaf),
+            path of each leaf, and a (leaves × n_periods) float64 array of
+            normalized values, NaN where a datum is too short.
+
         Notes
         -----
-        This is a recursive function that:
-        1. Cleans and validates the current node's label
-        2. Tracks the depth of the current path
-        3. If leaf node (no subLevel): extracts data values
-        4. If parent node (has subLevel): recurses on children
-        
+        Nodes whose cleaned label is empty are skipped with their subtree;
+        leaves with no datum beyond the first 5 entries are skipped.
+
         Examples
         --------
         >>> node = {
@@ -276,48 +373,55 @@ class FinancialStatementExtractor(BaseExtractor):
         ...     "datum": [None, None, None, None, None, 1000, 1100, 1200],
         ...     "subLevel": []
         ... }
-        >>> data_rows = []
-        >>> depth_tracker = []
-        >>> FinancialStatementExtractor.recursive_tree(
-        ...     node, [], ["2022", "2023", "2024"], data_rows, depth_tracker
-        ... )
-        >>> len(data_rows)
-        1
-        >>> data_rows[0]['_path']
-        ['Revenue']
-        """
-        current_label = FinancialStatementExtractor.clean_label(
-            node.get("label", "")
-        ).strip()
-        
-        if not current_label:
-            return
-            
-        current_path = path + [current_label]
-        depth_tracker.append(len(current_path))
-
-        # Check if this is a leaf node (no children)
-        if not node.get("subLevel"):
-            datum = node.get("datum", [])
-            if datum and len(datum) > 5:
-                values = [
-                    FinancialStatementExtractor.normalize_value(v) 
-                    for v in datum[5:]
-                ]
-                row = {"_path": current_path}
-                row.update(dict(zip(period_cols, values)))
-                data_rows.append(row)
-            return
-        
-        # Recurse on children if this is a parent node
-        for child in node.get("subLevel", []):
-            FinancialStatementExtractor.recursive_tree(
-                child, 
-                current_path, 
-                period_cols,
-                data_rows,
-                depth_tracker
-            )
+        >>> tree = FinancialStatementExtractor.flatten_tree([node], 3)
+        >>> tree.levels
+        [['Revenue']]
+        >>> tree.values
+        array([[1000., 1100., 1200.]])
+        """
+        clean = FinancialStatementExtractor.clean_label
+        normalize = FinancialStatementExtractor.normalize_value
+        levels: List[List[str]] = []
+        paths: List[Tuple[str, ...]] = []
+        leaf_labels: List[str] = []
+        values: List[float] = []
+        path: List[str] = []
+        stack = [(node, 0) for node in reversed(rows)]
+
+        while stack:
+            node, depth = stack.pop()
+            label = clean(node.get("label", ""))
+            if not label:
+                continue
+            del path[depth:]
+            path.append(label)
+            if depth == len(levels):
+                levels.append(list(leaf_labels))
+
+            children = node.get("subLevel")
+            if children:
+                stack.extend((child, depth + 1) for child in reversed(children))
+                continue
+
+            datum = node.get("datum")
+            if not datum or len(datum) <= 5:
+                continue
+            for level, name in zip(levels, path):
+                level.append(name)
+            for level in levels[depth + 1:]:
+                level.append(label)
+            leaf_labels.append(label)
+            paths.append(tuple(path))
+            datum = datum[5:5 + n_periods]
+            values.extend([normalize(v) for v in datum])
+            if len(datum) < n_periods:
+                values.extend([np.nan] * (n_periods - len(datum)))
+
+        return StatementTree(
+            levels,
+            paths,
+            np.array(values, dtype="float64").reshape(len(paths), n_periods),
+        )
         
     def _process_response(self, response: dict) -> pd.DataFrame:
         """
@@ -325,8 +429,8 @@ class FinancialStatementExtractor(BaseExtractor):
         
         This method performs the following operations:
             - Extracts column definitions and period information
-            - Recursively traverses the hierarchical tree structure of financial line items
-            - Normalizes nested levels to consistent depth
+            - Flattens the hierarchical tree of financial line items (`flatten_tree`)
+              into level columns padded to a consistent depth
             - Filters data by statement type
             - Scales values to millions (multiplies by 10^6)
         
@@ -358,64 +462,383 @@ class FinancialStatementExtractor(BaseExtractor):
             - Period columns : float
                 Financial values for each reporting period (in millions)
             
+            In long layout, see `_long_frame`.
             Returns empty DataFrame if response is invalid or contains no data.
         """
-        # Early validation
-        if not isinstance(response, dict) or not response:
+        statement = self._parse_statement(response)
+        if statement is None:
             return pd.DataFrame()
-        
-        # Extract metadata
-        column_defs = response.get("columnDefs", [])
-        period_cols = column_defs[5:]
-        
+        if self.layout == "long":
+            return self._long_frame(*statement)
+        return pd.DataFrame(self._wide_columns(*statement))
+
+    def _process_response_arrow(self, response: dict) -> pa.Table:
+        """
+        Process API response into an Arrow table.
+
+        Produces the same columns and rows as `_process_response`, built
+        from the flattened tree without pandas: period columns are the
+        float64 value arrays and, in long layout, the label columns are
+        dictionary arrays.
+
+        Parameters
+        ----------
+        response : dict
+            API response, see `_process_response`.
+
+        Returns
+        -------
+        pa.Table
+            Statement in the extractor layout. Returns an empty table if
+            response is invalid or contains no data.
+        """
+        statement = self._parse_statement(response)
+        if statement is None:
+            return pa.table({})
+        if self.layout == "long":
+            return self._long_table(*statement)
+        return pa.table(self._wide_columns(*statement))
+
+    def _parse_statement(self, response: dict) -> Optional[Tuple[Any, ...]]:
+        """
+        Flattened tree of a response and the context of its leaves.
+
+        Returns
+        -------
+        tuple or None
+            (tree, keep, period_cols, statement, security_id, security_label),
+            keep masking the leaves of the requested statement. None if the
+            response is invalid, of an unknown statement type or has no data.
+        """
+        if not isinstance(response, dict) or not response:
+            return None
+
+        period_cols = response.get("columnDefs", [])[5:]
         metadata = response.get("metadata", {})
-        security_id = metadata.get("security_id")
-        security_label = metadata.get("security_label")
-        
+
         statement_type = response.get("_meta", {}).get("statementType")
-        
         if not statement_type or statement_type not in self.filter_values:
-            return pd.DataFrame()
-        
-        data_rows = []
-        depth_tracker = []
-        
-        # Build data rows using static recursive_tree method
-        for item in response.get("rows", []):
-            self.recursive_tree(item, [], period_cols, data_rows, depth_tracker)
-        
-        if not data_rows:
-            return pd.DataFrame()
-        
-        # Normalize path depth
-        max_depth = max(depth_tracker)
-        
-        normalized_rows = []
-        for row in data_rows:
-            path = row.pop("_path")
-            padded_path = path + [path[-1]] * (max_depth - len(path))
-            for i, label in enumerate(padded_path):
-                row[f"sub_type{i}"] = label
-            
-            normalized_rows.append(row)
-        
-        df = pd.DataFrame(normalized_rows)
-        df.rename(columns={"sub_type0": "statement_type"}, inplace=True)
-        subtype_cols = ["statement_type"] + [f"sub_type{i}" for i in range(1, max_depth)]
-        df = df[subtype_cols + period_cols]
-        
+            return None
+
+        tree = self.flatten_tree(response.get("rows", []), len(period_cols))
+        if not tree.paths:
+            return None
+
         # Filter by statement type
-        filter_value = self.filter_values[statement_type]
-        df = df[df["statement_type"].isin([filter_value])]
-        
+        statement = self.filter_values[statement_type]
+        keep = np.array(tree.levels[0], dtype=object) == statement
+        return tree, keep, period_cols, statement, metadata.get("security_id"), metadata.get("security_label")
+
+    @staticmethod
+    def _wide_columns(
+        tree: StatementTree,
+        keep: np.ndarray,
+        period_cols: List[str],
+        statement: str,
+        security_id: Optional[str],
+        security_label: Optional[str]
+    ) -> Dict[str, Any]:
+        """Columns of the wide layout: labels, then one column per period."""
+        n_rows = int(keep.sum())
+        columns: Dict[str, Any] = {
+            "id_security": [security_id] * n_rows,
+            "security_label": [security_label] * n_rows,
+        }
+        for i, level in enumerate(tree.levels):
+            name = f"sub_type{i}" if i else "statement_type"
+            columns[name] = np.array(level, dtype=object)[keep]
+
         # Scale to millions
-        df.loc[:, period_cols] = df.loc[:, period_cols] * 10**6
-        
-        # Add security identifiers
-        df.insert(0, "id_security", security_id)
-        df.insert(1, "security_label", security_label)
-        
-        return df
+        columns.update(zip(period_cols, tree.values[keep].T * 10**6))
+        return columns
+
+    def _long_codes(
+        self,
+        tree: StatementTree,
+        keep: np.ndarray,
+        period_cols: List[str]
+    ) -> Optional[Tuple[np.ndarray, List[str], List[str], np.ndarray]]:
+        """
+        Line item codes and labels, periods and values of the long layout.
+
+        Returns
+        -------
+        tuple or None
+            (item_codes, items, periods, values): a code per kept leaf, the
+            distinct line items, the distinct periods in response order and
+            the (leaves × periods) values scaled to millions. None if no leaf
+            is kept.
+        """
+        leaves = np.flatnonzero(keep)
+        if not len(leaves):
+            return None
+
+        separator = self.config.LINE_ITEM_SEPARATOR
+        item_codes, items = pd.factorize(np.array([
+            separator.join(tree.paths[i][1:]) for i in leaves
+        ], dtype=object))
+        first = sorted(period_cols.index(p) for p in set(period_cols))
+        periods = [period_cols[i] for i in first]
+        values = tree.values[leaves][:, first] * 10**6
+        return item_codes, list(items), periods, values
+
+    def _long_frame(
+        self,
+        tree: StatementTree,
+        keep: np.ndarray,
+        period_cols: List[str],
+        statement: str,
+        security_id: Optional[str],
+        security_label: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Long layout of one statement: one row per (line item, period).
+
+        Parameters
+        ----------
+        tree : StatementTree
+            Flattened statement, from `flatten_tree`.
+        keep : np.ndarray
+            Boolean mask of the leaves of the requested statement.
+        period_cols : list of str
+            Period labels of the response.
+        statement : str
+            Root label of the requested statement.
+        security_id, security_label : str
+            Security of the response.
+
+        Returns
+        -------
+        pd.DataFrame
+            Categorical label columns and a float64 value column, scaled
+            to millions like the wide layout.
+        """
+        codes = self._long_codes(tree, keep, period_cols)
+        if codes is None:
+            return pd.DataFrame()
+        item_codes, items, periods, values = codes
+        n_items, n_periods = values.shape
+        size = n_items * n_periods
+
+        def constant(value):
+            if value is None:
+                return pd.Categorical.from_codes(np.full(size, -1, dtype="int8"), [])
+            return pd.Categorical.from_codes(np.zeros(size, dtype="int8"), [value])
+
+        return pd.DataFrame({
+            "security_id": constant(security_id),
+            "security_label": constant(security_label),
+            "statement_type": constant(statement),
+            "line_item": pd.Categorical.from_codes(np.repeat(item_codes, n_periods), items),
+            "period": pd.Categorical.from_codes(np.tile(np.arange(n_periods), n_items), periods),
+            "value": values.ravel(),
+        })
+
+    def _long_table(
+        self,
+        tree: StatementTree,
+        keep: np.ndarray,
+        period_cols: List[str],
+        statement: str,
+        security_id: Optional[str],
+        security_label: Optional[str]
+    ) -> pa.Table:
+        """
+        Long layout of one statement as Arrow, see `_long_frame`.
+
+        Label columns are dictionary arrays with int32 indices, so tables of
+        several responses concatenate without unifying index types.
+        """
+        codes = self._long_codes(tree, keep, period_cols)
+        if codes is None:
+            return pa.table({})
+        item_codes, items, periods, values = codes
+        n_items, n_periods = values.shape
+        size = n_items * n_periods
+
+        def dictionary(indices, labels):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=pa.int32()), pa.array(labels, type=pa.string())
+            )
+
+        def constant(value):
+            if value is None:
+                return dictionary(pa.nulls(size, type=pa.int32()), [])
+            return dictionary(np.zeros(size, dtype="int32"), [value])
+
+        return pa.table({
+            "security_id": constant(security_id),
+            "security_label": constant(security_label),
+            "statement_type": constant(statement),
+            "line_item": dictionary(np.repeat(item_codes, n_periods).astype("int32"), items),
+            "period": dictionary(np.tile(np.arange(n_periods, dtype="int32"), n_items), periods),
+            "value": pa.array(values.ravel(), type=pa.float64()),
+        })
+
+    def _concat(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate responses; in long layout, categorical columns stay categorical.
+
+        pd.concat turns categoricals with different categories into object
+        columns, so the long layout unions the categories instead.
+        """
+        if self.layout != "long":
+            return super()._concat(dfs)
+        frames = [df for df in dfs if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        columns = {
+            col: union_categoricals([df[col] for df in frames])
+            for col in self.config.LONG_CATEGORICAL_COLUMNS
+        }
+        columns["value"] = np.concatenate([df["value"].to_numpy() for df in frames])
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def period_key(period: str) -> Tuple[int, int, str]:
+        """
+        Chronological sort key of a period label.
+
+        Examples
+        --------
+        >>> sorted(["TTM", "Q2 2024", "2023", "Q1 2024"], key=FinancialStatementExtractor.period_key)
+        ['2023', 'Q1 2024', 'Q2 2024', 'TTM']
+        """
+        match = re.fullmatch(r"(?:Q([1-4]) )?(\d{4})", str(period).strip())
+        if not match:
+            return (9999, 9, str(period))
+        quarter, year = match.groups()
+        return (int(year), int(quarter) if quarter else 0, "")
+
+    @staticmethod
+    def to_panel(df: pd.DataFrame, dtype: str = "float64") -> StatementPanel:
+        """
+        Dense (securities × line items × periods) array of a long result.
+
+        Built from the categorical codes of the long frame, without pivoting.
+        Memory is securities × line items × periods × itemsize, e.g. about
+        145 MB for 3,000 companies, 300 line items and 20 periods in float64;
+        float32 halves it at about 7 significant digits.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Output of a run with layout="long".
+        dtype : str, default "float64"
+            Dtype of the array.
+
+        Returns
+        -------
+        StatementPanel
+            Values and the labels of each axis. Line items are
+            (statement_type, line_item) pairs in first-seen order, periods
+            are sorted chronologically.
+
+        Examples
+        --------
+        >>> df = get_financial_statement(ticker=tickers, statement_type="Income Statement",
+        ...                              report_frequency="Annualy", layout="long")
+        >>> panel = FinancialStatementExtractor.to_panel(df, dtype="float32")
+        >>> panel.values.shape
+        (3000, 87, 6)
+        """
+        security_codes, securities = pd.factorize(df["security_id"])
+
+        statement = pd.Categorical(df["statement_type"])
+        line_item = pd.Categorical(df["line_item"])
+        pair_codes = statement.codes.astype("int64") * len(line_item.categories) + line_item.codes
+        item_codes, pairs = pd.factorize(pair_codes)
+        line_items = pd.MultiIndex.from_arrays([
+            statement.categories[pairs // len(line_item.categories)],
+            line_item.categories[pairs % len(line_item.categories)],
+        ], names=["statement_type", "line_item"])
+
+        period = pd.Categorical(df["period"])
+        order = sorted(
+            range(len(period.categories)),
+            key=lambda i: FinancialStatementExtractor.period_key(period.categories[i])
+        )
+        rank = np.empty(len(order), dtype="int64")
+        rank[order] = np.arange(len(order))
+        periods = pd.Index(period.categories[order], name="period")
+
+        values = np.full((len(securities), len(line_items), len(periods)), np.nan, dtype=dtype)
+        values[security_codes, item_codes, rank[period.codes]] = df["value"].to_numpy()
+        return StatementPanel(values, pd.Index(np.asarray(securities), name="security_id"), line_items, periods)
+
+    @instrumented
+    async def run_grouped(
+        self,
+        engine: CoreConfig.EngineLiteral = "pandas",
+        deadline: Union[float, Deadline, None] = None
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Run every (statement type × report frequency) in one job.
+
+        Securities are resolved once at construction; all requests share one
+        HTTP session and are sent in windows of at most max_requests, so a
+        large universe is not rejected by the request count check. Results
+        are split by statement type and frequency, which keeps annual and
+        quarterly periods in separate wide frames.
+
+        Parameters
+        ----------
+        engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+            Output engine of every result.
+        deadline : float or Deadline, optional
+            Total budget in seconds of the whole job.
+
+        Returns
+        -------
+        dict
+            {(statement_type, report_frequency): result} for every requested
+            combination, in request order. Failed requests are listed in
+            self.failures and a deadline cut-off sets self.partial, as in run.
+
+        Raises
+        ------
+        ValueError
+            If the engine or an input is not supported.
+        """
+        engine = engine.lower()
+        if engine not in CoreConfig.ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'.")
+
+        self._check_inputs()
+        with instrumentation.stage("build_request"):
+            self._build_request()
+        self.failures = FailureReport()
+
+        groups: Dict[Tuple[str, str], List[pd.DataFrame]] = {
+            (stmt_type, frequency): []
+            for stmt_type in self.statement_type
+            for frequency in self.report_frequency
+        }
+        with deadline_scope(deadline) as scope:
+            responses: List[Any] = []
+            async with self._session() as session:
+                for offset in range(0, len(self.requests), self.max_requests):
+                    window = self.requests[offset:offset + self.max_requests]
+                    responses.extend(await self._fetch_responses(session, window))
+
+            for i, res in enumerate(responses):
+                if isinstance(res, Exception):
+                    self._record_failure(i, res)
+                    continue
+                meta = self.requests[i]["metadata"]
+                with instrumentation.stage("process_response", self._request_url(i)):
+                    groups[meta["statement_type"], meta["report_frequency"]].append(self._process_response(res))
+
+            self.partial = self._is_partial(scope)
+            results = {}
+            for key, dfs in groups.items():
+                df = self._validate_and_convert_types(self._concat(dfs) if dfs else pd.DataFrame())
+                result = DataFrameInterchange(df).to_engine(engine)
+                if scope is not None and isinstance(result, pd.DataFrame):
+                    result.attrs["partial"] = self.partial
+                results[key] = result
+
+        return results
     
 
 class HoldingExtractor(BaseExtractor):
@@ -453,6 +876,8 @@ class HoldingExtractor(BaseExtractor):
         Final column order for the DataFrame.
     metadata : list of dict
         Security metadata including IDs and labels.
+    top_n : int or None
+        Number of largest holdings kept per fund, all if None.
     """
     config = HoldingConfig
     schema = HoldingSchema
@@ -463,6 +888,7 @@ class HoldingExtractor(BaseExtractor):
         isin: Union[str, List[str]] = None,
         security_id: Union[str, List[str]] = None,
         performance_id: Union[str, List[str]] = None,
+        top_n: Optional[int] = None,
     ):
         """
         Initialize the HoldingExtractor.
@@ -483,6 +909,10 @@ class HoldingExtractor(BaseExtractor):
         performance_id : str or list of str, optional
             Single Morningstar performance ID or list of IDs for ETFs/funds.
             Mutually exclusive with ticker, isin, and security_id.
+        top_n : int, optional
+            Keep only the top_n largest holdings by weighting of each fund.
+            The endpoint page size is set to top_n, so fewer holdings are
+            downloaded.
 
         Notes
         -----
@@ -496,6 +926,9 @@ class HoldingExtractor(BaseExtractor):
 
         self.url = self.config.API_URL
         self.params = self.config.PARAMS
+        self.top_n = top_n
+        if isinstance(top_n, int) and top_n > 0:
+            self.params = {**self.params, **dict.fromkeys(self.config.PAGE_SIZE_PARAMS, top_n)}
         self.field_mapping = self.config.FIELD_MAPPING
         self.rename_columns = self.config.RENAME_COLUMNS
         self.columns = self.config.COLUMNS
@@ -510,12 +943,16 @@ class HoldingExtractor(BaseExtractor):
     def _check_inputs(self) -> None:
         """
         Validate user inputs for holdings extraction.
-        
-        Notes
-        -----
-        This method is currently a placeholder for future validation logic.
+
+        Raises
+        ------
+        ValueError
+            If top_n is not a positive integer.
         """
-        pass
+        if self.top_n is not None and (
+            not isinstance(self.top_n, int) or isinstance(self.top_n, bool) or self.top_n < 1
+        ):
+            raise ValueError(f"top_n must be a positive integer, got {self.top_n!r}")
 
     def _build_request(self) -> None:
         """
@@ -576,7 +1013,24 @@ class HoldingExtractor(BaseExtractor):
             - Various rating and performance metrics
             
             Returns empty DataFrame if response is invalid or contains no holdings.
+            With top_n, only the top_n largest weightings are kept.
         """
+        df = self._holding_frame(response)
+        if df.empty:
+            return df
+
+        if self.top_n is not None:
+            df = self._top(df, self.top_n)
+        df.sort_values(
+            by=["parent_security_id", "child_security_id"], 
+            inplace=True, 
+            ignore_index=True
+        )
+
+        return df
+
+    def _holding_frame(self, response: dict) -> pd.DataFrame:
+        """Holdings of one response, in API order."""
         if not isinstance(response, dict) or not response:
             return pd.DataFrame()
 
@@ -584,10 +1038,9 @@ class HoldingExtractor(BaseExtractor):
         security_id = metadata.get("security_id")
         security_label = metadata.get("security_label")
         
-        holding_pages = ["equityHoldingPage", "boldHoldingPage", "otherHoldingPage"]
         rows = []
 
-        for page_key in holding_pages:
+        for page_key in self.config.HOLDING_PAGES:
             page = response.get(page_key, {})
             holding_list = page.get("holdingList", [])
             
@@ -605,14 +1058,324 @@ class HoldingExtractor(BaseExtractor):
         df = pd.DataFrame(rows)
 
         df.rename(columns=self.rename_columns, inplace=True)
-        df = df[self.columns]
-        df.sort_values(
-            by=["parent_security_id", "child_security_id"], 
-            inplace=True, 
-            ignore_index=True
+        return df[self.columns]
+
+    @staticmethod
+    def _top(df: pd.DataFrame, n: int) -> pd.DataFrame:
+        """The n rows of largest weighting, missing weightings last."""
+        weighting = pd.to_numeric(df["weighting"], errors="coerce")
+        order = weighting.sort_values(ascending=False, kind="stable", na_position="last").index
+        return df.loc[order[:n]].reset_index(drop=True)
+
+    def _holding_columns(self, holdings: List[dict], metadata: dict) -> Dict[str, List[Any]]:
+        """Column lists of raw holdings of one fund, in API order."""
+        parent = metadata.get("security_id")
+        return {
+            col: [parent] * len(holdings) if col == "parent_security_id"
+            else [h.get(self.field_mapping[col]) for h in holdings]
+            for col in self.columns
+        }
+
+    def _holding_batch(self, holdings: List[dict], metadata: dict) -> pa.RecordBatch:
+        """
+        Record batch of raw holdings of one fund, typed from the schema.
+
+        Same columns as `_process_response`, in API order.
+        """
+        table = self._validate_and_convert_arrow(self._arrow_table(self._holding_columns(holdings, metadata)))
+        return table.combine_chunks().to_batches()[0]
+
+    def _process_response_arrow(self, response: dict) -> pa.Table:
+        """
+        Process Morningstar holdings response into an Arrow table.
+
+        Produces the same rows, columns and ordering as `_process_response`,
+        built column by column from the holding lists without pandas.
+
+        Parameters
+        ----------
+        response : dict
+            API response, see `_process_response`.
+
+        Returns
+        -------
+        pa.Table
+            Holdings typed from the schema, top_n largest weightings only if
+            set, sorted by parent and child security IDs. Returns an empty
+            table if response is invalid or contains no holdings.
+        """
+        if not isinstance(response, dict) or not response:
+            return pa.table({})
+
+        holdings = [
+            holding
+            for page_key in self.config.HOLDING_PAGES
+            for holding in (response.get(page_key) or {}).get("holdingList", [])
+        ]
+        if not holdings:
+            return pa.table({})
+
+        table = self._arrow_table(self._holding_columns(holdings, response.get("metadata", {})))
+        if self.top_n is not None:
+            table = table.take(self._top_indices(table["weighting"], self.top_n))
+        return table.take(pc.sort_indices(
+            table,
+            sort_keys=[("parent_security_id", "ascending"), ("child_security_id", "ascending")],
+            null_placement="at_end",
+        ))
+
+    @staticmethod
+    def _top_indices(weighting: pa.ChunkedArray, n: int) -> pa.Array:
+        """Indices of the n largest weightings, missing ones last, like `_top`."""
+        if not pa.types.is_floating(weighting.type):
+            weighting = pa.chunked_array([
+                pa.array(pd.to_numeric(weighting.to_pandas(), errors="coerce"), type=pa.float64())
+            ])
+        weighting = pc.if_else(pc.is_nan(weighting), pa.scalar(None, pa.float64()), weighting)
+        order = pc.sort_indices(
+            pa.table({"weighting": weighting}),
+            sort_keys=[("weighting", "descending")],
+            null_placement="at_end",
         )
+        return order[:n]
 
-        return df
+    async def _stream_request(
+        self,
+        session: aiohttp.ClientSession,
+        request: Dict[str, Any],
+        batch_size: int
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Parse one holdings response while it downloads, batch_size rows at a time."""
+        parser = JsonArrayStream((page, "holdingList") for page in self.config.HOLDING_PAGES)
+        pending: List[dict] = []
+        async for chunk in self.client.stream_chunks(
+            session, request["url"], request["params"], self.config.STREAM_CHUNK_SIZE
+        ):
+            pending.extend(item for _, item in parser.feed(chunk))
+            while len(pending) >= batch_size:
+                yield self._holding_batch(pending[:batch_size], request["metadata"])
+                del pending[:batch_size]
+        pending.extend(item for _, item in parser.close())
+        if pending:
+            yield self._holding_batch(pending, request["metadata"])
+
+    async def stream(self, batch_size: int = HoldingConfig.STREAM_BATCH_SIZE) -> AsyncIterator[pa.RecordBatch]:
+        """
+        Yield the holdings of every fund in record batches while downloading.
+
+        Each body is parsed incrementally (see JsonArrayStream) and never
+        held whole: peak memory is proportional to batch_size, not to the
+        size of the largest fund. Funds are downloaded one after the other.
+
+        Parameters
+        ----------
+        batch_size : int, default HoldingConfig.STREAM_BATCH_SIZE
+            Maximum rows per batch. A batch holds a single fund.
+
+        Yields
+        ------
+        pa.RecordBatch
+            Holdings with the columns of `run`, in API order (not sorted).
+
+        Notes
+        -----
+        Streamed requests are not retried (see BaseClient.stream_chunks).
+        A failed fund is listed in self.failures; batches it already
+        yielded are kept.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self._check_inputs()
+        with instrumentation.stage("build_request"):
+            self._build_request()
+        self.failures = FailureReport()
+
+        async with self._session() as session:
+            for i, request in enumerate(self.requests):
+                try:
+                    async for batch in self._stream_request(session, request, batch_size):
+                        yield batch
+                except Exception as e:
+                    self._record_failure(i, e)
+
+    @instrumented
+    async def run_to_sink(self, sink: BaseSink, batch_size: int = HoldingConfig.STREAM_BATCH_SIZE) -> int:
+        """
+        Stream the holdings into a sink, batch by batch, see `stream`.
+
+        Parameters
+        ----------
+        sink : BaseSink
+            Destination, left open.
+        batch_size : int, default HoldingConfig.STREAM_BATCH_SIZE
+            Maximum rows per written batch.
+
+        Returns
+        -------
+        int
+            Number of rows written by this run. Failed funds are listed in
+            self.failures.
+        """
+        rows_before = sink.rows_written
+        async for batch in self.stream(batch_size):
+            sink.write_batch(batch)
+        return sink.rows_written - rows_before
+
+    def _page_params(self, params: Dict[str, Any], page_size: int, number: int) -> Dict[str, Any]:
+        """Request parameters of one page of page_size holdings per holding type."""
+        return {
+            **params,
+            **dict.fromkeys(self.config.PAGE_SIZE_PARAMS, page_size),
+            self.config.PAGE_NUMBER_PARAM: number,
+        }
+
+    def _total_pages(self, response: dict) -> int:
+        """Number of pages of the longest holding list of a response."""
+        return max(
+            (response.get(page) or {}).get("totalPage") or 0
+            for page in self.config.HOLDING_PAGES
+        )
+
+    async def pages(
+        self,
+        page_size: int = HoldingConfig.PAGE_SIZE,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Yield the holdings of every fund page by page, fetching on demand.
+
+        A page is only requested once the previous one has been consumed, so
+        a caller that stops iterating early (e.g. after finding a holding)
+        does not download the rest of the portfolio. Funds are paged one
+        after the other.
+
+        The paging of a fund stops at its last page (the largest totalPage of
+        its holding lists), at the first empty page, after max_pages pages or
+        once top_n holdings have been yielded.
+
+        Parameters
+        ----------
+        page_size : int, default HoldingConfig.PAGE_SIZE
+            Holdings per page and holding type (equity, bond, other), mapped
+            to the endpoint page size parameters.
+        max_pages : int, optional
+            Maximum pages fetched per fund.
+
+        Yields
+        ------
+        pd.DataFrame
+            Typed holdings of one page of one fund, with the columns of
+            `run`, in API order. With top_n, the last page of a fund is
+            trimmed to its largest weightings.
+
+        Raises
+        ------
+        ValueError
+            If page_size or max_pages is not a positive integer.
+
+        Notes
+        -----
+        A failed page is listed in self.failures and the iteration moves on
+        to the next fund; pages already yielded are kept.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be a positive integer")
+        self._check_inputs()
+        with instrumentation.stage("build_request"):
+            self._build_request()
+        self.failures = FailureReport()
+
+        async with self._session() as session:
+            for i, request in enumerate(self.requests):
+                remaining = self.top_n
+                number = 1
+                while True:
+                    params = self._page_params(request["params"], page_size, number)
+                    try:
+                        response = await self.client.get_async(
+                            session, request["url"], params, request["metadata"]
+                        )
+                    except Exception as e:
+                        self._record_failure(i, e)
+                        break
+
+                    with instrumentation.stage("process_response", request["url"]):
+                        df = self._holding_frame(response)
+                    if df.empty:
+                        break
+                    if remaining is not None:
+                        df = self._top(df, remaining)
+                        remaining -= len(df)
+                    yield self._validate_and_convert_types(df)
+
+                    if (
+                        remaining == 0
+                        or number >= self._total_pages(response)
+                        or (max_pages is not None and number >= max_pages)
+                    ):
+                        break
+                    number += 1
+
+    @instrumented
+    async def run_paged(
+        self,
+        engine: CoreConfig.EngineLiteral = "pandas",
+        page_size: int = HoldingConfig.PAGE_SIZE,
+        max_pages: Optional[int] = None,
+        deadline: Union[float, Deadline, None] = None
+    ) -> Any:
+        """
+        Collect the pages of `pages` into one result.
+
+        Parameters
+        ----------
+        engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+            Output engine.
+        page_size : int, default HoldingConfig.PAGE_SIZE
+            Holdings per page and holding type.
+        max_pages : int, optional
+            Maximum pages fetched per fund.
+        deadline : float or Deadline, optional
+            Total budget in seconds, as in run. Pages fetched before it
+            expires are returned, flagged as partial.
+
+        Returns
+        -------
+        DataFrameInterchange or engine object
+            Holdings sorted as in run. Failed pages are listed in
+            self.failures.
+
+        Raises
+        ------
+        ValueError
+            If the engine, page_size or max_pages is not supported.
+        """
+        engine = engine.lower()
+        if engine not in CoreConfig.ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'.")
+
+        dfs = []
+        with deadline_scope(deadline) as scope:
+            async for df in self.pages(page_size, max_pages):
+                dfs.append(df)
+
+            with instrumentation.stage("concat", parts=len(dfs)):
+                df = self._concat(dfs) if dfs else pd.DataFrame()
+            df = self._validate_and_convert_types(df)
+            if not df.empty:
+                df.sort_values(
+                    by=["parent_security_id", "child_security_id"],
+                    inplace=True,
+                    ignore_index=True
+                )
+            self.partial = self._is_partial(scope)
+            result = DataFrameInterchange(df).to_engine(engine)
+            if scope is not None and isinstance(result, pd.DataFrame):
+                result.attrs["partial"] = self.partial
+
+        return result
              
 
 class HoldingInfoExtractor(BaseExtractor):
@@ -810,4 +1573,85 @@ class HoldingInfoExtractor(BaseExtractor):
         
         df.rename(columns=self.rename_columns, inplace=True)
         df = df[self.columns]
-        return df
\ No newline at end of file
+        return df
+
+
+class HoldingBundle(NamedTuple):
+    """
+    Holdings and portfolio summary of the same funds.
+
+    Attributes
+    ----------
+    holdings : DataFrameInterchange or engine object
+        One row per holding, as returned by HoldingExtractor.
+    info : DataFrameInterchange or engine object
+        One row per fund, as returned by HoldingInfoExtractor.
+    """
+    holdings: Any
+    info: Any
+
+
+class HoldingBundleExtractor:
+    """
+    Extracts holdings and holding info of ETFs or funds from one fetch per fund.
+
+    HoldingExtractor and HoldingInfoExtractor read the same holding endpoint;
+    the full holdings payload also carries the portfolio summary fields. Both
+    extractors are run on that payload inside a payload_scope, so each fund
+    is downloaded once and processed into both frames.
+
+    Attributes
+    ----------
+    holding : HoldingExtractor
+        Extractor of the holdings frame.
+    info : HoldingInfoExtractor
+        Extractor of the summary frame, requesting the full payload.
+    """
+
+    def __init__(
+        self,
+        ticker: Union[str, List[str]] = None,
+        isin: Union[str, List[str]] = None,
+        security_id: Union[str, List[str]] = None,
+        performance_id: Union[str, List[str]] = None,
+    ):
+        """
+        Initialize the HoldingBundleExtractor.
+
+        Parameters
+        ----------
+        ticker, isin, security_id, performance_id : str or list of str, optional
+            Fund identifiers, as for HoldingExtractor. Exactly one is expected.
+        """
+        identifiers = dict(ticker=ticker, isin=isin, security_id=security_id, performance_id=performance_id)
+        self.holding = HoldingExtractor(**identifiers)
+        self.info = HoldingInfoExtractor(**identifiers)
+        self.info.params = self.holding.params
+
+    async def run(
+        self,
+        engine: CoreConfig.EngineLiteral = "pandas",
+        deadline: Union[float, Deadline, None] = None
+    ) -> HoldingBundle:
+        """
+        Run both extractors, sharing each fund payload.
+
+        Parameters
+        ----------
+        engine : {"pandas", "polars", "dask", "modin", "arrow", "duckdb"}, default "pandas"
+            Output engine of both frames.
+        deadline : float or Deadline, optional
+            Total budget in seconds shared by both extractors.
+
+        Returns
+        -------
+        HoldingBundle
+            (holdings, info). Failed requests are listed in the failures of
+            self.holding and self.info.
+        """
+        with deadline_scope(deadline), payload_scope():
+            holdings, info = await asyncio.gather(
+                self.holding.run(engine=engine),
+                self.info.run(engine=engine),
+            )
+        return HoldingBundle(holdings, info)
@@ -1,7 +1,14 @@
+import numpy as np
 import pandas as pd
 from typing import Optional, Literal, Union, List, Dict, Any
 from functools import lru_cache
 from pathlib import Path
+import pyarrow.parquet as pq
+
+from morningpy.core.config import CoreConfig
+from morningpy.core.identifier_map import IdentifierMap
+from morningpy.core.search_index import NGramIndex, PrefixIndex, SymSpellIndex
+from morningpy.config.ticker import TickerConfig
 
 class TickerExtractor:
     """
@@ -20,9 +27,22 @@ class TickerExtractor:
     -----
     The parquet file is loaded once and cached for the lifetime of the application.
     Use `clear_cache()` to reload if the underlying file changes.
+
+    Substring searches on security_label, ticker and isin are served by an
+    n-gram index (see `search_index`), persisted next to the parquet file and
+    rebuilt automatically when the ticker data changes.
+
+    Low-cardinality columns listed in `TickerConfig.CATEGORICAL_COLUMNS`
+    (security type, country, exchange, ratings, style boxes...) are loaded as
+    pandas Categoricals straight from Arrow dictionary arrays, so equality
+    filters compare integer codes instead of Python strings.
     """
 
     _cached_tickers: Optional[pd.DataFrame] = None  # Class-level cache
+    _cached_index: Optional[NGramIndex] = None  # Class-level search index cache
+    _cached_prefix_index: Optional[PrefixIndex] = None  # Class-level autocomplete index
+    _cached_fuzzy_index: Optional[SymSpellIndex] = None  # Class-level typo-tolerant index
+    _cached_id_map: Optional[IdentifierMap] = None  # Class-level identifier lookup maps
 
     def __init__(self):
         """
@@ -68,13 +88,37 @@ class TickerExtractor:
         try: 
             module_dir = Path(__file__).parent
             parquet_path = module_dir / "data" / "tickers.parquet"
-            tickers = pd.read_parquet(parquet_path)
+            tickers = TickerExtractor._read_parquet(parquet_path)
         except:
             parquet_path = "morningpy/data/tickers.parquet"
-            tickers = pd.read_parquet(parquet_path)
+            tickers = TickerExtractor._read_parquet(parquet_path)
             
         return tickers
 
+    @staticmethod
+    def _read_parquet(path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read the ticker universe, dictionary-encoding low-cardinality columns.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to tickers.parquet.
+
+        Returns
+        -------
+        pd.DataFrame
+            Ticker data with `TickerConfig.CATEGORICAL_COLUMNS` as category dtype.
+
+        Notes
+        -----
+        The columns are read as Arrow dictionary arrays, which convert to
+        Categoricals without materializing one Python string per row.
+        """
+        names = set(pq.read_schema(path).names)
+        read_dictionary = [c for c in TickerConfig.CATEGORICAL_COLUMNS if c in names]
+        return pq.read_table(path, read_dictionary=read_dictionary).to_pandas()
+
     @classmethod
     def clear_cache(cls):
         """
@@ -91,12 +135,109 @@ class TickerExtractor:
         >>> extractor = TickerExtractor()  # Will reload from file
         """
         cls._cached_tickers = None
+        cls._cached_index = None
+        cls._cached_prefix_index = None
+        cls._cached_fuzzy_index = None
+        cls._cached_id_map = None
         cls._load_tickers.cache_clear()
 
+    @property
+    def id_map(self) -> IdentifierMap:
+        """
+        Identifier → row-position maps for ticker, isin, performance_id and security_id.
+
+        Returns
+        -------
+        IdentifierMap
+            Maps built once from the ticker data and shared by all instances.
+        """
+        if (
+            TickerExtractor._cached_id_map is None
+            or TickerExtractor._cached_id_map.frame is not self.tickers
+        ):
+            TickerExtractor._cached_id_map = IdentifierMap(self.tickers)
+        return TickerExtractor._cached_id_map
+
+    @property
+    def search_index(self) -> NGramIndex:
+        """
+        N-gram index over the columns listed in TickerConfig.SEARCH_INDEX_COLUMNS.
+
+        Returns
+        -------
+        NGramIndex
+            Index shared by all instances, loaded from
+            morningpy/data/{CoreConfig.TICKERS_INDEX_FILE} when up to date,
+            otherwise built from the ticker data and persisted there.
+        """
+        if TickerExtractor._cached_index is None:
+            index_path = Path(__file__).resolve().parent.parent / "data" / CoreConfig.TICKERS_INDEX_FILE
+            TickerExtractor._cached_index = NGramIndex.load_or_build(
+                self.tickers,
+                TickerConfig.SEARCH_INDEX_COLUMNS,
+                path=index_path,
+                n=TickerConfig.NGRAM_SIZE,
+            )
+        return TickerExtractor._cached_index
+
+    def search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        prefix: bool = False,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Ranked case-insensitive search over indexed identifier columns.
+
+        Parameters
+        ----------
+        query : str
+            Literal text to look for (no regex).
+        columns : list of str, optional
+            Indexed columns to search. Defaults to TickerConfig.SEARCH_INDEX_COLUMNS.
+        prefix : bool, default False
+            If True, match values starting with the query instead of containing it.
+        limit : int, optional
+            Maximum number of rows to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching tickers, best match first: exact matches, then prefix
+            matches, then substring matches, ties broken by match position
+            and value length. A row matching several columns keeps its best rank.
+
+        Examples
+        --------
+        >>> extractor = TickerExtractor()
+        >>> extractor.search("apple", limit=5)
+        >>> extractor.search("US03", columns=["isin"], prefix=True)
+        """
+        index = self.search_index
+        columns = columns or index.columns
+
+        positions, scores = [], []
+        for column in columns:
+            col_positions, col_scores = index.search(column, query, prefix=prefix)
+            positions.append(col_positions)
+            scores.append(col_scores)
+
+        positions = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+        scores = np.concatenate(scores) if scores else np.empty(0, dtype=np.int64)
+
+        order = np.argsort(scores, kind="stable")
+        positions = pd.unique(positions[order])
+        if limit is not None:
+            positions = positions[:limit]
+
+        return self.tickers.iloc[positions].reset_index(drop=True)
+
     def search_tickers(
         self,
         filters: Optional[Dict[str, Any]] = None,
-        exact_match: bool = False
+        exact_match: bool = False,
+        categorical: bool = False
     ) -> pd.DataFrame:
         """
         Retrieve tickers filtered by specified criteria.
@@ -109,6 +250,9 @@ class TickerExtractor:
         exact_match : bool, default False
             If True, performs exact string matching for text fields.
             If False, performs case-insensitive partial matching.
+        categorical : bool, default False
+            If True, dictionary-encoded columns are returned as category dtype.
+            If False, they are decoded back to plain object columns.
 
         Returns
         -------
@@ -124,23 +268,117 @@ class TickerExtractor:
         >>> # Filter by multiple values
         >>> extractor.search_tickers({"country": ["US", "GB"], "is_active": True})
         """
-        if not filters:
-            return self.tickers.copy()
-        
         filters = {
-            k: v for k, v in filters.items() 
+            k: v for k, v in (filters or {}).items() 
             if k != 'exact_match' and v is not None and k in self.tickers.columns
         }
 
         if not filters:
-            return self.tickers.copy()
+            return self._format_output(self.tickers.copy(), categorical)
 
         mask = pd.Series(True, index=self.tickers.index)
 
         for column, value in filters.items():
             mask &= self._apply_filter(column, value, exact_match)
 
-        return self.tickers[mask].reset_index(drop=True)
+        return self._format_output(self.tickers[mask].reset_index(drop=True), categorical)
+
+    @staticmethod
+    def _format_output(frame: pd.DataFrame, categorical: bool) -> pd.DataFrame:
+        """Decode category columns to object unless categorical output is requested."""
+        if categorical:
+            return frame
+        encoded = frame.select_dtypes(include="category").columns
+        if len(encoded):
+            frame = frame.astype({c: object for c in encoded})
+        return frame
+
+    def suggest(self, prefix: str, limit: int = 10) -> pd.DataFrame:
+        """
+        Autocomplete security labels and tickers from a typed prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            Text typed so far, matched case-insensitively.
+        limit : int, default 10
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching tickers. Labels or tickers starting with the prefix come
+            first, then labels with an inner word starting with it.
+
+        Notes
+        -----
+        Backed by a sorted-array PrefixIndex over TickerConfig.SUGGEST_COLUMNS,
+        built on first use and shared by all instances.
+
+        Examples
+        --------
+        >>> extractor = TickerExtractor()
+        >>> extractor.suggest("vangu", limit=5)
+        """
+        if TickerExtractor._cached_prefix_index is None:
+            TickerExtractor._cached_prefix_index = PrefixIndex.build(
+                self.tickers, TickerConfig.SUGGEST_COLUMNS
+            )
+        positions = TickerExtractor._cached_prefix_index.suggest(prefix, limit=limit)
+        return self.tickers.iloc[positions].reset_index(drop=True)
+
+    def fuzzy_search(
+        self,
+        query: str,
+        max_distance: int = 2,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Typo-tolerant search over the words of security labels and tickers.
+
+        Parameters
+        ----------
+        query : str
+            One or several words. Every word must match a word of the
+            security within max_distance edits.
+        max_distance : int, default 2
+            Maximum edit distance per word, capped at
+            TickerConfig.FUZZY_MAX_DISTANCE.
+        limit : int, optional
+            Maximum number of rows to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching tickers, closest first, with an added ``distance``
+            column holding the total edit distance.
+
+        Notes
+        -----
+        Backed by a SymSpellIndex over TickerConfig.SUGGEST_COLUMNS, built on
+        first use and shared by all instances.
+
+        Examples
+        --------
+        >>> extractor = TickerExtractor()
+        >>> extractor.fuzzy_search("vangaurd totl", max_distance=2)
+        """
+        if TickerExtractor._cached_fuzzy_index is None:
+            TickerExtractor._cached_fuzzy_index = SymSpellIndex.build(
+                self.tickers,
+                TickerConfig.SUGGEST_COLUMNS,
+                max_distance=TickerConfig.FUZZY_MAX_DISTANCE,
+                prefix_length=TickerConfig.FUZZY_PREFIX_LENGTH,
+            )
+        positions, distances = TickerExtractor._cached_fuzzy_index.search(
+            query, max_distance=max_distance
+        )
+        if limit is not None:
+            positions, distances = positions[:limit], distances[:limit]
+
+        result = self.tickers.iloc[positions].reset_index(drop=True)
+        result["distance"] = distances
+        return result
 
     def _apply_filter(
         self, 
@@ -164,6 +402,14 @@ class TickerExtractor:
         -------
         pd.Series
             Boolean mask indicating which rows match the filter.
+
+        Notes
+        -----
+        Partial matches on indexed columns are resolved through `search_index`
+        (literal, case-insensitive). Other columns fall back to a full scan.
+
+        On category columns every comparison is made once per category and
+        then mapped to rows through the integer codes.
         """
         col_data = self.tickers[column]
 
@@ -172,14 +418,59 @@ class TickerExtractor:
                 return pd.Series(True, index=self.tickers.index)
             return col_data.isin(value)
 
+        if isinstance(col_data.dtype, pd.CategoricalDtype):
+            return self._apply_categorical_filter(col_data, value, exact_match)
+
         if isinstance(value, str) and col_data.dtype == 'object':
             if exact_match:
                 return col_data == value
-            else:
-                return col_data.str.contains(value, case=False, na=False)
+            if column in TickerConfig.SEARCH_INDEX_COLUMNS:
+                positions, _ = self.search_index.search(column, value)
+                mask = np.zeros(len(self.tickers), dtype=bool)
+                mask[positions] = True
+                return pd.Series(mask, index=self.tickers.index)
+            return col_data.str.contains(value, case=False, na=False)
 
         return col_data == value
 
+    @staticmethod
+    def _apply_categorical_filter(
+        col_data: pd.Series,
+        value: Any,
+        exact_match: bool
+    ) -> pd.Series:
+        """
+        Boolean mask for a scalar filter on a category column.
+
+        Parameters
+        ----------
+        col_data : pd.Series
+            Category column to filter.
+        value : Any
+            Value to filter by.
+        exact_match : bool
+            Whether to use exact matching for string comparisons.
+
+        Returns
+        -------
+        pd.Series
+            Boolean mask indicating which rows match the filter.
+        """
+        categories = col_data.cat.categories
+        if isinstance(value, str) and not exact_match and categories.dtype == object:
+            matched = np.flatnonzero(
+                categories.str.contains(value, case=False, na=False)
+            )
+        else:
+            matched = np.flatnonzero(categories == value)
+
+        codes = col_data.cat.codes.to_numpy()
+        if len(matched) == 1:
+            mask = codes == matched[0]
+        else:
+            mask = np.isin(codes, matched)
+        return pd.Series(mask, index=col_data.index)
+
     def convert_to(
         self,
         ticker: Optional[str] = None,
@@ -228,24 +519,20 @@ class TickerExtractor:
         if not any([ticker, isin, performance_id, security_id]):
             raise ValueError("At least one source identifier must be provided")
 
-        df = self.tickers
-
         # Find matching row based on source identifier
         if ticker:
-            row = df[df["ticker"] == ticker]
+            position = self.id_map.position(ticker, "ticker")
         elif isin:
-            row = df[df["isin"] == isin]
+            position = self.id_map.position(isin, "isin")
         elif performance_id:
-            row = df[df["performance_id"] == performance_id]
-        elif security_id:
-            row = df[df["security_id"] == security_id]
+            position = self.id_map.position(performance_id, "performance_id")
         else:
-            return None
+            position = self.id_map.position(security_id, "security_id")
 
-        if row.empty:
+        if position is None:
             return None
 
-        return row.iloc[0][convert_to]
+        return self.tickers[convert_to].iat[position]
 
     def batch_convert(
         self,
@@ -269,7 +556,13 @@ class TickerExtractor:
         -------
         pd.DataFrame
             DataFrame with columns for source identifier, target identifier,
-            and security label.
+            and security label. One row per input identifier, in input order;
+            target and label are missing for unknown identifiers.
+
+        Notes
+        -----
+        Resolved with a single vectorized lookup in `id_map`. Identifiers
+        matching several rows resolve to the first one, as in `convert_to`.
 
         Examples
         --------
@@ -280,5 +573,19 @@ class TickerExtractor:
         ...     to_field="isin"
         ... )
         """
-        df = self.tickers[self.tickers[from_field].isin(identifiers)].copy()
-        return df[[from_field, to_field, "security_label"]].reset_index(drop=True)
\ No newline at end of file
+        identifiers = list(identifiers)
+        positions = self.id_map.first_positions(identifiers, from_field)
+        found = positions >= 0
+
+        targets = (
+            self.tickers[[to_field, "security_label"]]
+            .iloc[positions[found]]
+            .set_axis(np.flatnonzero(found))
+            .reindex(range(len(identifiers)))
+        )
+
+        return pd.DataFrame({
+            from_field: identifiers,
+            to_field: targets[to_field],
+            "security_label": targets["security_label"],
+        })
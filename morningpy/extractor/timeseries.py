@@ -1,5 +1,7 @@
 import pandas as pd
-from typing import List, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Dict, List, Union
 
 from morningpy.core.security_loader import SecurityLoader
 from morningpy.core.client import BaseClient
@@ -7,6 +9,39 @@ from morningpy.core.base_extract import BaseExtractor
 from morningpy.config.timeseries import *
 from morningpy.schema.timeseries import *
 
+
+def _finalize_timeseries_table(
+    table: pa.Table,
+    str_columns: List[str],
+    numeric_columns: List[str],
+    date_input_format: str,
+    date_output_format: str
+) -> pa.Table:
+    """
+    Fill missing values, normalize dates and sort a timeseries Arrow table.
+
+    Arrow counterpart of the tail of the pandas `_process_response`: string
+    columns are filled with "N/A", numeric columns with 0, dates are parsed
+    (UTC for offset-aware inputs), reformatted, and rows sorted by
+    security_id then date.
+    """
+    for col in str_columns:
+        i = table.schema.get_field_index(col)
+        table = table.set_column(i, col, pc.fill_null(table.column(i), "N/A"))
+
+    for col in numeric_columns:
+        i = table.schema.get_field_index(col)
+        values = table.column(i)
+        if pa.types.is_null(values.type):
+            values = values.cast(pa.float64())
+        table = table.set_column(i, col, pc.fill_null(values, 0))
+
+    i = table.schema.get_field_index("date")
+    parsed = pc.strptime(table.column(i), format=date_input_format, unit="s", error_is_null=True)
+    table = table.set_column(i, "date", pc.strftime(parsed, format=date_output_format))
+
+    return table.sort_by([("security_id", "ascending"), ("date", "ascending")])
+
     
 class IntradayTimeseriesExtractor(BaseExtractor):
     """
@@ -288,6 +323,55 @@ class IntradayTimeseriesExtractor(BaseExtractor):
                 
         df.sort_values(by=["security_id", "date"], inplace=True, ignore_index=True)
         return df
+
+    def _process_response_arrow(self, response: dict) -> pa.Table:
+        """
+        Process Morningstar intraday timeseries response into an Arrow table.
+
+        Produces the same columns, fill values and ordering as
+        `_process_response`, built column by column without pandas.
+
+        Parameters
+        ----------
+        response : dict
+            API response containing intraday timeseries data.
+
+        Returns
+        -------
+        pa.Table
+            Table with columns defined in FINAL_COLUMNS config. Returns an
+            empty table if response is invalid or empty.
+        """
+        if not isinstance(response, list) or not response:
+            return pa.table({})
+
+        columns: Dict[str, list] = {
+            col: [] for col in ["security_id", "previous_close", *self.field_mapping]
+        }
+
+        for security_block in response:
+            security_id = security_block.get("queryKey")
+
+            for daily_series in security_block.get("series", []):
+                previous_close = daily_series.get("previousClose")
+                children = daily_series.get("children", [])
+
+                columns["security_id"].extend([security_id] * len(children))
+                columns["previous_close"].extend([previous_close] * len(children))
+                for key, value in self.field_mapping.items():
+                    columns[key].extend([child.get(value) for child in children])
+
+        if not columns["security_id"]:
+            return pa.table({})
+
+        table = self._arrow_table({col: columns[col] for col in self.final_columns})
+        return _finalize_timeseries_table(
+            table,
+            self.str_columns,
+            self.numeric_columns,
+            self.config.DATE_INPUT_FORMAT,
+            self.config.DATE_OUTPUT_FORMAT
+        )
         
 
 class HistoricalTimeseriesExtractor(BaseExtractor):
@@ -548,4 +632,50 @@ class HistoricalTimeseriesExtractor(BaseExtractor):
         df["date"] = df["date"].dt.strftime("%Y-%m-%d") 
         
         df.sort_values(by=["security_id", "date"], inplace=True, ignore_index=True)
-        return df
\ No newline at end of file
+        return df
+
+    def _process_response_arrow(self, response: dict) -> pa.Table:
+        """
+        Process Morningstar historical timeseries response into an Arrow table.
+
+        Produces the same columns, fill values and ordering as
+        `_process_response`, built column by column without pandas.
+
+        Parameters
+        ----------
+        response : dict
+            API response containing historical timeseries data.
+
+        Returns
+        -------
+        pa.Table
+            Table with columns defined in FINAL_COLUMNS config. Returns an
+            empty table if response is invalid or empty.
+        """
+        if not isinstance(response, list) or not response:
+            return pa.table({})
+
+        columns: Dict[str, list] = {col: [] for col in ["security_id", *self.field_mapping]}
+
+        for block in response:
+            security_id = block.get("queryKey")
+            series_list = block.get("series")
+
+            if not series_list or not isinstance(series_list, list):
+                continue
+
+            columns["security_id"].extend([security_id] * len(series_list))
+            for key, value in self.field_mapping.items():
+                columns[key].extend([record.get(value) for record in series_list])
+
+        if not columns["security_id"]:
+            return pa.table({})
+
+        table = self._arrow_table({col: columns[col] for col in self.final_columns})
+        return _finalize_timeseries_table(
+            table,
+            self.str_columns,
+            self.numeric_columns,
+            self.config.DATE_INPUT_FORMAT,
+            self.config.DATE_OUTPUT_FORMAT
+        )
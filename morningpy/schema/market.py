@@ -97,6 +97,7 @@ class MarketCommoditiesSchema(DataFrameSchema):
     category: Optional[str] = None
     name: Optional[str] = None
     instrument_id: Optional[str] = None
+    exchange_name: Optional[str] = None
     exchange: Optional[str] = None
     option_expiration_date: Optional[str] = None
     last_price: Optional[float] = None
@@ -17,6 +17,10 @@ class FinancialStatementSchema(DataFrameSchema):
     sub_type7: Optional[str] = None
     sub_type8: Optional[str] = None
 
+@dataclass
+class FinancialStatementLongSchema(DataFrameSchema):
+    value: Optional[float] = None
+
 @dataclass
 class HoldingSchema(DataFrameSchema):
     parent_security_id: Optional[str] = None
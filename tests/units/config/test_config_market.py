@@ -253,9 +253,17 @@ class TestMarketCommoditiesConfig(ConfigTestMixin):
     
     def test_essential_columns_present(self):
         """Test that essential columns are present."""
-        essential = ["category", "name", "instrument_id", "exchange"]
+        essential = ["category", "name", "instrument_id", "exchange_name", "exchange"]
         for col in essential:
             assert col in MarketCommoditiesConfig.FINAL_COLUMNS
+    
+    def test_flattened_columns_unique(self):
+        """Test that no flattened column is renamed onto another one."""
+        renames = MarketCommoditiesConfig.RENAME_COLUMNS
+        base = list(MarketCommoditiesConfig.FLATTEN_SPEC["base"])
+        columns = [renames.get(col, col) for col in base + list(renames)]
+        assert len(set(columns)) == len(set(base + list(renames)))
+        assert len(set(MarketCommoditiesConfig.FINAL_COLUMNS)) == len(MarketCommoditiesConfig.FINAL_COLUMNS)
 
 
 @pytest.mark.config
@@ -12,8 +12,13 @@ Tests cover:
 - Complete pipeline execution
 """
 
+import asyncio
 import pytest
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import dask.dataframe as dd
 import aiohttp
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Any, List, Tuple, Dict
@@ -22,6 +27,11 @@ from abc import ABC
 from morningpy.core.base_extract import BaseExtractor
 from morningpy.core.interchange import DataFrameInterchange
 from morningpy.core.config import CoreConfig
+from morningpy.core.sink import open_sink
+from morningpy.core.client import BaseClient
+from morningpy.core.deadline import current_deadline
+from morningpy.core.error import DeadlineExceededError, PartialResultWarning
+from morningpy.core.instrumentation import MetricsCollector, instrument
 
 
 # ============================================================================
@@ -526,6 +536,255 @@ class TestRunPipeline:
             await concrete_extractor.run()
 
 
+# ============================================================================
+# Test Output Engines
+# ============================================================================
+
+class TestRunEngines:
+    """Test the engine argument of run and the Arrow-native path."""
+    
+    @pytest.mark.asyncio
+    async def test_arrow_engine_returns_table(self, concrete_extractor, mock_client, mock_schema):
+        """Test that the arrow engine returns a schema-typed Table."""
+        concrete_extractor.test_input = "valid"
+        concrete_extractor.schema = mock_schema
+        mock_client.fetch_all.return_value = [
+            {"id": 1, "name": "a", "price": 1},
+            {"id": 2, "name": "b", "price": 2.5},
+        ]
+        
+        result = await concrete_extractor.run(engine="arrow")
+        
+        assert isinstance(result, pa.Table)
+        assert result.num_rows == 2
+        assert result.schema.field("id").type == pa.int64()
+        assert result.schema.field("price").type == pa.float64()
+        assert result.schema.field("name").type == pa.string()
+    
+    @pytest.mark.asyncio
+    async def test_arrow_engine_uses_arrow_path(self, concrete_extractor, mock_client):
+        """Test that Arrow engines do not call the pandas pipeline."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [{"id": 1}]
+        concrete_extractor._call_api = AsyncMock()
+        
+        result = await concrete_extractor.run(engine="polars")
+        
+        assert isinstance(result, pl.DataFrame)
+        assert result["id"].to_list() == [1]
+        concrete_extractor._call_api.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_arrow_engine_skips_failed_responses(self, concrete_extractor, mock_client):
+        """Test that failed requests are logged and skipped."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [Exception("boom"), {"id": 1}]
+        
+        result = await concrete_extractor.run(engine="arrow")
+        
+        assert result.num_rows == 1
+        mock_client.logger.error.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_arrow_engine_all_failed(self, concrete_extractor, mock_client):
+        """Test that an empty table is returned when every request fails."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [Exception("boom")]
+        
+        result = await concrete_extractor.run(engine="arrow")
+        
+        assert isinstance(result, pa.Table)
+        assert result.num_rows == 0
+    
+    @pytest.mark.asyncio
+    async def test_pandas_based_engine(self, concrete_extractor, mock_client):
+        """Test that non-Arrow engines convert the pandas result."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [{"id": 1}]
+        
+        result = await concrete_extractor.run(engine="dask")
+        
+        assert isinstance(result, dd.DataFrame)
+    
+    @pytest.mark.asyncio
+    async def test_invalid_engine(self, concrete_extractor):
+        """Test that unsupported engines fail before any request."""
+        concrete_extractor.test_input = "valid"
+        concrete_extractor._build_request = Mock()
+        
+        with pytest.raises(ValueError, match="Unsupported engine 'spark'"):
+            await concrete_extractor.run(engine="spark")
+        concrete_extractor._build_request.assert_not_called()
+
+
+# ============================================================================
+# Test Failure Report
+# ============================================================================
+
+class TestFailureReport:
+    """Test that failed requests are reported alongside the result."""
+    
+    @pytest.mark.asyncio
+    async def test_run_returns_failures(self, concrete_extractor, mock_client):
+        """Test that failures are listed with their request and classification."""
+        concrete_extractor.test_input = "valid"
+        concrete_extractor._build_request = Mock()
+        concrete_extractor.requests = [
+            {"url": "https://x/A", "params": None, "metadata": {"security_id": "A"}},
+            {"url": "https://x/B", "params": None, "metadata": {"security_id": "B"}},
+        ]
+        mock_client.fetch_all.return_value = [{"id": 1}, KeyError("data")]
+        
+        result, failures = await concrete_extractor.run(return_failures=True)
+        
+        assert len(result) == 1
+        assert failures is concrete_extractor.failures
+        assert failures.security_ids() == ["B"]
+        assert failures.requests(retryable=False)[0]["url"] == "https://x/B"
+        mock_client.logger.error.assert_called_once_with("API call failed [B]: 'data'")
+    
+    @pytest.mark.asyncio
+    async def test_failures_reset_per_run(self, concrete_extractor, mock_client):
+        """Test that each run starts a new report."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [Exception("boom")]
+        await concrete_extractor.run(engine="arrow")
+        assert len(concrete_extractor.failures) == 1
+        
+        mock_client.fetch_all.return_value = [{"id": 1}]
+        await concrete_extractor.run()
+        
+        assert len(concrete_extractor.failures) == 0
+
+
+# ============================================================================
+# Test Deadline
+# ============================================================================
+
+class TestRunDeadline:
+    """Test partial results under a deadline."""
+    
+    @staticmethod
+    def slow_fetch(delays):
+        async def fetch_all(session, requests):
+            async def one(delay, i):
+                await asyncio.sleep(delay)
+                return {"id": i}
+            return await BaseClient._gather_until(current_deadline(), [one(d, i) for i, d in enumerate(delays)])
+        return fetch_all
+    
+    @pytest.mark.asyncio
+    async def test_partial_result_flagged(self, concrete_extractor, mock_client):
+        """Test that cut-off requests flag the result as partial."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.side_effect = self.slow_fetch([0, 10])
+        
+        with pytest.warns(PartialResultWarning, match="1/1 requests missing"):
+            result = await concrete_extractor.run(deadline=0.05)
+        
+        assert result["id"].tolist() == [0]
+        assert result.attrs["partial"] is True
+        assert concrete_extractor.partial
+        assert isinstance(concrete_extractor.failures.failures[0].error, DeadlineExceededError)
+    
+    @pytest.mark.asyncio
+    async def test_partial_arrow_metadata(self, concrete_extractor, mock_client):
+        """Test that Arrow results carry the partial flag in their metadata."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.side_effect = self.slow_fetch([0, 10])
+        
+        with pytest.warns(PartialResultWarning):
+            result = await concrete_extractor.run(engine="arrow", deadline=0.05)
+        
+        assert result.schema.metadata[b"morningpy.partial"] == b"true"
+    
+    @pytest.mark.asyncio
+    async def test_complete_within_deadline(self, concrete_extractor, mock_client):
+        """Test that a run finishing in time is not partial."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.side_effect = self.slow_fetch([0, 0])
+        
+        result = await concrete_extractor.run(deadline=5)
+        
+        assert len(result) == 2
+        assert result.attrs["partial"] is False
+        assert not concrete_extractor.partial
+
+
+# ============================================================================
+# Test Run To Sink
+# ============================================================================
+
+class TestRunToSink:
+    """Test streaming the pipeline into a sink."""
+    
+    @pytest.mark.asyncio
+    async def test_writes_one_batch_per_response(self, concrete_extractor, mock_client, mock_schema):
+        """Test that every successful response is written as its own batch."""
+        concrete_extractor.test_input = "valid"
+        concrete_extractor.schema = mock_schema
+        mock_client.fetch_all.return_value = [
+            {"id": 1, "name": "a", "price": 1},
+            Exception("boom"),
+            {"id": 2, "name": "b", "price": 2.5},
+        ]
+        sink = MagicMock(rows_written=0)
+        sink.write_batch.side_effect = lambda t: setattr(sink, "rows_written", sink.rows_written + t.num_rows)
+        
+        written = await concrete_extractor.run_to_sink(sink)
+        
+        assert written == 2
+        assert sink.write_batch.call_count == 2
+        batch = sink.write_batch.call_args_list[0].args[0]
+        assert batch.schema.field("price").type == pa.float64()
+        mock_client.logger.error.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_writes_parquet(self, concrete_extractor, mock_client, tmp_path):
+        """Test an end-to-end write to a Parquet sink."""
+        concrete_extractor.test_input = "valid"
+        mock_client.fetch_all.return_value = [{"id": 1}, {"id": 2}]
+        
+        with open_sink(tmp_path / "out.parquet") as sink:
+            written = await concrete_extractor.run_to_sink(sink)
+        
+        assert written == 2
+        assert pq.read_table(tmp_path / "out.parquet")["id"].to_pylist() == [1, 2]
+
+
+# ============================================================================
+# Test Instrumentation
+# ============================================================================
+
+class TestInstrumentation:
+    """Test the stages emitted by a run."""
+    
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    @pytest.mark.asyncio
+    async def test_pipeline_stages(self, concrete_extractor, mock_client, mock_schema, engine):
+        """Test that every pipeline stage is timed and labelled."""
+        concrete_extractor.test_input = "valid"
+        concrete_extractor.schema = mock_schema
+        mock_client.fetch_all.return_value = [{"id": 1}]
+        
+        with instrument(MetricsCollector()) as (metrics,):
+            await concrete_extractor.run(engine=engine)
+        
+        frame = metrics.to_frame()
+        assert {"run", "build_request", "process_response", "concat", "schema_conversion"} <= set(frame["stage"])
+        assert set(frame["extractor"]) == {"ConcreteExtractor"}
+        assert metrics.summary("process_response").count == 1
+        assert frame.loc[frame["stage"] == "process_response", "endpoint"].tolist() == ["api.example.com/data"]
+    
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, concrete_extractor, mock_client):
+        """Test that sessions are not traced without hooks."""
+        concrete_extractor.test_input = "valid"
+        
+        async with concrete_extractor._session() as session:
+            assert session.trace_configs == []
+
+
 # ============================================================================
 # Test Fetch Responses
 # ============================================================================
@@ -0,0 +1,317 @@
+"""Tests for the resumable bulk downloader."""
+import asyncio
+import json
+import pytest
+import pandas as pd
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from morningpy.api.bulk import download_universe
+from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.bulk import BulkJob, JobManifest, JobReport
+from morningpy.core.error import CircuitOpenError
+from morningpy.core.security_loader import SecurityLoader
+from morningpy.extractor.security import FinancialStatementExtractor
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakeExtractor(BaseExtractor):
+    """Extractor returning one row per (security, statement) request."""
+
+    fetch_all = AsyncMock()
+
+    def __init__(self, security_id=None, statements=("a",)):
+        client = Mock()
+        client.DEFAULT_TIMEOUT = 30
+        client.headers = {}
+        client.fetch_all = FakeExtractor.fetch_all
+        super().__init__(client)
+        self.security_ids = security_id
+        self.statements = statements
+
+    def _check_inputs(self):
+        pass
+
+    def _build_request(self):
+        self.requests = [
+            {"url": f"https://x/{s}/{stmt}", "params": {}, "metadata": {"security_id": s}}
+            for s in self.security_ids
+            if s != "UNKNOWN"
+            for stmt in self.statements
+        ]
+
+    def _process_response(self, response: Any) -> pd.DataFrame:
+        return pd.DataFrame([response])
+
+
+def echo(failing=(), error=asyncio.TimeoutError("timeout")):
+    """fetch_all side effect answering each request, failing some securities."""
+    async def fetch_all(session, requests):
+        return [
+            error
+            if r["metadata"]["security_id"] in failing
+            else {"security_id": r["metadata"]["security_id"], "url": r["url"]}
+            for r in requests
+        ]
+    return fetch_all
+
+
+@pytest.fixture(autouse=True)
+def reset_fetch():
+    FakeExtractor.fetch_all = AsyncMock(side_effect=echo())
+
+
+# ============================================================================
+# MANIFEST TESTS
+# ============================================================================
+
+class TestJobManifest:
+    """Test the append-only manifest."""
+
+    def test_header_and_records(self, tmp_path):
+        manifest = JobManifest(tmp_path / "m.jsonl", job={"extractor": "X"})
+        manifest.record([
+            {"security_id": "A", "status": "done", "rows": 2},
+            {"security_id": "B", "status": "failed", "error": "boom"},
+        ])
+
+        reloaded = JobManifest(tmp_path / "m.jsonl", job={"extractor": "X"})
+        assert reloaded.completed == {"A"}
+        assert reloaded.failed == {"B": "boom"}
+        assert reloaded.records["A"]["attempts"] == 1
+
+    def test_latest_record_wins(self, tmp_path):
+        manifest = JobManifest(tmp_path / "m.jsonl", job={})
+        manifest.record([{"security_id": "B", "status": "failed", "error": "boom"}])
+        manifest.record([{"security_id": "B", "status": "done", "rows": 1}])
+
+        reloaded = JobManifest(tmp_path / "m.jsonl", job={})
+        assert reloaded.completed == {"B"}
+        assert reloaded.records["B"]["attempts"] == 2
+
+    def test_truncated_line_ignored(self, tmp_path):
+        manifest = JobManifest(tmp_path / "m.jsonl", job={})
+        manifest.record([{"security_id": "A", "status": "done", "rows": 1}])
+        with open(tmp_path / "m.jsonl", "a") as f:
+            f.write('{"security_id": "B", "sta')
+
+        assert JobManifest(tmp_path / "m.jsonl", job={}).completed == {"A"}
+
+    def test_other_job_rejected(self, tmp_path):
+        JobManifest(tmp_path / "m.jsonl", job={"extractor": "X"})
+        with pytest.raises(ValueError, match="another job"):
+            JobManifest(tmp_path / "m.jsonl", job={"extractor": "Y"})
+
+
+# ============================================================================
+# JOB TESTS
+# ============================================================================
+
+class TestBulkJob:
+    """Test batching, checkpointing and resume."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_universe(self, tmp_path):
+        universe = pd.DataFrame({"security_id": ["A", "B", "C", "A", None]})
+        job = BulkJob(FakeExtractor, universe, tmp_path, batch_size=2)
+
+        report = await job.run()
+
+        assert job.security_ids == ["A", "B", "C"]
+        assert (report.completed, report.rows, report.requests) == (3, 3, 3)
+        assert len(list((tmp_path / "data").glob("*.parquet"))) == 2
+        assert sorted(job.read()["security_id"].to_pylist()) == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_only_failures(self, tmp_path):
+        FakeExtractor.fetch_all.side_effect = echo(failing={"B"})
+        first = await BulkJob(FakeExtractor, ["A", "B", "C"], tmp_path).run()
+        assert first.failed == {"B": "TimeoutError: timeout"}
+
+        FakeExtractor.fetch_all = AsyncMock(side_effect=echo())
+        job = BulkJob(FakeExtractor, ["A", "B", "C"], tmp_path)
+        assert job.pending() == ["B"]
+        second = await job.run()
+
+        assert (second.skipped, second.completed, second.failed) == (2, 1, {})
+        assert FakeExtractor.fetch_all.call_args.args[1][0]["metadata"] == {"security_id": "B"}
+        assert sorted(job.read()["security_id"].to_pylist()) == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_fatal_failures_not_requeued(self, tmp_path):
+        FakeExtractor.fetch_all.side_effect = echo(failing={"B"}, error=ValueError("bad payload"))
+        await BulkJob(FakeExtractor, ["A", "B"], tmp_path).run()
+
+        job = BulkJob(FakeExtractor, ["A", "B"], tmp_path)
+        assert job.manifest.fatal == {"B"}
+        assert job.pending() == []
+        assert job.pending(retry_fatal=True) == ["B"]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_stops_run(self, tmp_path):
+        FakeExtractor.fetch_all.side_effect = echo(failing={"B", "C", "D"}, error=CircuitOpenError("x", 30))
+        job = BulkJob(FakeExtractor, list("ABCD"), tmp_path, batch_size=2)
+
+        report = await job.run()
+
+        assert report.aborted.startswith("Circuit open for x")
+        assert report.completed == 1
+        assert list(report.failed) == ["B"]
+        assert job.pending() == ["B", "C", "D"]
+
+    @pytest.mark.asyncio
+    async def test_partial_security_not_written(self, tmp_path):
+        async def fetch_all(session, requests):
+            return [
+                RuntimeError("timeout") if r["url"].endswith("A/b") else {"security_id": r["metadata"]["security_id"]}
+                for r in requests
+            ]
+        FakeExtractor.fetch_all = AsyncMock(side_effect=fetch_all)
+        job = BulkJob(FakeExtractor, ["A", "B"], tmp_path, options={"statements": ("a", "b")})
+
+        report = await job.run()
+
+        assert report.failed == {"A": "RuntimeError: timeout"}
+        assert job.read()["security_id"].to_pylist() == ["B", "B"]
+
+    @pytest.mark.asyncio
+    async def test_crash_before_checkpoint_does_not_duplicate(self, tmp_path, monkeypatch):
+        crashed = BulkJob(FakeExtractor, ["A", "B"], tmp_path)
+        monkeypatch.setattr(crashed.manifest, "record", Mock(side_effect=KeyboardInterrupt))
+        with pytest.raises(KeyboardInterrupt):
+            await crashed.run()
+        assert len(list((tmp_path / "data").glob("*.parquet"))) == 1
+        assert crashed.read().num_rows == 0
+
+        job = BulkJob(FakeExtractor, ["A", "B"], tmp_path)
+        await job.run()
+
+        assert len(list((tmp_path / "data").glob("*.parquet"))) == 1
+        assert sorted(job.read()["security_id"].to_pylist()) == ["A", "B"]
+        assert job.manifest.parts == {job.manifest.records["A"]["part"]}
+
+    @pytest.mark.asyncio
+    async def test_rejected_write_fails_only_its_security(self, tmp_path):
+        async def fetch_all(session, requests):
+            return [
+                {"security_id": s, **({"extra": 1} if s == "B" else {})}
+                for s in (r["metadata"]["security_id"] for r in requests)
+            ]
+        FakeExtractor.fetch_all = AsyncMock(side_effect=fetch_all)
+        job = BulkJob(FakeExtractor, ["A", "B", "C"], tmp_path)
+
+        report = await job.run()
+
+        assert report.completed == 2
+        assert report.failed["B"].startswith("ValueError: Columns absent from the sink schema")
+        assert job.manifest.completed == {"A", "C"}
+        assert job.read()["security_id"].to_pylist() == ["A", "C"]
+
+    @pytest.mark.asyncio
+    async def test_requests_sent_in_bounded_windows(self, tmp_path, monkeypatch):
+        original_init = FakeExtractor.__init__
+
+        def init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            self.max_requests = 3
+        monkeypatch.setattr(FakeExtractor, "__init__", init)
+
+        await BulkJob(FakeExtractor, list("ABCDEFG"), tmp_path).run()
+
+        assert [len(c.args[1]) for c in FakeExtractor.fetch_all.call_args_list] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_unresolved_security_fails(self, tmp_path):
+        report = await BulkJob(FakeExtractor, ["A", "UNKNOWN"], tmp_path).run()
+
+        assert report.completed == 1
+        assert "not found" in report.failed["UNKNOWN"]
+
+    @pytest.mark.asyncio
+    async def test_progress_callback(self, tmp_path):
+        reports = []
+        await BulkJob(FakeExtractor, list("ABC"), tmp_path, batch_size=1,
+                      on_progress=lambda r: reports.append(r.completed)).run()
+
+        assert reports == [1, 2, 3]
+        manifest = [json.loads(l) for l in (tmp_path / "manifest.jsonl").read_text().splitlines()]
+        assert manifest[0] == {"job": {"extractor": "FakeExtractor", "options": {}}}
+        assert len(manifest) == 4
+
+    def test_invalid_batch_size(self, tmp_path):
+        with pytest.raises(ValueError, match="batch_size"):
+            BulkJob(FakeExtractor, ["A"], tmp_path, batch_size=0)
+
+
+# ============================================================================
+# FINANCIAL STATEMENT JOB TESTS
+# ============================================================================
+
+class TestStatementJob:
+    """Test a statement download over securities reporting different periods."""
+
+    @pytest.fixture
+    def tickers(self):
+        previous = SecurityLoader._cached_tickers, SecurityLoader._cached_id_map
+        SecurityLoader._cached_tickers = pd.DataFrame({
+            "security_id": ["0P00000001", "0P00000002"],
+            "security_label": ["Company One", "Company Two"],
+            "ticker": ["ONE", "TWO"],
+            "isin": ["US0000000001", "US0000000002"],
+            "performance_id": ["0P00000001", "0P00000002"],
+        })
+        SecurityLoader._cached_id_map = None
+        yield
+        SecurityLoader._cached_tickers, SecurityLoader._cached_id_map = previous
+
+    @pytest.fixture
+    def statements(self, monkeypatch):
+        """Serve the statement fixture, shifted one quarter back for 0P00000002."""
+        with open(RESPONSES_DIR / "get_financial_statement_response.json") as f:
+            response = json.load(f)
+        labels, periods = response["columnDefs"][:5], response["columnDefs"][5:]
+        periods = {
+            "0P00000001": periods,
+            "0P00000002": ["Q4 2019"] + periods[:-1],
+        }
+
+        async def fetch(extractor, requests):
+            return [
+                {**response, "columnDefs": labels + periods[r["metadata"]["security_id"]], "metadata": r["metadata"]}
+                for r in requests
+            ]
+        monkeypatch.setattr(BulkJob, "_fetch", staticmethod(fetch))
+        return periods
+
+    def test_keeps_every_period(self, tmp_path, tickers, statements):
+        report = download_universe(
+            ["0P00000001", "0P00000002"], "financial_statement", tmp_path,
+            statement_type="Income Statement", report_frequency="Quarterly",
+        )
+
+        assert (report.completed, report.failed) == (2, {})
+        options = {"statement_type": "Income Statement", "report_frequency": "Quarterly", "layout": "long"}
+        data = BulkJob(FinancialStatementExtractor, [], tmp_path, options=options).read().to_pandas()
+        for security_id, periods in statements.items():
+            written = data.loc[data["security_id"] == security_id, "period"].astype(str)
+            assert set(written) == set(periods)
+
+
+# ============================================================================
+# REPORT TESTS
+# ============================================================================
+
+class TestJobReport:
+    """Test progress figures."""
+
+    def test_throughput(self):
+        report = JobReport(total=10, skipped=2, completed=4, failed={"X": "e"}, rows=40, elapsed=2.0)
+
+        assert report.pending == 3
+        assert report.securities_per_second == 2.0
+        assert report.rows_per_second == 20.0
+        assert str(report).startswith("6/10 done (2 resumed), 1 failed")
@@ -4,10 +4,15 @@ import aiohttp
 import requests
 import logging
 import asyncio
+import time
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 from aiohttp import ClientResponseError, ClientError
 from morningpy.core.client import BaseClient
 from morningpy.core.auth import AuthManager, AuthType
+from morningpy.core.deadline import deadline_scope
+from morningpy.core.error import CircuitOpenError, DeadlineExceededError
+from morningpy.core.hedging import HedgePolicy
+from morningpy.core.resilience import CircuitBreaker
 
 
 # ============================================================================
@@ -27,6 +32,41 @@ def mock_auth_manager():
         yield mock_instance
 
 
+@pytest.fixture(autouse=True)
+def reset_breakers():
+    """Start every test with closed circuits."""
+    BaseClient.reset_breakers()
+    yield
+    BaseClient.reset_breakers()
+
+
+def session_returning(*outcomes):
+    """Mock session whose successive get() calls return or raise outcomes."""
+    session = Mock()
+    responses = []
+    for outcome in outcomes:
+        response = AsyncMock()
+        if isinstance(outcome, Exception):
+            response.raise_for_status = Mock(side_effect=outcome)
+        else:
+            response.raise_for_status = Mock()
+            response.json = AsyncMock(return_value=outcome)
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        responses.append(context)
+    session.get = Mock(side_effect=responses)
+    return session
+
+
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+def http_error(status, headers=None):
+    return ClientResponseError(Mock(real_url="https://api.example.com"), (), status=status, headers=headers)
+
+
 @pytest.fixture
 def base_client(mock_auth_manager):
     """Provide a BaseClient instance with mocked authentication."""
@@ -140,7 +180,8 @@ class TestBaseClientInit:
     def test_class_constants(self):
         """Test that class constants are defined correctly."""
         assert BaseClient.DEFAULT_TIMEOUT == 20
-        assert BaseClient.MAX_RETRIES == 1
+        assert BaseClient.MAX_RETRIES == 3
+        assert BaseClient.MAX_BACKOFF == 60
         assert BaseClient.BACKOFF_FACTOR == 2
 
 
@@ -215,6 +256,310 @@ class TestGetAsync:
                base_client.get_async.__name__ == 'get_async'
 
 
+# ============================================================================
+# RETRY AND CIRCUIT BREAKER TESTS
+# ============================================================================
+
+class TestRetryAndBreaker:
+    """Test error classification and per-host circuit breakers in get_async."""
+    
+    @pytest.mark.asyncio
+    async def test_fatal_status_not_retried(self, base_client):
+        """Test that a 404 fails on the first attempt."""
+        session = session_returning(http_error(404), {"data": "late"})
+        
+        with pytest.raises(ClientResponseError) as exc:
+            await base_client.get_async(session, "https://api.example.com/x")
+        
+        assert session.get.call_count == 1
+        assert exc.value.attempts == 1
+    
+    @pytest.mark.asyncio
+    async def test_transient_status_retried_with_retry_after(self, base_client):
+        """Test that a 429 is retried after the Retry-After delay."""
+        session = session_returning(http_error(429, {"Retry-After": "3"}), {"data": "ok"})
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await base_client.get_async(session, "https://api.example.com/x")
+        
+        assert result == {"data": "ok"}
+        mock_sleep.assert_awaited_once_with(3.0)
+    
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_fails_fast(self, base_client):
+        """Test that repeated failures open the host circuit."""
+        session = session_returning(*[http_error(503)] * 5)
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(ClientResponseError):
+                await base_client.get_async(session, "https://api.example.com/x")
+            # The 5th consecutive failure opens the circuit mid-retry
+            with pytest.raises(CircuitOpenError):
+                await base_client.get_async(session, "https://api.example.com/x")
+            with pytest.raises(CircuitOpenError):
+                await base_client.get_async(session, "https://api.example.com/y")
+        
+        assert session.get.call_count == BaseClient.BREAKER_FAILURE_THRESHOLD
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_releases_breaker(self, base_client):
+        """Test that a cancelled half-open trial lets the next request through."""
+        url = "https://api.example.com/x"
+        breaker = base_client.breaker(url)
+        breaker._opened_at = time.monotonic() - breaker.reset_timeout
+        started = asyncio.Event()
+        
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(10)
+        
+        with patch.object(base_client, '_get_json', side_effect=hang):
+            task = asyncio.create_task(base_client.get_async(Mock(), url))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        result = await base_client.get_async(session_returning({"data": "ok"}), url)
+        assert result == {"data": "ok"}
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_trial_releases_breaker(self, base_client):
+        """Test that a stream closed early by its consumer releases the trial."""
+        url = "https://api.example.com/x"
+        breaker = base_client.breaker(url)
+        breaker._opened_at = time.monotonic() - breaker.reset_timeout
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.content.iter_chunked = lambda size: async_iter([b"a", b"b"])
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        session = Mock()
+        session.get = Mock(return_value=context)
+        
+        stream = base_client.stream_chunks(session, url)
+        assert await stream.__anext__() == b"a"
+        await stream.aclose()
+        
+        assert breaker.before_request() is True
+    
+    def test_breakers_shared_per_host(self, base_client, mock_auth_manager):
+        """Test that clients share one breaker per host."""
+        other = BaseClient(auth_type="bearer")
+        
+        assert base_client.breaker("https://api.example.com/a") is other.breaker("https://api.example.com/b")
+        assert base_client.breaker("https://api.example.com/a") is not base_client.breaker("https://other.com/a")
+
+
+# ============================================================================
+# DEADLINE TESTS
+# ============================================================================
+
+class TestDeadline:
+    """Test that requests respect the current deadline."""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_returns_completed_before_deadline(self, base_client):
+        """Test that slow requests are cancelled and fast ones kept."""
+        async def fake_get(session, url, params=None, metadata=None):
+            await asyncio.sleep(0 if url.endswith("fast") else 10)
+            return {"url": url}
+        requests = [
+            {"url": "https://api.example.com/fast", "params": None, "metadata": None},
+            {"url": "https://api.example.com/slow", "params": None, "metadata": None},
+        ]
+        
+        with patch.object(base_client, 'get_async', side_effect=fake_get):
+            with deadline_scope(0.05):
+                results = await base_client.fetch_all(AsyncMock(), requests)
+        
+        assert results[0] == {"url": "https://api.example.com/fast"}
+        assert isinstance(results[1], DeadlineExceededError)
+    
+    @pytest.mark.asyncio
+    async def test_request_timeout_bounded_by_deadline(self, base_client):
+        """Test that the per-request timeout shrinks to the remaining budget."""
+        session = session_returning({"data": "ok"})
+        
+        with deadline_scope(2):
+            await base_client.get_async(session, "https://api.example.com/x")
+        
+        assert session.get.call_args.kwargs["timeout"] <= 2
+    
+    @pytest.mark.asyncio
+    async def test_no_retry_sleep_past_deadline(self, base_client):
+        """Test that a retry wait longer than the budget gives up at once."""
+        session = session_returning(http_error(503, {"Retry-After": "30"}), {"data": "ok"})
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with deadline_scope(5):
+                with pytest.raises(ClientResponseError):
+                    await base_client.get_async(session, "https://api.example.com/x")
+        
+        mock_sleep.assert_not_awaited()
+        assert session.get.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_expired_deadline_sends_nothing(self, base_client):
+        """Test that no request starts once the deadline expired."""
+        session = session_returning({"data": "ok"})
+        
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceededError):
+                await base_client.get_async(session, "https://api.example.com/x")
+        
+        session.get.assert_not_called()
+
+
+# ============================================================================
+# HEDGING TESTS
+# ============================================================================
+
+def trained_policy(**kwargs):
+    """HedgePolicy whose endpoint latency is already ~10ms."""
+    kwargs.setdefault("min_samples", 1)
+    kwargs.setdefault("budget", 1.0)
+    policy = HedgePolicy(**kwargs)
+    policy.record("https://api.example.com/x", 0.01)
+    return policy
+
+
+def timed_responses(*outcomes):
+    """Fake _get_json whose successive calls sleep, then return or raise."""
+    calls = []
+    queue = list(outcomes)
+
+    async def fake_get_json(session, url, params, timeout):
+        delay, outcome = queue.pop(0)
+        call_index = len(calls)
+        calls.append("started")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            calls[call_index] = "cancelled"
+            raise
+        calls[call_index] = "finished"
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return fake_get_json, calls
+
+
+class TestHedging:
+    """Test hedged requests."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_policy(self):
+        yield
+        BaseClient.hedge_policy = None
+    
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_cancelled(self, base_client):
+        """Test that a slow primary is duplicated and the faster hedge returned."""
+        base_client.hedge_policy = policy = trained_policy()
+        fake, calls = timed_responses((10, {"from": "primary"}), (0, {"from": "hedge"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            result = await base_client.get_async(Mock(), "https://api.example.com/x")
+            await asyncio.sleep(0)
+        
+        assert result == {"from": "hedge"}
+        assert calls == ["cancelled", "finished"]
+        assert (policy.requests, policy.hedges, policy.wins) == (1, 1, 1)
+    
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self, base_client):
+        """Test that requests answering before the delay send no duplicate."""
+        base_client.hedge_policy = policy = trained_policy(min_delay=1)
+        fake, calls = timed_responses((0, {"from": "primary"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            result = await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert result == {"from": "primary"}
+        assert calls == ["finished"]
+        assert policy.hedges == 0
+    
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_min_samples(self, base_client):
+        """Test that endpoints without a latency history are not hedged."""
+        base_client.hedge_policy = policy = HedgePolicy(min_samples=20, budget=1.0)
+        fake, calls = timed_responses((0.05, {"from": "primary"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert calls == ["finished"]
+        assert policy.hedges == 0
+    
+    @pytest.mark.asyncio
+    async def test_budget_exhausted(self, base_client):
+        """Test that no duplicate is sent beyond the hedge budget."""
+        base_client.hedge_policy = policy = trained_policy(budget=0.0)
+        fake, calls = timed_responses((0.05, {"from": "primary"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            result = await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert result == {"from": "primary"}
+        assert calls == ["finished"]
+    
+    @pytest.mark.asyncio
+    async def test_hedge_survives_primary_failure(self, base_client):
+        """Test that a failing primary does not discard a succeeding hedge."""
+        base_client.hedge_policy = trained_policy()
+        fake, calls = timed_responses((0.05, http_error(404)), (0.1, {"from": "hedge"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            result = await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert result == {"from": "hedge"}
+    
+    @pytest.mark.asyncio
+    async def test_hedge_survives_cancelled_primary(self, base_client):
+        """Test that a primary cancelled from elsewhere does not discard the hedge."""
+        base_client.hedge_policy = trained_policy()
+        fake, calls = timed_responses((0.05, asyncio.CancelledError()), (0.1, {"from": "hedge"}))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            result = await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert result == {"from": "hedge"}
+    
+    @pytest.mark.asyncio
+    async def test_raises_when_both_fail(self, base_client):
+        """Test that the error is raised once both requests failed."""
+        base_client.hedge_policy = trained_policy()
+        fake, calls = timed_responses((0.05, http_error(404)), (0.05, http_error(404)))
+        
+        with patch.object(base_client, '_get_json', side_effect=fake):
+            with pytest.raises(ClientResponseError):
+                await base_client.get_async(Mock(), "https://api.example.com/x")
+        
+        assert calls == ["finished", "finished"]
+    
+    @pytest.mark.asyncio
+    async def test_latency_recorded(self, base_client):
+        """Test that successful requests feed the endpoint histogram."""
+        base_client.hedge_policy = policy = HedgePolicy()
+        session = session_returning({"data": "ok"})
+        
+        await base_client.get_async(session, "https://api.example.com/0P000000GY/data")
+        
+        assert policy.histogram("https://api.example.com/0P000003MH/data").total == 1
+    
+    def test_class_level_policy_shared(self, mock_auth_manager):
+        """Test that the class-level policy applies unless overridden."""
+        shared, own = HedgePolicy(), HedgePolicy()
+        BaseClient.hedge_policy = shared
+        
+        assert BaseClient(auth_type="bearer").hedge_policy is shared
+        assert BaseClient(auth_type="bearer", hedge_policy=own).hedge_policy is own
+
+
 # ============================================================================
 # FETCH_ALL TESTS
 # ============================================================================
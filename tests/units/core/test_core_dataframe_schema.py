@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import Mock
+
+from morningpy.core.dataframe_schema import ConversionPlan, DataFrameSchema
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@dataclass
+class SampleSchema(DataFrameSchema):
+    id: Optional[int] = None
+    name: Optional[str] = None
+    price: Optional[float] = None
+    active: Optional[bool] = None
+
+
+@pytest.fixture(autouse=True)
+def clear_plans():
+    ConversionPlan.clear_cache()
+    yield
+    ConversionPlan.clear_cache()
+
+
+@pytest.fixture
+def plan():
+    return ConversionPlan.for_schema(SampleSchema)
+
+
+# ============================================================================
+# CONVERSION PLAN TESTS
+# ============================================================================
+
+class TestConversionPlan:
+    """Test compiled schema conversion plans."""
+
+    def test_plan_is_cached_per_schema(self, plan):
+        assert ConversionPlan.for_schema(SampleSchema) is plan
+        assert plan.dtype_map == SampleSchema().to_dtype_dict()
+
+    def test_converts_all_kinds(self, plan):
+        df = pd.DataFrame({
+            "id": ["1", "x", "3"],
+            "name": ["a", None, "c"],
+            "price": ["1.5", "2", None],
+            "active": [True, False, None],
+        })
+        result = plan.apply(df)
+        assert result["id"].dtype == "Int64"
+        assert pd.isna(result["id"].iloc[1])
+        assert result["name"].dtype == "string"
+        assert result["price"].dtype == "float64"
+        assert result["active"].dtype == "boolean"
+
+    def test_skips_columns_already_converted(self, plan):
+        price = pd.Series([1.0, 2.0])
+        df = pd.DataFrame({"price": price, "name": pd.Series(["a", "b"], dtype="string")})
+        converted = plan.apply(df.copy())
+        pd.testing.assert_frame_equal(converted, df)
+
+    def test_numeric_columns_kept_for_float_targets(self, plan):
+        result = plan.apply(pd.DataFrame({"price": [1, 2]}))
+        assert result["price"].dtype == "int64"
+
+    def test_numeric_to_int64_is_a_cast(self, plan):
+        result = plan.apply(pd.DataFrame({"id": [1.0, None]}))
+        assert result["id"].dtype == "Int64"
+
+    def test_failed_cast_does_not_block_other_columns(self, plan):
+        logger = Mock()
+        df = pd.DataFrame({"id": [1.5, 2.0], "name": ["a", "b"]})
+        result = plan.apply(df, logger=logger)
+        assert result["id"].dtype == "float64"
+        assert result["name"].dtype == "string"
+        logger.warning.assert_called_once()
+
+    def test_missing_and_extra_columns_logged(self, plan):
+        logger = Mock()
+        result = plan.apply(pd.DataFrame({"name": ["a"], "extra": [1]}), logger=logger)
+        assert list(result.columns) == ["name", "extra"]
+        assert logger.debug.call_count == 2
+
+    def test_duplicated_columns_converted_one_by_one(self, plan):
+        df = pd.DataFrame([["a", "1", "b"]], columns=["name", "id", "name"])
+        result = plan.apply(df)
+        assert list(result.columns) == ["name", "id", "name"]
+        assert result.dtypes.tolist() == ["string", "Int64", "string"]
+        assert result.iloc[0].tolist() == ["a", 1, "b"]
@@ -0,0 +1,105 @@
+"""Tests for deadline propagation."""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from morningpy.core.deadline import (
+    Deadline,
+    bounded_timeout,
+    current_deadline,
+    deadline_scope,
+)
+from morningpy.core.decorator import with_deadline
+from morningpy.core.error import DeadlineExceededError
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic."""
+    now = [100.0]
+    with patch("morningpy.core.deadline.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+# ============================================================================
+# DEADLINE TESTS
+# ============================================================================
+
+class TestDeadline:
+    """Test the remaining budget computation."""
+
+    def test_remaining_and_expiry(self, clock):
+        deadline = Deadline(5)
+        clock[0] += 2
+
+        assert deadline.remaining() == 3
+        assert not deadline.expired
+        clock[0] += 3
+        assert deadline.remaining() == 0
+        assert deadline.expired
+
+    def test_timeout_bounded_by_budget(self, clock):
+        deadline = Deadline(5)
+
+        assert deadline.timeout(20) == 5
+        assert deadline.timeout(1) == 1
+
+    def test_timeout_after_expiry_raises(self, clock):
+        deadline = Deadline(1)
+        clock[0] += 1
+
+        with pytest.raises(DeadlineExceededError):
+            deadline.timeout(20)
+
+    def test_negative_rejected(self):
+        with pytest.raises(ValueError):
+            Deadline(-1)
+
+
+# ============================================================================
+# SCOPE TESTS
+# ============================================================================
+
+class TestDeadlineScope:
+    """Test how the current deadline is set and nested."""
+
+    def test_no_deadline_by_default(self):
+        assert current_deadline() is None
+        assert bounded_timeout(20) == 20
+
+    def test_scope_sets_and_resets(self, clock):
+        with deadline_scope(3) as deadline:
+            assert current_deadline() is deadline
+            assert bounded_timeout(20) == 3
+        assert current_deadline() is None
+
+    def test_none_keeps_enclosing(self, clock):
+        with deadline_scope(3) as outer:
+            with deadline_scope(None) as inner:
+                assert inner is outer
+
+    def test_nested_never_extends(self, clock):
+        with deadline_scope(3) as outer:
+            with deadline_scope(10) as inner:
+                assert inner is outer
+            with deadline_scope(1) as tighter:
+                assert tighter.seconds == 1
+
+    @pytest.mark.asyncio
+    async def test_inherited_by_tasks(self):
+        with deadline_scope(30) as deadline:
+            seen = await asyncio.gather(asyncio.create_task(asyncio.sleep(0, current_deadline())))
+        assert seen == [deadline]
+
+    def test_with_deadline_decorator(self):
+        @with_deadline
+        def get_data(ticker=None, deadline=None):
+            return current_deadline()
+
+        assert get_data("AAPL") is None
+        assert get_data("AAPL", deadline=5).seconds == 5
+        assert get_data("AAPL", 2).seconds == 2
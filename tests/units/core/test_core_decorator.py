@@ -258,6 +258,92 @@ class TestRetryAsyncFunctions:
         mock_logger.warning.assert_not_called()
 
 
+# ============================================================================
+# RETRY POLICY TESTS
+# ============================================================================
+
+class TestRetryPolicy:
+    """Test retry predicates, jitter, caps and Retry-After hints."""
+    
+    @pytest.mark.asyncio
+    async def test_retry_if_stops_on_fatal_error(self, mock_logger):
+        """Test that errors rejected by retry_if are raised immediately."""
+        calls = [0]
+        
+        @retry(max_retries=3, backoff_factor=0.01, retry_if=lambda e: not isinstance(e, KeyError))
+        async def not_found():
+            calls[0] += 1
+            raise KeyError("missing")
+        
+        with patch('logging.getLogger', return_value=mock_logger):
+            with pytest.raises(KeyError) as exc:
+                await not_found()
+        
+        assert calls[0] == 1
+        assert exc.value.attempts == 1
+        mock_logger.warning.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_attempts_recorded_on_final_error(self, mock_logger):
+        """Test that the raised exception carries the attempt count."""
+        @retry(max_retries=3, backoff_factor=0.01)
+        async def always_fails():
+            raise ValueError("down")
+        
+        with patch('logging.getLogger', return_value=mock_logger):
+            with patch('asyncio.sleep'):
+                with pytest.raises(ValueError) as exc:
+                    await always_fails()
+        
+        assert exc.value.attempts == 3
+    
+    def test_retry_after_is_lower_bound(self, mock_logger):
+        """Test that a Retry-After hint lengthens the wait."""
+        error = ValueError("rate limited")
+        error.retry_after = 5
+        
+        @retry(max_retries=2, backoff_factor=1)
+        def limited():
+            raise error
+        
+        with patch('logging.getLogger', return_value=mock_logger):
+            with patch('time.sleep') as mock_sleep:
+                with pytest.raises(ValueError):
+                    limited()
+        
+        mock_sleep.assert_called_once_with(5.0)
+    
+    def test_max_backoff_caps_wait(self, mock_logger):
+        """Test that waits, Retry-After included, are capped."""
+        error = ValueError("rate limited")
+        error.retry_after = 120
+        
+        @retry(max_retries=2, backoff_factor=2, max_backoff=10)
+        def limited():
+            raise error
+        
+        with patch('logging.getLogger', return_value=mock_logger):
+            with patch('time.sleep') as mock_sleep:
+                with pytest.raises(ValueError):
+                    limited()
+        
+        mock_sleep.assert_called_once_with(10)
+    
+    def test_full_jitter(self, mock_logger):
+        """Test that jittered waits are drawn in [0, backoff_factor ** attempt]."""
+        @retry(max_retries=4, backoff_factor=2, jitter=True)
+        def flaky():
+            raise ValueError("down")
+        
+        with patch('logging.getLogger', return_value=mock_logger):
+            with patch('time.sleep'):
+                with patch('morningpy.core.decorator.random.uniform', return_value=0.5) as mock_uniform:
+                    with pytest.raises(ValueError):
+                        flaky()
+        
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 2), (0, 4), (0, 8)]
+
+
 # ============================================================================
 # SAVE_API_RESPONSE DECORATOR TESTS
 # ============================================================================
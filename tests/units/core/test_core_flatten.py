@@ -0,0 +1,143 @@
+"""Tests for the market data point flattener."""
+import json
+
+import pytest
+
+from morningpy.config.market import MarketCommoditiesConfig, MarketMoversConfig
+from morningpy.core.flatten import DataPointFlattener, FlatColumns
+from morningpy.extractor.market import MarketCommoditiesExtractor, MarketMoversExtractor
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+SPEC = {
+    "base": {"id": "id", "exchange": ("meta", "exchange")},
+    "points": "dataPoints",
+    "value_column": "{key}_value",
+    "exclude_properties": ["date", "currency"],
+    "extra_keys": ["exchange"],
+}
+
+
+def point(value, **properties):
+    return {"value": value, "properties": {k: {"value": v} for k, v in properties.items()}}
+
+
+ITEMS = [
+    {
+        "id": "a",
+        "meta": {"exchange": "XNAS"},
+        "dataPoints": {
+            "lastPrice": point(10.0, date="2025-01-01", listedCurrency="USD", size=3),
+            "netChange": {**point(1.5), "exchange": {"value": "XCEC"}},
+        },
+    },
+    {"id": "b", "dataPoints": {"lastPrice": point(20.0)}},
+]
+
+
+def make_extractor(cls):
+    """Build a market extractor without client."""
+    extractor = cls.__new__(cls)
+    extractor.rename_columns = cls.config.RENAME_COLUMNS
+    extractor.final_columns = cls.config.FINAL_COLUMNS
+    extractor.str_columns = getattr(cls.config, "STRING_COLUMNS", [])
+    extractor.numeric_columns = getattr(cls.config, "NUMERIC_COLUMNS", [])
+    extractor.flattener = DataPointFlattener.for_config(cls.config)
+    return extractor
+
+
+def load(name):
+    with open(RESPONSES_DIR / f"get_market_{name}_response.json") as f:
+        return json.load(f)
+
+
+# ============================================================================
+# FLATTEN TESTS
+# ============================================================================
+
+class TestFlatten:
+    """Test the spec-driven flattening."""
+
+    def test_columns(self):
+        data = DataPointFlattener(SPEC).flatten(ITEMS).data
+
+        assert data == {
+            "id": ["a", "b"],
+            "exchange": ["XNAS", None],
+            "lastPrice_value": [10.0, 20.0],
+            "lastPrice_size": [3, None],
+            "netChange_value": [1.5, None],
+            "netChange_exchange": ["XCEC", None],
+        }
+
+    def test_require_value(self):
+        items = [{"a": point(1), "b": {"properties": {}}, "c": "raw"}]
+
+        assert list(DataPointFlattener({"require_value": True}).flatten(items).data) == ["a"]
+        assert list(DataPointFlattener({}).flatten(items).data) == ["a", "b"]
+
+    def test_only_kept_columns(self):
+        flattener = DataPointFlattener(SPEC, columns=["id", "lastPrice_value"])
+
+        assert list(flattener.flatten(ITEMS).data) == ["id", "lastPrice_value"]
+
+    def test_append_with_constants(self):
+        flattener = DataPointFlattener(SPEC)
+        out = flattener.flatten(ITEMS[1:], category="x")
+        flattener.flatten(ITEMS[:1], out=out, category="y")
+
+        df = out.to_frame()
+        assert len(out) == 2
+        assert df["category"].tolist() == ["x", "y"]
+        assert df["netChange_value"].isna().tolist() == [True, False]
+        assert df["id"].tolist() == ["b", "a"]
+
+    def test_last_value_wins(self):
+        spec = {"base": {"ticker": ("meta", "ticker")}, "points": "fields"}
+        items = [{"meta": {"ticker": "M"}, "fields": {"ticker": point("F")}}]
+
+        assert DataPointFlattener(spec).flatten(items).data == {"ticker": ["F"]}
+
+    def test_empty(self):
+        assert FlatColumns().to_frame().empty
+        assert DataPointFlattener(SPEC).flatten([None]).rows == 0
+
+    def test_for_config_cached(self):
+        flattener = DataPointFlattener.for_config(MarketCommoditiesConfig)
+
+        assert DataPointFlattener.for_config(MarketCommoditiesConfig) is flattener
+        assert "netChange_exchange" in flattener.columns
+        assert "netChange_date" not in flattener.columns
+
+
+# ============================================================================
+# EXTRACTOR TESTS
+# ============================================================================
+
+class TestMarketExtractors:
+    """Test the market extractors built on the flattener."""
+
+    def test_commodities(self):
+        df = make_extractor(MarketCommoditiesExtractor)._process_response(load("commodities"))
+
+        assert list(df.columns) == MarketCommoditiesConfig.FINAL_COLUMNS
+        assert df.loc[0, ["exchange_name", "exchange"]].tolist() == ["Chicago Board of Trade", "XCBT"]
+        assert df["category"].is_monotonic_increasing
+        assert df["last_price"].notna().all()
+
+    def test_movers(self):
+        extractor = make_extractor(MarketMoversExtractor)
+        extractor.mover_type = ["gainers", "losers"]
+        response = load("movers")
+
+        df = extractor._process_response(response)
+
+        assert list(df.columns) == MarketMoversConfig.FINAL_COLUMNS
+        assert len(df) == len(response["gainers"]) + len(response["losers"])
+        assert set(df["category"]) == {"gainers", "losers"}
+        assert (df["updated_on"] == response["updatedOn"]).all()
+        assert df["percent_net_change"].is_monotonic_decreasing
@@ -0,0 +1,103 @@
+"""Tests for latency histograms and the hedge policy."""
+import pytest
+
+from morningpy.core.hedging import HedgePolicy, LatencyHistogram, endpoint_of
+
+
+# ============================================================================
+# ENDPOINT TESTS
+# ============================================================================
+
+class TestEndpointOf:
+    """Test endpoint keys."""
+
+    def test_masks_security_ids(self):
+        a = endpoint_of("https://api-global.morningstar.com/sal-service/v1/stock/newfinancials/0P000000GY/balanceSheet/detail")
+        b = endpoint_of("https://api-global.morningstar.com/sal-service/v1/stock/newfinancials/0P000003MH/balanceSheet/detail?x=1")
+
+        assert a == b == "api-global.morningstar.com/sal-service/v1/stock/newfinancials/{id}/balanceSheet/detail"
+
+    def test_keeps_distinct_endpoints(self):
+        assert endpoint_of("https://h/v1/a/0P000000GY/data") != endpoint_of("https://h/v1/b/0P000000GY/data")
+        assert endpoint_of("https://h/QS-markets/chartservice/v2/timeseries") == "h/QS-markets/chartservice/v2/timeseries"
+
+
+# ============================================================================
+# HISTOGRAM TESTS
+# ============================================================================
+
+class TestLatencyHistogram:
+    """Test quantile estimation."""
+
+    def test_empty(self):
+        assert LatencyHistogram().quantile(0.95) is None
+
+    def test_quantiles_within_bucket_resolution(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 100)  # 10ms .. 1s
+
+        assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.1)
+        assert histogram.quantile(0.95) == pytest.approx(0.95, rel=0.1)
+        assert histogram.quantile(0.95) >= 0.95
+
+    def test_extremes_clamped(self):
+        histogram = LatencyHistogram()
+        histogram.record(0)
+        histogram.record(1e9)
+
+        assert histogram.quantile(0.1) == LatencyHistogram.MIN_LATENCY
+        assert histogram.quantile(1.0) > 3600
+
+    def test_forgetting_follows_drift(self):
+        histogram = LatencyHistogram(max_samples=100)
+        for _ in range(1000):
+            histogram.record(0.01)
+        for _ in range(200):
+            histogram.record(1.0)
+
+        assert histogram.total < 100
+        assert histogram.quantile(0.5) == pytest.approx(1.0, rel=0.1)
+
+
+# ============================================================================
+# POLICY TESTS
+# ============================================================================
+
+class TestHedgePolicy:
+    """Test hedge delays and budget."""
+
+    def test_no_delay_before_min_samples(self):
+        policy = HedgePolicy(min_samples=5)
+        for _ in range(4):
+            policy.record("https://h/a", 0.2)
+        assert policy.delay("https://h/a") is None
+
+        policy.record("https://h/a", 0.2)
+        assert policy.delay("https://h/a") == pytest.approx(0.2, rel=0.1)
+
+    def test_delay_per_endpoint(self):
+        policy = HedgePolicy(min_samples=1)
+        policy.record("https://h/fast", 0.01)
+        policy.record("https://h/slow", 2.0)
+
+        assert policy.delay("https://h/fast") < policy.delay("https://h/slow")
+        assert policy.delay("https://h/other") is None
+
+    def test_min_delay(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0.05)
+        policy.record("https://h/a", 0.001)
+
+        assert policy.delay("https://h/a") == 0.05
+
+    def test_budget(self):
+        policy = HedgePolicy(budget=0.1)
+        policy.requests = 25
+
+        assert [policy.acquire() for _ in range(3)] == [True, True, False]
+        assert policy.hedges == 2
+
+    @pytest.mark.parametrize("kwargs", [{"percentile": 1}, {"percentile": 0}, {"budget": -0.1}])
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            HedgePolicy(**kwargs)
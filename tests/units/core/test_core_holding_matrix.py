@@ -0,0 +1,153 @@
+"""Tests for the sparse holdings analytics."""
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from morningpy.core.holding_matrix import HoldingMatrix, require_scipy
+
+sparse = pytest.importorskip("scipy.sparse")
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def holdings():
+    """Two funds and a fund of funds holding both, weights in percent."""
+    return pd.DataFrame({
+        "parent_security_id": ["F1", "F1", "F1", "F2", "F2", "FOF", "FOF", "FOF"],
+        "child_security_id": ["A", "B", None, "B", "C", "F1", "F2", "A"],
+        "isin": [None, None, "CASH", None, None, None, None, None],
+        "security_name": ["a", "b", "cash", "b", "c", "f1", "f2", "a"],
+        "weighting": [50.0, 30.0, 20.0, 60.0, 40.0, 50.0, 30.0, 20.0],
+        "sector": ["Tech", "Energy", None, "Energy", "Tech", None, None, "Tech"],
+        "country": ["US", "FR", None, "FR", "US", None, None, "US"],
+    })
+
+
+@pytest.fixture
+def matrix(holdings):
+    return HoldingMatrix.from_holdings(holdings)
+
+
+# ============================================================================
+# CONSTRUCTION TESTS
+# ============================================================================
+
+class TestFromHoldings:
+    """Test the matrix built from HoldingExtractor output."""
+
+    def test_shape_and_weights(self, matrix):
+        assert list(matrix.funds) == ["F1", "F2", "FOF"]
+        assert list(matrix.securities) == ["A", "B", "CASH", "C", "F1", "F2"]
+        assert matrix.weights.nnz == 8
+        np.testing.assert_allclose(matrix.weights.sum(axis=1).A1, [1.0, 1.0, 1.0])
+
+    def test_key_fallback_and_attributes(self, matrix):
+        assert matrix.attributes.loc["CASH", "security_name"] == "cash"
+        assert matrix.attributes.loc["B", "sector"] == "Energy"
+
+    def test_duplicates_summed_and_invalid_dropped(self, holdings):
+        extra = pd.DataFrame({
+            "parent_security_id": ["F1", "F1", None],
+            "child_security_id": ["A", None, "A"],
+            "weighting": [5.0, 10.0, 1.0],
+        })
+        matrix = HoldingMatrix.from_holdings(pd.concat([holdings, extra], ignore_index=True))
+
+        assert matrix.weights[0, matrix.securities.get_loc("A")] == pytest.approx(0.55)
+        assert matrix.weights.nnz == 8
+
+    def test_shape_mismatch(self):
+        with pytest.raises(ValueError, match="does not match"):
+            HoldingMatrix(sparse.csr_matrix((2, 2)), pd.Index(["F"]), pd.Index(["A", "B"]), pd.DataFrame())
+
+    def test_requires_scipy(self):
+        with patch.dict("sys.modules", {"scipy.sparse": None}):
+            with pytest.raises(ImportError, match="scipy"):
+                require_scipy()
+
+
+# ============================================================================
+# OVERLAP TESTS
+# ============================================================================
+
+class TestOverlap:
+    """Test pairwise overlap and shared holdings."""
+
+    def test_weight(self, matrix):
+        overlap = matrix.overlap()
+
+        assert overlap.loc["F1", "F2"] == pytest.approx(0.3)
+        assert overlap.loc["F2", "F1"] == pytest.approx(0.6)
+        assert overlap.loc["F2", "FOF"] == 0
+
+    def test_count_and_cosine(self, matrix):
+        assert matrix.overlap("count").loc["F1", "FOF"] == 1
+        cosine = matrix.overlap("cosine")
+        np.testing.assert_allclose(np.diag(cosine), 1.0)
+        assert cosine.loc["F1", "F2"] == pytest.approx(cosine.loc["F2", "F1"])
+
+    def test_sparse_result(self, matrix):
+        result = matrix.overlap("count", dense=False)
+        assert sparse.issparse(result) and result.shape == (3, 3)
+
+    def test_invalid_method(self, matrix):
+        with pytest.raises(ValueError, match="Invalid method"):
+            matrix.overlap("jaccard")
+
+    def test_shared_holdings(self, matrix):
+        shared = matrix.shared_holdings("F1", "FOF")
+
+        assert shared["security"].tolist() == ["A"]
+        assert shared.loc[0, "overlap"] == pytest.approx(0.2)
+
+    def test_most_held(self, matrix):
+        top = matrix.most_held(2)
+        assert top["security"].tolist() == ["B", "A"]
+        assert top["funds"].tolist() == [2, 2]
+
+
+# ============================================================================
+# LOOK-THROUGH TESTS
+# ============================================================================
+
+class TestLookThrough:
+    """Test fund of funds expansion and exposures."""
+
+    def test_expands_fund_positions(self, matrix):
+        look = matrix.look_through()
+        weights = look.to_frame().set_index(["fund", "security"])["weight"]
+
+        assert "F1" not in look.securities
+        assert weights["FOF", "A"] == pytest.approx(0.2 + 0.5 * 0.5)
+        assert weights["FOF", "B"] == pytest.approx(0.5 * 0.3 + 0.3 * 0.6)
+        np.testing.assert_allclose(look.weights.sum(axis=1).A1, [1.0, 1.0, 1.0])
+
+    def test_nested_funds(self, holdings):
+        top = pd.DataFrame({"parent_security_id": ["TOP"], "child_security_id": ["FOF"], "weighting": [100.0]})
+        look = HoldingMatrix.from_holdings(pd.concat([holdings, top])).look_through()
+
+        assert look.to_frame().query("fund == 'TOP'")["weight"].sum() == pytest.approx(1.0)
+
+    def test_cycle_truncated(self):
+        cycle = pd.DataFrame({
+            "parent_security_id": ["X", "X", "Y"],
+            "child_security_id": ["Y", "S", "X"],
+            "weighting": [50.0, 50.0, 100.0],
+        })
+        with pytest.warns(RuntimeWarning, match="max_depth"):
+            HoldingMatrix.from_holdings(cycle).look_through(max_depth=3)
+
+    def test_exposure(self, matrix):
+        exposure = matrix.exposure("sector", look_through=True)
+
+        assert list(exposure.columns) == ["Energy", "N/A", "Tech"]
+        assert exposure.loc["FOF", "Tech"] == pytest.approx(0.2 + 0.5 * 0.5 + 0.3 * 0.4)
+        np.testing.assert_allclose(exposure.sum(axis=1), 1.0)
+
+    def test_invalid_attribute(self, matrix):
+        with pytest.raises(ValueError, match="Invalid attribute"):
+            matrix.exposure("rating")
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from morningpy.core.identifier_map import IdentifierMap
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def tickers():
+    """Universe with a ticker listed twice and a missing ISIN."""
+    return pd.DataFrame({
+        'security_id': ['0P000000GY', '0P000003MH', '0P00000B3T', '0P00000ABC'],
+        'ticker': ['AAPL', 'MSFT', 'AAPL', 'TSLA'],
+        'isin': ['US0378331005', 'US5949181045', None, 'US88160R1014'],
+        'exchange': ['XNAS', 'XNAS', 'XLON', 'XNAS'],
+    })
+
+
+@pytest.fixture
+def id_map(tickers):
+    return IdentifierMap(tickers)
+
+
+# ============================================================================
+# LOOKUP TESTS
+# ============================================================================
+
+class TestIdentifierMap:
+    """Test IdentifierMap lookups against boolean-mask equivalents."""
+
+    def test_columns_skip_missing(self, id_map):
+        assert id_map.columns == ['ticker', 'isin', 'security_id']
+
+    def test_position_returns_first_row(self, id_map):
+        assert id_map.position('AAPL', 'ticker') == 0
+        assert id_map.position('TSLA', 'ticker') == 3
+
+    def test_position_unknown(self, id_map):
+        assert id_map.position('UNKNOWN', 'ticker') is None
+        assert id_map.position(None, 'isin') is None
+
+    def test_first_positions(self, id_map):
+        result = id_map.first_positions(['TSLA', 'UNKNOWN', 'AAPL'], 'ticker')
+        np.testing.assert_array_equal(result, [3, -1, 0])
+
+    def test_first_positions_empty(self, id_map):
+        assert len(id_map.first_positions([], 'ticker')) == 0
+
+    @pytest.mark.parametrize("values,column", [
+        (['AAPL'], 'ticker'),
+        (['AAPL', 'TSLA', 'UNKNOWN'], 'ticker'),
+        (['US5949181045'], 'isin'),
+        ([], 'security_id'),
+    ])
+    def test_rows_match_isin(self, id_map, tickers, values, column):
+        expected = np.flatnonzero(tickers[column].isin(values))
+        np.testing.assert_array_equal(id_map.rows(values, column), expected)
+
+    def test_unmapped_column_raises(self, id_map):
+        with pytest.raises(KeyError):
+            id_map.rows(['XNAS'], 'exchange')
+        with pytest.raises(KeyError):
+            id_map.position('XNAS', 'exchange')
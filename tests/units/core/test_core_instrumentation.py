@@ -0,0 +1,240 @@
+"""Tests for instrumentation hooks and metrics."""
+import sys
+import pytest
+import pytest_asyncio
+import aiohttp
+from aiohttp import web
+from unittest.mock import Mock, patch
+
+from morningpy.core import instrumentation
+from morningpy.core.auth import AuthManager
+from morningpy.core.client import BaseClient
+from morningpy.core.instrumentation import (
+    InstrumentationHook,
+    MetricsCollector,
+    OpenTelemetryHook,
+    StageEvent,
+    emit,
+    extractor_scope,
+    instrument,
+    require_opentelemetry,
+    stage,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class Recorder(InstrumentationHook):
+    """Hook keeping every event."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+    def stages(self):
+        return [e.stage for e in self.events]
+
+    def of(self, name):
+        return [e for e in self.events if e.stage == name]
+
+
+@pytest.fixture
+def recorder():
+    with instrument(Recorder()) as (hook,):
+        yield hook
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Local HTTP server answering JSON."""
+    async def handler(request):
+        return web.json_response({"id": request.match_info["id"], "values": list(range(100))})
+
+    app = web.Application()
+    app.router.add_get("/v1/data/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+# ============================================================================
+# STAGE TESTS
+# ============================================================================
+
+class TestStage:
+    """Test stage timing and event emission."""
+
+    def test_no_hook_no_event(self):
+        assert not instrumentation.enabled()
+        with stage("concat") as info:
+            info["rows"] = 3
+        assert instrumentation.trace_configs() == []
+
+    def test_event_fields(self, recorder):
+        with extractor_scope("HoldingExtractor"):
+            with stage("download", "https://h/v1/holding/0P000000GY/data") as info:
+                info["bytes"] = 42
+
+        (event,) = recorder.events
+        assert event.stage == "download"
+        assert event.extractor == "HoldingExtractor"
+        assert event.endpoint == "h/v1/holding/{id}/data"
+        assert event.bytes == 42
+        assert event.attributes == {}
+        assert event.duration >= 0 and event.ok
+
+    def test_error_recorded_and_raised(self, recorder):
+        with pytest.raises(KeyError):
+            with stage("process_response"):
+                raise KeyError("x")
+
+        assert isinstance(recorder.events[0].error, KeyError)
+
+    def test_failing_hook_swallowed(self, recorder):
+        broken = Mock(spec=InstrumentationHook)
+        broken.on_event.side_effect = RuntimeError("boom")
+
+        with instrument(broken):
+            emit("concat", 0.1)
+
+        assert recorder.stages() == ["concat"]
+
+    def test_unregistered_after_block(self):
+        with instrument(Recorder()) as (hook,):
+            assert instrumentation.enabled()
+        emit("concat", 0.1)
+
+        assert hook.events == []
+        assert not instrumentation.enabled()
+
+
+# ============================================================================
+# REQUEST TRACING TESTS
+# ============================================================================
+
+class TestRequestStages:
+    """Test the stages of a real HTTP request."""
+
+    @pytest.mark.asyncio
+    async def test_request_stages(self, recorder, server):
+        with patch("morningpy.core.client.AuthManager") as auth:
+            auth.return_value = Mock(spec=AuthManager)
+            auth.return_value.get_headers.return_value = {}
+            client = BaseClient(auth_type="bearer", url=server)
+
+        async with aiohttp.ClientSession(trace_configs=instrumentation.trace_configs()) as session:
+            with extractor_scope("TestExtractor"):
+                result = await client.get_async(session, f"{server}/v1/data/0P000000GY")
+
+        assert result["id"] == "0P000000GY"
+        assert {"token", "connect", "first_byte", "download", "decode", "request"} <= set(recorder.stages())
+        (download,) = recorder.of("download")
+        assert download.bytes > 100
+        assert download.extractor == "TestExtractor"
+        assert download.endpoint == server.split("//")[1] + "/v1/data/{id}"
+        assert recorder.of("first_byte")[0].attributes["status"] == 200
+
+
+# ============================================================================
+# METRICS TESTS
+# ============================================================================
+
+class TestMetricsCollector:
+    """Test in-memory aggregation and exports."""
+
+    @pytest.fixture
+    def metrics(self):
+        metrics = MetricsCollector()
+        with instrument(metrics):
+            with extractor_scope("HoldingExtractor"):
+                for i, seconds in enumerate([0.1, 0.2, 0.3]):
+                    emit("request", seconds, url=f"https://h/v1/{i}/data")
+                emit("request", 0.5, url="https://h/v1/9/data", error=TimeoutError())
+                emit("download", 0.05, url="https://h/v1/1/data", size=1000)
+            emit("concat", 0.01)
+        return metrics
+
+    def test_series_keyed_by_stage_extractor_endpoint(self, metrics):
+        stats = metrics.stats[("request", "HoldingExtractor", "h/v1/{id}/data")]
+
+        assert stats.count == 4
+        assert stats.errors == 1
+        assert stats.total == pytest.approx(1.1)
+        assert stats.max == 0.5
+        assert ("concat", "", "") in metrics.stats
+
+    def test_to_frame(self, metrics):
+        frame = metrics.to_frame()
+
+        assert list(frame.columns) == MetricsCollector.COLUMNS
+        row = frame[frame["stage"] == "download"].iloc[0]
+        assert row["bytes"] == 1000
+        assert row["p50"] == pytest.approx(0.05, rel=0.1)
+
+    def test_summary(self, metrics):
+        summary = metrics.summary("request")
+
+        assert summary.count == 4
+        assert summary.histogram.quantile(0.99) == pytest.approx(0.5, rel=0.1)
+        assert metrics.summary("request", extractor="Other").count == 0
+
+    def test_prometheus(self, metrics):
+        text = metrics.to_prometheus()
+        labels = 'stage="request",extractor="HoldingExtractor",endpoint="h/v1/{id}/data"'
+
+        assert "# TYPE morningpy_stage_duration_seconds summary" in text
+        assert f"morningpy_stage_duration_seconds_count{{{labels}}} 4" in text
+        assert f"morningpy_stage_errors_total{{{labels}}} 1" in text
+        assert 'morningpy_stage_bytes_total{stage="download"' in text
+        assert f'morningpy_stage_duration_seconds{{{labels},quantile="0.5"}}' in text
+        assert text.endswith("\n")
+
+    def test_reset(self, metrics):
+        metrics.reset()
+        assert metrics.to_frame().empty
+
+
+# ============================================================================
+# OPENTELEMETRY TESTS
+# ============================================================================
+
+class TestOpenTelemetryHook:
+    """Test span export."""
+
+    def test_span_per_event(self):
+        tracer = Mock()
+        hook = OpenTelemetryHook(tracer)
+        event = StageEvent(
+            stage="request",
+            duration=0.5,
+            start_ns=1_000_000_000,
+            extractor="HoldingExtractor",
+            endpoint="h/v1/{id}/data",
+            error=TimeoutError("slow"),
+            attributes={"status": 504},
+        )
+
+        hook.on_event(event)
+
+        name = tracer.start_span.call_args.args[0]
+        kwargs = tracer.start_span.call_args.kwargs
+        assert name == "morningpy.request"
+        assert kwargs["start_time"] == 1_000_000_000
+        assert kwargs["attributes"]["morningpy.extractor"] == "HoldingExtractor"
+        assert kwargs["attributes"]["morningpy.status"] == 504
+        span = tracer.start_span.return_value
+        span.record_exception.assert_called_once_with(event.error)
+        span.end.assert_called_once_with(end_time=1_500_000_000)
+
+    def test_missing_dependency(self):
+        with patch.dict(sys.modules, {"opentelemetry": None}):
+            with pytest.raises(ImportError, match="morningpy\\[otel\\]"):
+                require_opentelemetry()
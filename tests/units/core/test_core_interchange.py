@@ -5,6 +5,7 @@ import polars as pl
 import dask.dataframe as dd
 import modin.pandas as mpd
 import pyarrow as pa
+import pyarrow.parquet as pq
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 
@@ -242,14 +243,22 @@ class TestToPolarsDataFrame:
         assert len(result) == len(large_dataframe)
         assert isinstance(result, pl.DataFrame)
     
-    @patch('polars.from_pandas')
-    def test_calls_polars_from_pandas(self, mock_from_pandas, sample_interchange):
-        """Test that conversion uses pl.from_pandas."""
-        mock_from_pandas.return_value = Mock(spec=pl.DataFrame)
+    @patch('polars.from_arrow')
+    def test_calls_polars_from_arrow(self, mock_from_arrow, sample_interchange):
+        """Test that conversion goes through an Arrow table."""
+        mock_from_arrow.return_value = Mock(spec=pl.DataFrame)
         
         sample_interchange.to_polars_dataframe()
         
-        mock_from_pandas.assert_called_once()
+        mock_from_arrow.assert_called_once()
+        assert isinstance(mock_from_arrow.call_args[0][0], pa.Table)
+    
+    def test_shares_numeric_buffers(self, large_dataframe):
+        """Test that numeric columns are not copied."""
+        df = DataFrameInterchange(large_dataframe)
+        result = df.to_polars_dataframe()
+        
+        assert np.shares_memory(result['value'].to_numpy(), df['value'].to_numpy())
 
 
 # ============================================================================
@@ -302,6 +311,39 @@ class TestToDaskDataFrame:
         mock_from_pandas.assert_called_once()
         call_kwargs = mock_from_pandas.call_args[1]
         assert call_kwargs['npartitions'] == 1
+    
+    @pytest.mark.parametrize("n_rows,cores,expected", [
+        (0, 8, 1),
+        (10, 8, 1),
+        (250_000, 8, 3),
+        (10_000_000, 8, 8),
+        (10_000_000, None, 1),
+    ])
+    def test_default_npartitions(self, n_rows, cores, expected):
+        """Test partition count from row count and cores."""
+        with patch('os.cpu_count', return_value=cores):
+            assert DataFrameInterchange.default_npartitions(n_rows) == expected
+    
+    def test_explicit_npartitions(self, large_dataframe):
+        """Test that npartitions can be forced."""
+        result = DataFrameInterchange(large_dataframe).to_dask_dataframe(npartitions=4)
+        
+        assert result.npartitions == 4
+    
+    def test_partition_on_keeps_keys_together(self):
+        """Test that every key lives in exactly one partition."""
+        df = DataFrameInterchange({
+            'security_id': np.repeat(['A', 'B', 'C', 'D'], [3, 5, 2, 4]),
+            'value': range(14),
+        })
+        result = df.to_dask_dataframe(npartitions=3, partition_on='security_id')
+        
+        seen = []
+        for i in range(result.npartitions):
+            seen.extend(set(result.get_partition(i).compute().index))
+        assert sorted(seen) == ['A', 'B', 'C', 'D']
+        assert result.known_divisions
+        assert len(result.compute()) == 14
 
 
 
@@ -445,6 +487,74 @@ class TestToEngine:
             sample_interchange.to_engine(unsupported_engine)
 
 
+class TestArrowToEngine:
+    """Test suite for arrow_to_engine."""
+    
+    @pytest.mark.parametrize("engine,expected_type", [
+        ("arrow", pa.Table),
+        ("polars", pl.DataFrame),
+        ("pandas", DataFrameInterchange),
+        ("dask", dd.DataFrame),
+    ])
+    def test_converts_table(self, sample_interchange, engine, expected_type):
+        """Test that Arrow tables convert to every engine."""
+        table = sample_interchange.to_arrow_table()
+        
+        assert isinstance(DataFrameInterchange.arrow_to_engine(table, engine), expected_type)
+    
+    def test_arrow_engine_returns_same_table(self, sample_interchange):
+        """Test that the arrow engine does not copy."""
+        table = sample_interchange.to_arrow_table()
+        
+        assert DataFrameInterchange.arrow_to_engine(table, "arrow") is table
+    
+    def test_raises_on_invalid_engine(self, sample_interchange):
+        """Test that invalid engine raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported engine 'spark'"):
+            DataFrameInterchange.arrow_to_engine(sample_interchange.to_arrow_table(), "spark")
+    
+    def test_duckdb_requires_optional_dependency(self, sample_interchange):
+        """Test that a missing duckdb raises an actionable ImportError."""
+        with patch.dict("sys.modules", {"duckdb": None}):
+            with pytest.raises(ImportError, match="duckdb"):
+                sample_interchange.to_engine("duckdb")
+
+
+# ============================================================================
+# WRITE TESTS
+# ============================================================================
+
+class TestWrite:
+    """Test direct columnar writes."""
+    
+    def test_write_parquet(self, sample_interchange, tmp_path):
+        """Test that a Parquet file is written without the index."""
+        path = sample_interchange.write(tmp_path / "out.parquet")
+        
+        table = pq.read_table(path)
+        assert table.column_names == list(sample_interchange.columns)
+        assert table.num_rows == 5
+    
+    def test_write_partitioned(self, sample_interchange, tmp_path):
+        """Test Hive-partitioned output."""
+        sample_interchange.write(tmp_path / "ds", partition_cols=["col_bool"])
+        
+        assert sorted(p.name for p in (tmp_path / "ds").iterdir()) == [
+            "col_bool=false", "col_bool=true"
+        ]
+    
+    def test_write_ipc(self, sample_interchange, tmp_path):
+        """Test Arrow IPC output."""
+        path = sample_interchange.write(tmp_path / "out.arrow", format="ipc", compression=None)
+        
+        assert pa.ipc.open_file(path).read_all().num_rows == 5
+    
+    def test_write_duckdb_rejects_partitions(self, sample_interchange, tmp_path):
+        """Test that partitioning is refused for duckdb."""
+        with pytest.raises(ValueError, match="partition_cols"):
+            sample_interchange.write(tmp_path / "db.duckdb", format="duckdb", partition_cols=["col_str"])
+
+
 # ============================================================================
 # REPR AND HTML TESTS
 # ============================================================================
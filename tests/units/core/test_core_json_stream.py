@@ -0,0 +1,79 @@
+"""Tests for the incremental JSON array parser."""
+import json
+
+import pytest
+
+from morningpy.core.json_stream import JsonArrayStream
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+PAGES = ["equityHoldingPage", "boldHoldingPage", "otherHoldingPage"]
+TARGETS = [(page, "holdingList") for page in PAGES]
+
+
+@pytest.fixture
+def raw():
+    return (RESPONSES_DIR / "get_holding_response.json").read_bytes()
+
+
+def parse(data, targets=TARGETS, size=None):
+    """Feed data in chunks of size bytes; return (items, root)."""
+    stream = JsonArrayStream(targets)
+    size = size or len(data) or 1
+    items = []
+    for i in range(0, len(data), size):
+        items.extend(stream.feed(data[i:i + size]))
+    items.extend(stream.close())
+    return items, stream.root
+
+
+# ============================================================================
+# PARSING TESTS
+# ============================================================================
+
+class TestJsonArrayStream:
+    """Test streaming of target array items."""
+
+    @pytest.mark.parametrize("size", [1, 3, 64, None])
+    def test_matches_json_loads(self, raw, size):
+        doc = json.loads(raw)
+
+        items, root = parse(raw, size=size)
+
+        assert [item for _, item in items] == [h for page in PAGES for h in doc[page]["holdingList"]]
+        for page in PAGES:
+            doc[page]["holdingList"] = []
+        assert root == doc
+
+    def test_item_paths(self):
+        items, _ = parse(b'{"a": {"l": [1, 2]}, "b": {"l": [3]}}', [("a", "l"), ("b", "l")])
+        assert items == [(("a", "l"), 1), (("a", "l"), 2), (("b", "l"), 3)]
+
+    def test_numbers_split_across_chunks(self):
+        items, root = parse(b'{"n": 12.5e1, "a": [100, -3, true, null]}', [("a",)], size=1)
+
+        assert [item for _, item in items] == [100, -3, True, None]
+        assert root == {"n": 125.0, "a": []}
+
+    def test_multibyte_characters_split(self):
+        items, _ = parse('{"a": ["é", "日本"]}'.encode(), [("a",)], size=1)
+        assert [item for _, item in items] == ["é", "日本"]
+
+    def test_non_target_values_kept(self):
+        _, root = parse(b'{"x": [1, {"y": 2}], "e": {}, "a": []}', [("a",)])
+        assert root == {"x": [1, {"y": 2}], "e": {}, "a": []}
+
+    def test_items_emitted_before_close(self):
+        stream = JsonArrayStream([("a",)])
+
+        assert stream.feed(b'{"a": [{"k": 1}, {"k"') == [(("a",), {"k": 1})]
+        assert stream.items == 1
+
+    @pytest.mark.parametrize("data", [b'{"a": [1, 2', b'{"a" 1}', b'{"a": []}x', b'{"a": [tru]}'])
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            parse(data, [("a",)])
@@ -0,0 +1,154 @@
+"""Tests for the per-run payload cache."""
+import asyncio
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from morningpy.core.auth import AuthManager
+from morningpy.core.client import BaseClient
+from morningpy.core.payload_cache import (
+    PayloadCache,
+    current_payload_cache,
+    payload_scope,
+)
+from morningpy.core.replay import ReplayServer, replay_mode
+from morningpy.core.security_loader import SecurityLoader
+from morningpy.extractor.security import HoldingBundle, HoldingBundleExtractor
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def client():
+    with patch("morningpy.core.client.AuthManager") as auth:
+        auth.return_value = Mock(spec=AuthManager)
+        auth.return_value.get_headers.return_value = {}
+        yield BaseClient(auth_type="api_key", url="https://api.test")
+
+
+@pytest.fixture
+def tickers():
+    """Two funds, served by the security lookups instead of tickers.parquet."""
+    previous = SecurityLoader._cached_tickers, SecurityLoader._cached_id_map
+    SecurityLoader._cached_tickers = pd.DataFrame({
+        "security_id": ["0P0000001", "0P0000002"],
+        "security_label": ["Fund One", "Fund Two"],
+        "ticker": ["ONE", "TWO"],
+        "isin": ["US0000000001", "US0000000002"],
+        "performance_id": ["0P0000001", "0P0000002"],
+    })
+    SecurityLoader._cached_id_map = None
+    yield
+    SecurityLoader._cached_tickers, SecurityLoader._cached_id_map = previous
+
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+class TestPayloadCache:
+    """Test request sharing."""
+
+    def test_key_ignores_param_order(self):
+        assert PayloadCache.key("u", {"a": 1, "b": 2}) == PayloadCache.key("u", {"b": 2, "a": 1})
+        assert PayloadCache.key("u", {"a": 1}) != PayloadCache.key("u", {"a": 2})
+        assert PayloadCache.key("u") == PayloadCache.key("u", {})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_fetch(self):
+        cache = PayloadCache()
+        fetch = AsyncMock(return_value={"x": 1})
+
+        results = await asyncio.gather(*(cache.get("k", fetch) for _ in range(3)))
+
+        assert results == [{"x": 1}] * 3
+        fetch.assert_awaited_once()
+        assert (cache.misses, cache.hits) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        cache = PayloadCache()
+        fetch = AsyncMock(side_effect=[ConnectionError("down"), {"x": 1}])
+
+        with pytest.raises(ConnectionError):
+            await cache.get("k", fetch)
+
+        assert await cache.get("k", fetch) == {"x": 1}
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_fetch(self):
+        cache = PayloadCache()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "payload"
+
+        first = asyncio.ensure_future(cache.get("k", fetch))
+        second = asyncio.ensure_future(cache.get("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "payload"
+
+    def test_scope(self):
+        assert current_payload_cache() is None
+        with payload_scope() as outer:
+            with payload_scope() as inner:
+                assert inner is outer
+            assert current_payload_cache() is outer
+        assert current_payload_cache() is None
+
+
+# ============================================================================
+# CLIENT TESTS
+# ============================================================================
+
+class TestClientSharing:
+    """Test get_async within a payload scope."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_sent_once(self, client):
+        with patch.object(client, "_get_json", AsyncMock(return_value={"data": [1]})) as get_json:
+            with payload_scope():
+                a, b = await asyncio.gather(
+                    client.get_async(Mock(), "https://api.test/x", {"p": 1}, metadata={"security_id": "A"}),
+                    client.get_async(Mock(), "https://api.test/x", {"p": 1}, metadata={"security_id": "B"}),
+                )
+
+        get_json.assert_awaited_once()
+        assert a["metadata"] == {"security_id": "A"}
+        assert b["metadata"] == {"security_id": "B"}
+
+    @pytest.mark.asyncio
+    async def test_no_scope_no_sharing(self, client):
+        with patch.object(client, "_get_json", AsyncMock(return_value={"data": [1]})) as get_json:
+            await client.get_async(Mock(), "https://api.test/x")
+            await client.get_async(Mock(), "https://api.test/x")
+
+        assert get_json.await_count == 2
+
+
+# ============================================================================
+# HOLDING BUNDLE TESTS
+# ============================================================================
+
+class TestHoldingBundle:
+    """Test holdings and holding info from one fetch per fund."""
+
+    def test_one_fetch_per_fund(self, tickers):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            extractor = HoldingBundleExtractor(ticker=["ONE", "TWO"])
+            bundle = asyncio.run(extractor.run())
+
+        assert isinstance(bundle, HoldingBundle)
+        assert server.stats[("get_holding", 200)] == 2
+        assert sum(server.stats.values()) == 2
+        assert set(bundle.holdings["parent_security_id"]) == {"0P0000001", "0P0000002"}
+        assert list(bundle.info["security_id"]) == ["0P0000001", "0P0000002"]
+        assert bundle.info["number_of_holding"].notna().all()
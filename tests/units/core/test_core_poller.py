@@ -0,0 +1,239 @@
+"""Tests for the long-running extractor poller."""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pandas as pd
+import pytest
+
+from morningpy.core.base_extract import BaseExtractor
+from morningpy.core.poller import ExtractorPoller, PollFeed
+from morningpy.core.replay import ReplayServer, replay_mode
+from morningpy.extractor.market import MarketPoller
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class QuoteExtractor(BaseExtractor):
+    """Extractor serving one list of quotes per poll."""
+
+    def _check_inputs(self):
+        pass
+
+    def _build_request(self):
+        self.requests = [{"url": "https://api.example.com/quotes"}]
+
+    def _process_response(self, response):
+        return pd.DataFrame(response["quotes"])
+
+
+def quotes(*rows, updated="t0"):
+    return {"quotes": [{"id": i, "price": p, "updated": updated} for i, p in rows]}
+
+
+def auth_error(status=403):
+    return aiohttp.ClientResponseError(Mock(real_url="https://api.example.com/quotes"), (), status=status)
+
+
+def make_feed(*responses, interval=5.0):
+    """Feed whose successive polls return responses (a response or an exception)."""
+    client = Mock()
+    client.DEFAULT_TIMEOUT = 5
+    client.logger = Mock()
+    client.fetch_all = AsyncMock(side_effect=[[r] for r in responses])
+    return PollFeed(QuoteExtractor(client), keys=["id"], interval=interval, ignored=["updated"])
+
+
+def changes(delta):
+    return dict(zip(delta.changes["id"], delta.changes["change"]))
+
+
+# ============================================================================
+# DIFF TESTS
+# ============================================================================
+
+class TestPollOnce:
+    """Test snapshot diffing of successive polls."""
+
+    def test_first_poll_adds_everything(self):
+        async def main():
+            async with ExtractorPoller({"q": make_feed(quotes(("A", 1.0), ("B", 2.0)))}) as poller:
+                return await poller.poll_once("q")
+
+        delta = asyncio.run(main())
+
+        assert delta.feed == "q"
+        assert list(delta.changes.columns) == ["id", "change", "price", "updated"]
+        assert changes(delta) == {"A": "add", "B": "add"}
+
+    def test_only_changed_rows(self):
+        feed = make_feed(
+            quotes(("A", 1.0), ("B", 2.0), ("C", None)),
+            quotes(("A", 1.0), ("B", 2.5), ("C", None), ("D", 4.0), updated="t1"),
+            quotes(("B", 2.5), ("C", None), ("D", 4.0), updated="t2"),
+        )
+
+        async def main():
+            async with ExtractorPoller({"q": feed}) as poller:
+                return [await poller.poll_once("q") for _ in range(3)]
+
+        _, second, third = asyncio.run(main())
+
+        assert changes(second) == {"B": "change", "D": "add"}
+        assert second.changes.set_index("id").loc["B", "price"] == 2.5
+        assert changes(third) == {"A": "remove"}
+        assert third.changes["price"].tolist() == [1.0]
+
+    def test_unchanged_poll_emits_nothing(self):
+        feed = make_feed(quotes(("A", 1.0)), quotes(("A", 1.0), updated="t1"))
+
+        async def main():
+            async with ExtractorPoller({"q": feed}) as poller:
+                await poller.poll_once("q")
+                return await poller.poll_once("q")
+
+        assert asyncio.run(main()) is None
+
+    def test_duplicated_columns(self):
+        def frame(*rows):
+            return pd.DataFrame(rows, columns=["id", "exchange", "exchange"]).set_index("id")
+
+        changes = ExtractorPoller.diff(frame(("A", "CBOT", "XCBT"), ("B", "ICE", "IFUS")),
+                                       frame(("A", "CBOT", "XCBT"), ("B", "ICE", "XNYM")))
+
+        assert list(changes.columns) == ["id", "change", "exchange", "exchange"]
+        assert changes.values.tolist() == [["B", "change", "ICE", "XNYM"]]
+
+    def test_new_column_changes_every_row(self):
+        previous = pd.DataFrame({"id": ["A"], "price": [1.0]}).set_index("id")
+
+        changes = ExtractorPoller.diff(previous, previous.assign(size=3))
+
+        assert changes["change"].tolist() == ["change"]
+
+    def test_failed_poll_keeps_snapshot(self):
+        feed = make_feed(quotes(("A", 1.0)), auth_error(), quotes(("A", 1.0)))
+
+        async def main():
+            async with ExtractorPoller({"q": feed}) as poller:
+                await poller.poll_once("q")
+                with pytest.raises(RuntimeError, match="1/1 requests failed"):
+                    await poller.poll_once("q")
+                return await poller.poll_once("q")
+
+        assert asyncio.run(main()) is None
+        feed.extractor.client.refresh_headers.assert_called_once()
+
+    def test_other_errors_keep_headers(self):
+        feed = make_feed(auth_error(status=500))
+
+        async def main():
+            async with ExtractorPoller({"q": feed}) as poller:
+                with pytest.raises(RuntimeError):
+                    await poller.poll_once("q")
+
+        asyncio.run(main())
+        feed.extractor.client.refresh_headers.assert_not_called()
+
+
+# ============================================================================
+# RUN TESTS
+# ============================================================================
+
+class TestRun:
+    """Test the polling loop."""
+
+    def test_emits_deltas_to_queue(self):
+        feed = make_feed(
+            quotes(("A", 1.0)), quotes(("A", 1.0)), quotes(("A", 2.0)), *[quotes(("A", 2.0))] * 50,
+            interval=0.01,
+        )
+
+        async def main():
+            poller = ExtractorPoller({"q": feed}, jitter=0)
+            await poller.run(duration=0.1)
+            return [poller.queue.get_nowait() for _ in range(poller.queue.qsize())]
+
+        deltas = asyncio.run(main())
+
+        assert [changes(d) for d in deltas] == [{"A": "add"}, {"A": "change"}]
+
+    def test_async_callback_and_errors(self):
+        received = []
+
+        async def on_delta(delta):
+            received.append(delta)
+
+        feed = make_feed(RuntimeError("down"), quotes(("A", 1.0)), *[quotes(("A", 1.0))] * 50, interval=0.01)
+
+        async def main():
+            poller = ExtractorPoller({"q": feed}, on_delta=on_delta)
+            await poller.run(duration=0.1)
+            return poller
+
+        poller = asyncio.run(main())
+
+        assert [changes(d) for d in received] == [{"A": "add"}]
+        assert poller.errors == {"q": 1}
+
+    def test_stop(self):
+        feed = make_feed(*[quotes(("A", 1.0))] * 5, interval=60)
+
+        async def main():
+            poller = ExtractorPoller({"q": feed})
+            task = asyncio.create_task(poller.run())
+            await asyncio.sleep(0.05)
+            poller.stop()
+            await asyncio.wait_for(task, 1)
+
+        asyncio.run(main())
+        assert feed.extractor.client.fetch_all.await_count == 1
+
+    def test_jittered_wait(self):
+        poller = ExtractorPoller({"q": make_feed()}, jitter=0.2)
+
+        waits = [poller._wait_time(10.0, 1.0) for _ in range(200)]
+
+        assert all(7.0 <= w <= 11.0 for w in waits)
+        assert len(set(waits)) > 1
+        assert poller._wait_time(1.0, 5.0) == 0.0
+
+    @pytest.mark.parametrize("kwargs", [{"feeds": {}}, {"jitter": 1.5}])
+    def test_invalid(self, kwargs):
+        kwargs = {"feeds": {"q": make_feed()}, **kwargs}
+        with pytest.raises(ValueError):
+            ExtractorPoller(**kwargs)
+
+
+# ============================================================================
+# MARKET POLLER TESTS
+# ============================================================================
+
+class TestMarketPoller:
+    """Test the market feeds against replayed payloads."""
+
+    def test_feeds(self):
+        async def main():
+            poller = MarketPoller(interval={"movers": 1})
+            async with poller:
+                first = {name: await poller.poll_once(name) for name in poller.feeds}
+                second = {name: await poller.poll_once(name) for name in poller.feeds}
+            return poller, first, second
+
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            poller, first, second = asyncio.run(main())
+
+        assert poller.feeds["movers"].interval == 1
+        assert poller.feeds["indexes"].interval == 5.0
+        assert list(first["currencies"].changes.columns[:2]) == ["instrument_id", "change"]
+        assert list(first["movers"].changes.columns[:3]) == ["category", "performance_id", "change"]
+        assert set(first["movers"].changes["category"]) == {"gainers", "losers", "actives"}
+        assert all((delta.changes["change"] == "add").all() for delta in first.values())
+        assert second == {name: None for name in poller.feeds}
+
+    def test_invalid_feed(self):
+        with pytest.raises(ValueError, match="Invalid feed"):
+            MarketPoller(["bonds"])
@@ -0,0 +1,231 @@
+"""Tests for the local replay server."""
+import time
+from pathlib import Path
+import pytest
+import pytest_asyncio
+import aiohttp
+
+from morningpy.api.market import get_market_currencies
+from morningpy.config.market import MarketCurrenciesConfig
+from morningpy.config.security import HoldingConfig
+from morningpy.core.auth import AuthManager, AuthType
+from morningpy.core import replay
+from morningpy.core.config import CoreConfig
+from morningpy.core.replay import (
+    REPLAY_API_KEY,
+    REPLAY_TOKEN,
+    ReplayServer,
+    TokenBucket,
+    replay_mode,
+)
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+HOLDING = "/sal-service/v1/etf/portfolio/holding/v2/0P000000GY/data"
+
+
+@pytest_asyncio.fixture
+async def make_server():
+    """Start replay servers on the test loop, stopped after the test."""
+    servers = []
+
+    async def start(**kwargs):
+        server = ReplayServer(fixtures_dir=RESPONSES_DIR, seed=0, **kwargs)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        await server.stop()
+
+
+async def get(url, **params):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, params=params) as response:
+            return response.status, response.headers, await response.read()
+
+
+# ============================================================================
+# ROUTING TESTS
+# ============================================================================
+
+class TestRouting:
+    """Test endpoint to fixture routing."""
+
+    @pytest.mark.parametrize("path, params, fixture", [
+        (HOLDING, {"freeNum": "1"}, "get_holding_info"),
+        (HOLDING, {"freeNum": "10000"}, "get_holding"),
+        ("/QS-markets/chartservice/v2/timeseries", {"frequency": "5"}, "get_intraday_timeseries"),
+        ("/QS-markets/chartservice/v2/timeseries", {"frequency": "d"}, "get_historical_timeseries"),
+        ("/sal-service/v1/stock/newfinancials/0P000000GY/balanceSheet/detail", {}, "get_financial_statement"),
+        ("/api/v1/es/sections/economy", {}, "get_headline_news"),
+        ("/api/v2/stores/realtime/movers", {}, "get_market_movers"),
+        ("/api/v2/markets/currencies", {}, "get_market_currencies"),
+    ])
+    def test_route(self, path, params, fixture):
+        assert ReplayServer(fixtures_dir=RESPONSES_DIR).route(path, params).fixture == fixture
+
+    def test_unknown_path(self):
+        assert ReplayServer(fixtures_dir=RESPONSES_DIR).route("/api/v3/unknown", {}) is None
+
+    def test_invalid_error_rate(self):
+        with pytest.raises(ValueError):
+            ReplayServer(error_rate=2)
+
+
+# ============================================================================
+# FIXTURE DIRECTORY TESTS
+# ============================================================================
+
+class TestFixturesDir:
+    """Test the choice of the served fixture directory."""
+
+    def test_saved_responses_by_default(self, tmp_path, monkeypatch):
+        (tmp_path / "get_holding_response.json").write_text("{}")
+        monkeypatch.setattr(replay, "FIXTURES_DIR", tmp_path)
+
+        assert ReplayServer().fixtures_dir == tmp_path
+
+    def test_no_fallback_outside_the_package(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(replay, "FIXTURES_DIR", tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="No recorded responses .*pass fixtures_dir"):
+            ReplayServer()
+        with pytest.raises(FileNotFoundError):
+            ReplayServer(fixtures_dir=tmp_path)
+
+
+# ============================================================================
+# SERVER TESTS
+# ============================================================================
+
+class TestReplayServer:
+    """Test responses, latency and fault injection."""
+
+    @pytest.mark.asyncio
+    async def test_serves_fixture(self, make_server):
+        server = await make_server()
+
+        status, _, body = await get(f"{server.url}/api/v2/markets/currencies")
+
+        assert status == 200
+        assert body == (RESPONSES_DIR / "get_market_currencies_response.json").read_bytes()
+        assert server.stats[("get_market_currencies", 200)] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_route_404(self, make_server):
+        server = await make_server()
+
+        status, _, _ = await get(f"{server.url}/nowhere")
+
+        assert status == 404
+        assert server.stats[("/nowhere", 404)] == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_endpoints(self, make_server):
+        server = await make_server()
+
+        _, _, script = await get(f"{server.url}/assets/quotes/1.0.41/sal-components.js")
+        _, _, token = await get(f"{server.url}/api/v2/stores/maas/token")
+
+        assert f'keyApigee:"{REPLAY_API_KEY}"' in script.decode()
+        assert token.decode() == REPLAY_TOKEN
+
+    @pytest.mark.asyncio
+    async def test_latency(self, make_server):
+        server = await make_server(latency=0.2, jitter=0.05)
+
+        start = time.perf_counter()
+        await get(f"{server.url}/api/v2/markets/currencies")
+
+        assert time.perf_counter() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self, make_server):
+        server = await make_server(error_rate=1.0, error_statuses=[503])
+
+        status, _, _ = await get(f"{server.url}/api/v2/markets/currencies")
+
+        assert status == 503
+        assert server.stats[("get_market_currencies", 503)] == 1
+
+    @pytest.mark.asyncio
+    async def test_throttling(self, make_server):
+        server = await make_server(rate_limit=0.5, burst=2)
+
+        statuses = [(await get(f"{server.url}{HOLDING}"))[:2] for _ in range(3)]
+
+        assert [s for s, _ in statuses] == [200, 200, 429]
+        assert int(statuses[2][1]["Retry-After"]) >= 1
+
+
+class TestTokenBucket:
+    """Test the throttle."""
+
+    def test_refill(self):
+        bucket = TokenBucket(rate=100, burst=1)
+
+        assert bucket.acquire() is None
+        assert bucket.acquire() > 0
+        time.sleep(0.02)
+        assert bucket.acquire() is None
+
+
+# ============================================================================
+# REPLAY MODE TESTS
+# ============================================================================
+
+class TestReplayMode:
+    """Test redirection of the configs to a replay server."""
+
+    def test_rewrites_and_restores(self):
+        api_url, urls = MarketCurrenciesConfig.API_URL, dict(CoreConfig.URLS)
+
+        with replay_mode("http://127.0.0.1:9999") as base:
+            assert base == "http://127.0.0.1:9999"
+            assert MarketCurrenciesConfig.API_URL == "http://127.0.0.1:9999/api/v2/markets/currencies"
+            assert HoldingConfig.API_URL.startswith("http://127.0.0.1:9999/sal-service/")
+            assert CoreConfig.URLS["maas_token"].startswith("http://127.0.0.1:9999/")
+            assert CoreConfig.URLS["waf_token"] == "http://127.0.0.1:9999/waf-token"
+            assert CoreConfig.AUTH_CACHE_FILE != "cache.json"
+
+        assert MarketCurrenciesConfig.API_URL == api_url
+        assert CoreConfig.URLS == urls
+        assert CoreConfig.AUTH_CACHE_FILE == "cache.json"
+
+    def test_cache_file(self, tmp_path):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server:
+            with replay_mode(server, cache_file=tmp_path / "auth.json"):
+                AuthManager().get_headers(AuthType.API_KEY)
+            with replay_mode(server):
+                cache = Path(CoreConfig.AUTH_CACHE_FILE)
+                AuthManager().get_headers(AuthType.API_KEY)
+                assert cache.exists()
+
+        assert REPLAY_API_KEY in (tmp_path / "auth.json").read_text()
+        assert not cache.exists()
+        assert not (Path(replay.__file__).parent.parent / "data" / cache.name).exists()
+
+    def test_not_started(self):
+        with pytest.raises(ValueError):
+            with replay_mode(ReplayServer(fixtures_dir=RESPONSES_DIR)):
+                pass
+
+    def test_headers_from_server(self):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            auth = AuthManager()
+            assert auth.get_headers(AuthType.API_KEY)["Apikey"] == REPLAY_API_KEY
+            assert auth.get_headers(AuthType.BEARER_TOKEN)["authorization"] == f"Bearer {REPLAY_TOKEN}"
+            assert auth.get_headers(AuthType.WAF_TOKEN)["x-aws-waf-token"] == REPLAY_TOKEN
+
+    def test_extractor_end_to_end(self):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            df = get_market_currencies()
+
+        assert not df.empty
+        assert server.stats[("get_market_currencies", 200)] == 1
@@ -0,0 +1,212 @@
+"""Tests for error classification, circuit breakers and failure reports."""
+import asyncio
+import pytest
+import aiohttp
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from morningpy.core.error import APIConnectionError, CircuitOpenError, RateLimitError
+from morningpy.core.resilience import (
+    CircuitBreaker,
+    FailureReport,
+    is_retryable,
+    retry_after,
+    should_retry,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def http_error(status, headers=None):
+    """Build the exception raised by aiohttp raise_for_status."""
+    return aiohttp.ClientResponseError(
+        request_info=Mock(real_url="https://x"),
+        history=(),
+        status=status,
+        message="error",
+        headers=headers,
+    )
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic for breaker tests."""
+    now = [1000.0]
+    with patch("morningpy.core.resilience.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+# ============================================================================
+# CLASSIFICATION TESTS
+# ============================================================================
+
+class TestIsRetryable:
+    """Test retryable vs fatal classification."""
+
+    @pytest.mark.parametrize("status", [408, 429, 500, 502, 503, 504])
+    def test_transient_statuses(self, status):
+        assert is_retryable(http_error(status))
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+    def test_fatal_statuses(self, status):
+        assert not is_retryable(http_error(status))
+
+    @pytest.mark.parametrize("error", [
+        asyncio.TimeoutError(),
+        aiohttp.ServerDisconnectedError(),
+        aiohttp.ClientPayloadError("truncated"),
+        APIConnectionError("down"),
+        RateLimitError("slow down", retry_after=5),
+        CircuitOpenError("x", 10),
+    ])
+    def test_transient_errors(self, error):
+        assert is_retryable(error)
+
+    @pytest.mark.parametrize("error", [ValueError("bad"), KeyError("data"), TypeError()])
+    def test_other_errors_fatal(self, error):
+        assert not is_retryable(error)
+
+    def test_open_circuit_not_retried_in_place(self):
+        assert not should_retry(CircuitOpenError("x", 10))
+        assert should_retry(http_error(503))
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing."""
+
+    def test_seconds_header(self):
+        assert retry_after(http_error(429, {"Retry-After": "7"})) == 7.0
+
+    def test_http_date_header(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = retry_after(http_error(503, {"Retry-After": format_datetime(when, usegmt=True)}))
+        assert 25 <= delay <= 30
+
+    def test_past_date_is_zero(self):
+        assert retry_after(http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+
+    def test_attribute(self):
+        assert retry_after(RateLimitError("slow down", retry_after=12)) == 12.0
+
+    def test_missing_or_invalid(self):
+        assert retry_after(http_error(503)) is None
+        assert retry_after(http_error(503, {"Retry-After": "soon"})) is None
+        assert retry_after(ValueError()) is None
+
+
+# ============================================================================
+# CIRCUIT BREAKER TESTS
+# ============================================================================
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_at_threshold(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=10)
+        breaker.record(http_error(503))
+        breaker.before_request()
+        breaker.record(http_error(503))
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.before_request()
+        assert exc.value.retry_after == 10
+
+    def test_success_resets_count(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=2)
+        breaker.record(http_error(503))
+        breaker.record_success()
+        breaker.record(http_error(503))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_fatal_errors_do_not_count(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=1)
+        breaker.record(http_error(404))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+        clock[0] += 10
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=3, reset_timeout=10)
+        for _ in range(3):
+            breaker.record_failure()
+        clock[0] += 10
+        breaker.before_request()
+        breaker.record(asyncio.TimeoutError())
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_released_trial_admits_next(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+        clock[0] += 10
+
+        assert breaker.before_request() is True
+        breaker.release()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.failures == 1
+        assert breaker.before_request() is True
+
+    def test_host_of(self):
+        assert CircuitBreaker.host_of("https://api.example.com:8443/a?b=1") == "api.example.com:8443"
+
+
+# ============================================================================
+# FAILURE REPORT TESTS
+# ============================================================================
+
+class TestFailureReport:
+    """Test the structured failure report."""
+
+    @pytest.fixture
+    def report(self):
+        report = FailureReport()
+        report.add({"url": "https://x/A", "params": {"p": 1}, "metadata": {"security_id": "A"}}, http_error(503))
+        report.add(("https://x/B", None, {"security_id": "B"}), http_error(404))
+        error = asyncio.TimeoutError()
+        error.attempts = 3
+        report.add({"url": "https://x/A2", "metadata": {"security_id": "A"}}, error)
+        report.add(None, ValueError("boom"))
+        return report
+
+    def test_to_frame(self, report):
+        frame = report.to_frame()
+
+        assert list(frame.columns) == FailureReport.COLUMNS
+        assert frame["security_id"].tolist()[:3] == ["A", "B", "A"]
+        assert frame["status"].tolist()[:2] == [503, 404]
+        assert frame["retryable"].tolist() == [True, False, True, False]
+        assert frame["attempts"].tolist() == [1, 1, 3, 1]
+
+    def test_requeue_requests(self, report):
+        assert report.requests() == [
+            {"url": "https://x/A", "params": {"p": 1}, "metadata": {"security_id": "A"}},
+            {"url": "https://x/A2", "params": None, "metadata": {"security_id": "A"}},
+        ]
+        assert [r["url"] for r in report.requests(retryable=False)] == ["https://x/B", None]
+
+    def test_security_ids(self, report):
+        assert report.security_ids() == ["A", "B"]
+        assert report.security_ids(retryable=False) == ["B"]
+
+    def test_container(self, report):
+        assert len(report) == 4
+        assert bool(FailureReport()) is False
+        assert repr(report) == "FailureReport(4 failed, 2 retryable, 2 fatal)"
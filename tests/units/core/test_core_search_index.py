@@ -0,0 +1,257 @@
+"""Tests for the NGramIndex search index."""
+import pytest
+import numpy as np
+import pandas as pd
+
+from morningpy.core.search_index import NGramIndex, PrefixIndex, SymSpellIndex, edit_distance
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def sample_tickers_df():
+    """Create a sample tickers DataFrame for testing."""
+    return pd.DataFrame({
+        'security_id': ['0P000000GY', '0P000003MH', '0P00000B3T', '0P00000ABC', '0P00000XYZ', '0P00000NUL'],
+        'security_label': ['Apple Inc', 'Microsoft Corp', 'Amazon.com Inc', 'Pineapple Holdings', 'APPLE', None],
+        'ticker': ['AAPL', 'MSFT', 'AMZN', 'PNPL', 'APLE', 'NUL'],
+        'isin': ['US0378331005', 'US5949181045', 'US0231351067', 'US88160R1014', 'US02079K1079', None],
+    })
+
+
+@pytest.fixture
+def columns():
+    """Indexed columns."""
+    return ['security_label', 'ticker', 'isin']
+
+
+@pytest.fixture
+def index(sample_tickers_df, columns):
+    """Build an index over the sample DataFrame."""
+    return NGramIndex.build(sample_tickers_df, columns)
+
+
+# ============================================================================
+# BUILD TESTS
+# ============================================================================
+
+class TestBuild:
+    """Test index construction."""
+
+    def test_build_indexes_requested_columns(self, index, columns):
+        """Test that all requested columns are indexed."""
+        assert index.columns == columns
+        assert index.n == 3
+
+    def test_build_skips_missing_columns(self, sample_tickers_df):
+        """Test that columns absent from the frame are ignored."""
+        index = NGramIndex.build(sample_tickers_df, ['ticker', 'unknown'])
+        assert index.columns == ['ticker']
+
+    def test_fingerprint_changes_with_content(self, sample_tickers_df, columns):
+        """Test that the fingerprint reflects column content."""
+        fp = NGramIndex.compute_fingerprint(sample_tickers_df, columns)
+        changed = sample_tickers_df.copy()
+        changed.loc[0, 'ticker'] = 'AAPL2'
+        assert NGramIndex.compute_fingerprint(changed, columns) != fp
+        assert NGramIndex.compute_fingerprint(sample_tickers_df.copy(), columns) == fp
+
+
+# ============================================================================
+# SEARCH TESTS
+# ============================================================================
+
+class TestSearch:
+    """Test substring and prefix search."""
+
+    def test_substring_is_case_insensitive(self, index):
+        """Test that queries ignore case."""
+        positions, _ = index.search('security_label', 'APPLE')
+        assert set(positions.tolist()) == {0, 3, 4}
+
+    def test_results_are_ranked(self, index):
+        """Test exact, then prefix, then substring ordering."""
+        positions, scores = index.search('security_label', 'apple')
+        assert positions.tolist() == [4, 0, 3]
+        assert list(scores) == sorted(scores)
+
+    def test_prefix_mode(self, index):
+        """Test that prefix mode excludes inner matches."""
+        positions, _ = index.search('security_label', 'apple', prefix=True)
+        assert set(positions.tolist()) == {0, 4}
+
+    def test_matches_scan(self, index, sample_tickers_df):
+        """Test that index results agree with a literal scan."""
+        for query in ['inc', 'com', 'us0', '1005', 'soft co', 'xyz']:
+            positions, _ = index.search('security_label', query)
+            expected = np.flatnonzero(
+                sample_tickers_df['security_label'].str.contains(query, case=False, regex=False, na=False)
+            )
+            assert sorted(positions.tolist()) == expected.tolist()
+
+    def test_literal_matching(self, index):
+        """Test that regex metacharacters are matched literally."""
+        positions, _ = index.search('security_label', 'n.c')
+        assert positions.tolist() == [2]
+
+    def test_short_query_falls_back_to_scan(self, index):
+        """Test that queries shorter than n still work."""
+        positions, _ = index.search('ticker', 'ap')
+        assert set(positions.tolist()) == {0, 4}
+
+    def test_no_match(self, index):
+        """Test that an unknown n-gram returns no rows."""
+        positions, scores = index.search('ticker', 'zzzz')
+        assert len(positions) == 0
+        assert len(scores) == 0
+
+    def test_unindexed_column_raises(self, index):
+        """Test that searching an unindexed column raises KeyError."""
+        with pytest.raises(KeyError):
+            index.search('security_id', 'abc')
+
+
+# ============================================================================
+# PERSISTENCE TESTS
+# ============================================================================
+
+class TestPersistence:
+    """Test saving and reloading the index."""
+
+    def test_save_and_load_roundtrip(self, index, sample_tickers_df, tmp_path):
+        """Test that a reloaded index returns the same results."""
+        path = tmp_path / 'index.npz'
+        index.save(path)
+
+        loaded = NGramIndex.load(path).attach(sample_tickers_df)
+        assert loaded.columns == index.columns
+        assert loaded.fingerprint == index.fingerprint
+        for query in ['apple', 'us0', 'ms']:
+            expected, _ = index.search('security_label', query)
+            result, _ = loaded.search('security_label', query)
+            assert result.tolist() == expected.tolist()
+
+    def test_load_or_build_persists(self, sample_tickers_df, columns, tmp_path):
+        """Test that load_or_build writes the index on first use."""
+        path = tmp_path / 'index.npz'
+        NGramIndex.load_or_build(sample_tickers_df, columns, path=path)
+        assert path.exists()
+
+    def test_load_or_build_reuses_matching_index(self, sample_tickers_df, columns, tmp_path, monkeypatch):
+        """Test that an up-to-date persisted index is not rebuilt."""
+        path = tmp_path / 'index.npz'
+        NGramIndex.load_or_build(sample_tickers_df, columns, path=path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('index should not be rebuilt')
+
+        monkeypatch.setattr(NGramIndex, 'build', classmethod(fail))
+        index = NGramIndex.load_or_build(sample_tickers_df, columns, path=path)
+        positions, _ = index.search('ticker', 'aapl')
+        assert positions.tolist() == [0]
+
+    def test_load_or_build_rebuilds_stale_index(self, sample_tickers_df, columns, tmp_path):
+        """Test that a changed frame invalidates the persisted index."""
+        path = tmp_path / 'index.npz'
+        NGramIndex.load_or_build(sample_tickers_df, columns, path=path)
+
+        changed = sample_tickers_df.copy()
+        changed.loc[1, 'ticker'] = 'NEWT'
+        index = NGramIndex.load_or_build(changed, columns, path=path)
+        positions, _ = index.search('ticker', 'newt')
+        assert positions.tolist() == [1]
+
+
+# ============================================================================
+# PREFIX INDEX TESTS
+# ============================================================================
+
+class TestPrefixIndex:
+    """Test sorted-array autocompletion."""
+
+    @pytest.fixture
+    def prefix_index(self, sample_tickers_df):
+        return PrefixIndex.build(sample_tickers_df, ['security_label', 'ticker'])
+
+    def test_head_matches_sorted(self, prefix_index):
+        """Test that values starting with the prefix come in lexicographic order."""
+        assert prefix_index.suggest('appl').tolist() == [4, 0]
+
+    def test_inner_word_matches_follow(self, prefix_index):
+        """Test that inner-word completions come after head matches."""
+        assert prefix_index.suggest('inc').tolist() == [0, 2]
+        assert prefix_index.suggest('hold').tolist() == [3]
+
+    def test_matches_ticker_column(self, prefix_index):
+        """Test that tickers are completed too."""
+        assert prefix_index.suggest('ms').tolist() == [1]
+
+    def test_limit_and_dedup(self, prefix_index):
+        """Test that rows are unique and limited."""
+        result = prefix_index.suggest('a', limit=2)
+        assert len(result) == 2
+        assert len(set(result.tolist())) == 2
+
+    def test_empty_prefix(self, prefix_index):
+        """Test that an empty prefix returns nothing."""
+        assert len(prefix_index.suggest('')) == 0
+
+
+# ============================================================================
+# FUZZY INDEX TESTS
+# ============================================================================
+
+class TestEditDistance:
+    """Test the bounded edit distance."""
+
+    @pytest.mark.parametrize('source,target,expected', [
+        ('apple', 'apple', 0),
+        ('aple', 'apple', 1),
+        ('appel', 'apple', 1),
+        ('microsfot', 'microsoft', 1),
+        ('amazn', 'amazon', 1),
+    ])
+    def test_distance(self, source, target, expected):
+        assert edit_distance(source, target, 2) == expected
+
+    def test_bound(self):
+        """Test that distances above the bound are capped."""
+        assert edit_distance('abcdef', 'uvwxyz', 2) == 3
+
+
+class TestSymSpellIndex:
+    """Test typo-tolerant word search."""
+
+    @pytest.fixture
+    def fuzzy_index(self, sample_tickers_df):
+        return SymSpellIndex.build(sample_tickers_df, ['security_label', 'ticker'])
+
+    def test_single_typo(self, fuzzy_index):
+        """Test that a misspelt word is found."""
+        rows, distances = fuzzy_index.search('mircosoft')
+        assert rows.tolist() == [1]
+        assert distances.tolist() == [1]
+
+    def test_ranked_by_distance(self, fuzzy_index):
+        """Test that closer matches come first."""
+        rows, distances = fuzzy_index.search('appel')
+        assert list(distances) == sorted(distances)
+        assert set(rows.tolist()) >= {0, 4}
+
+    def test_all_words_required(self, fuzzy_index):
+        """Test that multi-word queries intersect rows."""
+        rows, distances = fuzzy_index.search('amazn inc')
+        assert rows.tolist() == [2]
+        assert distances.tolist() == [1]
+
+    def test_max_distance_respected(self, fuzzy_index):
+        """Test that matches beyond max_distance are excluded."""
+        rows, _ = fuzzy_index.search('mcrsft', max_distance=1)
+        assert len(rows) == 0
+
+    def test_empty_query(self, fuzzy_index):
+        """Test that a query without words returns nothing."""
+        rows, _ = fuzzy_index.search('  ')
+        assert len(rows) == 0
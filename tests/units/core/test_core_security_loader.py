@@ -11,6 +11,14 @@ from morningpy.core.security_loader import SecurityLoader
 # FIXTURES
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_loader_cache():
+    """Reset the class-level mapping cache around each test."""
+    SecurityLoader.clear_cache()
+    yield
+    SecurityLoader.clear_cache()
+
+
 @pytest.fixture
 def sample_tickers_df():
     """Create a sample tickers DataFrame for testing."""
@@ -164,6 +172,19 @@ class TestLoadTickers:
         with pytest.raises(FileNotFoundError):
             SecurityLoader()
 
+    @patch('pathlib.Path.mkdir')
+    @patch('pandas.read_parquet')
+    def test_load_tickers_reads_file_once(self, mock_read_parquet, mock_mkdir, sample_tickers_df):
+        """Test that the mapping file is cached across instances."""
+        mock_read_parquet.return_value = sample_tickers_df
+        
+        first = SecurityLoader()
+        second = SecurityLoader()
+        
+        mock_read_parquet.assert_called_once()
+        assert first.tickers is second.tickers
+        assert first.id_map is second.id_map
+
 
 # ============================================================================
 # LOOKUP IDS TESTS
@@ -0,0 +1,191 @@
+"""Tests for the streaming columnar sinks."""
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from unittest.mock import MagicMock, patch
+
+from morningpy.core.sink import (
+    DuckDBSink,
+    IPCSink,
+    ParquetSink,
+    open_sink,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def batch():
+    """A small batch with two securities."""
+    return pd.DataFrame({
+        'security_id': ['A', 'A', 'B'],
+        'date': ['2024-01-01', '2024-01-02', '2024-01-01'],
+        'weight': [0.5, 0.25, 0.25],
+    })
+
+
+# ============================================================================
+# PARQUET TESTS
+# ============================================================================
+
+class TestParquetSink:
+    """Test single-file and partitioned Parquet output."""
+
+    def test_appends_batches_to_one_file(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path) as sink:
+            sink.write_batch(batch)
+            sink.write_batch(pa.Table.from_pandas(batch, preserve_index=False))
+
+        assert sink.rows_written == 6
+        assert pq.read_table(path).num_rows == 6
+
+    def test_row_group_size_and_compression(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path, compression='snappy', row_group_size=1) as sink:
+            sink.write_batch(batch)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 3
+        assert metadata.row_group(0).column(0).compression == 'SNAPPY'
+
+    def test_hive_partitioning(self, tmp_path, batch):
+        with ParquetSink(tmp_path / 'ds', partition_cols=['security_id']) as sink:
+            sink.write_batch(batch)
+            sink.write_batch(batch)
+
+        assert sorted(p.name for p in (tmp_path / 'ds').iterdir()) == ['security_id=A', 'security_id=B']
+        table = ds.dataset(tmp_path / 'ds', partitioning='hive').to_table()
+        assert table.num_rows == 6
+
+    def test_missing_partition_column(self, tmp_path, batch):
+        with pytest.raises(ValueError, match='Partition columns'):
+            with ParquetSink(tmp_path / 'ds', partition_cols=['isin']) as sink:
+                sink.write_batch(batch)
+
+    def test_later_batches_conformed_to_schema(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path) as sink:
+            sink.write_batch(batch)
+            sink.write_batch(pd.DataFrame({'weight': [1]}))
+
+        result = pq.read_table(path)
+        assert result.column_names == ['security_id', 'date', 'weight']
+        assert result.column('security_id').null_count == 1
+        assert result.schema.field('weight').type == pa.float64()
+
+    def test_extra_columns_raise_by_default(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path) as sink:
+            sink.write_batch(batch)
+            with pytest.raises(ValueError, match=r"absent from the sink schema: \['extra'\]"):
+                sink.write_batch(pd.DataFrame({'weight': [1], 'extra': ['x']}))
+
+        assert sink.rows_written == 3
+        assert pq.read_table(path).num_rows == 3
+
+    def test_extra_columns_dropped_on_opt_in(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path, extra_columns='drop') as sink:
+            sink.write_batch(batch)
+            sink.write_batch(pd.DataFrame({'weight': [1], 'extra': ['x']}))
+
+        result = pq.read_table(path)
+        assert result.column_names == ['security_id', 'date', 'weight']
+        assert result.column('security_id').null_count == 1
+        assert result.schema.field('weight').type == pa.float64()
+
+    def test_empty_batches_ignored(self, tmp_path, batch):
+        path = tmp_path / 'out.parquet'
+        with ParquetSink(path) as sink:
+            sink.write_batch(pa.table({}))
+            sink.write_batch(batch)
+            sink.write_batch(batch.iloc[:0])
+
+        assert pq.read_table(path).num_rows == 3
+
+    def test_closed_sink_rejects_writes(self, tmp_path, batch):
+        sink = ParquetSink(tmp_path / 'out.parquet')
+        sink.close()
+        with pytest.raises(ValueError, match='closed'):
+            sink.write_batch(batch)
+
+
+# ============================================================================
+# ARROW IPC TESTS
+# ============================================================================
+
+class TestIPCSink:
+    """Test Arrow IPC output."""
+
+    def test_roundtrip(self, tmp_path, batch):
+        path = tmp_path / 'out.arrow'
+        with IPCSink(path, compression='lz4') as sink:
+            sink.write_batch(batch)
+            sink.write_batch(batch)
+
+        assert pa.ipc.open_file(path).read_all().num_rows == 6
+
+    def test_partitioned(self, tmp_path, batch):
+        with IPCSink(tmp_path / 'ds', partition_cols=['security_id', 'date']) as sink:
+            sink.write_batch(batch)
+
+        table = ds.dataset(tmp_path / 'ds', format='ipc', partitioning='hive').to_table()
+        assert table.num_rows == 3
+
+
+# ============================================================================
+# DUCKDB TESTS
+# ============================================================================
+
+class TestDuckDBSink:
+    """Test DuckDB output through a stub module."""
+
+    def test_creates_then_inserts(self, tmp_path, batch):
+        duckdb = MagicMock()
+        con = duckdb.connect.return_value
+        with patch.dict('sys.modules', {'duckdb': duckdb}):
+            with DuckDBSink(tmp_path / 'db.duckdb', table='holdings') as sink:
+                sink.write_batch(batch)
+                sink.write_batch(batch)
+
+        duckdb.connect.assert_called_once_with(str(tmp_path / 'db.duckdb'))
+        statements = [c.args[0] for c in con.execute.call_args_list]
+        assert statements[0].startswith('CREATE TABLE IF NOT EXISTS "holdings"')
+        assert sum(s.startswith('INSERT INTO "holdings"') for s in statements) == 2
+        con.close.assert_called_once()
+
+    def test_requires_duckdb(self, tmp_path, batch):
+        with patch.dict('sys.modules', {'duckdb': None}):
+            with pytest.raises(ImportError, match='duckdb'):
+                DuckDBSink(tmp_path / 'db.duckdb').write_batch(batch)
+
+
+# ============================================================================
+# FACTORY TESTS
+# ============================================================================
+
+class TestOpenSink:
+    """Test the format → sink factory."""
+
+    @pytest.mark.parametrize('fmt,expected', [
+        ('parquet', ParquetSink),
+        ('IPC', IPCSink),
+        ('feather', IPCSink),
+        ('duckdb', DuckDBSink),
+    ])
+    def test_formats(self, tmp_path, fmt, expected):
+        assert isinstance(open_sink(tmp_path / 'x', fmt), expected)
+
+    def test_extra_columns_option(self, tmp_path):
+        assert open_sink(tmp_path / 'x', 'parquet', extra_columns='drop').extra_columns == 'drop'
+        with pytest.raises(ValueError, match='extra_columns'):
+            open_sink(tmp_path / 'x', 'parquet', extra_columns='widen')
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported format 'csv'"):
+            open_sink(tmp_path / 'x', 'csv')
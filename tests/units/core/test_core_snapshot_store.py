@@ -0,0 +1,131 @@
+"""Tests for the holdings snapshot store."""
+import datetime
+
+import pandas as pd
+import pytest
+
+from morningpy.core.snapshot_store import HoldingSnapshotStore
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def holdings(fund, rows):
+    """HoldingExtractor-like frame from (id, name, weighting, shares) rows."""
+    return pd.DataFrame({
+        "parent_security_id": fund,
+        "child_security_id": pd.array([r[0] for r in rows], dtype="string"),
+        "security_name": pd.array([r[1] for r in rows], dtype="string"),
+        "weighting": [r[2] for r in rows],
+        "number_of_share": [r[3] for r in rows],
+        "sector": pd.array(["Tech"] * len(rows), dtype="string"),
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HoldingSnapshotStore(tmp_path / "store")
+    store.put(holdings("F", [("A", "a", 50.0, 10.0), ("B", "b", 50.0, 20.0)]), "2025-01-31")
+    store.put(holdings("F", [("A", "a", 60.0, 12.0), ("C", "c", 40.0, 5.0)]), "2025-02-28")
+    store.put(holdings("F", [("A", "a", 60.0, 12.0), ("C", "c", 30.0, 5.0), ("B", "b", 10.0, 1.0)]), "2025-03-31")
+    return store
+
+
+# ============================================================================
+# PUT TESTS
+# ============================================================================
+
+class TestPut:
+    """Test change detection and storage."""
+
+    def test_first_snapshot_adds_everything(self, tmp_path):
+        store = HoldingSnapshotStore(tmp_path)
+        changes = store.put(holdings("F", [("A", "a", 50.0, 10.0), ("B", "b", 50.0, 20.0)]), "2025-01-31")
+
+        assert changes["op"].tolist() == ["snapshot", "add", "add"]
+        assert (changes["portfolio_date"] == datetime.date(2025, 1, 31)).all()
+
+    def test_only_changes_stored(self, tmp_path):
+        store = HoldingSnapshotStore(tmp_path)
+        store.put(holdings("F", [("A", "a", 50.0, 10.0), ("B", "b", 50.0, 20.0), ("D", "d", 0.0, 1.0)]), "2025-01-31")
+
+        changes = store.put(holdings("F", [("A", "a", 60.0, 12.0), ("C", "c", 40.0, 5.0), ("D", "d", 0.0, 1.0)]), "2025-02-28")
+
+        ops = dict(zip(changes["security"], changes["op"]))
+        assert ops == {None: "snapshot", "C": "add", "B": "remove", "A": "change"}
+        change = changes[changes["op"] == "change"].iloc[0]
+        assert pd.isna(change["security_name"]) and change["weighting"] == 60.0
+
+    def test_same_date_skipped(self, store):
+        before = len(list(store.data_dir.iterdir()))
+
+        changes = store.put(holdings("F", [("Z", "z", 100.0, 1.0)]), "2025-03-31")
+
+        assert changes.empty
+        assert len(list(store.data_dir.iterdir())) == before
+
+    def test_older_date_rejected(self, store):
+        with pytest.raises(ValueError, match="older"):
+            store.put(holdings("F", [("A", "a", 100.0, 1.0)]), "2024-12-31")
+
+    def test_dates_per_fund(self, store):
+        frame = pd.concat([holdings("G", [("A", "a", 100.0, 1.0)]), holdings("H", [("A", "a", 100.0, 1.0)])])
+        store.put(frame, {"G": "2025-01-15", "H": "2025-02-15"})
+
+        assert store.funds() == ["F", "G", "H"]
+        assert store.dates("H") == [datetime.date(2025, 2, 15)]
+        with pytest.raises(ValueError, match="No portfolio_date"):
+            store.put(holdings("K", [("A", "a", 1.0, 1.0)]), {"G": "2025-03-01"})
+
+    def test_key_fallback(self, tmp_path):
+        store = HoldingSnapshotStore(tmp_path)
+        frame = holdings("F", [(None, "Cash", 5.0, None), ("A", "a", 95.0, 1.0)])
+
+        store.put(frame, "2025-01-31")
+
+        assert set(store.as_of("F")["security"]) == {"Cash", "A"}
+
+
+# ============================================================================
+# RECONSTRUCTION TESTS
+# ============================================================================
+
+class TestReconstruction:
+    """Test point-in-time holdings and diffs."""
+
+    def test_as_of(self, store):
+        state = store.as_of("F", "2025-02-15")
+
+        assert state["security"].tolist() == ["A", "B"]
+        assert state["weighting"].tolist() == [50.0, 50.0]
+        assert (state["portfolio_date"] == datetime.date(2025, 1, 31)).all()
+        assert state["security_name"].dtype == "string"
+
+    def test_latest_with_re_added_holding(self, store):
+        state = store.as_of("F").set_index("security")
+
+        assert list(state.index) == ["A", "B", "C"]
+        assert state.loc["A", "number_of_share"] == 12.0
+        assert state.loc["B", "weighting"] == 10.0
+        assert state.loc["A", "security_name"] == "a"
+        assert state.loc["A", "parent_security_id"] == "F"
+
+    def test_missing_snapshot(self, store):
+        with pytest.raises(KeyError):
+            store.as_of("F", "2024-01-01")
+        with pytest.raises(KeyError):
+            store.as_of("unknown")
+
+    def test_diff(self, store):
+        diff = store.diff("F", "2025-01-31", "2025-02-28").set_index("security")
+
+        assert diff["change"].to_dict() == {"A": "change", "B": "remove", "C": "add"}
+        assert diff.loc["A", ["weighting_a", "weighting_b"]].tolist() == [50.0, 60.0]
+        assert pd.isna(diff.loc["C", "weighting_a"])
+
+    def test_diff_skips_unchanged(self, store):
+        diff = store.diff("F", "2025-02-28", "2025-03-31")
+
+        assert dict(zip(diff["security"], diff["change"])) == {"B": "add", "C": "change"}
+        assert store.diff("F", "2025-03-31", "2025-03-31").empty
@@ -0,0 +1,553 @@
+"""Tests for the security extractors."""
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from morningpy.core.replay import ReplayServer, replay_mode
+from morningpy.core.security_loader import SecurityLoader
+from morningpy.core.sink import ParquetSink
+from morningpy.extractor.security import FinancialStatementExtractor, HoldingExtractor, StatementPanel
+from morningpy.schema.security import FinancialStatementLongSchema
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def make_extractor(layout="long"):
+    """Build a financial statement extractor without security lookup."""
+    cls = FinancialStatementExtractor
+    extractor = cls.__new__(cls)
+    extractor.filter_values = cls.config.FILTER_VALUE
+    extractor.endpoint = cls.config.ENDPOINT
+    extractor.valid_frequency = cls.config.VALID_FREQUENCY
+    extractor.statement_type = []
+    extractor.report_frequency = []
+    extractor.layout = layout
+    return extractor
+
+
+@pytest.fixture
+def response():
+    with open(RESPONSES_DIR / "get_financial_statement_response.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def tickers():
+    """Two companies, served by the security lookups instead of tickers.parquet."""
+    previous = SecurityLoader._cached_tickers, SecurityLoader._cached_id_map
+    SecurityLoader._cached_tickers = pd.DataFrame({
+        "security_id": ["0P0000001", "0P0000002"],
+        "security_label": ["Company One", "Company Two"],
+        "ticker": ["ONE", "TWO"],
+        "isin": ["US0000000001", "US0000000002"],
+        "performance_id": ["0P0000001", "0P0000002"],
+    })
+    SecurityLoader._cached_id_map = None
+    yield
+    SecurityLoader._cached_tickers, SecurityLoader._cached_id_map = previous
+
+
+def with_security(response, security_id, periods=None):
+    """Response of another security, optionally reporting other periods."""
+    response = {**response, "metadata": {"security_id": security_id, "security_label": security_id.lower()}}
+    if periods is not None:
+        response["columnDefs"] = response["columnDefs"][:5] + periods
+    return response
+
+
+# ============================================================================
+# TREE FLATTENING TESTS
+# ============================================================================
+
+def datum(*values):
+    return [None] * 5 + list(values)
+
+
+class TestFlattenTree:
+    """Test the iterative statement tree flattener."""
+
+    @pytest.fixture
+    def rows(self):
+        return [{"label": "IncomeStatement", "subLevel": [
+            {"label": "Total Revenue", "datum": datum(1, "_PO_", 3)},
+            {"label": "Costs", "subLevel": [
+                {"label": "COGS", "datum": datum("4.5", None)},
+                {"label": "Deep", "subLevel": [
+                    {"label": "  X  y ", "datum": datum(7, 8, 9)},
+                    {"label": "", "subLevel": [{"label": "Skipped", "datum": datum(1, 1, 1)}]},
+                ]},
+            ]},
+            {"label": "No Data", "datum": [1, 2]},
+        ]}]
+
+    def test_levels_padded_with_leaf_label(self, rows):
+        tree = FinancialStatementExtractor.flatten_tree(rows, 3)
+
+        assert tree.levels == [
+            ["IncomeStatement"] * 3,
+            ["Revenue", "Costs", "Costs"],
+            ["Revenue", "COGS", "Deep"],
+            ["Revenue", "COGS", "X y"],
+        ]
+        assert tree.paths[0] == ("IncomeStatement", "Revenue")
+
+    def test_values_normalized(self, rows):
+        tree = FinancialStatementExtractor.flatten_tree(rows, 3)
+
+        np.testing.assert_array_equal(tree.values[0], [1.0, 0.0, 3.0])
+        assert tree.values[1, 0] == 4.5 and tree.values[1, 1] == 0.0
+        assert np.isnan(tree.values[1, 2])
+
+    def test_empty(self):
+        tree = FinancialStatementExtractor.flatten_tree([], 3)
+        assert tree.paths == [] and tree.values.shape == (0, 3)
+
+    def test_wide_frame(self, rows):
+        response = {
+            "columnDefs": ["x"] * 5 + ["2020", "2021", "2022"],
+            "_meta": {"statementType": "income-statement"},
+            "metadata": {"security_id": "A", "security_label": "a"},
+            "rows": rows + [{"label": "Other", "subLevel": [{"label": "Z", "datum": datum(1, 2, 3)}]}],
+        }
+
+        df = make_extractor("wide")._process_response(response)
+
+        assert list(df.columns) == [
+            "id_security", "security_label", "statement_type",
+            "sub_type1", "sub_type2", "sub_type3", "2020", "2021", "2022",
+        ]
+        assert len(df) == 3
+        assert df["2020"].tolist() == [1e6, 4.5e6, 7e6]
+
+    def test_label_cache(self):
+        FinancialStatementExtractor.clean_label.cache_clear()
+        FinancialStatementExtractor.clean_label("Total Assets")
+        FinancialStatementExtractor.clean_label("Total Assets")
+
+        assert FinancialStatementExtractor.clean_label.cache_info().hits == 1
+
+
+# ============================================================================
+# LONG LAYOUT TESTS
+# ============================================================================
+
+class TestLongLayout:
+    """Test the long financial statement layout."""
+
+    def test_matches_wide_values(self, response):
+        response = with_security(response, "A")
+        wide = make_extractor("wide")._process_response(response)
+        long = make_extractor("long")._process_response(response)
+        periods = response["columnDefs"][5:]
+
+        assert list(long.columns) == FinancialStatementExtractor.config.LONG_CATEGORICAL_COLUMNS + ["value"]
+        assert len(long) == len(wide) * len(periods)
+        np.testing.assert_allclose(long["value"].to_numpy(), wide[periods].to_numpy().ravel())
+        assert set(long["statement_type"]) == {"IncomeStatement"}
+        assert (long["security_id"] == "A").all()
+
+    def test_categorical_labels(self, response):
+        long = make_extractor()._process_response(with_security(response, "A"))
+
+        for col in FinancialStatementExtractor.config.LONG_CATEGORICAL_COLUMNS:
+            assert isinstance(long[col].dtype, pd.CategoricalDtype)
+        assert long["line_item"].cat.categories.str.contains(" > ").any()
+
+    def test_concat_keeps_categoricals(self, response):
+        extractor = make_extractor()
+        periods = response["columnDefs"][5:]
+        frames = [
+            extractor._process_response(with_security(response, "A")),
+            extractor._process_response(with_security(response, "B", ["2019"] + periods[1:])),
+            pd.DataFrame(),
+        ]
+
+        df = extractor._concat(frames)
+
+        assert len(df) == len(frames[0]) + len(frames[1])
+        assert isinstance(df["period"].dtype, pd.CategoricalDtype)
+        assert "2019" in df["period"].cat.categories
+        assert list(df["security_id"].cat.categories) == ["A", "B"]
+
+    def test_wide_concat_unchanged(self):
+        df = make_extractor("wide")._concat([pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [2]})])
+        assert list(df.columns) == ["a", "b"]
+
+    def test_invalid_layout(self):
+        with pytest.raises(ValueError, match="Invalid layout"):
+            make_extractor("tall")._check_inputs()
+
+    def test_long_schema(self):
+        assert FinancialStatementLongSchema().to_dtype_dict() == {"value": "float64"}
+
+
+# ============================================================================
+# ARROW PROCESSING TESTS
+# ============================================================================
+
+class TestStatementArrow:
+    """Test the Arrow-native statement processing."""
+
+    @pytest.mark.parametrize("layout", ["wide", "long"])
+    def test_matches_pandas_processing(self, response, layout):
+        extractor = make_extractor(layout)
+        response = with_security(response, "A")
+
+        table = extractor._process_response_arrow(response)
+
+        pd.testing.assert_frame_equal(table.to_pandas(), extractor._process_response(response))
+
+    def test_long_labels_are_dictionaries(self, response):
+        extractor = make_extractor()
+        periods = response["columnDefs"][5:]
+        tables = [
+            extractor._process_response_arrow(with_security(response, "A")),
+            extractor._process_response_arrow(with_security(response, "B", ["2019"] + periods[1:])),
+        ]
+
+        table = pa.concat_tables(tables, promote_options="permissive")
+
+        for col in FinancialStatementExtractor.config.LONG_CATEGORICAL_COLUMNS:
+            assert table.schema.field(col).type == pa.dictionary(pa.int32(), pa.string())
+        assert "2019" in table.column("period").to_pandas().cat.categories
+
+    @pytest.mark.parametrize("response", [None, {}, {"_meta": {"statementType": "unknown"}}])
+    def test_empty_response(self, response):
+        assert make_extractor()._process_response_arrow(response).num_columns == 0
+
+
+class TestHoldingArrow:
+    """Test the Arrow-native holdings processing."""
+
+    @pytest.fixture
+    def holdings(self):
+        with open(RESPONSES_DIR / "get_holding_response.json") as f:
+            response = json.load(f)
+        return {**response, "metadata": {"security_id": "0P0000001", "security_label": "Company One"}}
+
+    @pytest.mark.parametrize("top_n", [None, 5])
+    def test_matches_pandas_processing(self, tickers, holdings, top_n):
+        extractor = HoldingExtractor(ticker="ONE", top_n=top_n)
+        expected = pa.Table.from_pandas(extractor._process_response(holdings), preserve_index=False)
+
+        table = extractor._process_response_arrow(holdings)
+
+        convert = extractor._validate_and_convert_arrow
+        assert convert(table).equals(convert(expected))
+
+    @pytest.mark.parametrize("weights", [
+        [None, float("nan"), 2.0, 1.0, 5.0],
+        [None, "x", "2.0", "1", "5"],
+    ], ids=["numeric", "strings"])
+    def test_missing_weightings_last(self, tickers, weights):
+        extractor = HoldingExtractor(ticker="ONE", top_n=3)
+        response = {**holding_page(1, 1, weights), "metadata": {"security_id": "0P0000001"}}
+
+        table = extractor._process_response_arrow(response)
+        expected = extractor._process_response(response)
+
+        assert table.column("child_security_id").to_pylist() == ["S1-2", "S1-3", "S1-4"]
+        assert table.column("child_security_id").to_pylist() == expected["child_security_id"].tolist()
+
+    def test_empty_response(self, tickers):
+        extractor = HoldingExtractor(ticker="ONE")
+        assert extractor._process_response_arrow({"equityHoldingPage": {"holdingList": []}}).num_columns == 0
+
+
+# ============================================================================
+# PANEL TESTS
+# ============================================================================
+
+class TestPanel:
+    """Test the dense NumPy panel."""
+
+    @pytest.fixture
+    def long(self, response):
+        extractor = make_extractor()
+        periods = response["columnDefs"][5:]
+        return extractor._concat([
+            extractor._process_response(with_security(response, "A")),
+            extractor._process_response(with_security(response, "B", ["2019"] + periods[1:])),
+        ])
+
+    def test_shape_and_values(self, long):
+        panel = FinancialStatementExtractor.to_panel(long)
+
+        assert isinstance(panel, StatementPanel)
+        n_items = long["line_item"].nunique()
+        assert panel.values.shape == (2, n_items, long["period"].nunique())
+        assert list(panel.securities) == ["A", "B"]
+
+        row = long.iloc[0]
+        i = panel.line_items.get_loc((row["statement_type"], row["line_item"]))
+        j = panel.periods.get_loc(row["period"])
+        assert panel.values[0, i, j] == row["value"]
+
+    def test_missing_periods_are_nan(self, long):
+        panel = FinancialStatementExtractor.to_panel(long, dtype="float32")
+
+        assert panel.values.dtype == np.float32
+        assert panel.periods[0] == "2019"
+        assert np.isnan(panel.values[0, :, 0]).all()
+        assert not np.isnan(panel.values[1, :, 0]).all()
+
+    def test_period_key(self):
+        periods = ["TTM", "Q2 2024", "2023", "Q1 2024"]
+        assert sorted(periods, key=FinancialStatementExtractor.period_key) == ["2023", "Q1 2024", "Q2 2024", "TTM"]
+
+
+# ============================================================================
+# GROUPED RUN TESTS
+# ============================================================================
+
+STATEMENTS = ["Income Statement", "Balance Sheet"]
+FREQUENCIES = ["Annualy", "Quarterly"]
+
+
+class TestGroupedRun:
+    """Test every statement type and frequency in one job."""
+
+    def test_requests_per_combination(self):
+        extractor = make_extractor("wide")
+        extractor.url = "https://api.test/"
+        extractor.params = {}
+        extractor.frequency_mapping = FinancialStatementExtractor.config.MAPPING_FREQUENCY
+        extractor.metadata = [{"security_id": "A", "security_label": "a"}, {"security_id": "B", "security_label": "b"}]
+        extractor.statement_type = STATEMENTS
+        extractor.report_frequency = FREQUENCIES
+
+        extractor._build_request()
+
+        assert len(extractor.requests) == 8
+        first = extractor.requests[1]
+        assert first["url"] == "https://api.test/A/incomeStatement/detail"
+        assert first["params"]["dataType"] == "Q"
+        assert first["metadata"] == {
+            "security_id": "A", "security_label": "a",
+            "statement_type": "Income Statement", "report_frequency": "Quarterly",
+        }
+
+    @pytest.mark.parametrize("field, value", [
+        ("statement_type", ["Income Statement", "Income"]),
+        ("report_frequency", ["Monthly"]),
+    ])
+    def test_invalid_inputs(self, field, value):
+        extractor = make_extractor("wide")
+        setattr(extractor, field, value)
+
+        with pytest.raises(ValueError, match=f"Invalid {field}"):
+            extractor._check_inputs()
+
+    def test_one_job(self, tickers):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            extractor = FinancialStatementExtractor(
+                ticker=["ONE", "TWO"], statement_type=STATEMENTS, report_frequency=FREQUENCIES
+            )
+            extractor.max_requests = 3
+            results = asyncio.run(extractor.run_grouped())
+
+        assert list(results) == [(s, f) for s in STATEMENTS for f in FREQUENCIES]
+        assert server.stats[("get_financial_statement", 200)] == 8
+        assert not extractor.failures
+        for df in results.values():
+            assert set(df["id_security"]) == {"0P0000001", "0P0000002"}
+
+
+# ============================================================================
+# HOLDING STREAM TESTS
+# ============================================================================
+
+class TestHoldingStream:
+    """Test holdings parsed into record batches while downloading."""
+
+    @staticmethod
+    async def collect(extractor, batch_size):
+        return [batch async for batch in extractor.stream(batch_size)]
+
+    def test_batches_match_run(self, tickers):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+            batches = asyncio.run(self.collect(extractor, 20))
+            full = asyncio.run(HoldingExtractor(ticker=["ONE", "TWO"]).run(engine="arrow"))
+
+        assert [b.num_rows for b in batches] == [20, 20, 6, 20, 20, 6]
+        streamed = pa.Table.from_batches(batches)
+        assert streamed.schema.equals(full.schema)
+        keys = ["parent_security_id", "child_security_id"]
+        pd.testing.assert_frame_equal(
+            streamed.to_pandas().sort_values(keys, ignore_index=True),
+            full.to_pandas(),
+        )
+
+    def test_failed_fund_recorded(self, tickers):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR, error_rate=1.0, error_statuses=[404]).running() as server, \
+                replay_mode(server):
+            extractor = HoldingExtractor(ticker=["ONE"])
+            batches = asyncio.run(self.collect(extractor, 20))
+
+        assert batches == []
+        assert len(extractor.failures) == 1
+
+    def test_run_to_sink(self, tickers, tmp_path):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            with ParquetSink(tmp_path / "holdings.parquet") as sink:
+                rows = asyncio.run(HoldingExtractor(ticker=["ONE", "TWO"]).run_to_sink(sink, batch_size=10))
+
+        assert rows == 92
+        assert pq.read_table(tmp_path / "holdings.parquet").num_rows == 92
+
+
+# ============================================================================
+# HOLDING PAGING TESTS
+# ============================================================================
+
+def holding_page(number, total, weights):
+    """Equity holdings page of a paged response."""
+    return {
+        "equityHoldingPage": {
+            "pageNumber": number,
+            "totalPage": total,
+            "holdingList": [{"secId": f"S{number}-{k}", "weighting": w} for k, w in enumerate(weights)],
+        },
+        "boldHoldingPage": {"pageNumber": number, "totalPage": 0, "holdingList": []},
+    }
+
+
+def paged_client(extractor, pages):
+    """Serve pages[security_id][pageNumber - 1], recording every requested page."""
+    calls = []
+
+    async def get_async(session, url, params, metadata):
+        security_id = metadata["security_id"]
+        calls.append((security_id, params["pageNumber"]))
+        book = pages[security_id]
+        if isinstance(book, Exception):
+            raise book
+        return {**book[params["pageNumber"] - 1], "metadata": metadata}
+
+    extractor.client.get_async = get_async
+    return calls
+
+
+class TestHoldingTopN:
+    """Test top_n mapped to the endpoint page size."""
+
+    def test_page_size_params(self, tickers):
+        extractor = HoldingExtractor(ticker="ONE", top_n=5)
+
+        assert extractor.params["premiumNum"] == extractor.params["freeNum"] == 5
+        assert HoldingExtractor.config.PARAMS["freeNum"] == 10000
+
+    @pytest.mark.parametrize("top_n", [0, -1, 2.5, True])
+    def test_invalid(self, tickers, top_n):
+        with pytest.raises(ValueError, match="top_n"):
+            HoldingExtractor(ticker="ONE", top_n=top_n)._check_inputs()
+
+    def test_keeps_largest_weightings(self, tickers):
+        with ReplayServer(fixtures_dir=RESPONSES_DIR).running() as server, replay_mode(server):
+            full = asyncio.run(HoldingExtractor(ticker="ONE").run())
+            top = asyncio.run(HoldingExtractor(ticker="ONE", top_n=5).run())
+
+        assert len(top) == 5
+        assert sorted(top["weighting"], reverse=True) == full["weighting"].nlargest(5).tolist()
+        assert top["child_security_id"].is_monotonic_increasing
+
+
+class TestHoldingPages:
+    """Test on-demand paging with early termination."""
+
+    @pytest.fixture
+    def pages(self):
+        return {
+            "0P0000001": [holding_page(1, 3, [5.0, 4.0]), holding_page(2, 3, [3.0, 2.0]), holding_page(3, 3, [1.0])],
+            "0P0000002": [holding_page(1, 1, [9.0])],
+        }
+
+    @staticmethod
+    async def collect(extractor, **kwargs):
+        return [df async for df in extractor.pages(**kwargs)]
+
+    def test_all_pages(self, tickers, pages):
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+        calls = paged_client(extractor, pages)
+
+        frames = asyncio.run(self.collect(extractor, page_size=2))
+
+        assert [len(df) for df in frames] == [2, 2, 1, 1]
+        assert calls == [("0P0000001", 1), ("0P0000001", 2), ("0P0000001", 3), ("0P0000002", 1)]
+        assert frames[0]["weighting"].dtype == "float64"
+
+    def test_page_size_params(self, tickers, pages):
+        extractor = HoldingExtractor(ticker="ONE")
+        params = []
+        paged_client(extractor, pages)
+        get_async = extractor.client.get_async
+
+        async def spy(session, url, p, metadata):
+            params.append(p)
+            return await get_async(session, url, p, metadata)
+
+        extractor.client.get_async = spy
+        asyncio.run(self.collect(extractor, page_size=2, max_pages=1))
+
+        assert params == [{**extractor.params, "premiumNum": 2, "freeNum": 2, "pageNumber": 1}]
+
+    def test_consumer_stops_fetching(self, tickers, pages):
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+        calls = paged_client(extractor, pages)
+
+        async def first_page():
+            async for df in extractor.pages(page_size=2):
+                return df
+
+        asyncio.run(first_page())
+
+        assert calls == [("0P0000001", 1)]
+
+    def test_top_n_stops_early(self, tickers, pages):
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"], top_n=3)
+        calls = paged_client(extractor, pages)
+
+        frames = asyncio.run(self.collect(extractor, page_size=2))
+
+        assert [df["weighting"].tolist() for df in frames] == [[5.0, 4.0], [3.0], [9.0]]
+        assert calls == [("0P0000001", 1), ("0P0000001", 2), ("0P0000002", 1)]
+
+    def test_max_pages(self, tickers, pages):
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+        calls = paged_client(extractor, pages)
+
+        asyncio.run(self.collect(extractor, page_size=2, max_pages=2))
+
+        assert calls == [("0P0000001", 1), ("0P0000001", 2), ("0P0000002", 1)]
+
+    def test_failed_fund_skipped(self, tickers, pages):
+        pages["0P0000001"] = RuntimeError("boom")
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+        paged_client(extractor, pages)
+
+        result = asyncio.run(extractor.run_paged(page_size=2))
+
+        assert result["parent_security_id"].tolist() == ["0P0000002"]
+        assert len(extractor.failures) == 1
+
+    def test_run_paged_sorted(self, tickers, pages):
+        extractor = HoldingExtractor(ticker=["ONE", "TWO"])
+        paged_client(extractor, pages)
+
+        result = asyncio.run(extractor.run_paged(page_size=2))
+
+        assert len(result) == 6
+        assert result["child_security_id"].tolist()[:5] == ["S1-0", "S1-1", "S2-0", "S2-1", "S3-0"]
+
+    def test_invalid_page_size(self, tickers):
+        with pytest.raises(ValueError, match="page_size"):
+            asyncio.run(self.collect(HoldingExtractor(ticker="ONE"), page_size=0))
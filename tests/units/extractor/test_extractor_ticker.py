@@ -1 +1,193 @@
-""
\ No newline at end of file
+"""Tests for TickerExtractor."""
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from morningpy.extractor.ticker import TickerExtractor
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def sample_tickers_df():
+    """Create a sample tickers DataFrame for testing."""
+    return pd.DataFrame({
+        'security_id': ['0P000000GY', '0P000003MH', '0P00000B3T', '0P00000ABC', '0P00000XYZ'],
+        'security_label': ['Apple Inc', 'Microsoft Corp', 'Amazon.com Inc', 'Pineapple Holdings', 'Apple'],
+        'ticker': ['AAPL', 'MSFT', 'AMZN', 'PNPL', 'APLE'],
+        'isin': ['US0378331005', 'US5949181045', 'US0231351067', 'US88160R1014', 'US02079K1079'],
+        'performance_id': ['0P000000GY', '0P000003MH', '0P00000B3T', '0P00000ABC', '0P00000XYZ'],
+        'security_type': ['stock', 'stock', 'stock', 'fund', 'etf'],
+        'country': ['United States', 'United States', 'United States', 'Canada', 'Canada'],
+    })
+
+
+@pytest.fixture
+def extractor(sample_tickers_df, tmp_path):
+    """Create a TickerExtractor on the sample data with an isolated index file."""
+    TickerExtractor.clear_cache()
+    TickerExtractor._cached_tickers = sample_tickers_df
+    with patch('morningpy.extractor.ticker.CoreConfig.TICKERS_INDEX_FILE', str(tmp_path / 'index.npz')):
+        yield TickerExtractor()
+    TickerExtractor.clear_cache()
+
+
+# ============================================================================
+# SEARCH TESTS
+# ============================================================================
+
+class TestSearch:
+    """Test ranked search over indexed columns."""
+
+    def test_ranked_across_columns(self, extractor):
+        """Test that exact matches come first across label and ticker."""
+        result = extractor.search('apple')
+        assert result['security_id'].tolist() == ['0P00000XYZ', '0P000000GY', '0P00000ABC']
+
+    def test_prefix_and_limit(self, extractor):
+        """Test prefix matching with a result limit."""
+        result = extractor.search('US0', columns=['isin'], prefix=True, limit=2)
+        assert len(result) == 2
+        assert result['isin'].str.startswith('US0').all()
+
+    def test_no_match_returns_empty(self, extractor):
+        """Test that an unmatched query returns an empty frame."""
+        assert extractor.search('nothing here').empty
+
+
+# ============================================================================
+# SUGGEST / FUZZY SEARCH TESTS
+# ============================================================================
+
+class TestSuggest:
+    """Test prefix autocompletion."""
+
+    def test_suggest_prefix(self, extractor):
+        """Test that labels and tickers are completed."""
+        result = extractor.suggest('appl', limit=5)
+        assert result['security_id'].tolist() == ['0P00000XYZ', '0P000000GY']
+
+    def test_suggest_limit(self, extractor):
+        """Test the suggestion limit."""
+        assert len(extractor.suggest('a', limit=1)) == 1
+
+
+class TestFuzzySearch:
+    """Test typo-tolerant search."""
+
+    def test_fuzzy_search_with_typo(self, extractor):
+        """Test that a misspelt label is found with its distance."""
+        result = extractor.fuzzy_search('micrsoft')
+        assert result['ticker'].tolist() == ['MSFT']
+        assert result['distance'].tolist() == [1]
+
+    def test_fuzzy_search_limit(self, extractor):
+        """Test the result limit."""
+        assert len(extractor.fuzzy_search('apple', limit=1)) == 1
+
+
+# ============================================================================
+# SEARCH TICKERS TESTS
+# ============================================================================
+
+class TestSearchTickers:
+    """Test filter-based search."""
+
+    def test_indexed_partial_match(self, extractor):
+        """Test partial matching on an indexed column."""
+        result = extractor.search_tickers({'security_label': 'APPLE'})
+        assert set(result['ticker']) == {'AAPL', 'PNPL', 'APLE'}
+
+    def test_indexed_filter_combined_with_scan(self, extractor):
+        """Test that indexed and unindexed filters are AND-combined."""
+        result = extractor.search_tickers({'security_label': 'apple', 'country': 'canada'})
+        assert set(result['ticker']) == {'PNPL', 'APLE'}
+
+    def test_exact_match_bypasses_index(self, extractor):
+        """Test exact matching stays case-sensitive equality."""
+        result = extractor.search_tickers({'security_label': 'Apple'}, exact_match=True)
+        assert result['ticker'].tolist() == ['APLE']
+
+    def test_list_filter(self, extractor):
+        """Test list filters use membership."""
+        result = extractor.search_tickers({'ticker': ['AAPL', 'MSFT']})
+        assert set(result['ticker']) == {'AAPL', 'MSFT'}
+
+
+# ============================================================================
+# CATEGORICAL COLUMNS TESTS
+# ============================================================================
+
+@pytest.fixture
+def categorical_extractor(sample_tickers_df, tmp_path):
+    """TickerExtractor loaded from a parquet file through the dictionary reader."""
+    path = tmp_path / 'tickers.parquet'
+    sample_tickers_df.to_parquet(path)
+    TickerExtractor.clear_cache()
+    TickerExtractor._cached_tickers = TickerExtractor._read_parquet(path)
+    with patch('morningpy.extractor.ticker.CoreConfig.TICKERS_INDEX_FILE', str(tmp_path / 'index.npz')):
+        yield TickerExtractor()
+    TickerExtractor.clear_cache()
+
+
+class TestCategoricalColumns:
+    """Test dictionary-encoded universe columns."""
+
+    def test_read_parquet_encodes_configured_columns(self, categorical_extractor):
+        tickers = categorical_extractor.tickers
+        assert isinstance(tickers['security_type'].dtype, pd.CategoricalDtype)
+        assert isinstance(tickers['country'].dtype, pd.CategoricalDtype)
+        assert tickers['ticker'].dtype == object
+
+    def test_exact_filter(self, categorical_extractor):
+        result = categorical_extractor.search_tickers({'security_type': 'stock'}, exact_match=True)
+        assert result['ticker'].tolist() == ['AAPL', 'MSFT', 'AMZN']
+
+    def test_partial_filter(self, categorical_extractor):
+        result = categorical_extractor.search_tickers({'country': 'states'})
+        assert result['ticker'].tolist() == ['AAPL', 'MSFT', 'AMZN']
+
+    def test_unknown_category(self, categorical_extractor):
+        assert categorical_extractor.search_tickers({'security_type': 'bond'}).empty
+
+    def test_list_filter(self, categorical_extractor):
+        result = categorical_extractor.search_tickers({'security_type': ['fund', 'etf']})
+        assert result['ticker'].tolist() == ['PNPL', 'APLE']
+
+    def test_output_decoded_by_default(self, categorical_extractor):
+        result = categorical_extractor.search_tickers()
+        assert result['security_type'].dtype == object
+
+    def test_categorical_output(self, categorical_extractor):
+        result = categorical_extractor.search_tickers({'country': 'Canada'}, categorical=True)
+        assert isinstance(result['country'].dtype, pd.CategoricalDtype)
+
+
+# ============================================================================
+# CONVERSION TESTS
+# ============================================================================
+
+class TestConvert:
+    """Test identifier conversion through the precomputed maps."""
+
+    def test_convert_to(self, extractor):
+        assert extractor.convert_to(ticker="AAPL", convert_to="isin") == "US0378331005"
+        assert extractor.convert_to(isin="US5949181045", convert_to="security_id") == "0P000003MH"
+
+    def test_convert_to_unknown(self, extractor):
+        assert extractor.convert_to(ticker="UNKNOWN", convert_to="isin") is None
+
+    def test_batch_convert_keeps_input_order(self, extractor):
+        result = extractor.batch_convert(["MSFT", "UNKNOWN", "AAPL", "MSFT"], "ticker", "isin")
+        assert result["ticker"].tolist() == ["MSFT", "UNKNOWN", "AAPL", "MSFT"]
+        assert result["isin"].iloc[0] == "US5949181045"
+        assert pd.isna(result["isin"].iloc[1])
+        assert result["isin"].iloc[2] == "US0378331005"
+        assert result["security_label"].iloc[3] == "Microsoft Corp"
+
+    def test_batch_convert_empty(self, extractor):
+        result = extractor.batch_convert([], "ticker", "isin")
+        assert result.empty
+        assert list(result.columns) == ["ticker", "isin", "security_label"]
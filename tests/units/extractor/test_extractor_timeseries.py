@@ -0,0 +1,74 @@
+"""Tests for the timeseries extractors."""
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from morningpy.extractor.timeseries import (
+    HistoricalTimeseriesExtractor,
+    IntradayTimeseriesExtractor,
+)
+from tests.conftest import RESPONSES_DIR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def make_extractor(cls):
+    """Build an extractor with its config attributes, without security lookup."""
+    extractor = cls.__new__(cls)
+    extractor.field_mapping = cls.config.FIELD_MAPPING
+    extractor.str_columns = cls.config.STRING_COLUMNS
+    extractor.numeric_columns = cls.config.NUMERIC_COLUMNS
+    extractor.final_columns = cls.config.FINAL_COLUMNS
+    return extractor
+
+
+@pytest.fixture(params=[
+    (IntradayTimeseriesExtractor, "get_intraday_timeseries_response.json"),
+    (HistoricalTimeseriesExtractor, "get_historical_timeseries_response.json"),
+], ids=["intraday", "historical"])
+def extractor_and_response(request):
+    cls, filename = request.param
+    with open(RESPONSES_DIR / filename) as f:
+        return make_extractor(cls), json.load(f)
+
+
+# ============================================================================
+# ARROW PROCESSING TESTS
+# ============================================================================
+
+class TestProcessResponseArrow:
+    """Test the Arrow-native response processing."""
+
+    def test_matches_pandas_processing(self, extractor_and_response):
+        extractor, response = extractor_and_response
+        expected = extractor._process_response(response)
+        table = extractor._process_response_arrow(response)
+
+        assert isinstance(table, pa.Table)
+        pd.testing.assert_frame_equal(table.to_pandas(), expected, check_dtype=False)
+
+    def test_typed_from_schema(self, extractor_and_response):
+        extractor, response = extractor_and_response
+        table = extractor._process_response_arrow(response)
+
+        assert table.schema.field("security_id").type == pa.string()
+        assert table.schema.field("close").type == pa.float64()
+        assert table.schema.field("volume").type == pa.float64()
+
+    def test_fills_missing_values(self, extractor_and_response):
+        extractor, response = extractor_and_response
+        response = json.loads(json.dumps(response))
+        response[0]["queryKey"] = None
+        table = extractor._process_response_arrow(response)
+
+        assert table.column("security_id").null_count == 0
+        assert table.column("security_id")[0].as_py() == "N/A"
+
+    @pytest.mark.parametrize("response", [None, [], {}, [{"queryKey": "X", "series": []}]])
+    def test_empty_response(self, extractor_and_response, response):
+        extractor, _ = extractor_and_response
+        assert extractor._process_response_arrow(response).num_rows == 0
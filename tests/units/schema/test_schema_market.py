@@ -199,7 +199,7 @@ class TestMarketCommoditiesSchema(SchemaTestBase):
     def test_has_essential_commodity_fields(self):
         """Test that essential commodity fields are present."""
         essential_fields = [
-            'category', 'name', 'instrument_id', 'exchange',
+            'category', 'name', 'instrument_id', 'exchange_name', 'exchange',
             'last_price', 'net_change', 'percent_net_change'
         ]
         schema_fields = {f.name for f in fields(MarketCommoditiesSchema)}